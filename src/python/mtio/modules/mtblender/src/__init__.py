@@ -422,6 +422,9 @@ class MOD_OT_export(bpy.types.Operator, ExportHelper):
     def getExportGenerateEnvelopes(self): return getConfigValue('exportGenerateEnvelopes')
     def setExportGenerateEnvelopes(self, value): setConfigValue('exportGenerateEnvelopes', value)
 
+    def getExportOptimizeVertexCache(self): return getConfigValue('exportOptimizeVertexCache')
+    def setExportOptimizeVertexCache(self, value): setConfigValue('exportOptimizeVertexCache', value)
+
     # General settings
     flipUpAxis: BoolProperty(name="Flip up axis", get=getFlipUpAxis, set=setFlipUpAxis)
     lukasCompat: BoolProperty(name="Compatibility with Lukas' script", get=getLukasCompat, set=setLukasCompat)
@@ -465,6 +468,7 @@ class MOD_OT_export(bpy.types.Operator, ExportHelper):
     exportOverwriteTextures: BoolProperty(name="Overwrite existing textures", get=getExportOverwriteTextures, set=setExportOverwriteTextures)
     exportGroupPerMesh: BoolProperty(name="Export group per mesh", get=getExportGroupPerMesh, set=setExportGroupPerMesh)
     exportGenerateEnvelopes: BoolProperty(name="Generate envelopes", get=getExportGenerateEnvelopes, set=setExportGenerateEnvelopes)
+    exportOptimizeVertexCache: BoolProperty(name="Optimize vertex cache", get=getExportOptimizeVertexCache, set=setExportOptimizeVertexCache)
 
     def updateVisibility( self ):
         pass
@@ -650,6 +654,7 @@ class MOD_PT_export_additional(bpy.types.Panel):
         layout.prop(operator, "exportOverwriteTextures")
         layout.prop(operator, "exportGroupPerMesh")
         layout.prop(operator, "exportGenerateEnvelopes")
+        layout.prop(operator, "exportOptimizeVertexCache")
 
 
 def menu_func_import(self, context):
@@ -5,9 +5,6 @@ from .mtlib.base_exporter import *
 from .blender_plugin import *
 import bpy
 
-def progressCallback( what, i, count ):
-    pass
-
 def assertBlenderMode(expectedMode:str):
     try:
         bpy.context.object.mode == expectedMode
@@ -17,7 +14,6 @@ def assertBlenderMode(expectedMode:str):
 class BlenderModelExporter(ModelExporterBase):
     def __init__(self) -> None:
         super().__init__(plugin)
-        self.progressCallback = progressCallback
 
     def getObjects( self ):
         temp = list(bpy.data.objects)
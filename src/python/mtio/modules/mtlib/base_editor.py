@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
 import log
-import yaml
+import yamlutil
 import os
 import datetime
 from ncl import NclMat44
@@ -192,6 +192,8 @@ class EditorPluginConfigBase:
         self.exportBakeScale = True
         self.exportGroupPerMesh = False
         self.exportGenerateEnvelopes = True
+        self.exportOptimizeVertexCache = False
+        self.exportTextureCacheSize = 1024
         self.exportMaterialPreset = 'MVC3 MaterialChar'
 
         # debug settings
@@ -215,12 +217,12 @@ class EditorPluginConfigBase:
 
     def save( self ):
         with open(self._plugin.getConfigFilePath(), 'w') as f:
-            yaml.dump(self._getVariables(), f)
+            yamlutil.dump(self._getVariables(), f)
 
     def load( self ):
         if os.path.exists(self._plugin.getConfigFilePath()):
             with open(self._plugin.getConfigFilePath(), 'r') as f:
-                temp = yaml.load(f, Loader=yaml.FullLoader)
+                temp = yamlutil.load(f)
                 if temp != None:
                     for key in temp:
                         if hasattr(self, key):
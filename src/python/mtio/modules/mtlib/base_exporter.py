@@ -9,6 +9,9 @@ import util
 from ncl import *
 from immodel import *
 import textureutil
+from texturecache import TextureCache
+from progress import ProgressReporter
+import mvc3materialnamedb
 import shutil
 from metadata import *
 import yaml
@@ -76,11 +79,16 @@ class ModelExporterBase(ABC):
         self.jointIdxByName = None
         self.ref = None
         self.textureMapCache = dict()
+        self.textureCache = None
+        if self.config.exportTextureCacheSize > 0:
+            self.textureCache = TextureCache( os.path.join( plugin.getAppDataDir(), 'texturecache' ), 
+                                              self.config.exportTextureCacheSize * 1024 * 1024 )
         self.materialCache = dict()
+        mvc3materialnamedb.setUserIndexPath( os.path.join( plugin.getAppDataDir(), 'materialnames.txt' ) )
         self.transformMtx = None
         self.processedNodes = set()
         self.refEnvelopes = []
-        self.progressCallback = None
+        self.progress = ProgressReporter( self.reportProgress, refresh=self.plugin.updateUI )
 
     # Abstract methods
     @abstractmethod
@@ -95,6 +103,13 @@ class ModelExporterBase(ABC):
     def updateSubProgress( self, what, value, count = 0 ):
         pass
 
+    def reportProgress( self, depth, what, value, count = 0 ):
+        '''Shows the progress of a stage reported through self.progress. Nested stages are shown as sub progress.'''
+        if depth == 0:
+            self.updateProgress( what, value, count )
+        else:
+            self.updateSubProgress( what, value, count )
+
     @abstractmethod
     def getEditorGroupCustomAttributeData( self, node: EditorNodeProxy  ) -> EditorCustomAttributeSetProxy:
         pass
@@ -350,10 +365,12 @@ class ModelExporterBase(ABC):
         else:
             # process all bones in the scene
             boneNodes = list(self.iterBoneNodes())
+            progress = self.progress.stage( 'Processing bones', len(boneNodes) )
             for i, editorNode in enumerate( boneNodes ):
-                self.updateProgress( 'Processing bones', i, len(boneNodes) )
+                progress.update( i )
                 self.processBone( editorNode )
                 self.processedNodes.add( editorNode )
+            progress.done()
 
             # resolve references
             for joint in self.model.joints:
@@ -376,10 +393,12 @@ class ModelExporterBase(ABC):
                     texPath = fullPath + '.241f5deb.tex'
                 else:
                     texPath = fullPath + '.tex'
-                if self.config.exportOverwriteTextures or not os.path.exists(texPath):
+                # rebuild textures whose source changed after the last export
+                isStale = os.path.exists(texPath) and os.path.getmtime(filename) > os.path.getmtime(texPath)
+                if self.config.exportOverwriteTextures or not os.path.exists(texPath) or isStale:
                     self.logger.info('converting texture to TEX')
                     try:
-                        textureutil.convertTexture( filename, texPath )
+                        textureutil.convertTexture( filename, texPath, cache=self.textureCache )
                     except PermissionError as e:
                         raise RuntimeError( f"unable to save tex file, make sure you have write permissions to {texPath}" )
                 else:
@@ -437,12 +456,13 @@ class ModelExporterBase(ABC):
 
     def generatePrimitives( self, editorNode: EditorNodeProxy, attribs: PrimitiveCustomAttributeData, 
         primWorkingSets: Dict[int, imPrimitiveWorkingSet] ):
+        progress = self.progress.stage( 'Optimizing submesh', len(primWorkingSets) )
         for i, primWorkingSet in enumerate(primWorkingSets.values()):
             primWorkingSet: imPrimitiveWorkingSet
             
             for prim in primWorkingSet.primitives:
                 prim: imPrimitive
-                if self.plugin.updateUI(): self.updateProgress( "Optimizing submesh", i, len(primWorkingSets) )
+                progress.update( i )
                 self.logger.info(f'processing submesh with material {prim.materialName}')
 
                 # copy over attribs
@@ -477,18 +497,23 @@ class ModelExporterBase(ABC):
                     prim.vertexFormat = imVertexFormat.createFromShader( self.config.debugExportForceShader )
                     
                 self.logger.debug( "trimming uvs" )
-                prim.removeUnusedUvs( self.progressCallback )
+                prim.removeUnusedUvs( progress )
                                 
                 if prim.hasUvs():
                     self.logger.debug( "generating tangents" )
-                    prim.generateTangents( self.progressCallback )
+                    prim.generateTangents( progress )
                 
                 self.logger.debug( "optimizing mesh" )
-                prim.makeIndexed( self.progressCallback )
+                prim.makeIndexed( progress )
+                if self.config.exportOptimizeVertexCache:
+                    acmrBefore, acmrAfter = prim.optimizeVertexCache( progress )
+                    self.logger.info( f"optimized vertex cache, ACMR {acmrBefore:.3f} -> {acmrAfter:.3f}" )
                 if target.current.useTriStrips:
-                    prim.generateTriStrips( self.progressCallback )
+                    stripCount, averageStripLength = prim.generateTriStrips( progress )
+                    self.logger.info( f"generated {stripCount} triangle strips, {averageStripLength:.1f} triangles per strip on average" )
                 
                 self.model.primitives.append( prim )
+        progress.done()
         
     def processMeshes( self ):
         if not self.config.exportPrimitives:
@@ -498,10 +523,12 @@ class ModelExporterBase(ABC):
         # convert meshes
         self.logger.info('processing meshes')
         meshNodes = list(self.iterMeshNodes())
+        progress = self.progress.stage( 'Processing meshes', len( meshNodes ) )
         for i, editorNode in enumerate( meshNodes ):
-            self.updateProgress('Processing meshes', i, len( meshNodes ) )
+            progress.update( i )
             self.processMesh( editorNode )
             self.processedNodes.add( editorNode )
+        progress.done()
             
     def iterGroupNodes( self ):
         # process all groups in the scene
@@ -532,8 +559,9 @@ class ModelExporterBase(ABC):
         else:
             # process all groups in the scene
             groupNodes = list(self.iterGroupNodes())
+            progress = self.progress.stage( 'Processing groups', len( groupNodes ) )
             for i in range( 0, len( groupNodes ) ):
-                self.updateProgress( 'Processing groups', i, len( groupNodes ) )
+                progress.update( i )
                 editorNode = groupNodes[i]
                 
                 self.logger.info(f'processing group node {editorNode.getName()}')
@@ -549,6 +577,7 @@ class ModelExporterBase(ABC):
                 )
                 self.model.groups.append(group)
                 self.processedNodes.add( editorNode )
+            progress.done()
                 
     def processEnvelope( self ):
         if not self.config.exportEnvelopes:
@@ -580,9 +609,9 @@ class ModelExporterBase(ABC):
     def writeBinaries( self ):
         self.logger.info('writing files')
         self.logger.debug('converting intermediate model to binary model format')
-        self.updateProgress( 'Writing files', 0 )
-        binMod = self.model.toBinaryModel( self.progressCallback )
-        self.updateProgress( 'Writing files', 25 )
+        progress = self.progress.stage( 'Writing files' )
+        binMod = self.model.toBinaryModel( progress )
+        progress.update( 25 )
         
         self.logger.debug('writing binary model')
         stream = NclBitStream()
@@ -597,7 +626,7 @@ class ModelExporterBase(ABC):
         else:
             mrlExportPath = self.outPath.basePath + '/' + self.outPath.baseName + '.mrl'
             
-        self.updateProgress( 'Writing files', 50 )
+        progress.update( 50 )
         if self.config.exportGenerateMrl:
             mrlYmlExportPath = mrlExportPath + ".yml"
             self.logger.info(f"writing generated mrl yml to {mrlYmlExportPath}")
@@ -607,7 +636,7 @@ class ModelExporterBase(ABC):
             except PermissionError as e:
                 raise RuntimeError( f"Unable to save mrl yml file, make sure you have write permissions to {mrlYmlExportPath}" )
           
-        self.updateProgress( 'Writing files', 75 )  
+        progress.update( 75 )
         if self.config.exportGenerateMrl or (self.config.exportExistingMrlYml and self.mrl != None):
             self.logger.info(f'exporting mrl yml to {mrlExportPath}')
             
@@ -616,7 +645,7 @@ class ModelExporterBase(ABC):
             except PermissionError as e:
                 raise RuntimeError( f"Unable to save mrl file, make sure you have write permissions to {mrlExportPath}" )
             
-        self.updateProgress( 'Writing files', 100 )
+        progress.done()
     
     def calcMatrices( self ):
         self.transformMtx = nclCreateMat44()
@@ -633,6 +662,7 @@ class ModelExporterBase(ABC):
         self.logger.info(f'exporting to {path}')
         
         # start building intermediate model data for conversion
+        self.progress.reset()
         self.model = imModel()
         self.outPath = util.ResourcePath(path, rootPath=self.config.exportRoot)
         if self.outPath.relBasePath == None:
@@ -656,7 +686,7 @@ class ModelExporterBase(ABC):
         if os.path.exists( self.config.exportMrlYmlPath ):
             self.logger.info(f'loading mrl yml from {self.config.exportMrlYmlPath}')
             self.mrl = imMaterialLib()
-            self.mrl.loadYamlFile( self.config.exportMrlYmlPath )
+            self.mrl.loadFile( self.config.exportMrlYmlPath )
         elif self.config.exportGenerateMrl:
             self.logger.info(f'generating new mrl')
             self.mrl = imMaterialLib()
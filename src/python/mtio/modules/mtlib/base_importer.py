@@ -12,6 +12,7 @@ from shaderinfo import *
 from rtexture import *
 from metadata import *
 import mvc3materialnamedb
+from progress import ProgressReporter
 from immaterial import *
 
 @dataclass
@@ -32,10 +33,16 @@ class PreprocessedWeightData:
     weightArray: list
         
 class ModelImporterBase(ABC):
+    # names of the vertex inputs decoded by decodeVertices
+    DECODED_VERTEX_INPUTS = frozenset( [ 'Position', 'Normal', 'Joint', 'Weight', 'UV_Primary', 'UV_Secondary', 'UV_Unique', 'UV_Extend' ] )
+    
     def __init__(self, plugin: EditorPluginBase) -> None:
         self.plugin = plugin
         self.config = self.plugin.config
         self.logger = self.plugin.logger
+        
+        # remember material names seen in imported models, so their MRL hashes can be resolved later
+        mvc3materialnamedb.setUserIndexPath( os.path.join( plugin.getAppDataDir(), 'materialnames.txt' ) )
         self.filePath = ''
         self.baseName = ''
         self.basePath = ''
@@ -48,6 +55,7 @@ class ModelImporterBase(ABC):
         self.editorGroupArray = []
         self.editorGroupLookup = dict()
         self.layer = None
+        self.progress = ProgressReporter( self.reportProgress, refresh=self.plugin.updateUI )
 
     # Shared functions
     def decodeInputToPoint3( self, inputInfo, vertexStream ):
@@ -110,6 +118,9 @@ class ModelImporterBase(ABC):
         editorJointArray = self.createArray()
 
         self.logger.debug( 'decoding vertices' )
+        
+        # only the inputs that are imported are decoded
+        elements = tuple( x for x in shaderInfo.getLayout().elements if x.name in ModelImporterBase.DECODED_VERTEX_INPUTS )
         vertexBufferStart = primitive.vertexBufferOffset + (primitive.vertexStartIndex * primitive.vertexStride)
         for j in range( 0, primitive.vertexCount ):
             vertexStart = vertexBufferStart + ( j * primitive.vertexStride )
@@ -117,37 +128,37 @@ class ModelImporterBase(ABC):
             # decode each vertex input
             editorVtxWeightArray = None
             editorVtxJointArray = None
-            for key, value in shaderInfo.inputsByName.items():
-                for inputInfo in value:
-                    vertexStream.setOffset( vertexStart + inputInfo.offset )
-
-                    if key == 'Position':
-                        pos = self.decodeInputToPoint3( inputInfo, vertexStream )
-                        if not self.config.debugDisableTransform:
-                            pos = nclTransform(pos, self.modelMtx )
-                        editorVertexArray.append( self.convertNclVec3ToPoint3( pos ) )
-                    elif key == 'Normal':
-                        nrm = self.decodeInputToPoint3( inputInfo, vertexStream )
-                        if not self.config.debugDisableTransform:
-                            nrm = nclNormalize( nclTransform( nrm, self.modelMtxNormal ) )
-                        editorNormalArray.append( self.convertNclVec3ToPoint3( nrm ) )
-                    elif key == 'Joint':
-                        if editorVtxJointArray == None:
-                            editorVtxJointArray = self.createArray()
-                        self.decodeInputToBoneIndexArray( inputInfo, vertexStream, editorVtxJointArray ) 
-                    elif key == 'Weight':
-                        if editorVtxWeightArray == None:
-                            editorVtxWeightArray = self.createArray()
-                        self.decodeInputToBoneWeightArray( inputInfo, vertexStream, editorVtxWeightArray )
-                    elif key == 'UV_Primary':
-                        editorUVPrimaryArray.append( self.convertNclVec3ToPoint3( self.decodeInputToUV( inputInfo, vertexStream ) ) )
-                    elif key == 'UV_Secondary':
-                        editorUVSecondaryArray.append( self.convertNclVec3ToPoint3( self.decodeInputToUV( inputInfo, vertexStream ) ) )
-                    elif key == 'UV_Unique':
-                        editorUVUniqueArray.append( self.convertNclVec3ToPoint3( self.decodeInputToUV( inputInfo, vertexStream ) ) )
-                    elif key == 'UV_Extend':
-                        editorUVExtendArray.append( self.convertNclVec3ToPoint3( self.decodeInputToUV( inputInfo, vertexStream ) ) )
-                        
+            for inputInfo in elements:
+                key = inputInfo.name
+                vertexStream.setOffset( vertexStart + inputInfo.offset )
+
+                if key == 'Position':
+                    pos = self.decodeInputToPoint3( inputInfo, vertexStream )
+                    if not self.config.debugDisableTransform:
+                        pos = nclTransform(pos, self.modelMtx )
+                    editorVertexArray.append( self.convertNclVec3ToPoint3( pos ) )
+                elif key == 'Normal':
+                    nrm = self.decodeInputToPoint3( inputInfo, vertexStream )
+                    if not self.config.debugDisableTransform:
+                        nrm = nclNormalize( nclTransform( nrm, self.modelMtxNormal ) )
+                    editorNormalArray.append( self.convertNclVec3ToPoint3( nrm ) )
+                elif key == 'Joint':
+                    if editorVtxJointArray == None:
+                        editorVtxJointArray = self.createArray()
+                    self.decodeInputToBoneIndexArray( inputInfo, vertexStream, editorVtxJointArray ) 
+                elif key == 'Weight':
+                    if editorVtxWeightArray == None:
+                        editorVtxWeightArray = self.createArray()
+                    self.decodeInputToBoneWeightArray( inputInfo, vertexStream, editorVtxWeightArray )
+                elif key == 'UV_Primary':
+                    editorUVPrimaryArray.append( self.convertNclVec3ToPoint3( self.decodeInputToUV( inputInfo, vertexStream ) ) )
+                elif key == 'UV_Secondary':
+                    editorUVSecondaryArray.append( self.convertNclVec3ToPoint3( self.decodeInputToUV( inputInfo, vertexStream ) ) )
+                elif key == 'UV_Unique':
+                    editorUVUniqueArray.append( self.convertNclVec3ToPoint3( self.decodeInputToUV( inputInfo, vertexStream ) ) )
+                elif key == 'UV_Extend':
+                    editorUVExtendArray.append( self.convertNclVec3ToPoint3( self.decodeInputToUV( inputInfo, vertexStream ) ) )
+                    
             if editorVtxWeightArray != None:
                 editorWeightArray.append( editorVtxWeightArray )
             if editorVtxJointArray != None:
@@ -168,39 +179,16 @@ class ModelImporterBase(ABC):
     def decodeFaces( self, primitive: rModelPrimitive, indexStream: NclBitStream ) -> EditorArrayProxy:
         self.logger.debug( 'decoding faces')
         editorFaceArray = self.createArray()
-        indexStart = ( primitive.indexBufferOffset + primitive.indexStartIndex ) * 2
-        indexStream.setOffset( indexStart )
-        if not target.current.useTriStrips:   
-            for j in range( 0, primitive.indexCount, 3 ):
-                face = self.createPoint3( 
-                    indexStream.readUShort() - primitive.vertexStartIndex + self.plugin.getIndexBase(), 
-                    indexStream.readUShort() - primitive.vertexStartIndex + self.plugin.getIndexBase(), 
-                    indexStream.readUShort() - primitive.vertexStartIndex + self.plugin.getIndexBase() )
-                editorFaceArray.append( face )
-        else:    
-            a = indexStream.readUShort() - primitive.vertexStartIndex + self.plugin.getIndexBase()
-            b = indexStream.readUShort() - primitive.vertexStartIndex + self.plugin.getIndexBase()
-            flip = True
-            j = 2
-            while j < primitive.indexCount:
-                c = indexStream.readUShort()
-                if c == 0xffff:
-                    a = indexStream.readUShort() - primitive.vertexStartIndex + self.plugin.getIndexBase()
-                    b = indexStream.readUShort() - primitive.vertexStartIndex + self.plugin.getIndexBase()
-                    flip = True
-                    j += 3
-                else:
-                    c = c - primitive.vertexStartIndex + self.plugin.getIndexBase()
-                    flip = not flip
-                    if flip:
-                        face = self.createPoint3( c,b,a )  
-                    else:
-                        face = self.createPoint3( a,b,c )
-                    
-                    editorFaceArray.append( face )
-                    a = b
-                    b = c
-                    j += 1
+        
+        # strips are expanded to a triangle list in one pass over the index buffer
+        triangles = self.model.getPrimitiveTriangles( primitive, target.current.useTriStrips ).tolist()
+        if len( triangles ) > 0 and ( min( triangles ) < 0 or max( triangles ) >= primitive.vertexCount ):
+            self.logger.warn( f'primitive {primitive.id} has indices outside of its {primitive.vertexCount} vertices '
+                              f'(vertex start index {primitive.vertexStartIndex})' )
+        indexBase = self.plugin.getIndexBase()
+        triangles = [ x + indexBase for x in triangles ]
+        for j in range( 0, len( triangles ), 3 ):
+            editorFaceArray.append( self.createPoint3( triangles[j], triangles[j + 1], triangles[j + 2] ) )
         return editorFaceArray
 
     def loadTextureSlot( self, material, slot ):
@@ -214,11 +202,8 @@ class ModelImporterBase(ABC):
                 self.logger.info( f'converting TEX file {textureTEXPath} to DDS {textureDDSPath}' )
                 
                 try:
-                    texture = rTextureData()
-                    texture.loadBinaryFile( textureTEXPath )
-                    textureDDS = texture.toDDS()
                     try:
-                        textureDDS.saveFile( textureDDSPath )
+                        convertTEXFileToDDSFile( textureTEXPath, textureDDSPath )
                     except PermissionError:
                         self.logger.error( f"failed to save TEX file to DDS, make sure you have write permissions to: {textureDDSPath}" )
                 except Exception as e:
@@ -248,8 +233,9 @@ class ModelImporterBase(ABC):
         
         self.editorGroupArray = []
         self.editorGroupLookup = dict()
+        progress = self.progress.stage( 'Importing groups', len( self.model.groups ) )
         for i, group in enumerate( self.model.groups ):
-            self.updateProgress( 'Importing groups', i, len( self.model.groups ) )
+            progress.update( i )
             
             editorGroup = self.createDummy( self.metadata.getGroupName( group.id ), group.boundingSphere )
             if self.layer != None:
@@ -258,6 +244,7 @@ class ModelImporterBase(ABC):
             self.setGroupCustomAttributes( group, editorGroup )
             self.editorGroupArray.append( editorGroup )
             self.editorGroupLookup[ group.id ] = editorGroup
+        progress.done()
 
     def importPrimitives( self ):
         self.logger.info('importing primitives')
@@ -265,8 +252,9 @@ class ModelImporterBase(ABC):
         indexStream = NclBitStream( self.model.indexBuffer )
         vertexStream = NclBitStream( self.model.vertexBuffer )
         envelopeIndex = 0
+        progress = self.progress.stage( 'Importing primitives', len( self.model.primitives ) )
         for i in range( len( self.model.primitives ) ):
-            self.updateProgress( 'Importing primitives', i, len( self.model.primitives ) )
+            progress.update( i )
             
             primitive = self.model.primitives[i]
             
@@ -279,6 +267,7 @@ class ModelImporterBase(ABC):
             
             self.importPrimitive( primitive, envelopeIndex, indexStream, vertexStream )
             envelopeIndex += primitive.envelopeCount
+        progress.done()
 
     def importSkeleton( self ):
         self.logger.info('importing skeleton')
@@ -289,8 +278,9 @@ class ModelImporterBase(ABC):
         
         self.editorBoneArray = []
         self.editorBoneLookup = dict()
+        progress = self.progress.stage( 'Importing skeleton', len( self.model.joints ) )
         for i, joint in enumerate( self.model.joints ):
-            self.updateProgress( 'Importing skeleton', i, len( self.model.joints ) )
+            progress.update( i )
             
             localMtx = self.model.jointLocalMtx[i]
             
@@ -320,6 +310,7 @@ class ModelImporterBase(ABC):
             editorBone = self.createBone( joint, jointName, worldMtx, editorParentBone ) 
             self.editorBoneArray.append( editorBone )
             self.editorBoneLookup[ joint.id ] = editorBone
+        progress.done()
 
     def fixupSkeleton( self ):
         if self.config.lukasCompat and self.editorRootBone is not None:
@@ -352,9 +343,10 @@ class ModelImporterBase(ABC):
             self.logger.warn(f'skipped loading mrl from {mrlName} because the file does not exist')
         
         self.editorMaterialArray = []
+        progress = self.progress.stage( 'Importing materials', len( self.model.materials ) )
         for i, materialName in enumerate( self.model.materials ):
             self.logger.info(f'importing material {materialName}')
-            self.updateProgress( 'Importing materials', i, len( self.model.materials ) )
+            progress.update( i )
             
             material = mtl.getMaterialByName( materialName )
             if material == None:
@@ -365,7 +357,7 @@ class ModelImporterBase(ABC):
                 self.setMaterialCustomAttributes( editorMaterial, material )                
                 
             self.editorMaterialArray.append( editorMaterial )
-
+        progress.done()
 
     def importEnvelopes( self ):
         self.logger.warn('importing envelopes skipped')
@@ -398,6 +390,7 @@ class ModelImporterBase(ABC):
         self.logger.info(f'import model from {modFilePath}')
         
         startTime = self.plugin.timeStamp()
+        self.progress.reset()
         
         if not self.plugin.isDebugEnv():
             self.plugin.disableSceneRedraw()
@@ -587,6 +580,13 @@ class ModelImporterBase(ABC):
     def updateSubProgress( self, what, value, count = 0 ):
         pass
 
+    def reportProgress( self, depth, what, value, count = 0 ):
+        '''Shows the progress of a stage reported through self.progress. Nested stages are shown as sub progress.'''
+        if depth == 0:
+            self.updateProgress( what, value, count )
+        else:
+            self.updateSubProgress( what, value, count )
+
     # Layer functions
     @abstractmethod
     def newLayerFromName(self, name) -> EditorLayerProxy:
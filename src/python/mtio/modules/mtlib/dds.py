@@ -409,20 +409,29 @@ class DDSFile:
         self.dxt10Header = DDS_HEADER_DXT10()
         self.buffer = bytearray()
         
-    def read( self, stream ):
+    # size of the magic, header and DXT10 header
+    MAX_HEADER_SIZE = 4 + 124 + 20
+        
+    def readHeader( self, stream ):
         if stream.readUInt() != DDS_MAGIC:
             raise Exception( "Invalid DDS file" )
         
         self.header.read( stream )
         if self.header.ddspf.dwFourCC == DDS_FOURCC_DXT10:
             self.dxt10Header.read( stream )
+        
+    def read( self, stream ):
+        self.readHeader( stream )
         self.buffer = stream.readBytes( stream.getSize() - stream.getOffset() )
         
-    def write( self, stream ):
+    def writeHeader( self, stream ):
         stream.writeUInt( DDS_MAGIC )
         self.header.write( stream )
         if self.header.ddspf.dwFourCC == DDS_FOURCC_DXT10:
             self.dxt10Header.write( stream )
+        
+    def write( self, stream ):
+        self.writeHeader( stream )
         stream.writeBytes( self.buffer )
         
     def calcPitch( self ):
@@ -440,9 +449,12 @@ class DDSFile:
         self.read( NclBitStream( util.loadIntoByteArray( path ) ) )
         
     def saveFile( self, path ):
+        # write the buffer directly rather than copying it into the stream first
         stream = NclBitStream()
-        self.write( stream )
-        util.saveByteArrayToFile( path, stream.getBuffer() )
+        self.writeHeader( stream )
+        with util.openFileForWriting( path ) as f:
+            f.write( stream.getBuffer() )
+            f.write( self.buffer )
         
     @staticmethod
     def fromFile( path ):
@@ -6,8 +6,9 @@ from argparse import ArgumentError
 import base64
 from dataclasses import dataclass
 import os
+import struct
 from typing import List, Optional, Tuple
-import yaml
+import yamlutil
 from rmaterial import *
 import mvc3materialnamedb
 import mvc3shaderdb
@@ -370,6 +371,15 @@ class imMaterialInfo(object):
 class imMaterialLib:
     VERSION = 1
     
+    # binary snapshot of the material library, a faster alternative to the yml form for batch conversion
+    SNAPSHOT_MAGIC = b'IMML'
+    SNAPSHOT_VERSION = 1
+    SNAPSHOT_EXT = 'snap'
+    SNAPSHOT_DATA_NONE = 0
+    SNAPSHOT_DATA_STR = 1
+    SNAPSHOT_DATA_FLOATS = 2
+    SNAPSHOT_DATA_INT = 3
+    
     def __init__( self ):
         self.textures: List[imMaterialTextureInfo] = []
         self.materials: List[imMaterialInfo] = []
@@ -494,7 +504,8 @@ class imMaterialLib:
                         f.write( "                {}, {}, {}, {}, \n".format(cmd.data[i], cmd.data[i+1], cmd.data[i+2], cmd.data[i+3]) )
                     f.write( "              ]]\n")
                 else:
-                    f.write( "            - [ {}, {}, {} ]\n".format( cmd.type, sanitize( cmd.name ), sanitize( cmd.data ) ) )
+                    data = list( cmd.data ) if cmd.type == 'cbuffer' else cmd.data
+                    f.write( "            - [ {}, {}, {} ]\n".format( cmd.type, sanitize( cmd.name ), sanitize( data ) ) )
             if mat.animData is not None:
                 if isinstance( mat.animData, bytes ):
                     f.write( "        animData: {}\n".format( base64.b64encode( mat.animData ).decode('ascii') ) )
@@ -511,7 +522,7 @@ class imMaterialLib:
         self.textures: List[imMaterialTextureInfo] = []
         self.materials: List[imMaterialInfo] = []
         
-        yamlObj = yaml.load( yamlText, Loader=yaml.FullLoader )
+        yamlObj = yamlutil.load( yamlText )
         if yamlObj['version'] > imMaterialLib.VERSION:
             raise Exception('unsupported material library version: {}'.format(yamlObj['version']))
         
@@ -572,14 +583,164 @@ class imMaterialLib:
         with open( path, "r" ) as f:
             self.loadYamlIO( f )
             
-    def saveBinaryFile( self, path ):
+    def saveSnapshotBuffer( self ) -> bytearray:
+        '''
+        Saves the material library to a binary snapshot. Strings are stored as a length followed by utf-8 data,
+        and constant buffers as packed float32 arrays.
+        '''
+        buffer = bytearray()
+        def writeStr( s ):
+            data = s.encode( 'utf-8' )
+            buffer.extend( struct.pack( '<I', len( data ) ) )
+            buffer.extend( data )
+        
+        buffer.extend( imMaterialLib.SNAPSHOT_MAGIC )
+        buffer.extend( struct.pack( '<II', imMaterialLib.SNAPSHOT_VERSION, len( self.textures ) ) )
+        for tex in self.textures:
+            writeStr( tex.path )
+            writeStr( tex.type )
+            
+        buffer.extend( struct.pack( '<I', len( self.materials ) ) )
+        for mat in self.materials:
+            writeStr( mat.name )
+            writeStr( mat.type )
+            writeStr( mat.blendState )
+            writeStr( mat.depthStencilState )
+            writeStr( mat.rasterizerState )
+            buffer.extend( struct.pack( '<III', util.u32( mat.cmdListFlags ), util.u32( mat.matFlags ), len( mat.cmds ) ) )
+            for cmd in mat.cmds:
+                buffer.append( imMaterialCmd.TYPES.index( cmd.type ) )
+                writeStr( cmd.name )
+                if cmd.data is None:
+                    buffer.append( imMaterialLib.SNAPSHOT_DATA_NONE )
+                elif isinstance( cmd.data, str ):
+                    buffer.append( imMaterialLib.SNAPSHOT_DATA_STR )
+                    writeStr( cmd.data )
+                elif isinstance( cmd.data, int ):
+                    buffer.append( imMaterialLib.SNAPSHOT_DATA_INT )
+                    buffer.extend( struct.pack( '<q', cmd.data ) )
+                else:
+                    buffer.append( imMaterialLib.SNAPSHOT_DATA_FLOATS )
+                    buffer.extend( struct.pack( f'<I{len( cmd.data )}f', len( cmd.data ), *cmd.data ) )
+                    
+            if mat.animData is None:
+                buffer.extend( struct.pack( '<i', -1 ) )
+            elif isinstance( mat.animData, bytes ):
+                buffer.extend( struct.pack( '<i', len( mat.animData ) ) )
+                buffer.extend( mat.animData )
+            else:
+                raise NotImplementedError('animData not implemented')
+        return buffer
+    
+    def saveSnapshotFile( self, path ):
+        util.saveByteArrayToFile( path, self.saveSnapshotBuffer() )
+            
+    def loadSnapshotBuffer( self, buffer ):
+        '''Loads the material library from a binary snapshot created by saveSnapshotBuffer'''
+        self.textures: List[imMaterialTextureInfo] = []
+        self.materials: List[imMaterialInfo] = []
+        
+        buffer = memoryview( buffer )
+        if bytes( buffer[0:4] ) != imMaterialLib.SNAPSHOT_MAGIC:
+            raise Exception( 'not a material library snapshot' )
+        
+        offset = 4
+        def readStr():
+            nonlocal offset
+            size, = struct.unpack_from( '<I', buffer, offset )
+            offset += 4 + size
+            return str( buffer[offset - size:offset], 'utf-8' )
+        
+        version, textureCount = struct.unpack_from( '<II', buffer, offset )
+        offset += 8
+        if version != imMaterialLib.SNAPSHOT_VERSION:
+            raise Exception( 'unsupported material library snapshot version: {}'.format( version ) )
+        
+        for i in range( textureCount ):
+            tex = imMaterialTextureInfo()
+            tex.path = readStr()
+            tex.type = readStr()
+            self.textures.append( tex )
+            
+        materialCount, = struct.unpack_from( '<I', buffer, offset )
+        offset += 4
+        constantBufferCache = dict()
+        for i in range( materialCount ):
+            mat = imMaterialInfo()
+            mat.name = readStr()
+            mat.type = readStr()
+            mat.blendState = readStr()
+            mat.depthStencilState = readStr()
+            mat.rasterizerState = readStr()
+            mat.cmdListFlags, mat.matFlags, cmdCount = struct.unpack_from( '<III', buffer, offset )
+            offset += 12
+            for j in range( cmdCount ):
+                cmd = imMaterialCmd()
+                cmd.type = imMaterialCmd.TYPES[ buffer[offset] ]
+                offset += 1
+                cmd.name = readStr()
+                dataType = buffer[offset]
+                offset += 1
+                if dataType == imMaterialLib.SNAPSHOT_DATA_STR:
+                    cmd.data = readStr()
+                elif dataType == imMaterialLib.SNAPSHOT_DATA_INT:
+                    cmd.data, = struct.unpack_from( '<q', buffer, offset )
+                    offset += 8
+                elif dataType == imMaterialLib.SNAPSHOT_DATA_FLOATS:
+                    count, = struct.unpack_from( '<I', buffer, offset )
+                    # identical constant buffers share a single immutable tuple
+                    key = ( cmd.name, bytes( buffer[offset + 4:offset + 4 + count * 4] ) )
+                    cmd.data = constantBufferCache.get( key )
+                    if cmd.data is None:
+                        cmd.data = unpackConstantBuffer( mvc3shaderdb.getShaderObjectIdFromName( cmd.name ).getHash(), key[1] )
+                        constantBufferCache[ key ] = cmd.data
+                    offset += 4 + count * 4
+                elif dataType != imMaterialLib.SNAPSHOT_DATA_NONE:
+                    raise Exception( 'unhandled material cmd data type: {}'.format( dataType ) )
+                mat.cmds.append( cmd )
+                
+            animDataSize, = struct.unpack_from( '<i', buffer, offset )
+            offset += 4
+            if animDataSize >= 0:
+                mat.animData = bytes( buffer[offset:offset + animDataSize] )
+                offset += animDataSize
+            self.materials.append( mat )
+            
+    def loadSnapshotFile( self, path ):
+        with open( path, 'rb' ) as f:
+            self.loadSnapshotBuffer( f.read() )
+            
+    @staticmethod
+    def isSnapshotPath( path ):
+        return path.lower().endswith( '.' + imMaterialLib.SNAPSHOT_EXT )
+            
+    def loadFile( self, path ):
+        '''Loads the material library from either a yml file or a binary snapshot, based on the file extension'''
+        if imMaterialLib.isSnapshotPath( path ):
+            self.loadSnapshotFile( path )
+        else:
+            self.loadYamlFile( path )
+            
+    def saveFile( self, path ):
+        '''Saves the material library to either a yml file or a binary snapshot, based on the file extension'''
+        if imMaterialLib.isSnapshotPath( path ):
+            self.saveSnapshotFile( path )
+        else:
+            self.saveYamlFile( path )
+            
+    def saveBinaryFile( self, path, deduplicate = False ):
         with open( path, "wb" ) as f:
             stream = NclBitStream()
-            self.saveBinaryStream( stream )
+            stats = self.saveBinaryStream( stream, deduplicate )
             f.write( stream.getBuffer() )
+        return stats
             
-    def saveBinaryStream( self, stream ):
-        writer = rMaterialStreamWriter( stream )
+    def saveBinaryStream( self, stream, deduplicate = False ):
+        '''
+        Saves the material library as an MRL. If deduplicate is set, identical command lists, constant buffers and animation data 
+        are only written once and shared between materials. Returns the rMaterialWriteStats of the written blocks.
+        '''
+        writer = rMaterialStreamWriter( stream, deduplicate )
         
         if target.current.name in ['mvc3-pc']:
             hash = 0xE588940A
@@ -612,7 +773,7 @@ class imMaterialLib:
             if matInfo.name.startswith( "_0x" ):
                 binMatInfo.nameHash = int( matInfo.name[1:], 16 )
             else:
-                binMatInfo.nameHash = util.computeHash( matInfo.name )     
+                binMatInfo.nameHash = mvc3materialnamedb.getMaterialNameHash( matInfo.name )
             
             binMatInfo.blendState = mvc3shaderdb.getShaderObjectIdFromName( matInfo.blendState )
             binMatInfo.depthStencilState = mvc3shaderdb.getShaderObjectIdFromName( matInfo.depthStencilState )
@@ -650,6 +811,7 @@ class imMaterialLib:
         writer.endMaterialInfoList()
         
         writer.flush()
+        return writer.stats
         
     def getMaterialByName( self, materialName ):
         for material in self.materials:
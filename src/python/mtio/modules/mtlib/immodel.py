@@ -7,14 +7,33 @@ from ncl import *
 from rmodel import *
 import vertexcodec
 import modelutil
+from progress import beginProgress
 from immaterial import *
 import re
 from copy import copy, deepcopy
 import sys
+import itertools
+import libtarget
+
+if libtarget.numpy:
+    import numpy as np
 
 def _isValidBoundingSphere( bs ):
     '''Returns if the bounding sphere is not None or identity'''
     return bs != None and (bs[0] != 0 and bs[1] != 0 and bs[2] != 0 and bs[3] != 0)
+
+def _transformPointArray( points, mtx ):
+    '''Transforms an array of 3d points by a 4x4 matrix, rounding the same way as nclTransform'''
+    m = np.array( [[mtx[c][r] for r in range( 4 )] for c in range( 4 )], dtype=np.float32 )
+    x = points[:, 0:1]
+    y = points[:, 1:2]
+    z = points[:, 2:3]
+    return ( ( m[0, 0:3] * x + m[1, 0:3] * y ) + ( m[2, 0:3] * z + m[3, 0:3] ) ).astype( np.float32 )
+
+def _normalizeArray( vectors ):
+    '''Normalizes an array of 3d vectors, rounding the same way as nclNormalize'''
+    lengthSq = ( vectors[:, 0] * vectors[:, 0] + vectors[:, 1] * vectors[:, 1] ) + vectors[:, 2] * vectors[:, 2]
+    return vectors * ( np.float32( 1 ) / np.sqrt( lengthSq ) )[:, np.newaxis]
         
 class imVertexWeight:
     def __init__( self ):
@@ -87,6 +106,8 @@ class imVertex(object):
     SHADER = None
     MAX_WEIGHT_COUNT = None
     COMPRESSED = None
+    # ( attribute, component index, vertexcodec component type ) in the order written by write()
+    LAYOUT = None
     
     def __init__( self ):
         self.position = NclVec3()
@@ -111,6 +132,11 @@ class imVertexIASkinTB4wt(imVertex):
     SHADER = 'IASkinTB4wt'
     MAX_WEIGHT_COUNT = 4
     COMPRESSED = True
+    LAYOUT = ( ( 'position', 0, 5 ), ( 'position', 1, 5 ), ( 'position', 2, 5 ), ( 'weights', 0, 5 ),
+               ( 'normal', 0, 9 ), ( 'normal', 1, 9 ), ( 'normal', 2, 9 ), ( 'occlusion', None, 9 ),
+               ( 'tangent', 0, 9 ), ( 'tangent', 1, 9 ), ( 'tangent', 2, 9 ), ( 'tangent', 3, 9 ),
+               ( 'jointIds', 0, 8 ), ( 'jointIds', 1, 8 ), ( 'jointIds', 2, 8 ), ( 'jointIds', 3, 8 ),
+               ( 'uvPrimary', 0, 2 ), ( 'uvPrimary', 1, 2 ), ( 'weights', 1, 2 ), ( 'weights', 2, 2 ) )
     
     def __init__( self ):
         super().__init__()
@@ -163,6 +189,10 @@ class imVertexIASkinTB2wt(imVertex):
     SHADER = 'IASkinTB2wt'
     MAX_WEIGHT_COUNT = 2
     COMPRESSED = True
+    LAYOUT = ( ( 'position', 0, 5 ), ( 'position', 1, 5 ), ( 'position', 2, 5 ), ( 'weights', 0, 5 ),
+               ( 'normal', 0, 9 ), ( 'normal', 1, 9 ), ( 'normal', 2, 9 ), ( 'occlusion', None, 9 ),
+               ( 'tangent', 0, 9 ), ( 'tangent', 1, 9 ), ( 'tangent', 2, 9 ), ( 'tangent', 3, 9 ),
+               ( 'uvPrimary', 0, 2 ), ( 'uvPrimary', 1, 2 ), ( 'jointIds', 0, 2 ), ( 'jointIds', 1, 2 ) )
     
     def __init__( self ):
         super().__init__()
@@ -210,6 +240,10 @@ class imVertexIASkinTB1wt(imVertex):
     SHADER = 'IASkinTB1wt'
     MAX_WEIGHT_COUNT = 1
     COMPRESSED = True
+    LAYOUT = ( ( 'position', 0, 5 ), ( 'position', 1, 5 ), ( 'position', 2, 5 ), ( 'jointId', None, 3 ),
+               ( 'normal', 0, 9 ), ( 'normal', 1, 9 ), ( 'normal', 2, 9 ), ( 'occlusion', None, 9 ),
+               ( 'tangent', 0, 9 ), ( 'tangent', 1, 9 ), ( 'tangent', 2, 9 ), ( 'tangent', 3, 9 ),
+               ( 'uvPrimary', 0, 2 ), ( 'uvPrimary', 1, 2 ) )
     
     def __init__( self ):
         super().__init__()
@@ -253,6 +287,10 @@ class imVertexIANonSkinTB(imVertex):
     SHADER = 'IANonSkinTB'
     MAX_WEIGHT_COUNT = 0
     COMPRESSED = False
+    LAYOUT = ( ( 'position', 0, 1 ), ( 'position', 1, 1 ), ( 'position', 2, 1 ),
+               ( 'normal', 0, 9 ), ( 'normal', 1, 9 ), ( 'normal', 2, 9 ), ( 'occlusion', None, 9 ),
+               ( 'tangent', 0, 9 ), ( 'tangent', 1, 9 ), ( 'tangent', 2, 9 ), ( 'tangent', 3, 9 ),
+               ( 'uvPrimary', 0, 2 ), ( 'uvPrimary', 1, 2 ) )
     
     def __init__( self ):
         super().__init__()
@@ -297,6 +335,8 @@ class imVertexIANonSkinBL(imVertex):
     SHADER = 'IANonSkinBL'
     MAX_WEIGHT_COUNT = 0
     COMPRESSED = False
+    LAYOUT = ( ( 'position', 0, 1 ), ( 'position', 1, 1 ), ( 'position', 2, 1 ), ( 'normal', None, 11 ),
+               ( 'uvPrimary', 0, 2 ), ( 'uvPrimary', 1, 2 ), ( 'uvUnique', 0, 2 ), ( 'uvUnique', 1, 2 ) )
     
     def __init__( self ):
         super().__init__()
@@ -340,6 +380,11 @@ class imVertexIANonSkinTBNLA(imVertex):
     SHADER = 'IANonSkinTBNLA'
     MAX_WEIGHT_COUNT = 0
     COMPRESSED = False
+    LAYOUT = ( ( 'position', 0, 1 ), ( 'position', 1, 1 ), ( 'position', 2, 1 ),
+               ( 'normal', 0, 9 ), ( 'normal', 1, 9 ), ( 'normal', 2, 9 ), ( 'occlusion', None, 10 ),
+               ( 'tangent', 0, 9 ), ( 'tangent', 1, 9 ), ( 'tangent', 2, 9 ), ( 'tangent', 3, 9 ),
+               ( 'uvPrimary', 0, 2 ), ( 'uvPrimary', 1, 2 ), ( 'uvExtend', 0, 2 ), ( 'uvExtend', 1, 2 ),
+               ( 'uvSecondary', 0, 2 ), ( 'uvSecondary', 1, 2 ), ( 'uvUnique', 0, 2 ), ( 'uvUnique', 1, 2 ) )
     
     def __init__( self ):
         super().__init__()
@@ -401,6 +446,8 @@ class imVertexIASkinBridge1wt(imVertex):
     SHADER = 'IASkinBridge1wt'
     MAX_WEIGHT_COUNT = 1
     COMPRESSED = True
+    LAYOUT = ( ( 'position', 0, 5 ), ( 'position', 1, 5 ), ( 'position', 2, 5 ), ( 'jointIds', 0, 4 ),
+               ( 'normal', None, 11 ) )
     
     def __init__( self ):
         super().__init__()
@@ -432,6 +479,8 @@ class imVertexIASkinBridge2wt(imVertex):
     SHADER = 'IASkinBridge2wt'
     MAX_WEIGHT_COUNT = 2
     COMPRESSED = True
+    LAYOUT = ( ( 'position', 0, 5 ), ( 'position', 1, 5 ), ( 'position', 2, 5 ), ( 'weights', 0, 5 ),
+               ( 'normal', None, 11 ), ( 'jointIds', 0, 4 ), ( 'jointIds', 1, 4 ) )
     
     def __init__( self ):
         super().__init__()
@@ -465,6 +514,10 @@ class imVertexIASkinBridge4wt(imVertex):
     SHADER = 'IASkinBridge4wt'
     MAX_WEIGHT_COUNT = 4
     COMPRESSED = True
+    LAYOUT = ( ( 'position', 0, 5 ), ( 'position', 1, 5 ), ( 'position', 2, 5 ), ( None, None, 3 ),
+               ( 'jointIds', 0, 8 ), ( 'jointIds', 1, 8 ), ( 'jointIds', 2, 8 ), ( 'jointIds', 3, 8 ),
+               ( 'weights', 0, 10 ), ( 'weights', 1, 10 ), ( 'weights', 2, 10 ), ( 'weights', 3, 10 ),
+               ( 'normal', None, 11 ) )
     
     def __init__( self ):
         super().__init__()
@@ -677,11 +730,11 @@ class imPrimitive(object):
             raise NotImplementedError()
         
     def removeUnusedUvs( self, progressCb = None ):
-        def _trim( progressCb, list ):
+        progress = beginProgress( progressCb, 'Trimming uvs', 4 )
+        def _trim( progress, list ):
+            progress.advance()
             used = False
             for i, uv in enumerate( list ):
-                if progressCb is not None: progressCb( 'Trimming uvs', i, len( list ) )
-                
                 if uv[0] != 0 or uv[1] != 0:
                     used = True
                     break
@@ -690,10 +743,11 @@ class imPrimitive(object):
             else:
                 return list
             
-        self.uvPrimary = _trim( progressCb, self.uvPrimary )
-        self.uvSecondary = _trim( progressCb, self.uvSecondary )
-        self.uvUnique = _trim( progressCb, self.uvUnique )
-        self.uvExtend = _trim( progressCb, self.uvExtend )
+        self.uvPrimary = _trim( progress, self.uvPrimary )
+        self.uvSecondary = _trim( progress, self.uvSecondary )
+        self.uvUnique = _trim( progress, self.uvUnique )
+        self.uvExtend = _trim( progress, self.uvExtend )
+        progress.done()
     
     def makeIndexed( self, progressCb = None ):
         '''
@@ -724,11 +778,17 @@ class imPrimitive(object):
         self.tangents = []
         self.indices = []
         
+        progress = beginProgress( progressCb, 'Optimizing vertices', len( positions ) )
+        if libtarget.numpy:
+            self._makeIndexedPacked( positions, normals, uvPrimary, uvSecondary, uvUnique, uvExtend, weights, tangents )
+            progress.done()
+            return
+        
         # optimize vertex buffer
         vertexIdxLookup = dict()
         nextVertexIdx = 0
         for i in range( 0, len( positions ) ):
-            if progressCb != None: progressCb( 'Optimizing vertices', i, len(positions) )
+            progress.update( i )
             
             cv = imCacheVertex()
             cv.position = (positions[i][0], positions[i][1], positions[i][2])
@@ -769,27 +829,113 @@ class imPrimitive(object):
                 idx = vertexIdxLookup.get(cv)
 
             self.indices.append(idx)
-           
-    def generateTriStrips( self, progressCb=None ):
-        # generate fake strips by creating strips containing only 1 triangle
-        tempIndices = list(self.indices)
-        self.indices=[]
-        for i in range( 0, len( tempIndices ) ):
-            if progressCb != None: progressCb( 'Generating triangle strips', i, len( tempIndices ) )
+        progress.done()
             
-            if i != 0 and i % 3 == 0:
-                self.indices.append( 0xFFFF )
+    def _makeIndexedPacked( self, positions, normals, uvPrimary, uvSecondary, uvUnique, uvExtend, weights, tangents ):
+        '''
+        makeIndexed implementation that welds all vertices at once using packed byte keys.
+        '''
+        count = len( positions )
+        hasUvs = uvPrimary is not None and len( uvPrimary ) > 0
+        isSkinned = weights is not None and len( weights ) > 0
+        
+        def _used( values ):
+            return hasUvs and values is not None and len( values ) != 0
+        
+        columns = [ modelutil.vectorsToArray( positions, 3 ),
+                    modelutil.vectorsToArray( normals[0:count], 3 ) ]
+        for values, componentCount in [ ( uvPrimary, 2 ), ( uvSecondary, 2 ), ( uvUnique, 2 ), ( uvExtend, 2 ), ( tangents, 4 ) ]:
+            if _used( values ):
+                columns.append( modelutil.vectorsToArray( values[0:count], componentCount ) )
+                
+        if isSkinned:
+            weightValues, weightCounts = modelutil.raggedToArray( [ w.weights for w in weights[0:count] ], np.float64 )
+            weightIndices, indexCounts = modelutil.raggedToArray( [ w.indices for w in weights[0:count] ], np.int64 )
+            columns += [ weightCounts, indexCounts, weightValues, weightIndices ]
             
-            self.indices.append( tempIndices[i] )
+        unique, indices = modelutil.weldVertices( columns )
+        
+        for i in unique:
+            self.positions.append( NclVec3( ( positions[i][0], positions[i][1], positions[i][2] ) ) )
+            self.normals.append( NclVec3( ( normals[i][0], normals[i][1], normals[i][2] ) ) )
+            
+            if hasUvs:
+                self.uvPrimary.append( NclVec2( ( uvPrimary[i][0], uvPrimary[i][1] ) ) )
+                if _used( uvSecondary ): self.uvSecondary.append( NclVec2( ( uvSecondary[i][0], uvSecondary[i][1] ) ) )
+                if _used( uvUnique ): self.uvUnique.append( NclVec2( ( uvUnique[i][0], uvUnique[i][1] ) ) )
+                if _used( uvExtend ): self.uvExtend.append( NclVec2( ( uvExtend[i][0], uvExtend[i][1] ) ) )
+                if _used( tangents ): self.tangents.append( NclVec4( ( tangents[i][0], tangents[i][1], tangents[i][2], tangents[i][3] ) ) )
+                
+            if isSkinned:
+                vtxWeight = imVertexWeight()
+                vtxWeight.indices = tuple( weights[i].indices )
+                vtxWeight.weights = tuple( weights[i].weights )
+                self.weights.append( vtxWeight )
+                
+        self.indices = indices.tolist()
+           
+    def optimizeVertexCache( self, progressCb=None ):
+        '''
+        Reorders the triangles for post-transform vertex cache efficiency, and the vertices by first use.
+        Returns the average cache miss ratio before and after optimization.
+        '''
+        vertexCount = len( self.positions )
+        acmrBefore = modelutil.calcACMR( self.indices )
+        indices = modelutil.optimizeVertexCache( self.indices, vertexCount, progressCb )
+        self.indices, order = modelutil.optimizeVertexFetch( indices, vertexCount )
+        
+        for name in ( 'positions', 'normals', 'tangents', 'uvPrimary', 'uvSecondary', 'uvUnique', 'uvExtend', 'weights' ):
+            values = getattr( self, name )
+            if values != None and len( values ) == vertexCount:
+                setattr( self, name, [ values[ i ] for i in order ] )
+                
+        return acmrBefore, modelutil.calcACMR( self.indices )
+        
+    def generateTriStrips( self, progressCb=None ):
+        '''
+        Converts the indexed triangle list into triangle strips separated by primitive restarts.
+        Returns the number of strips and their average length in triangles.
+        '''
+        strips = modelutil.stripifyTriangles( self.indices, progressCb=progressCb )
+        self.indices = modelutil.joinTriStrips( strips )
+        if len( strips ) == 0:
+            return 0, 0.0
+        
+        triangleCount = sum( len( strip ) - 2 for strip in strips )
+        return len( strips ), triangleCount / len( strips )
             
     def generateTangents( self, progressCb=None ):
-        tangents = [NclVec3()] * len(self.positions)
-        bitangents = [NclVec3()] * len(self.positions)
-        self.tangents = []
+        if libtarget.numpy:
+            progress = beginProgress( progressCb, 'Calculating tangent and binormal' )
+            indices = self.indices if self.isIndexed() else range( len( self.positions ) )
+            tangents = modelutil.calcTangents( modelutil.vectorsToArray( self.positions, 3 ), 
+                                               modelutil.vectorsToArray( self.normals, 3 ),
+                                               modelutil.vectorsToArray( self.uvPrimary, 2 ), 
+                                               np.fromiter( indices, dtype=np.int64, count=len( indices ) ) )
+            self.tangents = [ NclVec4( tuple( t ) ) for t in tangents.tolist() ]
+            progress.done()
+            return
+        
+        # accumulate per welded vertex, so that vertices that only differ by the face they belong to get the same tangent
+        weldIndices = []
+        weldedVertices = dict()
+        for i in range( len( self.positions ) ):
+            key = ( tuple( self.positions[ i ] ), tuple( self.normals[ i ] ), tuple( self.uvPrimary[ i ] ) )
+            weldIndices.append( weldedVertices.setdefault( key, len( weldedVertices ) ) )
+            
+        # index of the first vertex of each welded vertex
+        weldedVertexIndices = [ 0 ] * len( weldedVertices )
+        for i in reversed( range( len( weldIndices ) ) ):
+            weldedVertexIndices[ weldIndices[ i ] ] = i
+        
+        tangents = [NclVec3() for i in range( len( weldedVertexIndices ) )]
+        bitangents = [NclVec3() for i in range( len( weldedVertexIndices ) )]
+        weldedTangents = []
         count = len( self.indices ) if self.isIndexed() else len( self.positions )
 
+        progress = beginProgress( progressCb, 'Calculating tangent and binormal', count )
         for i in range( 0, count, 3 ):
-            if progressCb != None: progressCb( 'Calculating tangent and binormal', i, count )
+            progress.update( i )
             triangleA = self.indices[i] if self.isIndexed() else i
             triangleB = self.indices[i+1] if self.isIndexed() else i+1
             triangleC = self.indices[i+2] if self.isIndexed() else i+2
@@ -806,17 +952,19 @@ class imPrimitive(object):
             tangent = ( positionA * texCoordB[1] - positionB * texCoordA[1] ) * direction
             bitangent = ( positionB * texCoordA[0] - positionA * texCoordB[0] ) * direction
 
-            tangents[ triangleA ] += tangent
-            tangents[ triangleB ] += tangent
-            tangents[ triangleC ] += tangent
+            tangents[ weldIndices[ triangleA ] ] += tangent
+            tangents[ weldIndices[ triangleB ] ] += tangent
+            tangents[ weldIndices[ triangleC ] ] += tangent
 
-            bitangents[ triangleA ] += bitangent
-            bitangents[ triangleB ] += bitangent
-            bitangents[ triangleC ] += bitangent
+            bitangents[ weldIndices[ triangleA ] ] += bitangent
+            bitangents[ weldIndices[ triangleB ] ] += bitangent
+            bitangents[ weldIndices[ triangleC ] ] += bitangent
             
+        progress.done()
+        progress = beginProgress( progressCb, 'Averaging tangents', len( tangents ) )
         for i in range( 0, len( tangents ) ):
-            if progressCb != None: progressCb( 'Averaging tangents', i, len( tangents ) )
-            normal = self.normals[ i ]
+            progress.update( i )
+            normal = self.normals[ weldedVertexIndices[ i ] ]
 
             tangent = nclNormalize( tangents[ i ] )
             bitangent = nclNormalize( bitangents[ i ] )
@@ -825,39 +973,99 @@ class imPrimitive(object):
             bitangent = nclNormalize( bitangent - normal * nclDot( bitangent, normal ) )
 
             directionCheck = nclDot( nclNormalize( nclCross( normal, tangent ) ), bitangent )
-            self.tangents.append( NclVec4( ( tangent[0], tangent[1], tangent[2], (1.0 if directionCheck > 0.0 else -1.0 ) ) ) )
-
-        # Look for NaNs
-        for i in range( 0, len( self.positions ) ):
-            if progressCb != None: progressCb( 'Resolving NaNs', i, len( self.positions ) )
-            position = self.positions[ i ]
-            tangent = self.tangents[ i ]
-
-            if not math.isnan( tangent[0] ) and not math.isnan( tangent[1] ) and not math.isnan( tangent[2] ):
-                continue
-
-            nearestVertexIndex = -1
-            currentDistance = float("+inf")
-
-            for j in range( 0, len( self.positions ) ):
-                positionToCompare = self.positions[ j ]
-                tangentToCompare = self.tangents[ j ]
-
-                if i == j or math.isnan( tangentToCompare[0] ) or math.isnan( tangentToCompare[1] ) or math.isnan( tangentToCompare[2] ):
+            weldedTangents.append( NclVec4( ( tangent[0], tangent[1], tangent[2], (1.0 if directionCheck > 0.0 else -1.0 ) ) ) )
+
+        # resolve NaNs using the nearest vertex with a valid tangent, including those resolved before it
+        progress.done()
+        progress = beginProgress( progressCb, 'Resolving NaNs', len( weldedTangents ) )
+        isInvalid = [ math.isnan( t[0] ) or math.isnan( t[1] ) or math.isnan( t[2] ) for t in weldedTangents ]
+        if any( isInvalid ) and not all( isInvalid ):
+            grid = modelutil.PointGrid( [ self.positions[ i ] for i in weldedVertexIndices ] )
+            grid.add( [ i for i in range( len( weldedTangents ) ) if not isInvalid[ i ] ] )
+            for i in range( 0, len( weldedTangents ) ):
+                progress.update( i )
+                if not isInvalid[ i ]:
                     continue
-
-                #distance = nclDistanceSq( position, positionToCompare );
-                temp = position - positionToCompare
-                distance = nclDot(temp, temp)
-
-                if distance > currentDistance: 
-                    continue
-
-                nearestVertexIndex = j
-                currentDistance = distance
-
-            if nearestVertexIndex != -1:
-                self.tangents[ i ] = self.tangents[ nearestVertexIndex ]
+                
+                nearestVertexIndex = grid.findNearest( grid.points[ i ], exclude=i )
+                if nearestVertexIndex != -1:
+                    weldedTangents[ i ] = weldedTangents[ nearestVertexIndex ]
+                    grid.add( i )
+                
+        self.tangents = [ weldedTangents[ i ] for i in weldIndices ]
+        progress.done()
+                
+    def getVertexColumns( self ):
+        '''
+        Gathers the vertex data into numpy arrays keyed by imVertex attribute name, with the same values 
+        imModel.toBinaryModel assigns to each imVertex. Used to encode all vertices through imVertex.LAYOUT at once.
+        '''
+        vertexType = self.vertexFormat.vertexType
+        count = len( self.positions )
+        columns = {}
+        columns[ 'position' ] = modelutil.vectorsToArray( self.positions, 3, np.float32 )
+        columns[ 'normal' ] = modelutil.vectorsToArray( self.normals[0:count], 3, np.float32 )
+        columns[ 'occlusion' ] = np.ones( count )
+        
+        if self.hasUvs():
+            columns[ 'tangent' ] = modelutil.vectorsToArray( self.tangents[0:count], 4, np.float32 )
+            uvPrimary = modelutil.vectorsToArray( self.uvPrimary[0:count], 2, np.float32 )
+            columns[ 'uvPrimary' ] = uvPrimary
+            
+            # assign other uv channels to primary if they're not assigned
+            for name in [ 'uvSecondary', 'uvUnique', 'uvExtend' ]:
+                uvs = getattr( self, name )
+                column = uvPrimary.copy()
+                if uvs is not None and len( uvs ) > 0:
+                    usedCount = min( len( uvs ), count )
+                    column[0:usedCount] = modelutil.vectorsToArray( uvs[0:usedCount], 2, np.float32 )
+                columns[ name ] = column
+        else:
+            columns[ 'tangent' ] = np.zeros( ( count, 4 ), dtype=np.float32 )
+            for name in [ 'uvPrimary', 'uvSecondary', 'uvUnique', 'uvExtend' ]:
+                columns[ name ] = np.zeros( ( count, 2 ), dtype=np.float32 )
+                
+        weights = np.zeros( ( count, 4 ) )
+        jointIds = np.zeros( ( count, 4 ), dtype=np.int64 )
+        jointId = np.zeros( count, dtype=np.int64 )
+        maxWeightCount = vertexType.MAX_WEIGHT_COUNT
+        if maxWeightCount == 1:
+            # HACK assume that when the vertex has no indices but is assigned a vertex format with 1 weight, that it's an unrigged mesh
+            # for a skeleton mesh model
+            if self.isSkinned():
+                for i in range( count ):
+                    if len( self.weights[ i ].indices ) > 0:
+                        jointId[ i ] = self.weights[ i ].indices[ 0 ]
+        elif maxWeightCount > 1:
+            usedCounts = np.zeros( count, dtype=np.int64 )
+            for i in range( count ):
+                w = self.weights[ i ]
+                usedCount = min( len( w.weights ), maxWeightCount )
+                usedCounts[ i ] = usedCount
+                weights[ i, 0:usedCount ] = w.weights[0:usedCount]
+                jointIds[ i, 0:usedCount ] = w.indices[0:usedCount]
+                
+            # vanilla models repeat the last joint id with a weight of 0
+            slots = np.arange( 4 )[np.newaxis, :]
+            lastJointIds = np.where( usedCounts > 0, jointIds[ np.arange( count ), np.maximum( usedCounts - 1, 0 ) ], 0 )
+            jointIds = np.where( slots < usedCounts[:, np.newaxis], jointIds, 
+                                 np.where( slots < maxWeightCount, lastJointIds[:, np.newaxis], 0 ) )
+            
+            # remove very small weights
+            weights = np.where( weights < 0.001, 0, weights )
+            usedBoneCounts = np.count_nonzero( weights > 0.001, axis=1 )
+            if not np.all( usedBoneCounts > 0 ):
+                raise AssertionError( 'mesh {} has unrigged vertex at index {}'.format( self.name, int( np.argmin( usedBoneCounts > 0 ) ) ) )
+            
+            # adjust for floating point error by averaging out the weights
+            weightSum = ( ( weights[:, 0] + weights[:, 1] ) + weights[:, 2] ) + weights[:, 3]
+            weightAvgStep = ( 1 - weightSum ) / usedBoneCounts
+            weights = np.where( slots < usedBoneCounts[:, np.newaxis], weights + weightAvgStep[:, np.newaxis], weights )
+            
+        columns[ 'weights' ] = weights
+        columns[ 'jointIds' ] = jointIds
+        columns[ 'jointId' ] = jointId
+        return columns
                 
 @dataclass
 class imPrimitiveWorkingSet:
@@ -1012,8 +1220,9 @@ class imModel:
             mod.boneMap[ joint.id ] = i
         
         # convert joints
+        progress = beginProgress( progressCb, 'Converting joints', len( self.joints ) )
         for i, joint in enumerate( self.joints ): 
-            if progressCb != None: progressCb( 'Converting joints', i, len( self.joints ) )
+            progress.update( i )
                               
             modJoint = rModelJoint()
             modJoint.id = joint.id
@@ -1033,12 +1242,14 @@ class imModel:
             else:
                 # inverse bind matrix is calculated after processing vertices because it includes the model matrix
                 pass
+        progress.done()
 
         # convert groups
         # order groups by index, or at the end of not specified
         self.groups = sorted( self.groups, key=lambda x: x.index )
+        progress = beginProgress( progressCb, 'Converting groups', len( self.groups ) )
         for i, group in enumerate( self.groups ):
-            if progressCb != None: progressCb( 'Converting groups', i, len( self.groups ) )
+            progress.update( i )
             
             modGroup = rModelGroup()
             
@@ -1059,16 +1270,20 @@ class imModel:
             modGroup.field0c = group.field0c
             modGroup.id = group.id
             mod.groups.append( modGroup )
+        progress.done()
         
         nextVertexOffset = 0
         nextTriangleIndex = 0
         vertices = []
+        vertexColumns = []
+        vertexCount = 0
         indices = []
         
         # sort by index to keep order
         self.primitives = sorted( self.primitives, key=lambda x: x.index )
+        progress = beginProgress( progressCb, 'Converting primitives', len( self.primitives ) )
         for meshIndex, mesh in enumerate( self.primitives ):
-            if progressCb != None: progressCb( 'Converting primitives', meshIndex, len( self.primitives ) )
+            progress.update( meshIndex )
             
             mesh: imPrimitive
             
@@ -1127,77 +1342,82 @@ class imModel:
             mesh.updateVertexFormat( self )
             
             # convert vertices
-            for i in range(0, len(mesh.positions)):
-                if progressCb != None: progressCb( 'Converting vertices', i, len( mesh.positions ) )
+            if libtarget.numpy:
+                # encoded in one go once the model matrix is known
+                vertexColumns.append( mesh.getVertexColumns() )
+                vertexCount += len( mesh.positions )
+            else:
+                vertexProgress = progress.stage( 'Converting vertices', len( mesh.positions ) )
+                for i in range(0, len(mesh.positions)):
+                    vertexProgress.update( i )
                 
-                vtx: imVertex = mesh.vertexFormat.vertexType()                
-                vtx.position = mesh.positions[i]
-                vtx.normal = mesh.normals[i]  
-                vtx.occlusion = 1
+                    vtx: imVertex = mesh.vertexFormat.vertexType()                
+                    vtx.position = mesh.positions[i]
+                    vtx.normal = mesh.normals[i]  
+                    vtx.occlusion = 1
                 
-                if mesh.hasUvs():
-                    vtx.tangent = mesh.tangents[i]  
-                    vtx.uvPrimary = mesh.uvPrimary[i]
+                    if mesh.hasUvs():
+                        vtx.tangent = mesh.tangents[i]  
+                        vtx.uvPrimary = mesh.uvPrimary[i]
                     
-                    # assign other uv channels to primary if they're not assigned
-                    vtx.uvSecondary = mesh.uvSecondary[i] if mesh.uvSecondary is not None and len(mesh.uvSecondary) > i else vtx.uvPrimary
-                    vtx.uvUnique = mesh.uvUnique[i] if mesh.uvUnique is not None and len(mesh.uvUnique) > i else vtx.uvPrimary
-                    vtx.uvExtend = mesh.uvExtend[i] if mesh.uvExtend is not None and len(mesh.uvExtend) > i else vtx.uvPrimary
+                        # assign other uv channels to primary if they're not assigned
+                        vtx.uvSecondary = mesh.uvSecondary[i] if mesh.uvSecondary is not None and len(mesh.uvSecondary) > i else vtx.uvPrimary
+                        vtx.uvUnique = mesh.uvUnique[i] if mesh.uvUnique is not None and len(mesh.uvUnique) > i else vtx.uvPrimary
+                        vtx.uvExtend = mesh.uvExtend[i] if mesh.uvExtend is not None and len(mesh.uvExtend) > i else vtx.uvPrimary
                 
-                if vtx.MAX_WEIGHT_COUNT == 0:
-                    pass
-                elif vtx.MAX_WEIGHT_COUNT == 1:
-                    # HACK assume that when the vertex has no indices but is assigned a vertex format with 1 weight, that it's an unrigged mesh
-                    # for a skeleton mesh model
-                    if not mesh.isSkinned() or len( mesh.weights[i].indices ) == 0:
-                        jointIndex = 0
-                    else:
-                        jointIndex = mesh.weights[ i ].indices[ 0 ]
-
-                    vtx.jointId = jointIndex
-                else:            
-                    lastJointId = 0
-                    weightSum = 0
-                    usedBoneCount = 0
-                    for j in range( 0, vtx.MAX_WEIGHT_COUNT ):
-                        if j >= len( mesh.weights[ i ].weights ):
-                            # vanilla models repeat the last joint id with a weight of 0
-                            vtx.jointIds[ j ] = lastJointId
-                            vtx.weights[ j ] = 0
-                            continue
+                    if vtx.MAX_WEIGHT_COUNT == 0:
+                        pass
+                    elif vtx.MAX_WEIGHT_COUNT == 1:
+                        # HACK assume that when the vertex has no indices but is assigned a vertex format with 1 weight, that it's an unrigged mesh
+                        # for a skeleton mesh model
+                        if not mesh.isSkinned() or len( mesh.weights[i].indices ) == 0:
+                            jointIndex = 0
+                        else:
+                            jointIndex = mesh.weights[ i ].indices[ 0 ]
+
+                        vtx.jointId = jointIndex
+                    else:            
+                        lastJointId = 0
+                        weightSum = 0
+                        usedBoneCount = 0
+                        for j in range( 0, vtx.MAX_WEIGHT_COUNT ):
+                            if j >= len( mesh.weights[ i ].weights ):
+                                # vanilla models repeat the last joint id with a weight of 0
+                                vtx.jointIds[ j ] = lastJointId
+                                vtx.weights[ j ] = 0
+                                continue
                         
-                        weight = mesh.weights[ i ].weights[ j ]
-                        if weight < 0.001:
-                            # remove very small weights
-                            weight = 0
+                            weight = mesh.weights[ i ].weights[ j ]
+                            if weight < 0.001:
+                                # remove very small weights
+                                weight = 0
                         
-                        jointIndex = mesh.weights[ i ].indices[ j ]
-                        joint = mod.joints[ jointIndex ]
-                        boneId = jointIndex
+                            jointIndex = mesh.weights[ i ].indices[ j ]
+                            joint = mod.joints[ jointIndex ]
+                            boneId = jointIndex
                         
-                        vtx.weights[ j ] = weight
-                        weightSum += weight
+                            vtx.weights[ j ] = weight
+                            weightSum += weight
                         
-                        vtx.jointIds[ j ] = boneId
-                        lastJointId = boneId
+                            vtx.jointIds[ j ] = boneId
+                            lastJointId = boneId
                         
-                        if weight > 0.001:
-                            usedBoneCount += 1
+                            if weight > 0.001:
+                                usedBoneCount += 1
                         
-                    assert usedBoneCount > 0, 'mesh {} has unrigged vertex at index {}'.format(mesh.name, i)
+                        assert usedBoneCount > 0, 'mesh {} has unrigged vertex at index {}'.format(mesh.name, i)
 
-                    # adjust for floating point error by averaging out the weights
-                    weightError = 1 - weightSum
-                    weightAvgStep = weightError / usedBoneCount
-                    for j in range( usedBoneCount ):
-                        vtx.weights[ j ] += weightAvgStep
+                        # adjust for floating point error by averaging out the weights
+                        weightError = 1 - weightSum
+                        weightAvgStep = weightError / usedBoneCount
+                        for j in range( usedBoneCount ):
+                            vtx.weights[ j ] += weightAvgStep
                 
-                vertices.append( vtx )
+                    vertices.append( vtx )
+                vertexProgress.done()
                 
             # convert indices
-            for i in range(0, len( mesh.indices ) ):
-                if progressCb != None: progressCb( 'Converting face indices', i, len( mesh.indices ) )
-                indices.append( mesh.indices[ i ] )
+            indices.extend( mesh.indices )
                 
             # create primitive
             prim = rModelPrimitive()
@@ -1228,8 +1448,9 @@ class imModel:
             
             nextVertexOffset += prim.vertexCount * prim.vertexStride
             nextTriangleIndex += prim.indexCount 
+        progress.done()
         
-        bounds = modelutil.calcBounds( x.position for x in vertices )
+        bounds = modelutil.calcBounds( itertools.chain.from_iterable( x.positions for x in self.primitives ) )
         
         if len( self.joints ) > 0:
             # compress vertices
@@ -1247,12 +1468,14 @@ class imModel:
                 modelMtx = nclCreateMat44(modelMtx)
                 
                 # calculate joint inverse bind matrices
+                progress = beginProgress( progressCb, 'Calculating inverse bind matrices', len( self.joints ) )
                 for i, joint in enumerate( self.joints ):
-                    if progressCb != None: progressCb( 'Calculating inverse bind matrices', i, len( self.joints ) )   
+                    progress.update( i )
                     # apply model matrix to world transform of each joint
                     invBindMtx = nclInverse( nclMultiply( joint.getWorldMtx(), modelMtx ) )
                     finalInvBindMtx = nclCreateMat44( invBindMtx )
                     mod.jointInvBindMtx.append( finalInvBindMtx )
+                progress.done()
             else:
                 # extract the model matrix from the inverse bind matrix of the root bone
                 modelMtx = nclInverse( mod.jointInvBindMtx[0] )
@@ -1260,32 +1483,49 @@ class imModel:
             # normalize vertices
             modelMtxNormal = nclTranspose( nclInverse( modelMtx ) )
             
+            progress = beginProgress( progressCb, 'Compressing vertices', len( vertexColumns ) + len( vertices ) )
+            for i, columns in enumerate( vertexColumns ):
+                progress.update( i )
+                columns[ 'position' ] = _transformPointArray( columns[ 'position' ], modelMtx )
+                columns[ 'normal' ] = _normalizeArray( _transformPointArray( columns[ 'normal' ], modelMtxNormal ) )
+            
             for i, v in enumerate( vertices ):
-                if progressCb != None: progressCb( 'Compressing vertices', i, len( vertices ) )
+                progress.update( i )
                 v.position = nclTransform( v.position, modelMtx )
                 v.normal = nclNormalize( nclTransform( v.normal, modelMtxNormal ) )
+            progress.done()
         
         # create buffers
-        vertexBufferStream = NclBitStream()
-        for i, v in enumerate( vertices ):
-            if progressCb != None: progressCb( 'Writing vertices', i, len( vertices ) )
-            start = vertexBufferStream.getOffset()
-            v.write( vertexBufferStream )
-            realStride = vertexBufferStream.getOffset() - start
-            assert( realStride == v.STRIDE )
-        mod.vertexBuffer = vertexBufferStream.getBuffer()
+        if libtarget.numpy:
+            progress = beginProgress( progressCb, 'Writing vertices', len( vertexColumns ) )
+            vertexBuffer = bytearray()
+            for i, ( mesh, columns ) in enumerate( zip( self.primitives, vertexColumns ) ):
+                progress.update( i )
+                vertexType = mesh.vertexFormat.vertexType
+                vertexBuffer += vertexcodec.encodeVertexBufferArrays( vertexType.LAYOUT, columns, len( mesh.positions ), vertexType.STRIDE )
+            mod.vertexBuffer = vertexBuffer
+        else:
+            vertexCount = len( vertices )
+            vertexBufferStream = NclBitStream()
+            progress = beginProgress( progressCb, 'Writing vertices', len( vertices ) )
+            for i, v in enumerate( vertices ):
+                progress.update( i )
+                start = vertexBufferStream.getOffset()
+                v.write( vertexBufferStream )
+                realStride = vertexBufferStream.getOffset() - start
+                assert( realStride == v.STRIDE )
+            mod.vertexBuffer = vertexBufferStream.getBuffer()
+        progress.done()
             
-        indexBufferStream = NclBitStream()
-        for i in indices:
-            if progressCb != None: progressCb( 'Writing indices', i, len( indices ) )
-            indexBufferStream.writeUShort( i )
-        mod.indexBuffer = indexBufferStream.getBuffer()
+        progress = beginProgress( progressCb, 'Writing indices' )
+        mod.indexBuffer = indexArrayToBuffer( indices )
+        progress.done()
             
         # fill out header
         mod.header.jointCount = len( mod.joints )
         mod.header.primitiveCount = len( mod.primitives )
         mod.header.materialCount = len( mod.materials )
-        mod.header.vertexCount = len( vertices )
+        mod.header.vertexCount = vertexCount
         mod.header.indexCount = len( indices )
         mod.header.polygonCount = mod.header.indexCount // 3
         mod.header.vertexBufferSize = len( mod.vertexBuffer )
@@ -7,16 +7,10 @@ import os
 from rmodel import *
 import util
 from ncl import *
-
-try:
-    import ruamel.yaml as yaml
-except:
-    import yaml
+import yamlutil
 
 def _setYamlFlowStyle(x):
-    retval = yaml.comments.CommentedSeq(x)
-    retval.fa.set_flow_style()  # fa -> format attribute
-    return retval
+    return yamlutil.setFlowStyle( x )
 
 class JointMetadata:
     DEFAULT_NAME_PREFIX = "jnt_"
@@ -216,12 +210,13 @@ class ModelMetadata:
             for entry in it:
                 if entry.name.endswith(".mod") and entry.is_file():
                     basePath, baseName, exts = util.splitPath( entry.name )
-                    modBuffer = util.loadIntoByteArray( entry.path )
-                    mod = rModelData()
-                    mod.read( NclBitStream( modBuffer ) )
-                    
                     metadata = ModelMetadata()
-                    metadata.initFromBinary( baseName, mod, refMetadata )
+                    with util.mapReadOnlyStream( entry.path ) as stream:
+                        mod = rModelData()
+                        mod.read( stream )
+                        metadata.initFromBinary( baseName, mod, refMetadata )
+                        # drop the buffer views before the mapping is closed
+                        del mod
                     metadata.saveFile( ModelMetadata.getDefaultFilePath( baseName ) )
         
     def initFromBinary( self, name, modelData, refMetadata ):
@@ -317,11 +312,7 @@ class ModelMetadata:
         self._sort()
         
     def loadFile( self, path ):
-        yamlText = ''
-        with open( path, 'r' ) as f:
-            yamlText = f.read()
-        
-        yamlObj = yaml.safe_load( yamlText )
+        yamlObj = yamlutil.loadFile( path )
         if yamlObj is None:
             # empty file
             return
@@ -385,20 +376,13 @@ class ModelMetadata:
             self._copyAttributesExcept( prim, yPrim, [] )
             primitives.append( yPrim )
         
-        with open( path, 'w' ) as f:
-            yamlObj = dict()
-            yamlObj['version'] = self.CURRENT_VERSION
-            yamlObj['name'] = self.name
-            yamlObj['joints'] = self._createComplexMapping( joints )
-            yamlObj['groups'] = self._createComplexMapping( groups )
-            yamlObj['primitives'] = self._createComplexMapping( primitives )
-            
-            try:
-                yamlInst = yaml.YAML()
-                yamlInst.width = 1024
-                yamlInst.dump( yamlObj, f )
-            except Exception as e:
-                f.write( yaml.dump( yamlObj ) )
+        yamlObj = dict()
+        yamlObj['version'] = self.CURRENT_VERSION
+        yamlObj['name'] = self.name
+        yamlObj['joints'] = self._createComplexMapping( joints )
+        yamlObj['groups'] = self._createComplexMapping( groups )
+        yamlObj['primitives'] = self._createComplexMapping( primitives )
+        yamlutil.dumpFile( path, yamlObj, width=1024 )
         
     def getJointById( self, jointId ):
         return self._getObjectById( self.jointLookupById, jointId )
@@ -3,6 +3,13 @@ Various model-related utility functions.
 '''
 
 from ncl import *
+import itertools
+import math
+import libtarget
+from progress import beginProgress
+
+if libtarget.numpy:
+    import numpy as np
 
 class imModelBounds:
     def __init__( self ):
@@ -69,4 +76,543 @@ def calcBounds( vertices ) -> imModelBounds:
     b.radius = radius
     b.vminpoint = vminpoint
     b.vmaxpoint = vmaxpoint
-    return b
\ No newline at end of file
+    return b
+
+def vectorsToArray( vectors, componentCount, dtype=None ):
+    '''Converts a list of vectors to a numpy array of shape ( len( vectors ), componentCount )'''
+    return np.fromiter( itertools.chain.from_iterable( vectors ), dtype=np.float64 if dtype is None else dtype, 
+                        count=len( vectors ) * componentCount ).reshape( len( vectors ), componentCount )
+
+def raggedToArray( sequences, dtype ):
+    '''Converts a list of variable length sequences to a zero padded numpy array, and an array of their lengths'''
+    lengths = np.fromiter( ( len( x ) for x in sequences ), dtype=np.int64, count=len( sequences ) )
+    width = int( lengths.max() ) if len( sequences ) > 0 else 0
+    result = np.zeros( ( len( sequences ), width ), dtype=dtype )
+    values = np.fromiter( itertools.chain.from_iterable( sequences ), dtype=dtype, count=int( lengths.sum() ) )
+    rows = np.repeat( np.arange( len( sequences ) ), lengths )
+    cols = np.arange( len( values ) ) - np.repeat( np.cumsum( lengths ) - lengths, lengths )
+    result[ rows, cols ] = values
+    return result, lengths
+
+def weldVertices( columns ):
+    '''
+    Finds duplicate vertices by packing the attribute columns of each vertex into a fixed-width byte key.
+    The columns are numpy arrays with one row per vertex. Values compare like they do in Python:
+    -0.0 equals 0.0, and vertices containing NaN are never welded.
+    Returns ( unique, indices ), where unique holds the index of the first occurrence of each distinct vertex 
+    in order of appearance, and indices maps each vertex to its position in unique.
+    '''
+    count = len( columns[0] )
+    if count == 0:
+        return ( np.zeros( 0, dtype=np.int64 ), np.zeros( 0, dtype=np.int64 ) )
+    
+    parts = []
+    hasNaN = np.zeros( count, dtype=bool )
+    for column in columns:
+        column = np.asarray( column ).reshape( count, -1 )
+        if column.dtype.kind == 'f':
+            column = column.astype( np.float64 ) + 0.0
+            hasNaN |= np.isnan( column ).any( axis=1 )
+        else:
+            column = column.astype( np.int64 )
+        parts.append( column.view( np.uint8 ).reshape( count, -1 ) )
+        
+    # give every vertex with a NaN in it a key of its own
+    parts.append( np.where( hasNaN, np.arange( count ), -1 ).astype( np.int64 ).view( np.uint8 ).reshape( count, -1 ) )
+    
+    keys = np.ascontiguousarray( np.concatenate( parts, axis=1 ) )
+    keys = keys.view( np.dtype( ( np.void, keys.shape[1] ) ) ).ravel()
+    _, first, inverse = np.unique( keys, return_index=True, return_inverse=True )
+    
+    # np.unique sorts by key, restore the order of appearance
+    order = np.argsort( first, kind='stable' )
+    remap = np.empty_like( order )
+    remap[ order ] = np.arange( len( order ) )
+    return ( first[ order ], remap[ inverse.ravel() ] )
+
+class PointGrid:
+    '''
+    Uniform grid over a set of 3d points for nearest neighbour queries. Points are added to the grid explicitly,
+    so the searchable set can grow while querying. Works on plain tuples when numpy is not available.
+    '''
+    def __init__( self, points ):
+        self.cells = dict()
+        if libtarget.numpy:
+            self.points = np.asarray( points, dtype=np.float32 ).reshape( -1, 3 )
+            finite = self.points[ np.isfinite( self.points ).all( axis=1 ) ]
+            if len( finite ) > 0:
+                self.origin = finite.min( axis=0 )
+                extent = float( ( finite.max( axis=0 ) - self.origin ).max() )
+            else:
+                self.origin = np.zeros( 3, dtype=np.float32 )
+        else:
+            self.points = [ ( float( p[0] ), float( p[1] ), float( p[2] ) ) for p in points ]
+            finite = [ p for p in self.points if all( math.isfinite( x ) for x in p ) ]
+            if len( finite ) > 0:
+                self.origin = tuple( min( p[i] for p in finite ) for i in range( 3 ) )
+                extent = max( max( p[i] for p in finite ) - self.origin[i] for i in range( 3 ) )
+            else:
+                self.origin = ( 0.0, 0.0, 0.0 )
+        
+        if len( finite ) > 0:
+            self.cellSize = max( extent / max( 1, int( round( len( finite ) ** ( 1 / 3 ) ) ) ), 1e-6 )
+        else:
+            self.cellSize = 1.0
+        self.minCell = None
+        self.maxCell = None
+            
+    def _getCell( self, point ):
+        if libtarget.numpy:
+            return tuple( int( x ) for x in np.floor( ( point - self.origin ) / self.cellSize ) )
+        return tuple( math.floor( ( point[i] - self.origin[i] ) / self.cellSize ) for i in range( 3 ) )
+    
+    def _addCells( self, cells, indices ):
+        for cell, index in zip( cells, indices ):
+            if cell in self.cells:
+                self.cells[ cell ].append( index )
+            else:
+                self.cells[ cell ] = [ index ]
+    
+    def add( self, indices ):
+        '''Adds the points with the given indices to the grid, skipping those that aren't finite'''
+        if libtarget.numpy:
+            indices = np.asarray( indices, dtype=np.int64 ).reshape( -1 )
+            indices = indices[ np.isfinite( self.points[ indices ] ).all( axis=1 ) ]
+            if len( indices ) == 0:
+                return
+            
+            cells = np.floor( ( self.points[ indices ] - self.origin ) / self.cellSize ).astype( np.int64 )
+            self._addCells( map( tuple, cells.tolist() ), indices.tolist() )
+            cellMin = cells.min( axis=0 ).tolist()
+            cellMax = cells.max( axis=0 ).tolist()
+        else:
+            if isinstance( indices, int ):
+                indices = ( indices, )
+            indices = [ i for i in indices if all( math.isfinite( x ) for x in self.points[ i ] ) ]
+            if len( indices ) == 0:
+                return
+            
+            cells = [ self._getCell( self.points[ i ] ) for i in indices ]
+            self._addCells( cells, indices )
+            cellMin = [ min( cell[i] for cell in cells ) for i in range( 3 ) ]
+            cellMax = [ max( cell[i] for cell in cells ) for i in range( 3 ) ]
+        
+        if self.minCell is None:
+            self.minCell = tuple( cellMin )
+            self.maxCell = tuple( cellMax )
+        else:
+            self.minCell = tuple( min( a, b ) for a, b in zip( self.minCell, cellMin ) )
+            self.maxCell = tuple( max( a, b ) for a, b in zip( self.maxCell, cellMax ) )
+            
+    def _iterShell( self, center, radius ):
+        cx, cy, cz = center
+        for x in range( cx - radius, cx + radius + 1 ):
+            for y in range( cy - radius, cy + radius + 1 ):
+                if abs( x - cx ) == radius or abs( y - cy ) == radius:
+                    zRange = range( cz - radius, cz + radius + 1 )
+                else:
+                    zRange = ( cz - radius, cz + radius ) if radius > 0 else ( cz, )
+                for z in zRange:
+                    cell = self.cells.get( ( x, y, z ) )
+                    if cell is not None:
+                        yield cell
+            
+    def findNearest( self, point, exclude=-1 ):
+        '''
+        Returns the index of the nearest added point, preferring the highest index when distances are equal, or -1 if there is none.
+        Distances are computed in single precision when numpy is available.
+        '''
+        if libtarget.numpy:
+            point = np.asarray( point, dtype=np.float32 )
+            isFinite = np.isfinite( point ).all()
+        else:
+            point = ( float( point[0] ), float( point[1] ), float( point[2] ) )
+            isFinite = all( math.isfinite( x ) for x in point )
+        if len( self.cells ) == 0 or not isFinite:
+            return -1
+        
+        center = self._getCell( point )
+        maxRadius = max( max( abs( c - l ), abs( h - c ) ) for c, l, h in zip( center, self.minCell, self.maxCell ) )
+        nearestIndex = -1
+        nearestDistance = float( '+inf' )
+        for radius in range( 0, maxRadius + 1 ):
+            for cell in self._iterShell( center, radius ):
+                for index in cell:
+                    if index == exclude:
+                        continue
+                    other = self.points[ index ]
+                    dx = point[0] - other[0]
+                    dy = point[1] - other[1]
+                    dz = point[2] - other[2]
+                    distance = ( dx * dx + dy * dy ) + dz * dz
+                    if distance < nearestDistance or ( distance == nearestDistance and index > nearestIndex ):
+                        nearestIndex = index
+                        nearestDistance = distance
+                        
+            # every point beyond this shell is at least radius cells away
+            reach = radius * self.cellSize
+            if libtarget.numpy:
+                reach = np.float32( reach )
+            if nearestIndex != -1 and nearestDistance < reach * reach:
+                break
+            
+        return nearestIndex
+
+def calcTangents( positions, normals, uvs, indices ):
+    '''
+    Calculates per vertex tangents from triangle lists, with the bitangent sign stored in w.
+    Tangents are accumulated per welded vertex, ie. vertices with the same position, normal and uv get the same tangent,
+    so they can still be merged when the primitive is indexed.
+    Vertices that end up without a valid tangent take the tangent of the nearest vertex that has one.
+    Returns a float32 array of shape ( vertexCount, 4 ).
+    '''
+    positions = np.asarray( positions, dtype=np.float64 ).reshape( -1, 3 )
+    normals = np.asarray( normals, dtype=np.float64 ).reshape( -1, 3 )
+    uvs = np.asarray( uvs, dtype=np.float64 ).reshape( -1, 2 )
+    indices = np.asarray( indices, dtype=np.int64 )
+    indices = indices[ 0 : len( indices ) - ( len( indices ) % 3 ) ].reshape( -1, 3 )
+    
+    # weld the vertices and work on the welded ones, in the order they first appear in
+    weldedVertices, firstIndices, weldIndices = np.unique( np.concatenate( ( positions, normals, uvs ), axis=1 ), axis=0, 
+                                                           return_index=True, return_inverse=True )
+    order = np.argsort( firstIndices )
+    weldedVertices = weldedVertices[ order ]
+    rank = np.empty_like( order )
+    rank[ order ] = np.arange( len( order ) )
+    weldIndices = rank[ weldIndices.reshape( -1 ) ]
+    positions = weldedVertices[:, 0:3]
+    normals = weldedVertices[:, 3:6]
+    uvs = weldedVertices[:, 6:8]
+    indices = weldIndices[ indices ]
+    a = indices[:, 0]
+    b = indices[:, 1]
+    c = indices[:, 2]
+    
+    positionA = positions[ c ] - positions[ a ]
+    positionB = positions[ b ] - positions[ a ]
+    texCoordA = uvs[ c ] - uvs[ a ]
+    texCoordB = uvs[ b ] - uvs[ a ]
+    
+    direction = texCoordA[:, 0] * texCoordB[:, 1] - texCoordA[:, 1] * np.where( texCoordB[:, 0] > 0.0, 1.0, -1.0 )
+    #EDIT
+    direction *= -1
+    
+    tangent = ( positionA * texCoordB[:, 1:2] - positionB * texCoordA[:, 1:2] ) * direction[:, np.newaxis]
+    bitangent = ( positionB * texCoordA[:, 0:1] - positionA * texCoordB[:, 0:1] ) * direction[:, np.newaxis]
+    
+    tangents = np.zeros( ( len( positions ), 3 ) )
+    bitangents = np.zeros( ( len( positions ), 3 ) )
+    for corner in ( a, b, c ):
+        np.add.at( tangents, corner, tangent )
+        np.add.at( bitangents, corner, bitangent )
+    
+    with np.errstate( divide='ignore', invalid='ignore' ):
+        def _normalize( v ):
+            return v / np.sqrt( ( v * v ).sum( axis=1 ) )[:, np.newaxis]
+        
+        def _dot( l, r ):
+            return ( l * r ).sum( axis=1 )[:, np.newaxis]
+        
+        tangents = _normalize( tangents )
+        bitangents = _normalize( bitangents )
+        tangents = _normalize( tangents - normals * _dot( tangents, normals ) )
+        bitangents = _normalize( bitangents - normals * _dot( bitangents, normals ) )
+        directionCheck = _dot( _normalize( np.cross( normals, tangents ) ), bitangents )[:, 0]
+        
+    result = np.zeros( ( len( positions ), 4 ), dtype=np.float32 )
+    result[:, 0:3] = tangents
+    result[:, 3] = np.where( directionCheck > 0.0, 1.0, -1.0 )
+    
+    # resolve NaNs using the nearest vertex with a valid tangent, including those resolved before it
+    invalid = np.isnan( result[:, 0:3] ).any( axis=1 )
+    if invalid.any() and not invalid.all():
+        grid = PointGrid( positions )
+        grid.add( np.nonzero( ~invalid )[0] )
+        for i in np.nonzero( invalid )[0]:
+            nearestVertexIndex = grid.findNearest( grid.points[ i ], exclude=i )
+            if nearestVertexIndex != -1:
+                result[ i ] = result[ nearestVertexIndex ]
+                grid.add( i )
+    
+    return result[ weldIndices ]
+
+
+STRIP_RESTART_INDEX = 0xFFFF
+
+def _findStripNeighbour( triangles, edges, visited, claimed, edge ):
+    '''Finds an unclaimed triangle containing the given directed edge and returns it with its third vertex, or (-1, None).'''
+    for candidate in edges.get( edge, () ):
+        if not visited[ candidate ] and candidate not in claimed:
+            a, b, c = triangles[ candidate ]
+            if ( a, b ) == edge: return candidate, c
+            elif ( b, c ) == edge: return candidate, a
+            else: return candidate, b
+    return -1, None
+
+def _walkStrip( triangles, edges, visited, start, rotation ):
+    '''
+    Walks a strip in both directions from the given start triangle rotation and returns its triangle and vertex 
+    lists without claiming them. The first triangle of the returned strip always has the original winding.
+    '''
+    tri = triangles[ start ]
+    strip = [ tri[ rotation ], tri[ ( rotation + 1 ) % 3 ], tri[ ( rotation + 2 ) % 3 ] ]
+    stripTriangles = [ start ]
+    claimed = { start }
+    while True:
+        # even triangles continue across x->y, odd ones across y->x to keep the winding
+        x = strip[ -2 ]
+        y = strip[ -1 ]
+        edge = ( x, y ) if len( stripTriangles ) % 2 == 0 else ( y, x )
+        nextTriangle, vertex = _findStripNeighbour( triangles, edges, visited, claimed, edge )
+        if nextTriangle == -1:
+            break
+        
+        strip.append( vertex )
+        stripTriangles.append( nextTriangle )
+        claimed.add( nextTriangle )
+        
+    # extend backwards, every prepended triangle flips the parity of the ones after it
+    backward = []
+    backwardTriangles = []
+    first = ( strip[ 0 ], strip[ 1 ] )
+    flipped = False
+    while True:
+        x, y = first
+        edge = ( x, y ) if flipped else ( y, x )
+        prevTriangle, vertex = _findStripNeighbour( triangles, edges, visited, claimed, edge )
+        if prevTriangle == -1:
+            break
+        
+        backward.append( vertex )
+        backwardTriangles.append( prevTriangle )
+        claimed.add( prevTriangle )
+        first = ( vertex, x )
+        flipped = not flipped
+        
+    backward.reverse()
+    backwardTriangles.reverse()
+    strip = backward + strip
+    stripTriangles = backwardTriangles + stripTriangles
+    if flipped:
+        # the strip starts at odd parity. reversing a strip with an odd triangle count flips the parity 
+        # of every triangle, otherwise the first triangle is dropped and left for another strip
+        if len( stripTriangles ) % 2 == 1:
+            strip.reverse()
+            stripTriangles.reverse()
+        else:
+            strip.pop( 0 )
+            stripTriangles.pop( 0 )
+    return stripTriangles, strip
+
+def stripifyTriangles( indices, progressCb=None ):
+    '''
+    Converts a triangle list into triangle strips using a greedy walk over the edge adjacency of the whole primitive.
+    Each strip is grown in both directions from its start triangle for as long as a neighbour with matching winding exists.
+    New strips start at the least connected unvisited neighbour of the previous strip so strips stay local to the
+    vertex cache, or at the least connected unvisited triangle if there is none. 
+    Returns a list of strips, each a list of vertex indices.
+    '''
+    triangleCount = len( indices ) // 3
+    triangles = [ ( indices[i], indices[i+1], indices[i+2] ) for i in range( 0, triangleCount * 3, 3 ) ]
+    visited = [ False ] * triangleCount
+    strips = []
+    
+    progress = beginProgress( progressCb, 'Generating triangle strips', triangleCount )
+    
+    # directed edge -> triangles
+    edges = {}
+    for i, ( a, b, c ) in enumerate( triangles ):
+        for edge in ( ( a, b ), ( b, c ), ( c, a ) ):
+            edges.setdefault( edge, [] ).append( i )
+    
+    def iterNeighbours( i ):
+        a, b, c = triangles[ i ]
+        for edge in ( ( b, a ), ( c, b ), ( a, c ) ):
+            yield from edges.get( edge, () )
+    
+    def neighbourCount( i ):
+        count = 0
+        for neighbour in iterNeighbours( i ):
+            if not visited[ neighbour ]:
+                count += 1
+        return count
+    
+    # start strips at the triangles with the fewest neighbours first, as those are the easiest to leave behind
+    starts = sorted( range( triangleCount ), key=neighbourCount )
+    startIndex = 0
+    stripTriangles = []
+    visitedCount = 0
+    while visitedCount < triangleCount:
+        progress.update( visitedCount )
+        start = -1
+        startNeighbourCount = 0
+        for i in stripTriangles:
+            for neighbour in iterNeighbours( i ):
+                if not visited[ neighbour ]:
+                    count = neighbourCount( neighbour )
+                    if start == -1 or count < startNeighbourCount:
+                        start = neighbour
+                        startNeighbourCount = count
+        
+        if start == -1:
+            while visited[ starts[ startIndex ] ]:
+                startIndex += 1
+            start = starts[ startIndex ]
+        
+        best = None
+        for rotation in range( 3 ):
+            candidate = _walkStrip( triangles, edges, visited, start, rotation )
+            if best == None or len( candidate[0] ) > len( best[0] ):
+                best = candidate
+                
+        stripTriangles, strip = best
+        for i in stripTriangles:
+            visited[ i ] = True
+        visitedCount += len( stripTriangles )
+        strips.append( strip )
+            
+    progress.done()
+    return strips
+
+def joinTriStrips( strips ):
+    '''Joins triangle strips into a single index list using primitive restart.'''
+    indices = []
+    for strip in strips:
+        if len( indices ) > 0:
+            indices.append( STRIP_RESTART_INDEX )
+        indices.extend( strip )
+    return indices
+
+VERTEX_CACHE_SIZE = 24
+FORSYTH_CACHE_SIZE = 32
+FORSYTH_CACHE_DECAY_POWER = 1.5
+FORSYTH_LAST_TRI_SCORE = 0.75
+FORSYTH_VALENCE_BOOST_SCALE = 2.0
+FORSYTH_VALENCE_BOOST_POWER = 0.5
+
+def calcACMR( indices, cacheSize=VERTEX_CACHE_SIZE ):
+    '''
+    Calculates the average cache miss ratio (vertex shader invocations per triangle) of a triangle list or 
+    restart separated triangle strips, simulating a FIFO post-transform vertex cache of the given size.
+    '''
+    cache = set()
+    fifo = [ -1 ] * cacheSize
+    fifoIndex = 0
+    misses = 0
+    triangleCount = 0
+    stripLength = 0
+    isStrip = STRIP_RESTART_INDEX in indices
+    for index in indices:
+        if index == STRIP_RESTART_INDEX:
+            stripLength = 0
+            continue
+        
+        stripLength += 1
+        if not isStrip or stripLength >= 3:
+            triangleCount += 1
+        if index not in cache:
+            misses += 1
+            cache.discard( fifo[ fifoIndex ] )
+            cache.add( index )
+            fifo[ fifoIndex ] = index
+            fifoIndex = ( fifoIndex + 1 ) % cacheSize
+            
+    if not isStrip:
+        triangleCount //= 3
+    return misses / triangleCount if triangleCount > 0 else 0.0
+
+def optimizeVertexCache( indices, vertexCount, progressCb=None ):
+    '''
+    Reorders the triangles of a triangle list for post-transform vertex cache efficiency using
+    Tom Forsyth's linear-speed vertex cache optimization. Returns the reordered index list.
+    '''
+    triangleCount = len( indices ) // 3
+    if triangleCount == 0:
+        return list( indices )
+    
+    cacheScores = []
+    for i in range( FORSYTH_CACHE_SIZE ):
+        if i < 3:
+            cacheScores.append( FORSYTH_LAST_TRI_SCORE )
+        else:
+            cacheScores.append( ( 1.0 - ( i - 3 ) / ( FORSYTH_CACHE_SIZE - 3 ) ) ** FORSYTH_CACHE_DECAY_POWER )
+            
+    def vertexScore( cachePosition, valence ):
+        if valence == 0:
+            return -1.0
+        score = cacheScores[ cachePosition ] if cachePosition >= 0 else 0.0
+        return score + FORSYTH_VALENCE_BOOST_SCALE * ( valence ** -FORSYTH_VALENCE_BOOST_POWER )
+    
+    vertexTriangles = [ [] for i in range( vertexCount ) ]
+    for i in range( triangleCount ):
+        for j in range( i * 3, i * 3 + 3 ):
+            vertexTriangles[ indices[ j ] ].append( i )
+            
+    vertexScores = [ vertexScore( -1, len( triangles ) ) for triangles in vertexTriangles ]
+    triangleScores = [ vertexScores[ indices[ i * 3 ] ] + vertexScores[ indices[ i * 3 + 1 ] ] + vertexScores[ indices[ i * 3 + 2 ] ]
+        for i in range( triangleCount ) ]
+    triangleAdded = [ False ] * triangleCount
+    cache = []
+    result = []
+    
+    bestTriangle = max( range( triangleCount ), key=triangleScores.__getitem__ )
+    nextUnadded = 0
+    progress = beginProgress( progressCb, 'Optimizing vertex cache', len( indices ) )
+    while bestTriangle != -1:
+        progress.update( len( result ) )
+        
+        triangle = indices[ bestTriangle * 3 : bestTriangle * 3 + 3 ]
+        triangleAdded[ bestTriangle ] = True
+        result.extend( triangle )
+        # move the triangle vertices to the front of the LRU cache
+        for vertex in triangle:
+            triangles = vertexTriangles[ vertex ]
+            if bestTriangle in triangles:
+                triangles.remove( bestTriangle )
+        newCache = list( dict.fromkeys( triangle ) )
+        newCache.extend( v for v in cache if v not in newCache )
+        
+        # update the scores of everything in or evicted from the cache, and find the best next triangle
+        bestTriangle = -1
+        bestScore = -1.0
+        for position, vertex in enumerate( newCache ):
+            score = vertexScore( position if position < FORSYTH_CACHE_SIZE else -1, len( vertexTriangles[ vertex ] ) )
+            delta = score - vertexScores[ vertex ]
+            vertexScores[ vertex ] = score
+            for other in vertexTriangles[ vertex ]:
+                triangleScores[ other ] += delta
+                
+        for vertex in newCache[ 0 : FORSYTH_CACHE_SIZE ]:
+            for other in vertexTriangles[ vertex ]:
+                if triangleScores[ other ] > bestScore:
+                    bestScore = triangleScores[ other ]
+                    bestTriangle = other
+        cache = newCache[ 0 : FORSYTH_CACHE_SIZE ]
+                    
+        if bestTriangle == -1:
+            # dead end, continue with the next triangle in input order
+            while nextUnadded < triangleCount and triangleAdded[ nextUnadded ]:
+                nextUnadded += 1
+            if nextUnadded < triangleCount:
+                bestTriangle = nextUnadded
+                
+    progress.done()
+    return result
+
+def optimizeVertexFetch( indices, vertexCount ):
+    '''
+    Orders vertices by their first use in the index list so vertex fetches are as sequential as possible.
+    Unreferenced vertices are moved to the end. Returns the remapped index list and the new vertex order, 
+    as a list of old vertex indices.
+    '''
+    remap = [ -1 ] * vertexCount
+    order = []
+    for index in indices:
+        if index != STRIP_RESTART_INDEX and remap[ index ] == -1:
+            remap[ index ] = len( order )
+            order.append( index )
+    for index in range( vertexCount ):
+        if remap[ index ] == -1:
+            remap[ index ] = len( order )
+            order.append( index )
+    return [ remap[ index ] if index != STRIP_RESTART_INDEX else index for index in indices ], order
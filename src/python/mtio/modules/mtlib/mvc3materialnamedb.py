@@ -1,240 +1,110 @@
 '''
-Module containing the default set of UMVC3 material names used to resolve their name given only a hash (as stored in MRL).
+Module containing the set of UMVC3 material names used to resolve their name given only a hash (as stored in MRL).
+
+The default names dumped from the game ship with their hashes precomputed in res/mvc3materialnames.txt.
+Names seen in loaded models are learned, and when a user index file is set they are appended to it
+so that they can be resolved in later sessions as well. Both files store one '<hash> <name>' entry per line.
 '''
 
+import os
 import util
 
-# dumped from UMVC3 PC
-_defaultNames = [
-    'XfB_N__E_m01_7',
-    'XfB_N__E_A0__m01_',
-    'XfBAN__E0__m00_7',
-    'XfBA_E0__m04_',
-    'XfB_N__E_m00_24',
-    'XfB_N__E_m00_22',
-    'XfB_N__E_m04_1',
-    'XfB_N__E_m00_3',
-    'XfBA_IW_02__m11_',
-    'XfB_N__E_m07_1',
-    'XfBAN__EW_0__m00_',
-    'XfB_N__E_m07_',
-    'XfB_N__E0__m00_',
-    'XfB__E_m00_9',
-    'XfBAN__E_I0__m00_',
-    'XfBAN_0__m00_2',
-    'XfB_N__m00_8',
-    'XfBA_IW_34__m04_',
-    'XfB__E_m00_',
-    'XfBA_IW_31__m31_',
-    'XfB_N__E_m10_1',
-    'XfB_N__E_m00_23',
-    'XfBAW_0__m00_',
-    'XfBAN__E0__m00_13',
-    'XfB__E_m00_4',
-    'XfB_N__m00_5',
-    'XfBA_IW_13__m22_',
-    'XfB__m01_1',
-    'XfB__E_m01_1',
-    'XfBA_EW_0__m00_1',
-    'XfB__E_m07_',
-    'XfBA_EW_0__m00_',
-    'XfBA0__m00_1',
-    'XfBAN__E0__m04_',
-    'XfBA_I0__m02_',
-    'XfB_N__E_m01_2',
-    'XfB_N__E_m00_21',
-    'XfBA_IW_03__m21_',
-    'XfBA_E0__m00_2',
-    'XfBA_IW_01__m30_',
-    'XfB__m00_1',
-    'XfB_N__E_m05_',
-    'XfB_N__E_m09_',
-    'XfB__I_m00_',
-    'XfB_N__E_m00_18',
-    'XfB_N__ED__m03_5',
-    'XfB_N__E_m00_7',
-    'XfB_N__E_m03_2',
-    'XfB_N__E_m02_4',
-    'XfB_N__m00_4',
-    'XfB_N__E_m00_26',
-    'XfB_N__ED__m03_1',
-    'XfB_N__E_m03_4',
-    'XfB_N__E_m00_12',
-    'XfB__E_m05_3',
-    'XfB_N__E_m01_3',
-    'XfB_N__E_m02_',
-    'XfBA_IW_13__m13_',
-    'XfB_N__E_m01_6',
-    'XfBA_IW_03__m03_',
-    'XfB_N__ED__m03_2',
-    'XfB_N__E_m00_1',
-    'XfB__E_m00_1',
-    'XfBA_IW_01__m01_',
-    'XfBA_IW_0__m00_',
-    'XfBAN__E0__m00_2',
-    'XfB__E_m05_1',
-    'XfB_N__E_m00_6',
-    'XfB__E_m05_7',
-    'XfBA_IW_23__m23_',
-    'XfB_N__E_A0__m00_',
-    'XfB_N__E_m08_1',
-    'XfBA0__m00_',
-    'XfBA_IW_0__m04_',
-    'XfB_N__E_m03_3',
-    'XfB__E_m00_6',
-    'XfB_N__E_m14_',
-    'XfBAN_N__E0_m01_6',
-    'XfB_N__EW__m00_',
-    'XfB_N__E_m00_25',
-    'XfBA_IW_0__m03_',
-    'XfB_N__m00_2',
-    'XfB_N__E_m00_28',
-    'XfB_N__E_m13_',
-    'XfBAN__EW_0__m02_',
-    'XfB_N__E_m00_20',
-    'XfB_N__E_m02_1',
-    'XfB__m08_',
-    'XfB_N__E_m00_16',
-    'XfBA_IW_00__m00_',
-    'XfB_N__ED__m03_',
-    'XfBA_IW_0__m06_1',
-    'XfB_N__E_m05_1',
-    'XfB_N__E_m04_',
-    'XfBAN__E1__m00_',
-    'XfB_W__m00_',
-    'XfBA_I0__m00_1',
-    'XfB_N__E_m01_4',
-    'XfBAN_0__m00_1',
-    'Scene_Material',
-    'XfB__m02',
-    'XfB__E_m04_',
-    'XfB_N__E_m01_5',
-    'XfB_N__E_m06_1',
-    'XfBAN_0__m00_',
-    'XfB_N__ED__m03_3',
-    'XfB__E_m00_8',
-    'XfBAN__E0__m01',
-    'XfBA0__m00_2',
-    'XfB_N__E_m00_10',
-    'XfB_N__E_A_I0__m01_1',
-    'XfB__E_m01_',
-    'XfB_N__E_m00_4',
-    'XfB_N__E0__m01_',
-    'XfB_N__E_A_I0__m01_',
-    'XfB_N__E_m00_5',
-    'XfBAN__E0__m00_1',
-    'XfB_N__E_m00_8',
-    'XfB_N__E_m02_5',
-    'XfB_N__E_m00_15',
-    'XfB_N__m00_',
-    'XfB_N__E_m00_14',
-    'XfBAN__E0__m00_4',
-    'XfBA0__m00_3',
-    'lambert1',
-    'XfBAW_0__m01_',
-    'XfB_N__E_m04_2',
-    'XfB__E_m06_2',
-    'XfB_N__E_m03_1',
-    'XfB_N__E_m00_13',
-    'XfB_N__E_m06_2',
-    'XfB_N__E_m02_3',
-    'XfB__E_m05_',
-    'XfB_N__E_m11_',
-    'XfB_N__ED__m03_6',
-    'XfBA_I00__m00_',
-    'XfB_N__E_m00_19',
-    'XfB__I_m00_6',
-    'XfB__E_m06_',
-    'XfB_N__E_m00_29',
-    'XfBAN__E0__m03_',
-    'XfBAN__E0__m00_',
-    'XfB_N__m00_6',
-    'XfBA_E0__m00_',
-    'XfB_N__m00_1',
-    'XfB__m00_4',
-    'XfBAN__E0__m06_',
-    'XfBA0__m02_',
-    'XfB_N__E_A0__m00_1',
-    'XfB_N__E_m08_',
-    'XfB__m00_3',
-    'XfBA_EW_0__m00_4',
-    'XfB_N__m02_',
-    'XfB_N__E_m01_1',
-    'XfB_N__m00_7',
-    'XfB_N__E_m00_11',
-    'XfB_N__E_m02_2',
-    'XfBAN__E0__m01_6',
-    'XfB_N__E_m01',
-    'XfB_N__E_m00_30',
-    'XfB__E_m08_1',
-    'XfB_N__E_m12_',
-    'XfB_N__E_m00_27',
-    'XfB_N__m00_3',
-    'XfB_N__ED__m03_4',
-    'XfB_N__E_m00_',
-    'XfB__E_m00_7',
-    'XfB__E_m08_',
-    'XfB_N__E_m1',
-    'XfB__I_m05_',
-    'XfBA0__m03_',
-    'XfB__m01_',
-    'XfB__E_m00_3',
-    'XfB__E_m00_2',
-    'XfB_N__E_m15_',
-    'XfB_N__E_m01_8',
-    'XfB_N__E_m00_9',
-    'XfBA_IW_11__m02_',
-    'XfBAN__R0__m00_',
-    'XfB_N__ED__m03_7',
-    'XfBAN__E0__m00_10',
-    'XfB_N__E_m00_2',
-    'XfB__E_m00_5',
-    'XfBAN__E0__m00_5',
-    'XfB__m00_',
-    'XfB__E_m05_5',
-    'XfB_N__E_m01_',
-    'XfBAN__E0__m00_3',
-    'XfB__m06_',
-    'XfB_N__E_m14_1',
-    'XfB_N__E_m00_17',
-    'XfB__E_I_m00_',
-    'XfB__I_m00_4',
-    'XfB__E_m07_1',
-    'XfBA_IW_12__m12_',
-    'XfB_N__E_m05_2',
-    'XfB_N__E_m06_',
-    'XfBAW_0__m04_1',
-    'XfB_N__E_m03_',
-    'XfB__m00_2',
-    'XfBAN__E0__m00_12',
-    'XfBA_E0__m00_1',
-]
+DATABASE_PATH = os.path.join( os.path.dirname( os.path.realpath( __file__ ) ), 'res', 'mvc3materialnames.txt' )
 
 _isInit = False
 _hashToName = dict()
+_nameToHash = dict()
+_userIndexPath = None
+
+def _readIndex( path ):
+    entries = []
+    if path is None or not os.path.exists( path ):
+        return entries
+
+    with open( path, 'r', encoding='utf-8' ) as f:
+        for line in f:
+            line = line.rstrip( '\r\n' )
+            if line == '' or line.startswith( '#' ):
+                continue
+
+            tokens = line.split( ' ', 1 )
+            if len( tokens ) != 2:
+                # skip lines cut short, eg. by an interrupted write
+                continue
+            try:
+                entries.append( ( int( tokens[0], 16 ), tokens[1] ) )
+            except ValueError:
+                continue
+    return entries
+
+def _appendToIndex( path, entries ):
+    dirName = os.path.dirname( path )
+    if dirName != '':
+        os.makedirs( dirName, exist_ok=True )
+    with open( path, 'a', encoding='utf-8', newline='\n' ) as f:
+        # written at once so that concurrent processes don't interleave partial lines
+        f.write( ''.join( '{:08x} {}\n'.format( hsh, name ) for hsh, name in entries ) )
 
-def _registerMaterialNames( names ):
-    global _hashToName
-    for n in names:
-        _hashToName[util.computeHash(n)] = n
+def _addEntries( entries ):
+    for hsh, name in entries:
+        _hashToName[ hsh ] = name
+        _nameToHash[ name ] = hsh
 
 def _ensureInit():
     global _isInit
-    global _hashToName
-    
+
     if not _isInit:
-        _hashToName = dict()
-        _registerMaterialNames( _defaultNames )
+        _hashToName.clear()
+        _nameToHash.clear()
+        _addEntries( _readIndex( DATABASE_PATH ) )
+        _addEntries( _readIndex( _userIndexPath ) )
         _isInit = True
-        
+
+def setUserIndexPath( path ):
+    '''Sets the file that newly learned names are saved to, and loads the names learned previously'''
+    global _userIndexPath
+
+    if path == _userIndexPath:
+        return
+
+    _userIndexPath = path
+    if _isInit:
+        _addEntries( _readIndex( path ) )
+
+def getUserIndexPath():
+    return _userIndexPath
+
+def getDefaultUserIndexPath():
+    '''Gets the user index path used by the command line tools'''
+    return os.path.join( os.path.expanduser( '~' ), '.mtio', 'materialnames.txt' )
+
 def registerMaterialNames( names ):
+    '''Learns the given names, and saves the ones that were not known yet to the user index. Returns the number of new names.'''
     _ensureInit()
-    _registerMaterialNames( names )
-        
+
+    newEntries = []
+    for name in names:
+        if name in _nameToHash or name.startswith( '_0x' ):
+            continue
+
+        hsh = util.computeHash( name )
+        _hashToName[ hsh ] = name
+        _nameToHash[ name ] = hsh
+        newEntries.append( ( hsh, name ) )
+
+    if len( newEntries ) > 0 and _userIndexPath is not None:
+        _appendToIndex( _userIndexPath, newEntries )
+    return len( newEntries )
+
 def getMaterialName( hsh ):
-    global _hashToName
     _ensureInit()
     return _hashToName[ util.u32( hsh ) ]
 
 def getMaterialNameHash( name ):
-    return util.computeHash( name )
\ No newline at end of file
+    '''Gets the hash of the given name. Unknown names are hashed without being learned.'''
+    _ensureInit()
+
+    hsh = _nameToHash.get( name )
+    if hsh is None:
+        hsh = util.computeHash( name )
+    return hsh
@@ -78,6 +78,12 @@ def generateIndex():
         
     
 
+def _isCmdDataEqual( a, b ):
+    # constant buffers may be stored as either lists or tuples
+    if isinstance( a, ( list, tuple ) ) and isinstance( b, ( list, tuple ) ):
+        return tuple( a ) == tuple( b )
+    return a == b
+
 def query( filter: MaterialTemplate ) -> Iterable[imMaterialInfo]:
     try:
         from mvc3materialtemplatedb_generated import templates
@@ -109,7 +115,7 @@ def query( filter: MaterialTemplate ) -> Iterable[imMaterialInfo]:
                             if cmd.name == cmdFilter.name:
                                 if cmdFilter.data is not None:
                                     # if filtering on data..
-                                    match = cmd.data == cmdFilter.data
+                                    match = _isCmdDataEqual( cmd.data, cmdFilter.data )
                                 else:
                                     # not filtering on data, so accept the previous match
                                     match = True
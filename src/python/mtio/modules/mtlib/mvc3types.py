@@ -1,5952 +1,55 @@
-# Generated file. Changes made may be lost.
+'''
+Type name database. The type names are stored in precompiled form in res/mvc3types.pickle,
+and are only loaded on first use.
+'''
 
-typeNameByHash = {
-    0x23FD1B3A: 'uMenuOptionKbd',
-    0x41235E57: 'uMenuOptionPC',
-    0x5BC0F1D0: 'cAtkCtrl',
-    0x0BD05F38: 'cAtkCtrl::TargetInfo',
-    0x63652058: 'cHitPrimSphere',
-    0x06301D0D: 'cHitPrimCapsule',
-    0x227A8048: 'rAtkInfo',
-    0x25B70ECB: 'sHitSolver',
-    0x5F2BDC1F: 'sHitSolver::cNode',
-    0x4EAE654D: 'cActionTime',
-    0x714909F0: 'cActorGameModelAnm',
-    0x22635518: 'cAimInfo',
-    0x25C29D56: 'cMayaMotionWork',
-    0x65F2A06E: 'uActionCamera',
-    0x75204BC4: 'uActionSideCamera',
-    0x2CFEA369: 'uCollectionCamera',
-    0x0ECE755D: 'uStageScreenCamera',
-    0x26200CA6: 'cChrArchive',
-    0x22466B65: 'cChrArchive::Prim',
-    0x7059E4BE: 'cChrChgOrder',
-    0x1379008F: 'cChrTeam',
-    0x4613BF06: 'cChrAbility',
-    0x27418FA0: 'cChrAbility::Prim',
-    0x5125D992: 'cChrCmd',
-    0x51FEEA53: 'cChrCmd::Line',
-    0x3E303415: 'cChrCmdBtnChrg',
-    0x60E01A65: 'cChrCmdCombo',
-    0x2E4AC24F: 'cChrCmdLimit',
-    0x1A954284: 'cChrCmdSpatk',
-    0x7A72D7B8: 'cChrInput',
-    0x60AD2F8D: 'cChrJointHold',
-    0x45616145: 'cChrMessage',
-    0x52E64ED5: 'cChrNode',
-    0x75C07782: 'cChrPause',
-    0x742DACBD: 'cChrStatus',
-    0x13B8EEAB: 'cChrTargetInfo',
-    0x130130CE: 'cChrTrace',
-    0x125ED139: 'cFollowEyes',
-    0x1E81D60B: 'uChrCamera',
-    0x4C82C65E: 'uChrChain',
-    0x4CAE9FE8: 'uChrWeapon',
-    0x7B97FF6C: 'uCharacter',
-    0x76898F2B: 'sCharacter',
-    0x7D16BBEE: 'cChrCommand',
-    0x28DD8317: 'rChrCombo',
-    0x126EA0E5: 'rChrCommand',
-    0x52A8DBF6: 'rChrSpatk',
-    0x3C6EA504: 'rChrBaseact',
-    0x5B486CCE: 'rChrColList',
-    0x05500206: 'rChrCpu',
-    0x1DF3E03E: 'rChrProfile',
-    0x3C41466B: 'rChrStatus',
-    0x70EF6939: 'uCharacterPre',
-    0x00FB57B0: 'uCharacterPost',
-    0x4EECED46: 'uAmaterasu',
-    0x550F859B: 'uArthur',
-    0x7C596310: 'uCapAmerica',
-    0x5E55730D: 'uChris',
-    0x1FC3D090: 'uChunli',
-    0x5602C28F: 'uCViper',
-    0x0FF963CE: 'uDante',
-    0x56661648: 'uDeadPool',
-    0x670ADAAA: 'uDormammu',
-    0x4D830D22: 'uDrDoom',
-    0x36350C1A: 'uDrStrange',
-    0x6B64E738: 'uDrStrangeSh',
-    0x5F78B754: 'uFelicia',
-    0x030CFD70: 'uFeliciaC',
-    0x736609FF: 'uFeliciaF',
-    0x6B5C583E: 'uFrank',
-    0x171045E6: 'uGalactus',
-    0x298A709D: 'uGhostRider',
-    0x7C196009: 'uGouki',
-    0x321E5118: 'uHaggar',
-    0x58800C1D: 'uHawkEye',
-    0x3298921D: 'uHiryu',
-    0x175D214F: 'uHulk',
-    0x1B4469F2: 'uIronFist',
-    0x07214B84: 'uIronMan',
-    0x360C2673: 'uJill',
-    0x6AA59281: 'uKobun',
-    0x5E8C21F4: 'uLeilei',
-    0x347A2EE3: 'uLinlin',
-    0x30B095B9: 'uMagneto',
-    0x3B0033FB: 'uMayoi',
-    0x212F15C7: 'uModok',
-    0x7406EA0B: 'uMorrigan',
-    0x71D44156: 'uMorriganSh',
-    0x2449B8AB: 'uNaruhodo',
-    0x74BEBD03: 'uNemesis',
-    0x737F4BF0: 'uNova',
-    0x062DF385: 'uPhoenix',
-    0x294B3D65: 'uRedArremer',
-    0x121D1D45: 'uRedArremerSh',
-    0x3FC65F4B: 'uRRaccoon',
-    0x33F0CD9F: 'uRyu',
-    0x47A03EBB: 'uSentinel',
-    0x46977F50: 'uSheHulk',
-    0x2C2F4646: 'uShuma',
-    0x0149C30F: 'uSpencer',
-    0x589BE90C: 'uSpiderMan',
-    0x63BDCA72: 'uStorm',
-    0x201861F4: 'uSuperSkrull',
-    0x50E38A58: 'uTaskMaster',
-    0x562A0248: 'uThor',
-    0x190AF0C2: 'uTrish',
-    0x539A78A1: 'uTron',
-    0x2B5384F5: 'uVergil',
-    0x4439DD8A: 'uVJoe',
-    0x0713BB3E: 'uWesker',
-    0x13C43CCB: 'uWolverine',
-    0x32553A22: 'uX23',
-    0x2247E6ED: 'uZero',
-    0x70460F56: 'uZeroSh',
-    0x614C61A9: 'uZombie',
-    0x01FBCF9F: 'uCnsLock',
-    0x71B1DD7F: 'uCnsLockChr',
-    0x263EF9C8: 'uCnsLockChr::cLimitParam',
-    0x3A0AA551: 'uCnsShare',
-    0x40F73C88: 'uChrCpu',
-    0x34915C02: 'uChrCpu::_ActHistory',
-    0x56A81090: 'sGameEffect',
-    0x097DD25A: 'uGameEffectPreProcess',
-    0x0DD27182: 'uKirigakureEffect',
-    0x2AB7A441: 'uKirigakureScreenEffect',
-    0x586D6CA0: 'uGameEffectModelKobunHead',
-    0x15501DDE: 'uGameEffectModelZombie',
-    0x55EF5CFC: 'uHellBikeFireEffect',
-    0x60DC2091: 'uHellBikeLightEffect',
-    0x4D3D50CD: 'uNetArrowHitEffect',
-    0x6C212413: 'uGameEffectModelHawk',
-    0x7FD46D35: 'uGameEffectModelRagnarok',
-    0x551AFC49: 'uGameEffectModelRagnarokCipher',
-    0x58D8AC78: 'uGameEffectModelTiger',
-    0x347CADD3: 'uGameEffectModelForm3',
-    0x06C0138C: 'uSyokusyuEffect',
-    0x6D6EAE97: 'uGameEffectModelDigHole',
-    0x4FDE9E52: 'uGameEffectModelNetTrap',
-    0x3A5EF005: 'uGameEffectModelWebBallBind',
-    0x04EC60C6: 'uAkebonoFinishEffect',
-    0x7C90CC8F: 'uAnaglyphEffect',
-    0x7C9BED97: 'uDamageBlockingEffect',
-    0x1957CD7A: 'uExAtkSpace',
-    0x03062AA5: 'uExAtkSpaceLv1',
-    0x1A0F7B1F: 'uExAtkSpaceLv2',
-    0x6D084B89: 'uExAtkSpaceLv3',
-    0x736CDE2A: 'uExAtkSpaceLv4',
-    0x046BEEBC: 'uExAtkSpaceLv5',
-    0x1D62BF06: 'uExAtkSpaceLv6',
-    0x6A658F90: 'uExAtkSpaceLv7',
-    0x7ADA9201: 'uExAtkSpaceLv8',
-    0x3C806875: 'uFlameYarareEffect',
-    0x574B5CE7: 'uIceYarareEffect',
-    0x79D11A59: 'uSnapBackEffect',
-    0x7E4E2BFE: 'uThunderYarareEffect',
-    0x0E054CA5: 'uWinEffect',
-    0x3B93EB54: 'uXFactorOutlineFilter',
-    0x42B86C37: 'uGameEffectModelFilm',
-    0x59D99FDA: 'uVSinkenSlowEffect',
-    0x28B3A7CC: 'uX23HairEffect',
-    0x3E1DDAD3: 'uGameEffect',
-    0x397245A1: 'uGameEffectModel',
-    0x2D6BD03D: 'uGameEffectModel2D',
-    0x045ED8F9: 'uMaterialVjob',
-    0x482DC544: 'uMaterialVjobSetColor',
-    0x41FD4A92: 'uMaterialVjobSetUV',
-    0x33D3D0A0: 'uMaterialVjobCngColor',
-    0x687C4738: 'uMaterialVjobCngUV',
-    0x7F474A65: 'uMaterialVjobAddUV',
-    0x526771FE: 'uMaterialVjobPatAnm',
-    0x2FFDE9BA: 'uMaterialVjobCngReflectiveColor',
-    0x00025186: 'uMaterialVjobCngSpecularColor',
-    0x6E7CDA45: 'uMaterialVjobAnimation',
-    0x13AC4385: 'uMaterialVjobAddUVScale',
-    0x138FF06E: 'cMissionWork',
-    0x7AB4A23B: 'sMission',
-    0x3CDBABBC: 'uMission',
-    0x3C2143E8: 'uMissionFilePath',
-    0x4B5ADF72: 'uMissionFilePath_Tutorial',
-    0x6023910C: 'uMissionFilePath_Ryu',
-    0x694247DC: 'uMissionFilePath_Chunli',
-    0x44A877DC: 'uMissionFilePath_Gouki',
-    0x66E464D8: 'uMissionFilePath_Chris',
-    0x71922C72: 'uMissionFilePath_Wesker',
-    0x2DECCC28: 'uMissionFilePath_VJoe',
-    0x3748741B: 'uMissionFilePath_Dante',
-    0x21BBE717: 'uMissionFilePath_Trish',
-    0x53ED4FEB: 'uMissionFilePath_Frank',
-    0x7ED54F23: 'uMissionFilePath_Spencer',
-    0x238E12D7: 'uMissionFilePath_Arthur',
-    0x13D3367F: 'uMissionFilePath_Amaterasu',
-    0x4B92F74F: 'uMissionFilePath_Zero',
-    0x3A4F6903: 'uMissionFilePath_Tron',
-    0x46A11A64: 'uMissionFilePath_Morrigan',
-    0x280DB6B8: 'uMissionFilePath_Leilei',
-    0x20E43B78: 'uMissionFilePath_Felicia',
-    0x208355C3: 'uMissionFilePath_CViper',
-    0x449FC654: 'uMissionFilePath_Haggar',
-    0x5FD937D1: 'uMissionFilePath_Jill',
-    0x0A2985C8: 'uMissionFilePath_Hiryu',
-    0x5DD213B9: 'uMissionFilePath_Vergil',
-    0x16EE48C4: 'uMissionFilePath_Naruhodo',
-    0x76938AB6: 'uMissionFilePath_RedArremer',
-    0x0B22312F: 'uMissionFilePath_Nemesis',
-    0x05A43235: 'uMissionFilePath_SpiderMan',
-    0x2381D4C3: 'uMissionFilePath_CapAmerica',
-    0x4EFBE7F2: 'uMissionFilePath_Wolverine',
-    0x4F2C1995: 'uMissionFilePath_Magneto',
-    0x7E8830ED: 'uMissionFilePath_Hulk',
-    0x390BF37C: 'uMissionFilePath_SheHulk',
-    0x0F3B3D8B: 'uMissionFilePath_TaskMaster',
-    0x78BDC7A8: 'uMissionFilePath_IronMan',
-    0x3FFF13EA: 'uMissionFilePath_Thor',
-    0x3B029A6E: 'uMissionFilePath_DrDoom',
-    0x79B17FA9: 'uMissionFilePath_Phoenix',
-    0x149E5193: 'uMissionFilePath_Shuma',
-    0x199E0212: 'uMissionFilePath_Modok',
-    0x55AD2AC5: 'uMissionFilePath_Dormammu',
-    0x64C1E627: 'uMissionFilePath_DeadPool',
-    0x5B0CDDA7: 'uMissionFilePath_Storm',
-    0x3F9D3A2D: 'uMissionFilePath_SuperSkrull',
-    0x7507CED4: 'uMissionFilePath_Sentinel',
-    0x618666B1: 'uMissionFilePath_X23',
-    0x1AAA5A52: 'uMissionFilePath_Nova',
-    0x0D61AF24: 'uMissionFilePath_RRaccoon',
-    0x7652C74E: 'uMissionFilePath_GhostRider',
-    0x29E3999D: 'uMissionFilePath_IronFist',
-    0x6B0AD723: 'uMissionFilePath_DrStrange',
-    0x271C8031: 'uMissionFilePath_HawkEye',
-    0x25B7B589: 'uMissionFilePath_Galactus',
-    0x6FBF8058: 'rActionParam',
-    0x4EB1C230: 'sAction',
-    0x287A9968: 'cArm',
-    0x2DDE6A64: 'sShot',
-    0x5D5F7465: 'sShot::cNodeList',
-    0x472610E6: 'uShotLaser',
-    0x4E267F5F: 'uShotMissile',
-    0x53914C5F: 'uShotOption',
-    0x17849E07: 'uShotShield',
-    0x39114754: 'uShotVulcan',
-    0x35B9C743: 'uShotVulcanBakuen',
-    0x679005D9: 'uShotVulcanExtentThunder',
-    0x2AF37CB0: 'uShotVulcanHyoran',
-    0x6CC92E1A: 'uShotVulcanMagatama',
-    0x6C6063B4: 'uShotVulcanOneSpark',
-    0x76F2B243: 'uShotVulcanOneSparkZan',
-    0x7A54A24F: 'uShotVulcanRaikou',
-    0x14FF9C2F: 'uShotVulcanRaikouSub',
-    0x5CA9B7ED: 'uShotVulcanTekadama',
-    0x1FF66388: 'uShotVulcanTekadamaExplode',
-    0x456483BF: 'uShotVulcanTsutamaki',
-    0x3F721E65: 'uShotMissileArrow',
-    0x48B7E249: 'uShotOptionSickleBoomerang',
-    0x3DC1E142: 'uShotShieldKnightShield',
-    0x155BFE3B: 'uShotVulcanAxe',
-    0x1FC7E4A7: 'uShotVulcanBraceletOfGoddess',
-    0x60D33C12: 'uShotVulcanCrossSword',
-    0x610EFF3B: 'uShotVulcanGreatSorcery',
-    0x7E7C0231: 'uShotVulcanJavelin',
-    0x5E109508: 'uShotVulcanKnife',
-    0x17A93657: 'uShotVulcanTorch',
-    0x2F7BE2FB: 'uShotVulcanTorchFirePillar',
-    0x7D7EFE20: 'uShotOptionShieldSlash',
-    0x554DA965: 'uShotLaserSatelliteLaser',
-    0x7CCACBDD: 'uShotMissileGrenadeLauncher',
-    0x6252C644: 'uShotShieldFlameGun',
-    0x30C119C5: 'uShotVulcanFireGrenadeBomb',
-    0x3C1E9061: 'uShotVulcanFireGrenadeExplode',
-    0x2F1CD297: 'uShotVulcanFireGrenadeGroundFlame',
-    0x08E7DD3A: 'uShotVulcanGrenadeLauncherExplode',
-    0x5BF34CC8: 'uShotVulcanHandGrenadeBomb',
-    0x3BDDFBC8: 'uShotVulcanHandGrenadeExplode',
-    0x53A05C62: 'uShotVulcanHandGun',
-    0x60FC8175: 'uShotVulcanLandMine',
-    0x5BFCB8C1: 'uShotVulcanLandMineExplode',
-    0x41070531: 'uShotVulcanMachineGun',
-    0x4A104CB5: 'uShotVulcanMagnumGun',
-    0x73B448F8: 'uShotVulcanRocketLauncher',
-    0x7450FBFD: 'uShotVulcanSatelliteLaserLock',
-    0x7C0FBBB1: 'uShotVulcanShotGun',
-    0x0E0375DB: 'uShotShieldKikousyou',
-    0x3CF662CA: 'uShotVulcanKikouken',
-    0x466316A4: 'uShotLaserOpticBlast',
-    0x5B12FD8F: 'uShotVulcanBurningKick',
-    0x3C9434E6: 'uShotVulcanSeismoHammer',
-    0x7EBFD26D: 'uShotLaserCrystal',
-    0x65A1FFC3: 'uShotLaserMillionCarat',
-    0x07FBCE75: 'uShotLaserThunderBolt',
-    0x72888E7B: 'uShotLaserTwister',
-    0x2893DFFA: 'uShotMissileHysteric',
-    0x30933DD5: 'uShotOptionGrapple',
-    0x1E782F67: 'uShotShieldJamSession',
-    0x733BE63F: 'uShotShieldTempest',
-    0x2F99EC0B: 'uShotVulcanAcidRain',
-    0x6957753A: 'uShotVulcanAirPlay',
-    0x759CAB03: 'uShotVulcanBulletDanceFinish',
-    0x0C4DF8AF: 'uShotVulcanDrive',
-    0x65AD68F2: 'uShotVulcanEbonyAndIvory',
-    0x406E4AE5: 'uShotVulcanFireWorks',
-    0x7599E2BB: 'uShotVulcanMultiLock',
-    0x23018021: 'uShotVulcanDualShot',
-    0x2BA02B05: 'uShotVulcanSomersaultGrenade',
-    0x3EE5A794: 'uShotVulcanSomersaultGrenadeExplode',
-    0x45C8C7C1: 'uShotVulcanSomersaultLasso',
-    0x093AF360: 'uShotVulcanSomersaultShuriken',
-    0x7FC20C5B: 'uShotLaserDarkDimension',
-    0x46A51E49: 'uShotMissileFloatBomb',
-    0x2352A176: 'uShotVulcanBlackHole',
-    0x7C5B9936: 'uShotVulcanChaosticFlame',
-    0x2CD4CA32: 'uShotVulcanFireCarpet',
-    0x70DC15D0: 'uShotVulcanInferno',
-    0x11BA578C: 'uShotVulcanMagicCreate',
-    0x6037E1DE: 'uShotVulcanMagicDestroy',
-    0x614B22B2: 'uShotVulcanMagicMagma',
-    0x42EDAF5C: 'uShotVulcanMagicMagmaSpread',
-    0x3C39AB15: 'uShotVulcanMagicMeteor',
-    0x42800839: 'uShotVulcanSpiralArrow',
-    0x1B726F4E: 'uShotLaserDrDoomJS',
-    0x4AD71D0D: 'uShotLaserPlasmaBeam',
-    0x306C179C: 'uShotMissileDoomsMissile',
-    0x4F5283B4: 'uShotVulcanMissileEmplacement',
-    0x44095156: 'uShotVulcanMolecularShield',
-    0x7E202664: 'uShotVulcanMolecularShieldPre',
-    0x35621CDB: 'uShotVulcanPhotonShot',
-    0x0FB5018C: 'uShotVulcanSphereFlame',
-    0x6D5B50D5: 'uShotLaserBoltsOfBalthakk',
-    0x423E3B46: 'uShotLaserFlamesOfFaltine',
-    0x19A80043: 'uShotLaserStrangeReflector',
-    0x50C0F59B: 'uShotMissileOpticalMagicSpread',
-    0x6D1F4A79: 'uShotVulcanAstralProjection',
-    0x33835CBB: 'uShotVulcanElementalSummon',
-    0x4B4484B4: 'uShotVulcanElementalSummonExplode',
-    0x2ADA4C48: 'uShotVulcanElementalSummonShot',
-    0x78CAA8BB: 'uShotVulcanMagicSword',
-    0x5D64877F: 'uShotVulcanOpticalMagic',
-    0x32850864: 'uShotVulcanOpticalMagicS',
-    0x63490ACC: 'uShotVulcanOpticalMagicSpread',
-    0x6633B6AA: 'uShotVulcanSpellOfVishanti',
-    0x0ED811B9: 'uShotVulcanThrowRose',
-    0x6240F456: 'uShotVulcanPleaseHelpMe',
-    0x2005B18C: 'uShotVulcanSandSplash',
-    0x76542BE8: 'uShotLaserLikeAMegaman',
-    0x7C839716: 'uShotShieldWeaponCartSpread',
-    0x17FD4493: 'uShotShieldWildPitchHit',
-    0x6D587771: 'uShotVulcanThrowWeapon',
-    0x3F3D3961: 'uShotVulcanThrowWeaponB',
-    0x6790D6D8: 'uShotVulcanWeaponCart',
-    0x23EE37D7: 'uShotVulcanWeaponCartSpread',
-    0x5612947B: 'uShotVulcanWildPitch',
-    0x57EDDB90: 'uShotLaserCosmicBeam',
-    0x3B798FBE: 'uShotShieldHellFire',
-    0x3F75D1D7: 'uShotVulcanBigFirePillar',
-    0x48F23B31: 'uShotVulcanBreakFireChain',
-    0x71FA04EF: 'uShotVulcanFireWall',
-    0x79683B0E: 'uShotLaserMessatsuGouHadou',
-    0x56F568C1: 'uShotVulcanGouHadouken',
-    0x146DA4F5: 'uShotVulcanTenmaGouZanku',
-    0x1AD465F6: 'uShotVulcanBodyPressFinish',
-    0x4DBF21C2: 'uShotVulcanIronPipeRolling',
-    0x38A1E3C2: 'uShotVulcanAntmanArrow',
-    0x79AC228C: 'uShotVulcanBombArrow',
-    0x20907355: 'uShotVulcanBombArrowExplode',
-    0x4920D6B1: 'uShotVulcanHyperAimArrow',
-    0x0EFC2AE0: 'uShotVulcanIceArrow',
-    0x2F63C7FD: 'uShotVulcanNetArrow',
-    0x7A49A4BB: 'uShotVulcanNormalArrow',
-    0x567D77EF: 'uShotVulcanPierceArrow',
-    0x5C9A6E95: 'uShotVulcanPoisonArrow',
-    0x2B0AE474: 'uShotVulcanRangingBladeArrow',
-    0x76386ECA: 'uShotVulcanSpreadArrow',
-    0x6858C0F8: 'uShotVulcanThunderCartridge',
-    0x5B734DB8: 'uShotVulcanThunderCartridgeExplode',
-    0x4179442B: 'uShotShieldFormationD',
-    0x278430CF: 'uShotShieldOuroboros',
-    0x086784E8: 'uShotShieldOuroborosExit',
-    0x16807465: 'uShotVulcanFormationATiger',
-    0x12BDDCB4: 'uShotVulcanFormationBHawk',
-    0x5CFFD275: 'uShotVulcanFormationCBom',
-    0x039B7231: 'uShotVulcanFormationCExplode',
-    0x165382BF: 'uShotVulcanFormationCSpread',
-    0x53F4BC31: 'uShotVulcanFormationDSpread',
-    0x2B8902EC: 'uShotVulcanLegionHawk',
-    0x759DEBD3: 'uShotVulcanLegionTiger',
-    0x5DEDBBEB: 'uShotVulcanOuroborosShot',
-    0x71FF8ECD: 'uShotVulcanGammaQuake',
-    0x7BF17AF5: 'uShotVulcanGammaSlam',
-    0x3A532A5C: 'uShotLaserDragonAura',
-    0x487BFD3D: 'uShotLaserProtonCannon',
-    0x4C3148EE: 'uShotLaserUniBeam',
-    0x3FD6A01E: 'uShotShieldRepulsarBlastSP',
-    0x2916BD86: 'uShotVulcan2CMissile',
-    0x048123A0: 'uShotVulcanRepulsarBlastSPExpload',
-    0x16BB6231: 'uShotVulcanSmartBomb',
-    0x6EAB9C41: 'uShotVulcanJillMachineGun',
-    0x7EC9A643: 'uShotVulcanAnkihouBomb',
-    0x53E10A7D: 'uShotVulcanAnkihouBombExplode',
-    0x466E3409: 'uShotVulcanAnkihouKobun',
-    0x3DF6D2AC: 'uShotVulcanAnkihouRolling',
-    0x562F49CA: 'uShotVulcanHenkyouKi',
-    0x6F9E9EC3: 'uShotVulcanTenraiha',
-    0x1FB13581: 'uShotVulcanZireitou',
-    0x74ED065C: 'uShotLaserEMDisruptor',
-    0x6B9F3037: 'uShotLaserMagneticShockWave',
-    0x494BFCE5: 'uShotMissileGravitySqueeze',
-    0x673B3E2D: 'uShotVulcanHyperGravitation',
-    0x08C88C7C: 'uShotVulcanMagneticBlast',
-    0x511D546F: 'uShotVulcanMagneticTempst',
-    0x648BC7A8: 'uShotVulcanMagnetoAtkSitM',
-    0x787F0187: 'uShotLaserPsionicBlaster',
-    0x18786113: 'uShotMissileJammingBomb',
-    0x14865C0F: 'uShotOptionPsionicCubeDamage',
-    0x2CB81109: 'uShotVulcanJammingBomb',
-    0x11E30DD1: 'uShotVulcanJammingBombExplode',
-    0x33EF634D: 'uShotVulcanLightWall',
-    0x63A51A17: 'uShotVulcanModokSitM',
-    0x34A181E0: 'uShotVulcanModokStandM',
-    0x41A0EABB: 'uShotVulcanPsionicCube',
-    0x2E9E7683: 'uShotOptionSoulFistAbsorb',
-    0x42414817: 'uShotVulcanFinishingShower',
-    0x6930D705: 'uShotVulcanShilhouetteBlade',
-    0x0EE4ABD9: 'uShotVulcanSoulFist',
-    0x2ACD7CCC: 'uShotLaserEvidencePhoto',
-    0x258B3F68: 'uShotVulcanBreakClock',
-    0x04E6044F: 'uShotVulcanBreakVase',
-    0x502AE095: 'uShotVulcanBrownEnvelope',
-    0x0033064A: 'uShotVulcanBrownEnvelopeExplode',
-    0x3F1CADA2: 'uShotVulcanDogMissile',
-    0x70E67F70: 'uShotVulcanFileStorm',
-    0x533E9B85: 'uShotVulcanHammerImpact',
-    0x0F35C297: 'uShotVulcanItemThrow',
-    0x1181C7DA: 'uShotVulcanMobilePhone',
-    0x0769A411: 'uShotVulcanNaruhodoKnife',
-    0x7C1BF533: 'uShotVulcanExatkRocketLauncher',
-    0x1EF8E2A1: 'uShotVulcanNemesisRocketLauncher',
-    0x43AC214D: 'uShotVulcanRocketLauncherExplode',
-    0x52AB7CE8: 'uShotLaserGMBeam',
-    0x057B6B10: 'uShotLaserGMPulse',
-    0x23D6F134: 'uShotShieldBodyBeam',
-    0x2CF28271: 'uShotVulcanEnergySpear',
-    0x3D8E4353: 'uShotVulcanEnergySpearSpread',
-    0x56A208D4: 'uShotVulcanGMPulse',
-    0x0A7F5DB4: 'uShotMissileTKShot',
-    0x52FF40C4: 'uShotOptionHealingFieldGathering',
-    0x16E27D1F: 'uShotShieldHealingField',
-    0x375D7301: 'uShotVulcanDarkPhoenixFire',
-    0x4FC63EC8: 'uShotVulcanKaiserPhoenix',
-    0x20609B15: 'uShotVulcanTKBind',
-    0x3C7D3027: 'uShotVulcanTKBindSpread',
-    0x169F12A8: 'uShotVulcanTKShotExplode',
-    0x68F1CA67: 'uShotLaserDarkFire',
-    0x09765265: 'uShotVulcanFire',
-    0x3113EB4F: 'uShotVulcanFirePillar',
-    0x61915E00: 'uShotLaserRRaccoonPistol',
-    0x20D0583A: 'uShotMissileHomingEnergyGun',
-    0x5A45F410: 'uShotVulcanClaymoreMine',
-    0x08C8FF89: 'uShotVulcanClaymoreSpread',
-    0x252BA144: 'uShotVulcanDigHole',
-    0x0E382BE2: 'uShotVulcanEnergyGun',
-    0x52651F46: 'uShotVulcanFallRock',
-    0x7E1D4152: 'uShotVulcanGatlingGun',
-    0x7E991E77: 'uShotVulcanHomingEnergyGunExplode',
-    0x73598585: 'uShotVulcanHomingEnergyGunGroundExplode',
-    0x2E65D791: 'uShotVulcanHyperTrap',
-    0x191F0E99: 'uShotVulcanHyperTrapSpread',
-    0x5D2FE56B: 'uShotVulcanJDBomb',
-    0x336C37EB: 'uShotVulcanJDBombExplode',
-    0x212F706E: 'uShotVulcanOilBalloon',
-    0x0D168098: 'uShotVulcanOilBalloonExplode',
-    0x645DC99F: 'uShotVulcanOilBalloonGroundFire',
-    0x26D89205: 'uShotVulcanOilBalloonGroundOil',
-    0x3858485D: 'uShotVulcanPendulumLog',
-    0x78972521: 'uShotVulcanPrickleBoard',
-    0x5E715B30: 'uShotVulcanTrapLandMine',
-    0x3E29340C: 'uShotLaserReflectSinkuHadouken',
-    0x755CC92B: 'uShotLaserSinkuHadouken',
-    0x70C0999B: 'uShotVulcanHadouken',
-    0x68190BBE: 'uShotLaserAttackS',
-    0x69579272: 'uShotVulcanDirectAttackBomb',
-    0x0CBFA14C: 'uShotVulcanDirectAttackBombExplode',
-    0x327CBFE0: 'uShotVulcanMiniSentinel',
-    0x4307EA09: 'uShotVulcanPlasmaStorm',
-    0x0E0C068A: 'uShotVulcanCar',
-    0x34C0C0C7: 'uShotLaserHyperMysticBlast',
-    0x15CB4B46: 'uShotLaserMysticBlast',
-    0x544398D4: 'uShotVulcanHyperMysticSmash',
-    0x52D36AA7: 'uShotVulcanMysticStare',
-    0x3BF5C07B: 'uShotVulcanMysticStareBomb',
-    0x0290C913: 'uShotVulcanMysticStareExplode',
-    0x09CD3E50: 'uShotOptionAttackWire',
-    0x4BF93EB8: 'uShotOptionSwingWire',
-    0x5EEAAD0D: 'uShotVulcanFurisosoguShi',
-    0x2B0F6E25: 'uShotVulcanSwingWire',
-    0x50C01DD6: 'uShotVulcanWebBall',
-    0x4BCC62F5: 'uShotVulcanWebMove',
-    0x0EBCA372: 'uShotVulcanWebThrow',
-    0x38F17356: 'uShotLaserDoubleTyphoon',
-    0x7B2C0B96: 'uShotLaserWildStorm',
-    0x2747149B: 'uShotVulcanIceStorm',
-    0x49EE84F7: 'uShotVulcanLightningSphere',
-    0x6035DC6E: 'uShotVulcanLightningSphereBurst',
-    0x0565B232: 'uShotVulcanLightningStorm',
-    0x41CC8294: 'uShotVulcanWhirlWind',
-    0x184470A4: 'uShotShieldSuperBurningSkrull',
-    0x40D3346B: 'uShotVulcanDivePunch',
-    0x2895353D: 'uShotVulcanArrowRain',
-    0x34C0372B: 'uShotVulcanArrowShot',
-    0x539BAF3D: 'uShotVulcanBullet',
-    0x288115B3: 'uShotLaserBigThunder',
-    0x470E38DA: 'uShotLaserMujoThunder',
-    0x5C0B0A33: 'uShotVulcanBigTornado',
-    0x30671052: 'uShotVulcanMujoSyoryuThunder',
-    0x220D5C0C: 'uShotVulcanMujoThunderCharge',
-    0x2E239536: 'uShotMissileTrishBullet',
-    0x0DAD20CD: 'uShotOptionSpadaBoomerang',
-    0x4BA25418: 'uShotVulcanBarrier',
-    0x73605EBF: 'uShotVulcanBarrierSpread',
-    0x0DBBBA4C: 'uShotVulcanEnergyBolt',
-    0x5A9AE0FB: 'uShotVulcanChushokuRash',
-    0x52E670F6: 'uShotVulcanKingKobun',
-    0x7B60D628: 'uShotVulcanKobunLauncher',
-    0x35F8E561: 'uShotVulcanRockThrow',
-    0x402568D5: 'uShotVulcanShikiDan',
-    0x358C2C2F: 'uShotVulcanShikiDanKobun',
-    0x522F4001: 'uShotOptionRoundTrip',
-    0x6C49A571: 'uShotShieldRaidSword',
-    0x7DCFCC61: 'uShotShieldSpiralSword',
-    0x31BF74A0: 'uShotShieldStormSword',
-    0x0BF320B3: 'uShotVulcanJigenZan',
-    0x583FFAAA: 'uShotVulcanRapidSlash',
-    0x604022A6: 'uShotVulcanStormSwordSpread',
-    0x31E834B8: 'uShotVulcanBoomerang',
-    0x00E7F455: 'uShotVulcanShockingPinkBomb',
-    0x78D0207D: 'uShotVulcanShockingPinkExplode',
-    0x57372D34: 'uShotVulcanSixCannon',
-    0x49801F12: 'uShotVulcanWeskerHandGun',
-    0x14EB75C4: 'uShotLaserRaikousen',
-    0x7DF501E9: 'uShotLaserRekkouha',
-    0x260B0B6B: 'uShotVulcanGenmuZero',
-    0x4958DFB7: 'uShotVulcanHadangeki',
-    0x5BE88F65: 'uShotVulcanZeroBuster',
-    0x229E9FC4: 'uShot',
-    0x2DD690F2: 'uShotPreProcess',
-    0x504ABA50: 'sReplay',
-    0x7E288789: 'uStgObj000_LightBeam',
-    0x307AE152: 'uStgObj002_Cage',
-    0x483B6CE7: 'uStgObj002_CityObj',
-    0x0A305B6F: 'uStgObj002_Heli',
-    0x3400C979: 'uStgObj002_HeliCrew',
-    0x3C037BE4: 'uStgObj002_OnCageMan',
-    0x1EA39127: 'uStgObj003_MadGear',
-    0x485A9EDB: 'uStgObj003_MadGear::cState',
-    0x589C4DD1: 'uStgObj003_MetroCity',
-    0x56F9DCC5: 'uStgObj003_MetroDrum',
-    0x4047803F: 'uStgObj003_MetroPnt',
-    0x71C53EBD: 'uStgObj003_MetroShadow',
-    0x7F1241D4: 'uStgObj004_Astaroth',
-    0x3C091063: 'uStgObj004_DvlFlw',
-    0x798C4DF4: 'uStgObj004_DvlFlw::cState',
-    0x2ED58338: 'uStgObj004_MoveLandObj',
-    0x78903828: 'uStgObj005_FireFlower',
-    0x765ED4A0: 'uStgObj005_Kobun',
-    0x3C23EA8E: 'uStgObj005_SyncKobun',
-    0x48F7340A: 'uStgObj005_TeiselBorn',
-    0x26AF818A: 'uStgObj005_TronBorn',
-    0x26D4283F: 'uStgObj005_WaterFF',
-    0x11595F24: 'uStgObj005_ZufuGeredo',
-    0x11BA0DF8: 'uStgObj005_ZufuGeredoObj',
-    0x3DE72F1A: 'uStgObj006_Buddhist',
-    0x2D4FFD51: 'uStgObj006_GeninFollow',
-    0x3A6FB7B8: 'uStgObj006_GeninPnt',
-    0x1A37D811: 'uStgObj006_GeninScreen',
-    0x125101AB: 'uStgObj007_Helicarrier',
-    0x42C252B6: 'uStgObj009_Peg',
-    0x252C13E6: 'uStgObj009_Scale',
-    0x710E09C9: 'uStgObj010_Corpse',
-    0x0893CC70: 'uStgObj010_Glass',
-    0x50B3F938: 'uStgObj010_LaboBack',
-    0x7DC9C66E: 'uStgObj010_LaboBase',
-    0x293DB2EC: 'uStgObj010_LaboDust',
-    0x65A331C0: 'uStgObj010_LaboFire',
-    0x22661D11: 'uStgObj010_LaboItem',
-    0x75A57C00: 'uStgObj010_LaboPoint',
-    0x688502C7: 'uStgObj010_Licker',
-    0x032B94CD: 'uStgObj010_Licker::cState',
-    0x44E5EC64: 'uStgObj010_Licker::cDeadAnm',
-    0x4D404FA6: 'uStgObj010_Licker::uCnsPosInter',
-    0x3381FF2C: 'uStgObj010_LickerCmn',
-    0x1E9495B9: 'uStgObj010_Shutter',
-    0x2071B285: 'uStgObj010_Tank',
-    0x3555417B: 'uStgObj011_BreakGround',
-    0x7D0A0E7B: 'uStgObj011_Earth',
-    0x6AB6D500: 'uStgObj011_Galactus',
-    0x0B2818EC: 'uStgObj011_Meteo',
-    0x33E5D5A8: 'uStgObj100_CopyRobot',
-    0x55903737: 'uStgObj100_Monitor',
-    0x1A059D4E: 'uStgObj100_ProfessorX',
-    0x50F4066E: 'uStgObj100_SearchRobot',
-    0x7B661FB1: 'uStgObj102_Monitor',
-    0x5F2D4EE7: 'uStgObj103_MadGear',
-    0x1FB81E83: 'uStgObj103_MadGear::cState',
-    0x64D8EDCF: 'uStgObj103_Sentinel',
-    0x50C6AFAE: 'uStgObj103_Sentinel::cState',
-    0x53CB7B5D: 'uStgObj104_DvlFlw',
-    0x16DEFB15: 'uStgObj104_DvlFlw::cState',
-    0x172E58D0: 'uStgObj104_MoveLandObj',
-    0x520980CA: 'uStgObj104_RainCtrl',
-    0x6125C0E3: 'uStgObj105_Kobun',
-    0x460F2C16: 'uStgObj105_Pnt',
-    0x3C808D6D: 'uStgObj105_SnowCtrl',
-    0x61F3D8E3: 'uStgObj105_TreeObj',
-    0x64551523: 'uStgObj106_DD',
-    0x7106EC38: 'uStgObj106_DD::cState',
-    0x4E8A801B: 'uStgObj107_Jet',
-    0x3C46DCF3: 'uStgObj107_Trail',
-    0x3C60F293: 'uStgObj109_Meteor',
-    0x64B55902: 'uStgObj109_Peg',
-    0x4B16B557: 'uStgObj110_LaboBack',
-    0x70D76EDE: 'uStgObjCameraFollow',
-    0x4683C369: 'uStgObjSceneCopy',
-    0x704601CD: 'uStageObject',
-    0x2558E6D5: 'uStageObjectBase000',
-    0x525FD643: 'uStageObjectBase001',
-    0x4B5687F9: 'uStageObjectBase002',
-    0x3C51B76F: 'uStageObjectBase003',
-    0x223522CC: 'uStageObjectBase004',
-    0x5532125A: 'uStageObjectBase005',
-    0x4C3B43E0: 'uStageObjectBase006',
-    0x3B3C7376: 'uStageObjectBase007',
-    0x2B836EE7: 'uStageObjectBase008',
-    0x5C845E71: 'uStageObjectBase009',
-    0x3C43D794: 'uStageObjectBase010',
-    0x4B44E702: 'uStageObjectBase011',
-    0x249A8CE2: 'uStageObjectBase100',
-    0x4A94EDCE: 'uStageObjectBase102',
-    0x3D93DD58: 'uStageObjectBase103',
-    0x23F748FB: 'uStageObjectBase104',
-    0x54F0786D: 'uStageObjectBase105',
-    0x4DF929D7: 'uStageObjectBase106',
-    0x3AFE1941: 'uStageObjectBase107',
-    0x5D463446: 'uStageObjectBase109',
-    0x3D81BDA3: 'uStageObjectBase110',
-    0x70296F36: 'uStageObjectBaseCmn',
-    0x3833B1E9: 'cBackupBase',
-    0x066D4D0A: 'cChrFlag',
-    0x2BE46D19: 'cHitParam',
-    0x502A3F19: 'cExciteParam',
-    0x56E4C74F: 'cExcite',
-    0x2EFF2A70: 'cFSMDummyParameter',
-    0x4157A52B: 'cFSMAnmSetParameter',
-    0x6D722634: 'cFSMU32DataSetParameter',
-    0x70AE2D27: 'cFSMS32DataSetParameter',
-    0x5D669B97: 'cFSMF32DataSetParameter',
-    0x2FC507E0: 'cFSMS32RangeSetParameter',
-    0x64897CDA: 'cFSMF32RangeSetParameter',
-    0x6830F693: 'cFSMBoolDataSetParameter',
-    0x2B621BCD: 'cFSMVec3DataSetParameter',
-    0x46C40CB2: 'cFSMTransRotateSetParameter',
-    0x3658B92B: 'cFSMVjobDescSetParameter',
-    0x33B8CFF3: 'cShake',
-    0x0606229E: 'cShakeParam',
-    0x06146A43: 'sStage',
-    0x63C27696: 'uStageScheduler',
-    0x24DC0CED: 'uStageStaticModel',
-    0x504D895E: 'uStage',
-    0x59FAFE8A: 'uStage000',
-    0x37F49FA6: 'uStage002',
-    0x453AE833: 'uStage002::Parameter',
-    0x40F3AF30: 'uStage003',
-    0x5E973A93: 'uStage004',
-    0x7B3E3879: 'uStage004::cChrParam',
-    0x29900A05: 'uStage005',
-    0x609B7416: 'uStage005::cChrParam',
-    0x30995BBF: 'uStage006',
-    0x479E6B29: 'uStage007',
-    0x2026462E: 'uStage009',
-    0x65913997: 'uStage009::cChrParam',
-    0x40E1CFCB: 'uStage010',
-    0x37E6FF5D: 'uStage011',
-    0x19E176ED: 'uStage011::cRoundBackup',
-    0x583894BD: 'uStage100',
-    0x3636F591: 'uStage102',
-    0x4131C507: 'uStage103',
-    0x5F5550A4: 'uStage104',
-    0x6631D90F: 'uStage104::cChrParam',
-    0x28526032: 'uStage105',
-    0x7D949560: 'uStage105::cChrParam',
-    0x315B3188: 'uStage106',
-    0x465C011E: 'uStage107',
-    0x21E42C19: 'uStage109',
-    0x789ED8E1: 'uStage109::cChrParam',
-    0x4123A5FC: 'uStage110',
-    0x7A41F1B3: 'uStageMenu',
-    0x2D61F70A: 'uAction',
-    0x2038621F: 'uActorGameModel',
-    0x69639562: 'uActorShareModel',
-    0x3EF04FD7: 'aAction',
-    0x5A1488F9: 'aBoot',
-    0x402AF35C: 'aChrSelect',
-    0x175B0BCC: 'aChrSelectBlank',
-    0x43AB6D19: 'aChrSelectResten',
-    0x65FDADBB: 'aCredit',
-    0x4A132392: 'aEarthAtk',
-    0x6D2F170A: 'aEnding',
-    0x6C6C080F: 'aFinalResut',
-    0x3FD217B1: 'aGame',
-    0x29CA7FF8: 'aGameDataInstall',
-    0x0C45C5D1: 'aGameOver',
-    0x61FC1CAE: 'aMenu',
-    0x442A946D: 'aMission',
-    0x6A4D42C4: 'aModelViewer',
-    0x1728A8D5: 'aMovie',
-    0x764B3A01: 'aMvcArea',
-    0x29E81959: 'aNetworkRoom',
-    0x4370D5C4: 'aNewChallenger',
-    0x51C039AF: 'aNextBattle',
-    0x4D51F020: 'aPadInit',
-    0x06D6CE46: 'aRoomJump',
-    0x214022D1: 'aTitle',
-    0x11717A38: 'aTitleLogo',
-    0x28D6EDF7: 'aStage000',
-    0x46D88CDB: 'aStage002',
-    0x31DFBC4D: 'aStage003',
-    0x2FBB29EE: 'aStage004',
-    0x58BC1978: 'aStage005',
-    0x41B548C2: 'aStage006',
-    0x36B27854: 'aStage007',
-    0x510A5553: 'aStage009',
-    0x31CDDCB6: 'aStage010',
-    0x46CAEC20: 'aStage011',
-    0x291487C0: 'aStage100',
-    0x471AE6EC: 'aStage102',
-    0x301DD67A: 'aStage103',
-    0x2E7943D9: 'aStage104',
-    0x597E734F: 'aStage105',
-    0x407722F5: 'aStage106',
-    0x37701263: 'aStage107',
-    0x50C83F64: 'aStage109',
-    0x300FB681: 'aStage110',
-    0x0F483566: 'cClearFlag',
-    0x13383E83: 'cEventData',
-    0x2F55A737: 'cExtraCpu',
-    0x7EC75E67: 'cPlayData',
-    0x7A0B5A2C: 'cPlayDataAccumulate',
-    0x32013A89: 'cSecret',
-    0x69DCDDCB: 'cSPCData',
-    0x08CC92A7: 'sBattleSetting',
-    0x7A725087: 'sBattleSetting::cChr',
-    0x6BE1ED74: 'sBattleSetting::cMainChr',
-    0x4A86842A: 'sBattleSetting::cSubChr',
-    0x2D2D4F07: 'sBattleSetting::cOnePlay',
-    0x3442AE1E: 'sGameConfig',
-    0x3B472488: 'sMvc3Main',
-    0x772CE107: 'sMvc3Manager',
-    0x21617F54: 'nDraw::MaterialChar',
-    0x6C468C46: 'nDraw::MaterialCharAlpha',
-    0x6EBE0B47: 'nDraw::MaterialStgSimple',
-    0x20813BB8: 'nDraw::MaterialStgSimple2',
-    0x3B5107CA: 'nDraw::MaterialUI',
-    0x3D6DA1E9: 'sId',
-    0x26F84990: 'sId::Id',
-    0x5A5246A8: 'sId::Map',
-    0x2447D742: 'sId::rIdMapList',
-    0x58B0522A: 'cDlcFile',
-    0x6B8DF09F: 'cNetAcBase',
-    0x60E2D65F: 'cNetAcBase::MsgNetArcade',
-    0x14A16F15: 'cNetAcBase::MsgNetPlayerStatus',
-    0x6A08F7B2: 'cNetAcBase::MsgNetPlayerVer',
-    0x0DF6C9DB: 'cMatchListener',
-    0x59DACE69: 'cNetAcCustom',
-    0x2340E61B: 'cNetAcRank',
-    0x6315A4A9: 'cNetChrSel',
-    0x53165401: 'cNetChrSel::MsgChrTypeSel',
-    0x53F3D1A6: 'cNetChrSel::MsgChrType',
-    0x1E7D3968: 'cNetChrSel::MsgChrAssistSel',
-    0x58F7E8CD: 'cNetChrSel::MsgChrAssist',
-    0x4E4BB431: 'cNetChrSel::MsgStg',
-    0x70B794AD: 'cNetChrSel::MsgBattleData',
-    0x7210C0AC: 'cNetChrSel::MsgFinish',
-    0x75EB49D4: 'cNetChrSel::MsgCurrentMember',
-    0x4C122186: 'cNetChrSel::MsgManner',
-    0x001DFD46: 'cNetChrSel::MsgSpCard',
-    0x16CD5699: 'cNetChrSel::MsgBattleInfo',
-    0x27B0F843: 'cNetFriendList',
-    0x2186685E: 'cNetFriendListListener',
-    0x666AC043: 'cNetLicense',
-    0x38FE69E6: 'cNetLicenseUpload',
-    0x01BA7B89: 'cNetLicenseDownload',
-    0x43C4B47B: 'cNetMannerBase',
-    0x7040A5C5: 'cNetMannerUpload',
-    0x2DC1CACD: 'cNetMannerDownload',
-    0x13C84CA5: 'cNetTitleStorageDownload',
-    0x7EF5FB2B: 'cNetRoomCmu',
-    0x3646DA99: 'cNetRoomCmuEventListener',
-    0x09E969E3: 'cNetRoomCmu::MsgPlayerInfoAll',
-    0x2FEDE634: 'cNetRoomCmu::MsgPlayerInfo',
-    0x04D4489B: 'cNetRoomCmu::MsgPlayerResult',
-    0x14884E20: 'cNetRoomCmu::MsgPlayerBattleRecord',
-    0x75250B3F: 'cNetRoomCmu::MsgPlayerBattleRecordAfter',
-    0x5C6E73F7: 'cNetRoomCmu::MsgPlayerBattleAfterState',
-    0x24F279F2: 'cNetRoomCmu::MsgRoomID',
-    0x7EEB0925: 'cNetRoomCmu::MsgRoomState',
-    0x3DEA208F: 'cNetRoomCmu::MsgParam',
-    0x2800F714: 'cNetRoomCmu::MsgRoomRecord',
-    0x54239D8B: 'cNetRoomCmu::MsgRoomInfo',
-    0x229D626F: 'cNetRoomCmu::MsgBattleResult',
-    0x707AAA30: 'cNetRoomCmu::MsgRoomLog',
-    0x76F980F7: 'cNetRoomCmu::MsgRoomVer',
-    0x1BA8D549: 'cNetRoomCmu::MsgMatchReadyInfo',
-    0x6AAC3A83: 'cNetRoomCmu::MsgMatchReadyOk',
-    0x4FA06983: 'cNetRoomCmu::MsgMatchNext',
-    0x2C3F61D5: 'cNetRoomCmu::MsgMatchCountDown',
-    0x3D27E5E8: 'cNetRoomCmu::MsgEarthAtkPlayerInfo',
-    0x31AFCE73: 'cNetRoomCmu::MsgAreaJumpCall',
-    0x324FEC17: 'cNetScoreDownload',
-    0x2FBF9E81: 'cNetScoreDownloadListener',
-    0x0BA35F33: 'cNetScoreUpload',
-    0x3F4F168C: 'cNetScoreUploadListener',
-    0x4629DF12: 'cNetStep',
-    0x2D0B9EDF: 'cNetStep::MsgToHost',
-    0x2DCACB0F: 'cNetStep::MsgFromHost',
-    0x61D191FE: 'cNetStep::MsgFromHostFlag',
-    0x0B22E02E: 'cNetworkHandshake',
-    0x08D70263: 'cNetworkHandshake::MsgNetworkHandshake',
-    0x1C0DE20D: 'cNetworkHandshake::MsgNetworkHandshakeGallery',
-    0x2C7CE84D: 'sAgentSession',
-    0x2C44A685: 'cMvc3SessionEventListener',
-    0x6C662564: 'sAppNetwork',
-    0x48254965: 'sEarthAtk',
-    0x3DBBA41E: 'sLicense',
-    0x3124E902: 'sMvc3Guide',
-    0x7FD99AB8: 'sMvc3Guide::uErrDialog',
-    0x0DB0FD6E: 'sMvc3Ranking',
-    0x4ABE8A72: 'sMvc3SyncPad::cCommunicationTool',
-    0x26FCF949: 'sMvc3SyncPad::cCommunicationTool::MsgInputData',
-    0x3ED1CFA1: 'sMvc3SyncPad::cCommunicationTool::MsgInputActData',
-    0x69B81331: 'sMvc3SyncPad::cCommunicationTool::MsgInputActData2',
-    0x1EBF23A7: 'sMvc3SyncPad::cCommunicationTool::MsgInputActData3',
-    0x00DBB604: 'sMvc3SyncPad::cCommunicationTool::MsgInputActData4',
-    0x77DC8692: 'sMvc3SyncPad::cCommunicationTool::MsgInputActData5',
-    0x6ED5D728: 'sMvc3SyncPad::cCommunicationTool::MsgInputActData6',
-    0x19D2E7BE: 'sMvc3SyncPad::cCommunicationTool::MsgInputActData7',
-    0x096DFA2F: 'sMvc3SyncPad::cCommunicationTool::MsgInputActData8',
-    0x7E6ACAB9: 'sMvc3SyncPad::cCommunicationTool::MsgInputActData9',
-    0x42BB0A2A: 'sMvc3SyncPad::cCommunicationTool::MsgInputActDataRep',
-    0x74E36729: 'sMvc3SyncPad::cCommunicationTool::MsgInputCmd',
-    0x2D7049F2: 'sMvc3SyncPad::cCommunicationTool::MsgGalleryData',
-    0x0B3D1ACE: 'sMvc3SyncPad::cCommunicationTool::MsgCrcData',
-    0x34DDCDA9: 'sMvc3SyncPad',
-    0x49CB6A3A: 'sNetworkRoom',
-    0x03155298: 'cNetRoomBootupBase',
-    0x54110492: 'cNetRoomBootupCreate',
-    0x6F373FCE: 'cNetRoomBootupSearch',
-    0x6D0C5A4E: 'sPeripheral',
-    0x5A7E5D8A: 'rAnmCmd',
-    0x15C373D1: 'rBattleSetting',
-    0x326F732E: 'rChainSetup',
-    0x7D37E18C: 'rChrSelAssist',
-    0x33CB2BE8: 'rCredit',
-    0x04BFFE96: 'rCredit::Command',
-    0x68A1639F: 'rDlcFile',
-    0x53E132D0: 'rEarthAtkVingo',
-    0x7D8FCA3C: 'rEarthAtkVingo::cEarthAtkVingoParam',
-    0x3B199159: 'rEnding',
-    0x4C997026: 'rEnding::Command',
-    0x007542AE: 'rExCpuInfo',
-    0x1DB58B09: 'rFontSize',
-    0x75CC71DE: 'rGameConfig',
-    0x08B15B78: 'rGameDataInstallList',
-    0x448BBDD4: 'rGameEffectModel',
-    0x7359DE6B: 'rIdConvertList',
-    0x682F6B29: 'rMayaCameraXml',
-    0x009A64A8: 'rMayaCameraList',
-    0x6C9FD2CA: 'rMayaCameraListXml::CameraInfo',
-    0x30D89FB0: 'rMayaCameraListXml',
-    0x112708AF: 'rMenuMain',
-    0x361EA2A5: 'rMission',
-    0x5B55F5B1: 'rMsgData',
-    0x09D93049: 'rMvc3Setting',
-    0x48E25BBB: 'rPowerGrid',
-    0x763DB1E4: 'rReplay',
-    0x357EF6D4: 'rResourcePathList',
-    0x30F6E705: 'rSPCList',
-    0x7061F3E6: 'rSPCList::cUserData',
-    0x7E809739: 'rSPCList::cUserDataU32',
-    0x60E08A10: 'rSPCList::cUserDataF32',
-    0x1AB9DAF6: 'rSPCUseTable',
-    0x642AE284: 'rStageParam',
-    0x2450435F: 'rStageParam::cStageParam',
-    0x2C7171FA: 'rStgObjLayout',
-    0x5CF454DA: 'rStgObjLayout::cUserData',
-    0x32D2C684: 'rStgObjLayout::cUserDataU32',
-    0x2CB2DBAD: 'rStgObjLayout::cUserDataF32',
-    0x501ACD5C: 'rSubTitleLabel',
-    0x10BE43D4: 'rShot',
-    0x4C01F8B2: 'rShot::cCommonData',
-    0x3753A9BA: 'rShot::cAtkData',
-    0x7F33FD7F: 'rShot::cHitData',
-    0x141D851F: 'rShotList',
-    0x60B821BB: 'rGalleryChrVoiceMap',
-    0x5223CB7E: 'sGSound',
-    0x0C13623E: 'uGSoundProcess',
-    0x78C642B4: 'uStorage',
-    0x4D157EB8: 'uStoragePC',
-    0x484D6405: 'sGameDataInstall',
-    0x4EB8D294: 'sMovie2',
-    0x53FBD484: 'sMvc3Area',
-    0x5CA4615E: 'sMvc3Effect',
-    0x262CC745: 'sMvc3Pad',
-    0x7E9869C6: 'sMvc3Render',
-    0x42478DD4: 'sMvc3Resource',
-    0x6A17CAF7: 'sMvc3Resource::cLoadResource',
-    0x38856C99: 'sMvc3Resource::cFNFResource',
-    0x57F8A548: 'sMvc3Resource::cLoadArea',
-    0x22C3C1ED: 'sMvc3Scene',
-    0x127C7C26: 'sMvc3Setting',
-    0x229721D7: 'sMvc3Shader2',
-    0x249CD73D: 'sMvc3Tool',
-    0x1827DCA1: 'sMvc3Vibration',
-    0x38A84664: 'cGameUiResManager',
-    0x597C4874: 'cMsgWindowManager',
-    0x7DEED8E6: 'sGameUi',
-    0x5BE6C32F: 'cActorGameSpriteAnm',
-    0x156FAA86: 'uActorGameSprite',
-    0x32782CE2: 'uBaseSprite',
-    0x65577EFD: 'uBaseSpriteVjob',
-    0x1729EEC2: 'uBaseSpriteVjobu32',
-    0x047B6218: 'uBaseSpriteVjobFloat',
-    0x1EC89196: 'uBaseSpriteVjobMtFloat2',
-    0x244E1BC8: 'uBaseSpriteVjobMtVector3',
-    0x748DC100: 'uBaseSpriteVjobMtVector3Ref',
-    0x3A2A8E6B: 'uBaseSpriteVjobMtVector4',
-    0x6690E8DC: 'uBaseSpriteVjobMtColor',
-    0x7942324B: 'uUiAnmSprite',
-    0x518E722D: 'uUiAnmSpriteFont',
-    0x31CEC9D8: 'uUiAnmSpriteFont::cFontVertex',
-    0x33D9AE47: 'cMsgChgData',
-    0x4AF926B7: 'uUiAnmSpriteFrame',
-    0x3498E7A4: 'uUiAnmSpriteRadar',
-    0x3514D74F: 'uBattleUi',
-    0x1FD675CB: 'uBattleUiBase',
-    0x28F031E1: 'uBattleUiCommandList',
-    0x075158B2: 'uHitModel',
-    0x32BBF45E: 'uBattleUiHit',
-    0x6EBA9E72: 'uHitDamageModel',
-    0x7608D966: 'uCmbTextModel',
-    0x66EB3FCA: 'uCmbText',
-    0x4002B233: 'uBattleUiMission',
-    0x1E1FBCE1: 'uBattleUiMissionCommand',
-    0x48A85539: 'uBattleUiMissionList',
-    0x5932FF03: 'uBattleUiNaruhodo',
-    0x33C4551D: 'uBattleUiPause',
-    0x44D12F14: 'uBattleUiPauseBlur',
-    0x26950A29: 'uBattleUiPauseNetGallery',
-    0x55E3113B: 'uBattleUiPhase',
-    0x30F613EF: 'uBattleUiTime',
-    0x17FF1DD3: 'uBattleUiTraining',
-    0x5B2D1C98: 'uBattleUiTrainingAttack',
-    0x07D9AE32: 'uBattleUiTrainingRecord',
-    0x22DF653B: 'uBtChrIcon',
-    0x49B8448A: 'uBtAssistChrIcon',
-    0x4AAF2CBF: 'uBtChr2Icon',
-    0x23BA6206: 'uBtContinue',
-    0x72A64E81: 'uBtGameOver',
-    0x3A1F1831: 'uBtGaugeCardIcon',
-    0x23ABA697: 'uBtGaugeHc',
-    0x0D3FF2DC: 'uBtGaugeLife',
-    0x39FB34A6: 'uBtKeyDisp',
-    0x5EF7508B: 'uBtKeyDispBtn',
-    0x5B2311B4: 'uBtNewChallenger',
-    0x4BBA3CA9: 'uBtNewChallenger1647',
-    0x755939E5: 'uBtResult',
-    0x69488840: 'uBtResultScore',
-    0x0CB1D9AA: 'uBtResultScoreArcade',
-    0x7DAD7C0F: 'uBtResultScoreEAOffline',
-    0x7DB0A661: 'uBtResultScoreEarthAtk',
-    0x34A4BF1E: 'uBtResultScoreFree',
-    0x71F39633: 'uBtResultScoreRank',
-    0x10A871BE: 'uBtResultScoreVersus',
-    0x08307BAD: 'uBtScore',
-    0x6C92B102: 'uBtSimpleLicense',
-    0x581807E1: 'uBtStatusGauge',
-    0x23571375: 'uBtStatusGaugeManager',
-    0x201DF06C: 'uBtSubTitle',
-    0x059C13E4: 'uBtUiSubSysMsg',
-    0x3A3DFFB0: 'uBtVsSpcCard',
-    0x50C1D306: 'u2PCtrlSelect',
-    0x106DBCDE: 'uCreditMsg',
-    0x3CCD582D: 'uCreditNames',
-    0x2F9C86C0: 'uDelayFunc',
-    0x31D12120: 'uDelayUnit',
-    0x31BA79B6: 'uE3Thank',
-    0x362C9810: 'uEarthAtkVingo',
-    0x03905A0A: 'uEarthAtkVingo::uVingoEffect',
-    0x7EBEAFD7: 'uEnding',
-    0x6FDD9E2F: 'uFinishScreen',
-    0x7BDC6134: 'uLoading',
-    0x16990E0B: 'uSaveDataAccess',
-    0x68EF8ED7: 'uSPCCard',
-    0x5A85658C: 'uSPCWindow',
-    0x0617DDAA: 'uUiArcDisp',
-    0x5560DD36: 'uUiBase',
-    0x709F0E54: 'uUiChoiceWindow',
-    0x533B5744: 'uUiCursor',
-    0x6B3651FA: 'uUiDepthClear',
-    0x0301B847: 'uUiEffectBase',
-    0x2024AC38: 'uUiEffect',
-    0x2CCC13AD: 'uUiErrorFade',
-    0x5B7C1A5D: 'uUiKeyInfo',
-    0x26618272: 'uUiKeyInfoDraw',
-    0x000E25FF: 'uUiModelBase',
-    0x700D8D20: 'uUiModel',
-    0x40814A32: 'uUiMaskModel',
-    0x25DBCB23: 'uUiToonModel',
-    0x5F8470B1: 'uUiPageChange',
-    0x4C003B0D: 'uUiPopup2D',
-    0x7C75DA70: 'uUiPopupWindow',
-    0x33EA910D: 'uUiPreMenu',
-    0x57CBF8F8: 'uUiRoomWatch',
-    0x3E1CEBBD: 'uUiScheduler',
-    0x6AD01AAB: 'uUiScreenCopy',
-    0x460A2262: 'uUiSdlAnimeFrame',
-    0x2359B254: 'uUiSprite',
-    0x723D4571: 'uUiSprite::rTmpTexture',
-    0x7E628910: 'uUiSprite3D',
-    0x2150D089: 'uUiSpriteCore',
-    0x25E362BE: 'uUiSpriteMove',
-    0x7917FB8B: 'uBtFilePath',
-    0x31DA65FA: 'uBtFinalResultFilePath',
-    0x57AF4D08: 'uBtMsgFilePath',
-    0x44EEB174: 'uLogoFilePath',
-    0x12326765: 'uMenuEndingFilePath',
-    0x7D6D5D8B: 'uMenuEndingFilePath_Ryu',
-    0x7B13BE91: 'uMenuEndingFilePath_Chunli',
-    0x22B86A85: 'uMenuEndingFilePath_Gouki',
-    0x00F47981: 'uMenuEndingFilePath_Chris',
-    0x63C3D53F: 'uMenuEndingFilePath_Wesker',
-    0x5EAD9467: 'uMenuEndingFilePath_VJoe',
-    0x51586942: 'uMenuEndingFilePath_Dante',
-    0x47ABFA4E: 'uMenuEndingFilePath_Trish',
-    0x35FD52B2: 'uMenuEndingFilePath_Frank',
-    0x76AA23F7: 'uMenuEndingFilePath_Spencer',
-    0x31DFEB9A: 'uMenuEndingFilePath_Arthur',
-    0x32831368: 'uMenuEndingFilePath_Amaterasu',
-    0x38D3AF00: 'uMenuEndingFilePath_Zero',
-    0x490E314C: 'uMenuEndingFilePath_Tron',
-    0x471773C5: 'uMenuEndingFilePath_Morrigan',
-    0x3A5C4FF5: 'uMenuEndingFilePath_Leilei',
-    0x289B57AC: 'uMenuEndingFilePath_Felicia',
-    0x32D2AC8E: 'uMenuEndingFilePath_CViper',
-    0x56CE3F19: 'uMenuEndingFilePath_Haggar',
-    0x2C986F9E: 'uMenuEndingFilePath_Jill',
-    0x6C399891: 'uMenuEndingFilePath_Hiryu',
-    0x4F83EAF4: 'uMenuEndingFilePath_Vergil',
-    0x17582165: 'uMenuEndingFilePath_Naruhodo',
-    0x75E15F54: 'uMenuEndingFilePath_RedArremer',
-    0x035D5DFB: 'uMenuEndingFilePath_Nemesis',
-    0x24F41722: 'uMenuEndingFilePath_SpiderMan',
-    0x20F30121: 'uMenuEndingFilePath_CapAmerica',
-    0x6FABC2E5: 'uMenuEndingFilePath_Wolverine',
-    0x47537541: 'uMenuEndingFilePath_Magneto',
-    0x0DC968A2: 'uMenuEndingFilePath_Hulk',
-    0x31749FA8: 'uMenuEndingFilePath_SheHulk',
-    0x0C49E869: 'uMenuEndingFilePath_TaskMaster',
-    0x70C2AB7C: 'uMenuEndingFilePath_IronMan',
-    0x4CBE4BA5: 'uMenuEndingFilePath_Thor',
-    0x29536323: 'uMenuEndingFilePath_DrDoom',
-    0x71CE137D: 'uMenuEndingFilePath_Phoenix',
-    0x728E4CCA: 'uMenuEndingFilePath_Shuma',
-    0x7F8E1F4B: 'uMenuEndingFilePath_Modok',
-    0x541B4364: 'uMenuEndingFilePath_Dormammu',
-    0x65778F86: 'uMenuEndingFilePath_DeadPool',
-    0x3D1CC0FE: 'uMenuEndingFilePath_Storm',
-    0x711ACBAC: 'uMenuEndingFilePath_SuperSkrull',
-    0x74B1A775: 'uMenuEndingFilePath_Sentinel',
-    0x7CC8AA36: 'uMenuEndingFilePath_X23',
-    0x69EB021D: 'uMenuEndingFilePath_Nova',
-    0x0CD7C685: 'uMenuEndingFilePath_RRaccoon',
-    0x752012AC: 'uMenuEndingFilePath_GhostRider',
-    0x2855F03C: 'uMenuEndingFilePath_IronFist',
-    0x4A5AF234: 'uMenuEndingFilePath_DrStrange',
-    0x2F63ECE5: 'uMenuEndingFilePath_HawkEye',
-    0x2401DC28: 'uMenuEndingFilePath_Galactus',
-    0x6223A198: 'uMenuEndingMsgFilePath',
-    0x7227A80F: 'uMenuEndingMsgFilePath_Ryu',
-    0x62EDB0B4: 'uMenuEndingMsgFilePath_Chunli',
-    0x30803E13: 'uMenuEndingMsgFilePath_Gouki',
-    0x12CC2D17: 'uMenuEndingMsgFilePath_Chris',
-    0x7A3DDB1A: 'uMenuEndingMsgFilePath_Wesker',
-    0x347799AB: 'uMenuEndingMsgFilePath_VJoe',
-    0x43603DD4: 'uMenuEndingMsgFilePath_Dante',
-    0x5593AED8: 'uMenuEndingMsgFilePath_Trish',
-    0x27C50624: 'uMenuEndingMsgFilePath_Frank',
-    0x3DB709BE: 'uMenuEndingMsgFilePath_Spencer',
-    0x2821E5BF: 'uMenuEndingMsgFilePath_Arthur',
-    0x488365EF: 'uMenuEndingMsgFilePath_Amaterasu',
-    0x5209A2CC: 'uMenuEndingMsgFilePath_Zero',
-    0x23D43C80: 'uMenuEndingMsgFilePath_Tron',
-    0x485C97DB: 'uMenuEndingMsgFilePath_Morrigan',
-    0x23A241D0: 'uMenuEndingMsgFilePath_Leilei',
-    0x63867DE5: 'uMenuEndingMsgFilePath_Felicia',
-    0x2B2CA2AB: 'uMenuEndingMsgFilePath_CViper',
-    0x4F30313C: 'uMenuEndingMsgFilePath_Haggar',
-    0x46426252: 'uMenuEndingMsgFilePath_Jill',
-    0x7E01CC07: 'uMenuEndingMsgFilePath_Hiryu',
-    0x567DE4D1: 'uMenuEndingMsgFilePath_Vergil',
-    0x1813C57B: 'uMenuEndingMsgFilePath_Naruhodo',
-    0x06C749A1: 'uMenuEndingMsgFilePath_RedArremer',
-    0x484077B2: 'uMenuEndingMsgFilePath_Nemesis',
-    0x5EF461A5: 'uMenuEndingMsgFilePath_SpiderMan',
-    0x53D517D4: 'uMenuEndingMsgFilePath_CapAmerica',
-    0x15ABB462: 'uMenuEndingMsgFilePath_Wolverine',
-    0x0C4E5F08: 'uMenuEndingMsgFilePath_Magneto',
-    0x6713656E: 'uMenuEndingMsgFilePath_Hulk',
-    0x7A69B5E1: 'uMenuEndingMsgFilePath_SheHulk',
-    0x7F6FFE9C: 'uMenuEndingMsgFilePath_TaskMaster',
-    0x3BDF8135: 'uMenuEndingMsgFilePath_IronMan',
-    0x26644669: 'uMenuEndingMsgFilePath_Thor',
-    0x30AD6D06: 'uMenuEndingMsgFilePath_DrDoom',
-    0x3AD33934: 'uMenuEndingMsgFilePath_Phoenix',
-    0x60B6185C: 'uMenuEndingMsgFilePath_Shuma',
-    0x6DB64BDD: 'uMenuEndingMsgFilePath_Modok',
-    0x5B50A77A: 'uMenuEndingMsgFilePath_Dormammu',
-    0x6A3C6B98: 'uMenuEndingMsgFilePath_DeadPool',
-    0x2F249468: 'uMenuEndingMsgFilePath_Storm',
-    0x3CBEEB29: 'uMenuEndingMsgFilePath_SuperSkrull',
-    0x7BFA436B: 'uMenuEndingMsgFilePath_Sentinel',
-    0x73825FB2: 'uMenuEndingMsgFilePath_X23',
-    0x03310FD1: 'uMenuEndingMsgFilePath_Nova',
-    0x039C229B: 'uMenuEndingMsgFilePath_RRaccoon',
-    0x06060459: 'uMenuEndingMsgFilePath_GhostRider',
-    0x271E1422: 'uMenuEndingMsgFilePath_IronFist',
-    0x305A84B3: 'uMenuEndingMsgFilePath_DrStrange',
-    0x647EC6AC: 'uMenuEndingMsgFilePath_HawkEye',
-    0x2B4A3836: 'uMenuEndingMsgFilePath_Galactus',
-    0x3F49954C: 'uMenuExtraCPUFilePath',
-    0x146B020D: 'uMenuExtraCPUSingleFilePath',
-    0x398DE4CF: 'uMenuLicenseCmnFilePath',
-    0x7DBC1C90: 'uMenuLicenseCmnMsgFilePath',
-    0x08F1BD39: 'uMenuLicenseFilePath',
-    0x6483FE32: 'uMenuNetRoomFilePath',
-    0x35150CE9: 'uMnChrSelCmnFilePath',
-    0x234B271E: 'uMnChrSelEAFilePath',
-    0x36F50936: 'uMnChrSelFilePath',
-    0x34B927DC: 'uMnChrSelSDCC11FilePath',
-    0x1996D0AC: 'uMnChrSelGC11FilePath',
-    0x020C7A96: 'uMnChrSelTGS11FilePath',
-    0x16DAAD4F: 'uMnChrSelNYCC11FilePath',
-    0x72A720EF: 'uMnChrSelMsgFilePath',
-    0x3AFBDEFB: 'uMnChrSelMsgSDCC11FilePath',
-    0x61D262AF: 'uMnChrSelMsgGC11FilePath',
-    0x1B7D6F9E: 'uMnChrSelMsgTGS11FilePath',
-    0x18985468: 'uMnChrSelMsgNYCC11FilePath',
-    0x6CFBD45B: 'uMnChrSelStgFilePath',
-    0x039BC24A: 'uMnCntFilePath',
-    0x3FD0E8A3: 'uMnEarthFilePath',
-    0x6A9EDB6A: 'uMnEarthManualFilePath',
-    0x700C968F: 'uMnGameOverFilePath',
-    0x4C7E4D7C: 'uMnMainFilePath',
-    0x54372CE3: 'uMnMainSDCC11FilePath',
-    0x720B944B: 'uMnMainGC11FilePath',
-    0x3C899009: 'uMnMainTGS11FilePath',
-    0x7654A670: 'uMnMainNYCC11FilePath',
-    0x61D5F82A: 'uMnMainMsgFilePath',
-    0x7C380BDA: 'uMnMainMsgSDCC11FilePath',
-    0x57D4C199: 'uMnMainMsgGC11FilePath',
-    0x5471FCA4: 'uMnMainMsgTGS11FilePath',
-    0x5E5B8149: 'uMnMainMsgNYCC11FilePath',
-    0x392A93E6: 'uMnNextBtFilePath',
-    0x1BD7CF36: 'uMnNextBtFilePath_Stage00',
-    0x6C9D4222: 'uMnNextBtFilePath_Stage00b',
-    0x6CD0FFA0: 'uMnNextBtFilePath_Stage01',
-    0x75867363: 'uMnNextBtFilePath_Stage01b',
-    0x75D9AE1A: 'uMnNextBtFilePath_Stage02',
-    0x5EAB20A0: 'uMnNextBtFilePath_Stage02b',
-    0x02DE9E8C: 'uMnNextBtFilePath_Stage03',
-    0x47B011E1: 'uMnNextBtFilePath_Stage03b',
-    0x1CBA0B2F: 'uMnNextBtFilePath_Stage04',
-    0x08F18726: 'uMnNextBtFilePath_Stage04b',
-    0x6BBD3BB9: 'uMnNextBtFilePath_Stage05',
-    0x11EAB667: 'uMnNextBtFilePath_Stage05b',
-    0x72B46A03: 'uMnNextBtFilePath_Stage06',
-    0x3AC7E5A4: 'uMnNextBtFilePath_Stage06b',
-    0x05B35A95: 'uMnNextBtFilePath_Stage07',
-    0x23DCD4E5: 'uMnNextBtFilePath_Stage07b',
-    0x150C4704: 'uMnNextBtFilePath_Stage08',
-    0x2444C82A: 'uMnNextBtFilePath_Stage08b',
-    0x620B7792: 'uMnNextBtFilePath_Stage09',
-    0x3D5FF96B: 'uMnNextBtFilePath_Stage09b',
-    0x02CCFE77: 'uMnNextBtFilePath_Stage10',
-    0x6D5F2815: 'uMnNextBtFilePath_Stage10b',
-    0x75CBCEE1: 'uMnNextBtFilePath_Stage11',
-    0x508B9C56: 'uNaruhodo07FilePath',
-    0x753DD5EB: 'uNextBattleFilePath',
-    0x4BDE2D9E: 'uUiCmnFilePath',
-    0x3B876ED4: 'uUiCmnShowFilePath',
-    0x7898342C: 'uUiCmnMsgFilePath',
-    0x426D3D0A: 'uUiCreditFilePath',
-    0x1A28D46E: 'uUiCreditMsgFilePath',
-    0x1E053E4E: 'uUiFilePathBase',
-    0x2449B7F8: 'uUiGameEAFilePath',
-    0x3085FF46: 'uUiReadyFilePath',
-    0x689404BD: 'uUiSPCFilePath_all',
-    0x426E92E8: 'uUiSPCFilePath_0',
-    0x3569A27E: 'uUiSPCFilePath_1',
-    0x2C60F3C4: 'uUiSPCFilePath_2',
-    0x5B67C352: 'uUiSPCFilePath_3',
-    0x450356F1: 'uUiSPCFilePath_4',
-    0x32046667: 'uUiSPCFilePath_5',
-    0x2B0D37DD: 'uUiSPCFilePath_6',
-    0x5C0A074B: 'uUiSPCFilePath_7',
-    0x4CB51ADA: 'uUiSPCFilePath_8',
-    0x3BB22A4C: 'uUiSPCFilePath_9',
-    0x11D10535: 'uUiSPCFilePath_10',
-    0x66D635A3: 'uUiSPCFilePath_11',
-    0x7FDF6419: 'uUiSPCFilePath_12',
-    0x08D8548F: 'uUiSPCFilePath_13',
-    0x16BCC12C: 'uUiSPCFilePath_14',
-    0x61BBF1BA: 'uUiSPCFilePath_15',
-    0x78B2A000: 'uUiSPCFilePath_16',
-    0x0FB59096: 'uUiSPCFilePath_17',
-    0x1F0A8D07: 'uUiSPCFilePath_18',
-    0x680DBD91: 'uUiSPCFilePath_19',
-    0x3AFC56F6: 'uUiSPCFilePath_20',
-    0x4DFB6660: 'uUiSPCFilePath_21',
-    0x54F237DA: 'uUiSPCFilePath_22',
-    0x23F5074C: 'uUiSPCFilePath_23',
-    0x3D9192EF: 'uUiSPCFilePath_24',
-    0x4A96A279: 'uUiSPCFilePath_25',
-    0x539FF3C3: 'uUiSPCFilePath_26',
-    0x2498C355: 'uUiSPCFilePath_27',
-    0x3427DEC4: 'uUiSPCFilePath_28',
-    0x4320EE52: 'uUiSPCFilePath_29',
-    0x23E767B7: 'uUiSPCFilePath_30',
-    0x54E05721: 'uUiSPCFilePath_31',
-    0x4DE9069B: 'uUiSPCFilePath_32',
-    0x3AEE360D: 'uUiSPCFilePath_33',
-    0x248AA3AE: 'uUiSPCFilePath_34',
-    0x538D9338: 'uUiSPCFilePath_35',
-    0x4546122F: 'uUiSPCFilePath_b35',
-    0x4A84C282: 'uUiSPCFilePath_36',
-    0x3D83F214: 'uUiSPCFilePath_37',
-    0x2D3CEF85: 'uUiSPCFilePath_38',
-    0x5A3BDF13: 'uUiSPCFilePath_39',
-    0x6CA6F170: 'uUiSPCFilePath_40',
-    0x1BA1C1E6: 'uUiSPCFilePath_41',
-    0x02A8905C: 'uUiSPCFilePath_42',
-    0x75AFA0CA: 'uUiSPCFilePath_43',
-    0x6BCB3569: 'uUiSPCFilePath_44',
-    0x1CCC05FF: 'uUiSPCFilePath_45',
-    0x05C55445: 'uUiSPCFilePath_46',
-    0x72C264D3: 'uUiSPCFilePath_47',
-    0x627D7942: 'uUiSPCFilePath_48',
-    0x157A49D4: 'uUiSPCFilePath_49',
-    0x75BDC031: 'uUiSPCFilePath_50',
-    0x02BAF0A7: 'uUiSPCFilePath_51',
-    0x1BB3A11D: 'uUiSPCFilePath_52',
-    0x6CB4918B: 'uUiSPCFilePath_53',
-    0x72D00428: 'uUiSPCFilePath_54',
-    0x05D734BE: 'uUiSPCFilePath_55',
-    0x1CDE6504: 'uUiSPCFilePath_56',
-    0x6BD95592: 'uUiSPCFilePath_57',
-    0x7B664803: 'uUiSPCFilePath_58',
-    0x0C617895: 'uUiSPCFilePath_59',
-    0x5E9093F2: 'uUiSPCFilePath_60',
-    0x2997A364: 'uUiSPCFilePath_61',
-    0x309EF2DE: 'uUiSPCFilePath_62',
-    0x4799C248: 'uUiSPCFilePath_63',
-    0x59FD57EB: 'uUiSPCFilePath_64',
-    0x2EFA677D: 'uUiSPCFilePath_65',
-    0x37F336C7: 'uUiSPCFilePath_66',
-    0x40F40651: 'uUiSPCFilePath_67',
-    0x504B1BC0: 'uUiSPCFilePath_68',
-    0x274C2B56: 'uUiSPCFilePath_69',
-    0x478BA2B3: 'uUiSPCFilePath_70',
-    0x308C9225: 'uUiSPCFilePath_71',
-    0x2985C39F: 'uUiSPCFilePath_72',
-    0x5E82F309: 'uUiSPCFilePath_73',
-    0x40E666AA: 'uUiSPCFilePath_74',
-    0x37E1563C: 'uUiSPCFilePath_75',
-    0x2EE80786: 'uUiSPCFilePath_76',
-    0x59EF3710: 'uUiSPCFilePath_77',
-    0x49502A81: 'uUiSPCFilePath_78',
-    0x3E571A17: 'uUiSPCFilePath_79',
-    0x4013BE7C: 'uUiSPCFilePath_80',
-    0x37148EEA: 'uUiSPCFilePath_81',
-    0x2E1DDF50: 'uUiSPCFilePath_82',
-    0x591AEFC6: 'uUiSPCFilePath_83',
-    0x477E7A65: 'uUiSPCFilePath_84',
-    0x30794AF3: 'uUiSPCFilePath_85',
-    0x29701B49: 'uUiSPCFilePath_86',
-    0x5E772BDF: 'uUiSPCFilePath_87',
-    0x4EC8364E: 'uUiSPCFilePath_88',
-    0x39CF06D8: 'uUiSPCFilePath_89',
-    0x59088F3D: 'uUiSPCFilePath_90',
-    0x2E0FBFAB: 'uUiSPCFilePath_91',
-    0x3706EE11: 'uUiSPCFilePath_92',
-    0x4001DE87: 'uUiSPCFilePath_93',
-    0x5E654B24: 'uUiSPCFilePath_94',
-    0x29627BB2: 'uUiSPCFilePath_95',
-    0x306B2A08: 'uUiSPCFilePath_96',
-    0x476C1A9E: 'uUiSPCFilePath_97',
-    0x57D3070F: 'uUiSPCFilePath_98',
-    0x20D43799: 'uUiSPCFilePath_99',
-    0x70FB258A: 'uUiSPCFilePath_100',
-    0x07FC151C: 'uUiSPCFilePath_101',
-    0x1EF544A6: 'uUiSPCFilePath_102',
-    0x69F27430: 'uUiSPCFilePath_103',
-    0x5B1AF4CB: 'uUiSPCFilePath_i_base0',
-    0x2C1DC45D: 'uUiSPCFilePath_i_base1',
-    0x351495E7: 'uUiSPCFilePath_i_base2',
-    0x4213A571: 'uUiSPCFilePath_i_base3',
-    0x6A830FF2: 'uUiSPCFilePath_i_base100',
-    0x1D843F64: 'uUiSPCFilePath_i_base101',
-    0x048D6EDE: 'uUiSPCFilePath_i_base102',
-    0x738A5E48: 'uUiSPCFilePath_i_base103',
-    0x68C5B1AB: 'uUiSPCFilePath_i_base200',
-    0x1FC2813D: 'uUiSPCFilePath_i_base201',
-    0x06CBD087: 'uUiSPCFilePath_i_base202',
-    0x71CCE011: 'uUiSPCFilePath_i_base203',
-    0x6907DB9C: 'uUiSPCFilePath_i_base300',
-    0x1E00EB0A: 'uUiSPCFilePath_i_base301',
-    0x0709BAB0: 'uUiSPCFilePath_i_base302',
-    0x700E8A26: 'uUiSPCFilePath_i_base303',
-    0x6C48CD19: 'uUiSPCFilePath_i_base400',
-    0x1B4FFD8F: 'uUiSPCFilePath_i_base401',
-    0x0246AC35: 'uUiSPCFilePath_i_base402',
-    0x75419CA3: 'uUiSPCFilePath_i_base403',
-    0x6D8AA72E: 'uUiSPCFilePath_i_base500',
-    0x1A8D97B8: 'uUiSPCFilePath_i_base501',
-    0x0384C602: 'uUiSPCFilePath_i_base502',
-    0x7483F694: 'uUiSPCFilePath_i_base503',
-    0x6FCC1977: 'uUiSPCFilePath_i_base600',
-    0x18CB29E1: 'uUiSPCFilePath_i_base601',
-    0x01C2785B: 'uUiSPCFilePath_i_base602',
-    0x76C548CD: 'uUiSPCFilePath_i_base603',
-    0x6E0E7340: 'uUiSPCFilePath_i_base700',
-    0x190943D6: 'uUiSPCFilePath_i_base701',
-    0x0000126C: 'uUiSPCFilePath_i_base702',
-    0x770722FA: 'uUiSPCFilePath_i_base703',
-    0x6552347D: 'uUiSPCFilePath_i_base800',
-    0x125504EB: 'uUiSPCFilePath_i_base801',
-    0x0B5C5551: 'uUiSPCFilePath_i_base802',
-    0x7C5B65C7: 'uUiSPCFilePath_i_base803',
-    0x61F4EF33: 'uUiSPCFilePath_icon0',
-    0x16F3DFA5: 'uUiSPCFilePath_icon1',
-    0x0FFA8E1F: 'uUiSPCFilePath_icon2',
-    0x78FDBE89: 'uUiSPCFilePath_icon3',
-    0x66992B2A: 'uUiSPCFilePath_icon4',
-    0x3C831745: 'uUiSPCFilePath_icon100',
-    0x4B8427D3: 'uUiSPCFilePath_icon101',
-    0x528D7669: 'uUiSPCFilePath_icon102',
-    0x258A46FF: 'uUiSPCFilePath_icon103',
-    0x3BEED35C: 'uUiSPCFilePath_icon104',
-    0x4CE9E3CA: 'uUiSPCFilePath_icon105',
-    0x55E0B270: 'uUiSPCFilePath_icon106',
-    0x22E782E6: 'uUiSPCFilePath_icon107',
-    0x32589F77: 'uUiSPCFilePath_icon108',
-    0x455FAFE1: 'uUiSPCFilePath_icon109',
-    0x25982604: 'uUiSPCFilePath_icon110',
-    0x529F1692: 'uUiSPCFilePath_icon111',
-    0x4B964728: 'uUiSPCFilePath_icon112',
-    0x3C9177BE: 'uUiSPCFilePath_icon113',
-    0x22F5E21D: 'uUiSPCFilePath_icon114',
-    0x55F2D28B: 'uUiSPCFilePath_icon115',
-    0x4CFB8331: 'uUiSPCFilePath_icon116',
-    0x3BFCB3A7: 'uUiSPCFilePath_icon117',
-    0x2B43AE36: 'uUiSPCFilePath_icon118',
-    0x5C449EA0: 'uUiSPCFilePath_icon119',
-    0x3EC5A91C: 'uUiSPCFilePath_icon200',
-    0x49C2998A: 'uUiSPCFilePath_icon201',
-    0x50CBC830: 'uUiSPCFilePath_icon202',
-    0x27CCF8A6: 'uUiSPCFilePath_icon203',
-    0x39A86D05: 'uUiSPCFilePath_icon204',
-    0x4EAF5D93: 'uUiSPCFilePath_icon205',
-    0x57A60C29: 'uUiSPCFilePath_icon206',
-    0x20A13CBF: 'uUiSPCFilePath_icon207',
-    0x301E212E: 'uUiSPCFilePath_icon208',
-    0x471911B8: 'uUiSPCFilePath_icon209',
-    0x27DE985D: 'uUiSPCFilePath_icon210',
-    0x3F07C32B: 'uUiSPCFilePath_icon300',
-    0x4800F3BD: 'uUiSPCFilePath_icon301',
-    0x5109A207: 'uUiSPCFilePath_icon302',
-    0x260E9291: 'uUiSPCFilePath_icon303',
-    0x386A0732: 'uUiSPCFilePath_icon304',
-    0x4F6D37A4: 'uUiSPCFilePath_icon305',
-    0x5664661E: 'uUiSPCFilePath_icon306',
-    0x21635688: 'uUiSPCFilePath_icon307',
-    0x31DC4B19: 'uUiSPCFilePath_icon308',
-    0x3A48D5AE: 'uUiSPCFilePath_icon400',
-    0x4D4FE538: 'uUiSPCFilePath_icon401',
-    0x5446B482: 'uUiSPCFilePath_icon402',
-    0x23418414: 'uUiSPCFilePath_icon403',
-    0x3D2511B7: 'uUiSPCFilePath_icon404',
-    0x4A222121: 'uUiSPCFilePath_icon405',
-    0x532B709B: 'uUiSPCFilePath_icon406',
-    0x3B8ABF99: 'uUiSPCFilePath_icon500',
-    0x4C8D8F0F: 'uUiSPCFilePath_icon501',
-    0x5584DEB5: 'uUiSPCFilePath_icon502',
-    0x2283EE23: 'uUiSPCFilePath_icon503',
-    0x39CC01C0: 'uUiSPCFilePath_icon600',
-    0x4ECB3156: 'uUiSPCFilePath_icon601',
-    0x57C260EC: 'uUiSPCFilePath_icon602',
-    0x20C5507A: 'uUiSPCFilePath_icon603',
-    0x3EA1C5D9: 'uUiSPCFilePath_icon604',
-    0x49A6F54F: 'uUiSPCFilePath_icon605',
-    0x50AFA4F5: 'uUiSPCFilePath_icon606',
-    0x27A89463: 'uUiSPCFilePath_icon607',
-    0x371789F2: 'uUiSPCFilePath_icon608',
-    0x4010B964: 'uUiSPCFilePath_icon609',
-    0x20D73081: 'uUiSPCFilePath_icon610',
-    0x57D00017: 'uUiSPCFilePath_icon611',
-    0x4ED951AD: 'uUiSPCFilePath_icon612',
-    0x380E6BF7: 'uUiSPCFilePath_icon700',
-    0x4F095B61: 'uUiSPCFilePath_icon701',
-    0x56000ADB: 'uUiSPCFilePath_icon702',
-    0x21073A4D: 'uUiSPCFilePath_icon703',
-    0x33522CCA: 'uUiSPCFilePath_icon800',
-    0x44551C5C: 'uUiSPCFilePath_icon801',
-    0x5D5C4DE6: 'uUiSPCFilePath_icon802',
-    0x2A5B7D70: 'uUiSPCFilePath_icon803',
-    0x5B548E2A: 'uUiSPCFilePath_i_lv0',
-    0x2C53BEBC: 'uUiSPCFilePath_i_lv1',
-    0x355AEF06: 'uUiSPCFilePath_i_lv2',
-    0x425DDF90: 'uUiSPCFilePath_i_lv3',
-    0x5C394A33: 'uUiSPCFilePath_i_lv4',
-    0x590D1FAD: 'uFont',
-    0x3C889B42: 'uFont::cFontVertex',
-    0x0A6047A4: 'uFont2D',
-    0x137B76E5: 'uFont3D',
-    0x4EA03CCB: 'uFontBase',
-    0x331AC360: 'uFontModel',
-    0x5DDCB35D: 'uChrColorType',
-    0x161669BB: 'uChrUvOffset',
-    0x4E40BB7D: 'uMenuChrSel',
-    0x470EE776: 'uMenuChrSelAssist',
-    0x07527911: 'uMenuChrSelBgMain',
-    0x7D577FFC: 'uMenuChrSelCardPlayer',
-    0x7FFBF3F4: 'uMenuChrSelCtrlMode',
-    0x239F0A76: 'uMenuChrSelCursor',
-    0x7622F76C: 'uMenuChrSelCursor::uCursor',
-    0x65F30449: 'uMenuChrSelHandicap',
-    0x1A5CFA8A: 'uMenuChrSelMakeTex',
-    0x42F85C03: 'uMenuChrSelNetInfoPlayer',
-    0x3C666048: 'uMenuChrSelOption',
-    0x1EB468B4: 'uMenuChrSelReserveUnit',
-    0x773A0FB2: 'uMenuGallery',
-    0x213958F4: 'uMenuGalleryArtWork',
-    0x6CFD4F2C: 'uMenuGalleryArtworkFilePath_Ryu00',
-    0x4C63F38C: 'uMenuGalleryArtworkFilePath_Chunli00',
-    0x39C5127E: 'uMenuGalleryArtworkFilePath_Gouki00',
-    0x591734E8: 'uMenuGalleryArtworkFilePath_Chris00',
-    0x2687C2EB: 'uMenuGalleryArtworkFilePath_Wesker00',
-    0x3C2E7AE0: 'uMenuGalleryArtworkFilePath_VJoe00',
-    0x247771AD: 'uMenuGalleryArtworkFilePath_Dante00',
-    0x61C4EAAC: 'uMenuGalleryArtworkFilePath_Trish00',
-    0x01C01D91: 'uMenuGalleryArtworkFilePath_Frank00',
-    0x1D4319B2: 'uMenuGalleryArtworkFilePath_Spencer00',
-    0x349645F0: 'uMenuGalleryArtworkFilePath_Arthur00',
-    0x7AE926E8: 'uMenuGalleryArtworkFilePath_Amaterasu00',
-    0x279908DA: 'uMenuGalleryArtworkFilePath_Zero00',
-    0x6CE2C74D: 'uMenuGalleryArtworkFilePath_Tron00',
-    0x6060D8AB: 'uMenuGalleryArtworkFilePath_Morrigan00',
-    0x07485EEA: 'uMenuGalleryArtworkFilePath_Leilei00',
-    0x1364F639: 'uMenuGalleryArtworkFilePath_Felicia00',
-    0x7280C59B: 'uMenuGalleryArtworkFilePath_CViper00',
-    0x2586FFA4: 'uMenuGalleryArtworkFilePath_Haggar00',
-    0x533F79B5: 'uMenuGalleryArtworkFilePath_Jill00',
-    0x44D8989A: 'uMenuGalleryArtworkFilePath_Hiryu00',
-    0x38EFCD13: 'uMenuGalleryArtworkFilePath_Vergil00',
-    0x4B0284D5: 'uMenuGalleryArtworkFilePath_Naruhodo00',
-    0x5A807EA6: 'uMenuGalleryArtworkFilePath_RedArremer00',
-    0x064B7F72: 'uMenuGalleryArtworkFilePath_Nemesis00',
-    0x7712D309: 'uMenuGalleryArtworkFilePath_SpiderMan00',
-    0x041BDAF4: 'uMenuGalleryArtworkFilePath_CapAmerica00',
-    0x05107F84: 'uMenuGalleryArtworkFilePath_Wolverine00',
-    0x2DD455B4: 'uMenuGalleryArtworkFilePath_Magneto00',
-    0x3EA8B4B8: 'uMenuGalleryArtworkFilePath_Hulk00',
-    0x62B76050: 'uMenuGalleryArtworkFilePath_SheHulk00',
-    0x656DE99F: 'uMenuGalleryArtworkFilePath_TaskMaster00',
-    0x2657D548: 'uMenuGalleryArtworkFilePath_IronMan00',
-    0x538E127A: 'uMenuGalleryArtworkFilePath_Thor00',
-    0x62F2C39F: 'uMenuGalleryArtworkFilePath_DrDoom00',
-    0x7AF65EBB: 'uMenuGalleryArtworkFilePath_Phoenix00',
-    0x1C29947F: 'uMenuGalleryArtworkFilePath_Shuma00',
-    0x4CD3B03B: 'uMenuGalleryArtworkFilePath_Modok00',
-    0x71A576A3: 'uMenuGalleryArtworkFilePath_Dormammu00',
-    0x0F3F583A: 'uMenuGalleryArtworkFilePath_DeadPool00',
-    0x430D6711: 'uMenuGalleryArtworkFilePath_Storm00',
-    0x32425FB4: 'uMenuGalleryArtworkFilePath_SuperSkrull00',
-    0x051BD378: 'uMenuGalleryArtworkFilePath_Sentinel00',
-    0x1E4F79C3: 'uMenuGalleryArtworkFilePath_X2300',
-    0x7092EAAB: 'uMenuGalleryArtworkFilePath_Nova00',
-    0x2B129B6D: 'uMenuGalleryArtworkFilePath_RRaccoon00',
-    0x0E8828FF: 'uMenuGalleryArtworkFilePath_GhostRider00',
-    0x51AFBF87: 'uMenuGalleryArtworkFilePath_IronFist00',
-    0x3BEA9E87: 'uMenuGalleryArtworkFilePath_DrStrange00',
-    0x6E6C6F89: 'uMenuGalleryArtworkFilePath_HawkEye00',
-    0x4DD90865: 'uMenuGalleryArtworkFilePath_Galactus00',
-    0x1BFA7FBA: 'uMenuGalleryArtworkFilePath_Ryu01',
-    0x3B64C31A: 'uMenuGalleryArtworkFilePath_Chunli01',
-    0x4EC222E8: 'uMenuGalleryArtworkFilePath_Gouki01',
-    0x2E10047E: 'uMenuGalleryArtworkFilePath_Chris01',
-    0x5180F27D: 'uMenuGalleryArtworkFilePath_Wesker01',
-    0x4B294A76: 'uMenuGalleryArtworkFilePath_VJoe01',
-    0x5370413B: 'uMenuGalleryArtworkFilePath_Dante01',
-    0x16C3DA3A: 'uMenuGalleryArtworkFilePath_Trish01',
-    0x76C72D07: 'uMenuGalleryArtworkFilePath_Frank01',
-    0x6A442924: 'uMenuGalleryArtworkFilePath_Spencer01',
-    0x43917566: 'uMenuGalleryArtworkFilePath_Arthur01',
-    0x0DEE167E: 'uMenuGalleryArtworkFilePath_Amaterasu01',
-    0x509E384C: 'uMenuGalleryArtworkFilePath_Zero01',
-    0x1BE5F7DB: 'uMenuGalleryArtworkFilePath_Tron01',
-    0x1767E83D: 'uMenuGalleryArtworkFilePath_Morrigan01',
-    0x704F6E7C: 'uMenuGalleryArtworkFilePath_Leilei01',
-    0x6463C6AF: 'uMenuGalleryArtworkFilePath_Felicia01',
-    0x0587F50D: 'uMenuGalleryArtworkFilePath_CViper01',
-    0x5281CF32: 'uMenuGalleryArtworkFilePath_Haggar01',
-    0x24384923: 'uMenuGalleryArtworkFilePath_Jill01',
-    0x33DFA80C: 'uMenuGalleryArtworkFilePath_Hiryu01',
-    0x4FE8FD85: 'uMenuGalleryArtworkFilePath_Vergil01',
-    0x3C05B443: 'uMenuGalleryArtworkFilePath_Naruhodo01',
-    0x2D874E30: 'uMenuGalleryArtworkFilePath_RedArremer01',
-    0x714C4FE4: 'uMenuGalleryArtworkFilePath_Nemesis01',
-    0x0015E39F: 'uMenuGalleryArtworkFilePath_SpiderMan01',
-    0x731CEA62: 'uMenuGalleryArtworkFilePath_CapAmerica01',
-    0x72174F12: 'uMenuGalleryArtworkFilePath_Wolverine01',
-    0x5AD36522: 'uMenuGalleryArtworkFilePath_Magneto01',
-    0x49AF842E: 'uMenuGalleryArtworkFilePath_Hulk01',
-    0x15B050C6: 'uMenuGalleryArtworkFilePath_SheHulk01',
-    0x126AD909: 'uMenuGalleryArtworkFilePath_TaskMaster01',
-    0x5150E5DE: 'uMenuGalleryArtworkFilePath_IronMan01',
-    0x248922EC: 'uMenuGalleryArtworkFilePath_Thor01',
-    0x15F5F309: 'uMenuGalleryArtworkFilePath_DrDoom01',
-    0x0DF16E2D: 'uMenuGalleryArtworkFilePath_Phoenix01',
-    0x6B2EA4E9: 'uMenuGalleryArtworkFilePath_Shuma01',
-    0x3BD480AD: 'uMenuGalleryArtworkFilePath_Modok01',
-    0x06A24635: 'uMenuGalleryArtworkFilePath_Dormammu01',
-    0x783868AC: 'uMenuGalleryArtworkFilePath_DeadPool01',
-    0x340A5787: 'uMenuGalleryArtworkFilePath_Storm01',
-    0x45456F22: 'uMenuGalleryArtworkFilePath_SuperSkrull01',
-    0x721CE3EE: 'uMenuGalleryArtworkFilePath_Sentinel01',
-    0x69484955: 'uMenuGalleryArtworkFilePath_X2301',
-    0x0795DA3D: 'uMenuGalleryArtworkFilePath_Nova01',
-    0x5C15ABFB: 'uMenuGalleryArtworkFilePath_RRaccoon01',
-    0x798F1869: 'uMenuGalleryArtworkFilePath_GhostRider01',
-    0x26A88F11: 'uMenuGalleryArtworkFilePath_IronFist01',
-    0x4CEDAE11: 'uMenuGalleryArtworkFilePath_DrStrange01',
-    0x196B5F1F: 'uMenuGalleryArtworkFilePath_HawkEye01',
-    0x3ADE38F3: 'uMenuGalleryArtworkFilePath_Galactus01',
-    0x02F32E00: 'uMenuGalleryArtworkFilePath_Ryu02',
-    0x226D92A0: 'uMenuGalleryArtworkFilePath_Chunli02',
-    0x57CB7352: 'uMenuGalleryArtworkFilePath_Gouki02',
-    0x371955C4: 'uMenuGalleryArtworkFilePath_Chris02',
-    0x4889A3C7: 'uMenuGalleryArtworkFilePath_Wesker02',
-    0x52201BCC: 'uMenuGalleryArtworkFilePath_VJoe02',
-    0x4A791081: 'uMenuGalleryArtworkFilePath_Dante02',
-    0x0FCA8B80: 'uMenuGalleryArtworkFilePath_Trish02',
-    0x6FCE7CBD: 'uMenuGalleryArtworkFilePath_Frank02',
-    0x734D789E: 'uMenuGalleryArtworkFilePath_Spencer02',
-    0x5A9824DC: 'uMenuGalleryArtworkFilePath_Arthur02',
-    0x14E747C4: 'uMenuGalleryArtworkFilePath_Amaterasu02',
-    0x499769F6: 'uMenuGalleryArtworkFilePath_Zero02',
-    0x02ECA661: 'uMenuGalleryArtworkFilePath_Tron02',
-    0x0E6EB987: 'uMenuGalleryArtworkFilePath_Morrigan02',
-    0x69463FC6: 'uMenuGalleryArtworkFilePath_Leilei02',
-    0x7D6A9715: 'uMenuGalleryArtworkFilePath_Felicia02',
-    0x1C8EA4B7: 'uMenuGalleryArtworkFilePath_CViper02',
-    0x4B889E88: 'uMenuGalleryArtworkFilePath_Haggar02',
-    0x3D311899: 'uMenuGalleryArtworkFilePath_Jill02',
-    0x2AD6F9B6: 'uMenuGalleryArtworkFilePath_Hiryu02',
-    0x56E1AC3F: 'uMenuGalleryArtworkFilePath_Vergil02',
-    0x250CE5F9: 'uMenuGalleryArtworkFilePath_Naruhodo02',
-    0x348E1F8A: 'uMenuGalleryArtworkFilePath_RedArremer02',
-    0x68451E5E: 'uMenuGalleryArtworkFilePath_Nemesis02',
-    0x191CB225: 'uMenuGalleryArtworkFilePath_SpiderMan02',
-    0x6A15BBD8: 'uMenuGalleryArtworkFilePath_CapAmerica02',
-    0x6B1E1EA8: 'uMenuGalleryArtworkFilePath_Wolverine02',
-    0x43DA3498: 'uMenuGalleryArtworkFilePath_Magneto02',
-    0x50A6D594: 'uMenuGalleryArtworkFilePath_Hulk02',
-    0x0CB9017C: 'uMenuGalleryArtworkFilePath_SheHulk02',
-    0x0B6388B3: 'uMenuGalleryArtworkFilePath_TaskMaster02',
-    0x4859B464: 'uMenuGalleryArtworkFilePath_IronMan02',
-    0x3D807356: 'uMenuGalleryArtworkFilePath_Thor02',
-    0x0CFCA2B3: 'uMenuGalleryArtworkFilePath_DrDoom02',
-    0x14F83F97: 'uMenuGalleryArtworkFilePath_Phoenix02',
-    0x7227F553: 'uMenuGalleryArtworkFilePath_Shuma02',
-    0x22DDD117: 'uMenuGalleryArtworkFilePath_Modok02',
-    0x1FAB178F: 'uMenuGalleryArtworkFilePath_Dormammu02',
-    0x61313916: 'uMenuGalleryArtworkFilePath_DeadPool02',
-    0x2D03063D: 'uMenuGalleryArtworkFilePath_Storm02',
-    0x5C4C3E98: 'uMenuGalleryArtworkFilePath_SuperSkrull02',
-    0x6B15B254: 'uMenuGalleryArtworkFilePath_Sentinel02',
-    0x704118EF: 'uMenuGalleryArtworkFilePath_X2302',
-    0x1E9C8B87: 'uMenuGalleryArtworkFilePath_Nova02',
-    0x451CFA41: 'uMenuGalleryArtworkFilePath_RRaccoon02',
-    0x608649D3: 'uMenuGalleryArtworkFilePath_GhostRider02',
-    0x3FA1DEAB: 'uMenuGalleryArtworkFilePath_IronFist02',
-    0x55E4FFAB: 'uMenuGalleryArtworkFilePath_DrStrange02',
-    0x00620EA5: 'uMenuGalleryArtworkFilePath_HawkEye02',
-    0x23D76949: 'uMenuGalleryArtworkFilePath_Galactus02',
-    0x07F82D36: 'uMenuGalleryArtworkFilePath_Stage00a',
-    0x1EE31C77: 'uMenuGalleryArtworkFilePath_Stage01a',
-    0x35CE4FB4: 'uMenuGalleryArtworkFilePath_Stage02a',
-    0x2CD57EF5: 'uMenuGalleryArtworkFilePath_Stage03a',
-    0x6394E832: 'uMenuGalleryArtworkFilePath_Stage04a',
-    0x7A8FD973: 'uMenuGalleryArtworkFilePath_Stage05a',
-    0x51A28AB0: 'uMenuGalleryArtworkFilePath_Stage06a',
-    0x48B9BBF1: 'uMenuGalleryArtworkFilePath_Stage07a',
-    0x4F21A73E: 'uMenuGalleryArtworkFilePath_Stage08a',
-    0x563A967F: 'uMenuGalleryArtworkFilePath_Stage09a',
-    0x063A4701: 'uMenuGalleryArtworkFilePath_Stage10a',
-    0x1F217640: 'uMenuGalleryArtworkFilePath_Stage11a',
-    0x340C2583: 'uMenuGalleryArtworkFilePath_Stage12a',
-    0x2D1714C2: 'uMenuGalleryArtworkFilePath_Stage13a',
-    0x62568205: 'uMenuGalleryArtworkFilePath_Stage14a',
-    0x7B4DB344: 'uMenuGalleryArtworkFilePath_Stage15a',
-    0x5060E087: 'uMenuGalleryArtworkFilePath_Stage16a',
-    0x497BD1C6: 'uMenuGalleryArtworkFilePath_Stage17a',
-    0x4EE3CD09: 'uMenuGalleryArtworkFilePath_Stage18a',
-    0x1EF17C8C: 'uMenuGalleryArtworkFilePath_Stage00b',
-    0x07EA4DCD: 'uMenuGalleryArtworkFilePath_Stage01b',
-    0x2CC71E0E: 'uMenuGalleryArtworkFilePath_Stage02b',
-    0x35DC2F4F: 'uMenuGalleryArtworkFilePath_Stage03b',
-    0x7A9DB988: 'uMenuGalleryArtworkFilePath_Stage04b',
-    0x638688C9: 'uMenuGalleryArtworkFilePath_Stage05b',
-    0x48ABDB0A: 'uMenuGalleryArtworkFilePath_Stage06b',
-    0x51B0EA4B: 'uMenuGalleryArtworkFilePath_Stage07b',
-    0x5628F684: 'uMenuGalleryArtworkFilePath_Stage08b',
-    0x4F33C7C5: 'uMenuGalleryArtworkFilePath_Stage09b',
-    0x1F3316BB: 'uMenuGalleryArtworkFilePath_Stage10b',
-    0x062827FA: 'uMenuGalleryArtworkFilePath_Stage11b',
-    0x2D057439: 'uMenuGalleryArtworkFilePath_Stage12b',
-    0x341E4578: 'uMenuGalleryArtworkFilePath_Stage13b',
-    0x7B5FD3BF: 'uMenuGalleryArtworkFilePath_Stage14b',
-    0x6244E2FE: 'uMenuGalleryArtworkFilePath_Stage15b',
-    0x4969B13D: 'uMenuGalleryArtworkFilePath_Stage16b',
-    0x5072807C: 'uMenuGalleryArtworkFilePath_Stage17b',
-    0x57EA9CB3: 'uMenuGalleryArtworkFilePath_Stage18b',
-    0x72B70BE0: 'uMenuGalleryArtworkFilePath_Special00',
-    0x05B03B76: 'uMenuGalleryArtworkFilePath_Special01',
-    0x1CB96ACC: 'uMenuGalleryArtworkFilePath_Special02',
-    0x6BBE5A5A: 'uMenuGalleryArtworkFilePath_Special03',
-    0x75DACFF9: 'uMenuGalleryArtworkFilePath_Special04',
-    0x02DDFF6F: 'uMenuGalleryArtworkFilePath_Special05',
-    0x1BD4AED5: 'uMenuGalleryArtworkFilePath_Special06',
-    0x6CD39E43: 'uMenuGalleryArtworkFilePath_Special07',
-    0x7C6C83D2: 'uMenuGalleryArtworkFilePath_Special08',
-    0x0B6BB344: 'uMenuGalleryArtworkFilePath_Special09',
-    0x6BAC3AA1: 'uMenuGalleryArtworkFilePath_Special10',
-    0x1CAB0A37: 'uMenuGalleryArtworkFilePath_Special11',
-    0x05A25B8D: 'uMenuGalleryArtworkFilePath_Special12',
-    0x72A56B1B: 'uMenuGalleryArtworkFilePath_Special13',
-    0x6CC1FEB8: 'uMenuGalleryArtworkFilePath_Special14',
-    0x468B11DF: 'uMenuGalleryArtworkFilePath_Concept00',
-    0x318C2149: 'uMenuGalleryArtworkFilePath_Concept01',
-    0x288570F3: 'uMenuGalleryArtworkFilePath_Concept02',
-    0x5F824065: 'uMenuGalleryArtworkFilePath_Concept03',
-    0x41E6D5C6: 'uMenuGalleryArtworkFilePath_Concept04',
-    0x36E1E550: 'uMenuGalleryArtworkFilePath_Concept05',
-    0x2FE8B4EA: 'uMenuGalleryArtworkFilePath_Concept06',
-    0x58EF847C: 'uMenuGalleryArtworkFilePath_Concept07',
-    0x485099ED: 'uMenuGalleryArtworkFilePath_Concept08',
-    0x3F57A97B: 'uMenuGalleryArtworkFilePath_Concept09',
-    0x3A84A773: 'uMenuGalleryArtworkFilePath_Comic00',
-    0x4D8397E5: 'uMenuGalleryArtworkFilePath_Comic01',
-    0x548AC65F: 'uMenuGalleryArtworkFilePath_Comic02',
-    0x238DF6C9: 'uMenuGalleryArtworkFilePath_Comic03',
-    0x3DE9636A: 'uMenuGalleryArtworkFilePath_Comic04',
-    0x4AEE53FC: 'uMenuGalleryArtworkFilePath_Comic05',
-    0x53E70246: 'uMenuGalleryArtworkFilePath_Comic06',
-    0x24E032D0: 'uMenuGalleryArtworkFilePath_Comic07',
-    0x345F2F41: 'uMenuGalleryArtworkFilePath_Comic08',
-    0x43581FD7: 'uMenuGalleryArtworkFilePath_Comic09',
-    0x239F9632: 'uMenuGalleryArtworkFilePath_Comic10',
-    0x5498A6A4: 'uMenuGalleryArtworkFilePath_Comic11',
-    0x4D91F71E: 'uMenuGalleryArtworkFilePath_Comic12',
-    0x3A96C788: 'uMenuGalleryArtworkFilePath_Comic13',
-    0x0A9DCC3D: 'uMenuGalleryBios',
-    0x37742E87: 'uMenuGalleryBiosFaceFilePath',
-    0x7ECFDD93: 'uMenuGalleryBiosFaceFilePath_Ryu',
-    0x6A7D16D5: 'uMenuGalleryBiosFaceFilePath_Chunli',
-    0x4D1B725E: 'uMenuGalleryBiosFaceFilePath_Gouki',
-    0x6F57615A: 'uMenuGalleryBiosFaceFilePath_Chris',
-    0x72AD7D7B: 'uMenuGalleryBiosFaceFilePath_Wesker',
-    0x4DC2AEB1: 'uMenuGalleryBiosFaceFilePath_VJoe',
-    0x3EFB7199: 'uMenuGalleryBiosFaceFilePath_Dante',
-    0x2808E295: 'uMenuGalleryBiosFaceFilePath_Trish',
-    0x5A5E4A69: 'uMenuGalleryBiosFaceFilePath_Frank',
-    0x070AC8D6: 'uMenuGalleryBiosFaceFilePath_Spencer',
-    0x20B143DE: 'uMenuGalleryBiosFaceFilePath_Arthur',
-    0x09C44CDB: 'uMenuGalleryBiosFaceFilePath_Amaterasu',
-    0x2BBC95D6: 'uMenuGalleryBiosFaceFilePath_Zero',
-    0x5A610B9A: 'uMenuGalleryBiosFaceFilePath_Tron',
-    0x0B0FC370: 'uMenuGalleryBiosFaceFilePath_Morrigan',
-    0x2B32E7B1: 'uMenuGalleryBiosFaceFilePath_Leilei',
-    0x593BBC8D: 'uMenuGalleryBiosFaceFilePath_Felicia',
-    0x23BC04CA: 'uMenuGalleryBiosFaceFilePath_CViper',
-    0x47A0975D: 'uMenuGalleryBiosFaceFilePath_Haggar',
-    0x3FF75548: 'uMenuGalleryBiosFaceFilePath_Jill',
-    0x039A804A: 'uMenuGalleryBiosFaceFilePath_Hiryu',
-    0x5EED42B0: 'uMenuGalleryBiosFaceFilePath_Vergil',
-    0x5B4091D0: 'uMenuGalleryBiosFaceFilePath_Naruhodo',
-    0x2732FA3D: 'uMenuGalleryBiosFaceFilePath_RedArremer',
-    0x72FDB6DA: 'uMenuGalleryBiosFaceFilePath_Nemesis',
-    0x1FB34891: 'uMenuGalleryBiosFaceFilePath_SpiderMan',
-    0x7220A448: 'uMenuGalleryBiosFaceFilePath_CapAmerica',
-    0x54EC9D56: 'uMenuGalleryBiosFaceFilePath_Wolverine',
-    0x36F39E60: 'uMenuGalleryBiosFaceFilePath_Magneto',
-    0x1EA65274: 'uMenuGalleryBiosFaceFilePath_Hulk',
-    0x40D47489: 'uMenuGalleryBiosFaceFilePath_SheHulk',
-    0x5E9A4D00: 'uMenuGalleryBiosFaceFilePath_TaskMaster',
-    0x0162405D: 'uMenuGalleryBiosFaceFilePath_IronMan',
-    0x5FD17173: 'uMenuGalleryBiosFaceFilePath_Thor',
-    0x383DCB67: 'uMenuGalleryBiosFaceFilePath_DrDoom',
-    0x006EF85C: 'uMenuGalleryBiosFaceFilePath_Phoenix',
-    0x1D2D5411: 'uMenuGalleryBiosFaceFilePath_Shuma',
-    0x102D0790: 'uMenuGalleryBiosFaceFilePath_Modok',
-    0x1803F3D1: 'uMenuGalleryBiosFaceFilePath_Dormammu',
-    0x296F3F33: 'uMenuGalleryBiosFaceFilePath_DeadPool',
-    0x52BFD825: 'uMenuGalleryBiosFaceFilePath_Storm',
-    0x4526C1F5: 'uMenuGalleryBiosFaceFilePath_SuperSkrull',
-    0x38A917C0: 'uMenuGalleryBiosFaceFilePath_Sentinel',
-    0x7F6A2A2E: 'uMenuGalleryBiosFaceFilePath_X23',
-    0x7A8438CB: 'uMenuGalleryBiosFaceFilePath_Nova',
-    0x40CF7630: 'uMenuGalleryBiosFaceFilePath_RRaccoon',
-    0x27F3B7C5: 'uMenuGalleryBiosFaceFilePath_GhostRider',
-    0x644D4089: 'uMenuGalleryBiosFaceFilePath_IronFist',
-    0x711DAD87: 'uMenuGalleryBiosFaceFilePath_DrStrange',
-    0x5EC307C4: 'uMenuGalleryBiosFaceFilePath_HawkEye',
-    0x68196C9D: 'uMenuGalleryBiosFaceFilePath_Galactus',
-    0x2B27A002: 'uMenuGalleryBiosFilePath',
-    0x1D7C28D9: 'uMenuGalleryBook',
-    0x78CCD90E: 'uMenuGalleryBookFilePath_Book000',
-    0x0FCBE998: 'uMenuGalleryBookFilePath_Book001',
-    0x16C2B822: 'uMenuGalleryBookFilePath_Book002',
-    0x61C588B4: 'uMenuGalleryBookFilePath_Book003',
-    0x7FA11D17: 'uMenuGalleryBookFilePath_Book004',
-    0x08A62D81: 'uMenuGalleryBookFilePath_Book005',
-    0x11AF7C3B: 'uMenuGalleryBookFilePath_Book006',
-    0x66A84CAD: 'uMenuGalleryBookFilePath_Book007',
-    0x7617513C: 'uMenuGalleryBookFilePath_Book008',
-    0x011061AA: 'uMenuGalleryBookFilePath_Book009',
-    0x61D7E84F: 'uMenuGalleryBookFilePath_Book010',
-    0x16D0D8D9: 'uMenuGalleryBookFilePath_Book011',
-    0x0FD98963: 'uMenuGalleryBookFilePath_Book012',
-    0x78DEB9F5: 'uMenuGalleryBookFilePath_Book013',
-    0x66BA2C56: 'uMenuGalleryBookFilePath_Book014',
-    0x11BD1CC0: 'uMenuGalleryBookFilePath_Book015',
-    0x08B44D7A: 'uMenuGalleryBookFilePath_Book016',
-    0x7FB37DEC: 'uMenuGalleryBookFilePath_Book017',
-    0x6F0C607D: 'uMenuGalleryBookFilePath_Book018',
-    0x180B50EB: 'uMenuGalleryBookFilePath_Book019',
-    0x4AFABB8C: 'uMenuGalleryBookFilePath_Book020',
-    0x3DFD8B1A: 'uMenuGalleryBookFilePath_Book021',
-    0x24F4DAA0: 'uMenuGalleryBookFilePath_Book022',
-    0x53F3EA36: 'uMenuGalleryBookFilePath_Book023',
-    0x4D977F95: 'uMenuGalleryBookFilePath_Book024',
-    0x3A904F03: 'uMenuGalleryBookFilePath_Book025',
-    0x23991EB9: 'uMenuGalleryBookFilePath_Book026',
-    0x549E2E2F: 'uMenuGalleryBookFilePath_Book027',
-    0x442133BE: 'uMenuGalleryBookFilePath_Book028',
-    0x33260328: 'uMenuGalleryBookFilePath_Book029',
-    0x53E18ACD: 'uMenuGalleryBookFilePath_Book030',
-    0x24E6BA5B: 'uMenuGalleryBookFilePath_Book031',
-    0x3DEFEBE1: 'uMenuGalleryBookFilePath_Book032',
-    0x4AE8DB77: 'uMenuGalleryBookFilePath_Book033',
-    0x548C4ED4: 'uMenuGalleryBookFilePath_Book034',
-    0x238B7E42: 'uMenuGalleryBookFilePath_Book035',
-    0x3A822FF8: 'uMenuGalleryBookFilePath_Book036',
-    0x4D851F6E: 'uMenuGalleryBookFilePath_Book037',
-    0x5D3A02FF: 'uMenuGalleryBookFilePath_Book038',
-    0x2A3D3269: 'uMenuGalleryBookFilePath_Book039',
-    0x1CA01C0A: 'uMenuGalleryBookFilePath_Book040',
-    0x6BA72C9C: 'uMenuGalleryBookFilePath_Book041',
-    0x72AE7D26: 'uMenuGalleryBookFilePath_Book042',
-    0x05A94DB0: 'uMenuGalleryBookFilePath_Book043',
-    0x1BCDD813: 'uMenuGalleryBookFilePath_Book044',
-    0x6CCAE885: 'uMenuGalleryBookFilePath_Book045',
-    0x75C3B93F: 'uMenuGalleryBookFilePath_Book046',
-    0x02C489A9: 'uMenuGalleryBookFilePath_Book047',
-    0x127B9438: 'uMenuGalleryBookFilePath_Book048',
-    0x657CA4AE: 'uMenuGalleryBookFilePath_Book049',
-    0x05BB2D4B: 'uMenuGalleryBookFilePath_Book050',
-    0x72BC1DDD: 'uMenuGalleryBookFilePath_Book051',
-    0x6BB54C67: 'uMenuGalleryBookFilePath_Book052',
-    0x1CB27CF1: 'uMenuGalleryBookFilePath_Book053',
-    0x02D6E952: 'uMenuGalleryBookFilePath_Book054',
-    0x75D1D9C4: 'uMenuGalleryBookFilePath_Book055',
-    0x6CD8887E: 'uMenuGalleryBookFilePath_Book056',
-    0x1BDFB8E8: 'uMenuGalleryBookFilePath_Book057',
-    0x0B60A579: 'uMenuGalleryBookFilePath_Book058',
-    0x7C6795EF: 'uMenuGalleryBookFilePath_Book059',
-    0x2E967E88: 'uMenuGalleryBookFilePath_Book060',
-    0x59914E1E: 'uMenuGalleryBookFilePath_Book061',
-    0x40981FA4: 'uMenuGalleryBookFilePath_Book062',
-    0x379F2F32: 'uMenuGalleryBookFilePath_Book063',
-    0x29FBBA91: 'uMenuGalleryBookFilePath_Book064',
-    0x5EFC8A07: 'uMenuGalleryBookFilePath_Book065',
-    0x47F5DBBD: 'uMenuGalleryBookFilePath_Book066',
-    0x30F2EB2B: 'uMenuGalleryBookFilePath_Book067',
-    0x204DF6BA: 'uMenuGalleryBookFilePath_Book068',
-    0x574AC62C: 'uMenuGalleryBookFilePath_Book069',
-    0x378D4FC9: 'uMenuGalleryBookFilePath_Book070',
-    0x408A7F5F: 'uMenuGalleryBookFilePath_Book071',
-    0x59832EE5: 'uMenuGalleryBookFilePath_Book072',
-    0x2E841E73: 'uMenuGalleryBookFilePath_Book073',
-    0x30E08BD0: 'uMenuGalleryBookFilePath_Book074',
-    0x47E7BB46: 'uMenuGalleryBookFilePath_Book075',
-    0x5EEEEAFC: 'uMenuGalleryBookFilePath_Book076',
-    0x29E9DA6A: 'uMenuGalleryBookFilePath_Book077',
-    0x3956C7FB: 'uMenuGalleryBookFilePath_Book078',
-    0x4E51F76D: 'uMenuGalleryBookFilePath_Book079',
-    0x30155306: 'uMenuGalleryBookFilePath_Book080',
-    0x47126390: 'uMenuGalleryBookFilePath_Book081',
-    0x5E1B322A: 'uMenuGalleryBookFilePath_Book082',
-    0x291C02BC: 'uMenuGalleryBookFilePath_Book083',
-    0x3778971F: 'uMenuGalleryBookFilePath_Book084',
-    0x407FA789: 'uMenuGalleryBookFilePath_Book085',
-    0x5976F633: 'uMenuGalleryBookFilePath_Book086',
-    0x2E71C6A5: 'uMenuGalleryBookFilePath_Book087',
-    0x3ECEDB34: 'uMenuGalleryBookFilePath_Book088',
-    0x49C9EBA2: 'uMenuGalleryBookFilePath_Book089',
-    0x290E6247: 'uMenuGalleryBookFilePath_Book090',
-    0x5E0952D1: 'uMenuGalleryBookFilePath_Book091',
-    0x4700036B: 'uMenuGalleryBookFilePath_Book092',
-    0x300733FD: 'uMenuGalleryBookFilePath_Book093',
-    0x2E63A65E: 'uMenuGalleryBookFilePath_Book094',
-    0x596496C8: 'uMenuGalleryBookFilePath_Book095',
-    0x406DC772: 'uMenuGalleryBookFilePath_Book096',
-    0x376AF7E4: 'uMenuGalleryBookFilePath_Book097',
-    0x27D5EA75: 'uMenuGalleryBookFilePath_Book098',
-    0x50D2DAE3: 'uMenuGalleryBookFilePath_Book099',
-    0x790EB339: 'uMenuGalleryBookFilePath_Book100',
-    0x0E0983AF: 'uMenuGalleryBookFilePath_Book101',
-    0x1700D215: 'uMenuGalleryBookFilePath_Book102',
-    0x6007E283: 'uMenuGalleryBookFilePath_Book103',
-    0x7E637720: 'uMenuGalleryBookFilePath_Book104',
-    0x096447B6: 'uMenuGalleryBookFilePath_Book105',
-    0x106D160C: 'uMenuGalleryBookFilePath_Book106',
-    0x676A269A: 'uMenuGalleryBookFilePath_Book107',
-    0x77D53B0B: 'uMenuGalleryBookFilePath_Book108',
-    0x00D20B9D: 'uMenuGalleryBookFilePath_Book109',
-    0x60158278: 'uMenuGalleryBookFilePath_Book110',
-    0x1712B2EE: 'uMenuGalleryBookFilePath_Book111',
-    0x0E1BE354: 'uMenuGalleryBookFilePath_Book112',
-    0x791CD3C2: 'uMenuGalleryBookFilePath_Book113',
-    0x67784661: 'uMenuGalleryBookFilePath_Book114',
-    0x107F76F7: 'uMenuGalleryBookFilePath_Book115',
-    0x0976274D: 'uMenuGalleryBookFilePath_Book116',
-    0x7E7117DB: 'uMenuGalleryBookFilePath_Book117',
-    0x6ECE0A4A: 'uMenuGalleryBookFilePath_Book118',
-    0x19C93ADC: 'uMenuGalleryBookFilePath_Book119',
-    0x4B38D1BB: 'uMenuGalleryBookFilePath_Book120',
-    0x3C3FE12D: 'uMenuGalleryBookFilePath_Book121',
-    0x2536B097: 'uMenuGalleryBookFilePath_Book122',
-    0x52318001: 'uMenuGalleryBookFilePath_Book123',
-    0x4C5515A2: 'uMenuGalleryBookFilePath_Book124',
-    0x3B522534: 'uMenuGalleryBookFilePath_Book125',
-    0x225B748E: 'uMenuGalleryBookFilePath_Book126',
-    0x555C4418: 'uMenuGalleryBookFilePath_Book127',
-    0x45E35989: 'uMenuGalleryBookFilePath_Book128',
-    0x32E4691F: 'uMenuGalleryBookFilePath_Book129',
-    0x5223E0FA: 'uMenuGalleryBookFilePath_Book130',
-    0x2524D06C: 'uMenuGalleryBookFilePath_Book131',
-    0x3C2D81D6: 'uMenuGalleryBookFilePath_Book132',
-    0x4B2AB140: 'uMenuGalleryBookFilePath_Book133',
-    0x554E24E3: 'uMenuGalleryBookFilePath_Book134',
-    0x22491475: 'uMenuGalleryBookFilePath_Book135',
-    0x3B4045CF: 'uMenuGalleryBookFilePath_Book136',
-    0x4C477559: 'uMenuGalleryBookFilePath_Book137',
-    0x5CF868C8: 'uMenuGalleryBookFilePath_Book138',
-    0x2BFF585E: 'uMenuGalleryBookFilePath_Book139',
-    0x1D62763D: 'uMenuGalleryBookFilePath_Book140',
-    0x6A6546AB: 'uMenuGalleryBookFilePath_Book141',
-    0x736C1711: 'uMenuGalleryBookFilePath_Book142',
-    0x046B2787: 'uMenuGalleryBookFilePath_Book143',
-    0x1A0FB224: 'uMenuGalleryBookFilePath_Book144',
-    0x6D0882B2: 'uMenuGalleryBookFilePath_Book145',
-    0x7401D308: 'uMenuGalleryBookFilePath_Book146',
-    0x0306E39E: 'uMenuGalleryBookFilePath_Book147',
-    0x13B9FE0F: 'uMenuGalleryBookFilePath_Book148',
-    0x64BECE99: 'uMenuGalleryBookFilePath_Book149',
-    0x0479477C: 'uMenuGalleryBookFilePath_Book150',
-    0x737E77EA: 'uMenuGalleryBookFilePath_Book151',
-    0x6A772650: 'uMenuGalleryBookFilePath_Book152',
-    0x1D7016C6: 'uMenuGalleryBookFilePath_Book153',
-    0x03148365: 'uMenuGalleryBookFilePath_Book154',
-    0x7413B3F3: 'uMenuGalleryBookFilePath_Book155',
-    0x6D1AE249: 'uMenuGalleryBookFilePath_Book156',
-    0x1A1DD2DF: 'uMenuGalleryBookFilePath_Book157',
-    0x0AA2CF4E: 'uMenuGalleryBookFilePath_Book158',
-    0x7DA5FFD8: 'uMenuGalleryBookFilePath_Book159',
-    0x2F5414BF: 'uMenuGalleryBookFilePath_Book160',
-    0x58532429: 'uMenuGalleryBookFilePath_Book161',
-    0x415A7593: 'uMenuGalleryBookFilePath_Book162',
-    0x365D4505: 'uMenuGalleryBookFilePath_Book163',
-    0x2839D0A6: 'uMenuGalleryBookFilePath_Book164',
-    0x5F3EE030: 'uMenuGalleryBookFilePath_Book165',
-    0x4637B18A: 'uMenuGalleryBookFilePath_Book166',
-    0x3130811C: 'uMenuGalleryBookFilePath_Book167',
-    0x218F9C8D: 'uMenuGalleryBookFilePath_Book168',
-    0x5688AC1B: 'uMenuGalleryBookFilePath_Book169',
-    0x364F25FE: 'uMenuGalleryBookFilePath_Book170',
-    0x41481568: 'uMenuGalleryBookFilePath_Book171',
-    0x584144D2: 'uMenuGalleryBookFilePath_Book172',
-    0x2F467444: 'uMenuGalleryBookFilePath_Book173',
-    0x3122E1E7: 'uMenuGalleryBookFilePath_Book174',
-    0x4625D171: 'uMenuGalleryBookFilePath_Book175',
-    0x5F2C80CB: 'uMenuGalleryBookFilePath_Book176',
-    0x282BB05D: 'uMenuGalleryBookFilePath_Book177',
-    0x3894ADCC: 'uMenuGalleryBookFilePath_Book178',
-    0x4F939D5A: 'uMenuGalleryBookFilePath_Book179',
-    0x31D73931: 'uMenuGalleryBookFilePath_Book180',
-    0x46D009A7: 'uMenuGalleryBookFilePath_Book181',
-    0x5FD9581D: 'uMenuGalleryBookFilePath_Book182',
-    0x28DE688B: 'uMenuGalleryBookFilePath_Book183',
-    0x36BAFD28: 'uMenuGalleryBookFilePath_Book184',
-    0x41BDCDBE: 'uMenuGalleryBookFilePath_Book185',
-    0x58B49C04: 'uMenuGalleryBookFilePath_Book186',
-    0x2FB3AC92: 'uMenuGalleryBookFilePath_Book187',
-    0x3F0CB103: 'uMenuGalleryBookFilePath_Book188',
-    0x480B8195: 'uMenuGalleryBookFilePath_Book189',
-    0x28CC0870: 'uMenuGalleryBookFilePath_Book190',
-    0x5FCB38E6: 'uMenuGalleryBookFilePath_Book191',
-    0x46C2695C: 'uMenuGalleryBookFilePath_Book192',
-    0x31C559CA: 'uMenuGalleryBookFilePath_Book193',
-    0x2FA1CC69: 'uMenuGalleryBookFilePath_Book194',
-    0x58A6FCFF: 'uMenuGalleryBookFilePath_Book195',
-    0x41AFAD45: 'uMenuGalleryBookFilePath_Book196',
-    0x36A89DD3: 'uMenuGalleryBookFilePath_Book197',
-    0x26178042: 'uMenuGalleryBookFilePath_Book198',
-    0x5110B0D4: 'uMenuGalleryBookFilePath_Book199',
-    0x13A5B3B7: 'uMenuGalleryBookFilePath_GuidePS4jp00',
-    0x64A28321: 'uMenuGalleryBookFilePath_GuidePS4jp01',
-    0x7DABD29B: 'uMenuGalleryBookFilePath_GuidePS4jp02',
-    0x0AACE20D: 'uMenuGalleryBookFilePath_GuidePS4jp03',
-    0x14C877AE: 'uMenuGalleryBookFilePath_GuidePS4jp04',
-    0x63CF4738: 'uMenuGalleryBookFilePath_GuidePS4jp05',
-    0x7AC61682: 'uMenuGalleryBookFilePath_GuidePS4jp06',
-    0x0DC12614: 'uMenuGalleryBookFilePath_GuidePS4jp07',
-    0x1D7E3B85: 'uMenuGalleryBookFilePath_GuidePS4jp08',
-    0x6A790B13: 'uMenuGalleryBookFilePath_GuidePS4jp09',
-    0x0ABE82F6: 'uMenuGalleryBookFilePath_GuidePS4jp10',
-    0x7DB9B260: 'uMenuGalleryBookFilePath_GuidePS4jp11',
-    0x5D7E2D9B: 'uMenuGalleryBookFilePath_GuidePS4en00',
-    0x2A791D0D: 'uMenuGalleryBookFilePath_GuidePS4en01',
-    0x33704CB7: 'uMenuGalleryBookFilePath_GuidePS4en02',
-    0x44777C21: 'uMenuGalleryBookFilePath_GuidePS4en03',
-    0x5A13E982: 'uMenuGalleryBookFilePath_GuidePS4en04',
-    0x2D14D914: 'uMenuGalleryBookFilePath_GuidePS4en05',
-    0x341D88AE: 'uMenuGalleryBookFilePath_GuidePS4en06',
-    0x431AB838: 'uMenuGalleryBookFilePath_GuidePS4en07',
-    0x53A5A5A9: 'uMenuGalleryBookFilePath_GuidePS4en08',
-    0x24A2953F: 'uMenuGalleryBookFilePath_GuidePS4en09',
-    0x44651CDA: 'uMenuGalleryBookFilePath_GuidePS4en10',
-    0x33622C4C: 'uMenuGalleryBookFilePath_GuidePS4en11',
-    0x5AF7D861: 'uMenuGalleryBookFilePath_GuidePS4fr00',
-    0x2DF0E8F7: 'uMenuGalleryBookFilePath_GuidePS4fr01',
-    0x34F9B94D: 'uMenuGalleryBookFilePath_GuidePS4fr02',
-    0x43FE89DB: 'uMenuGalleryBookFilePath_GuidePS4fr03',
-    0x5D9A1C78: 'uMenuGalleryBookFilePath_GuidePS4fr04',
-    0x2A9D2CEE: 'uMenuGalleryBookFilePath_GuidePS4fr05',
-    0x33947D54: 'uMenuGalleryBookFilePath_GuidePS4fr06',
-    0x44934DC2: 'uMenuGalleryBookFilePath_GuidePS4fr07',
-    0x542C5053: 'uMenuGalleryBookFilePath_GuidePS4fr08',
-    0x232B60C5: 'uMenuGalleryBookFilePath_GuidePS4fr09',
-    0x43ECE920: 'uMenuGalleryBookFilePath_GuidePS4fr10',
-    0x34EBD9B6: 'uMenuGalleryBookFilePath_GuidePS4fr11',
-    0x0619B485: 'uMenuGalleryBookFilePath_GuidePS4it00',
-    0x711E8413: 'uMenuGalleryBookFilePath_GuidePS4it01',
-    0x6817D5A9: 'uMenuGalleryBookFilePath_GuidePS4it02',
-    0x1F10E53F: 'uMenuGalleryBookFilePath_GuidePS4it03',
-    0x0174709C: 'uMenuGalleryBookFilePath_GuidePS4it04',
-    0x7673400A: 'uMenuGalleryBookFilePath_GuidePS4it05',
-    0x6F7A11B0: 'uMenuGalleryBookFilePath_GuidePS4it06',
-    0x187D2126: 'uMenuGalleryBookFilePath_GuidePS4it07',
-    0x08C23CB7: 'uMenuGalleryBookFilePath_GuidePS4it08',
-    0x7FC50C21: 'uMenuGalleryBookFilePath_GuidePS4it09',
-    0x1F0285C4: 'uMenuGalleryBookFilePath_GuidePS4it10',
-    0x6805B552: 'uMenuGalleryBookFilePath_GuidePS4it11',
-    0x3EB4ABA2: 'uMenuGalleryBookFilePath_GuidePS4sp00',
-    0x49B39B34: 'uMenuGalleryBookFilePath_GuidePS4sp01',
-    0x50BACA8E: 'uMenuGalleryBookFilePath_GuidePS4sp02',
-    0x27BDFA18: 'uMenuGalleryBookFilePath_GuidePS4sp03',
-    0x39D96FBB: 'uMenuGalleryBookFilePath_GuidePS4sp04',
-    0x4EDE5F2D: 'uMenuGalleryBookFilePath_GuidePS4sp05',
-    0x57D70E97: 'uMenuGalleryBookFilePath_GuidePS4sp06',
-    0x20D03E01: 'uMenuGalleryBookFilePath_GuidePS4sp07',
-    0x306F2390: 'uMenuGalleryBookFilePath_GuidePS4sp08',
-    0x47681306: 'uMenuGalleryBookFilePath_GuidePS4sp09',
-    0x27AF9AE3: 'uMenuGalleryBookFilePath_GuidePS4sp10',
-    0x50A8AA75: 'uMenuGalleryBookFilePath_GuidePS4sp11',
-    0x7B220AF1: 'uMenuGalleryBookFilePath_GuidePS4ge00',
-    0x0C253A67: 'uMenuGalleryBookFilePath_GuidePS4ge01',
-    0x152C6BDD: 'uMenuGalleryBookFilePath_GuidePS4ge02',
-    0x622B5B4B: 'uMenuGalleryBookFilePath_GuidePS4ge03',
-    0x7C4FCEE8: 'uMenuGalleryBookFilePath_GuidePS4ge04',
-    0x0B48FE7E: 'uMenuGalleryBookFilePath_GuidePS4ge05',
-    0x1241AFC4: 'uMenuGalleryBookFilePath_GuidePS4ge06',
-    0x65469F52: 'uMenuGalleryBookFilePath_GuidePS4ge07',
-    0x75F982C3: 'uMenuGalleryBookFilePath_GuidePS4ge08',
-    0x02FEB255: 'uMenuGalleryBookFilePath_GuidePS4ge09',
-    0x62393BB0: 'uMenuGalleryBookFilePath_GuidePS4ge10',
-    0x153E0B26: 'uMenuGalleryBookFilePath_GuidePS4ge11',
-    0x66C2FD30: 'uMenuGalleryBookFilePath_GuideXBOjp00',
-    0x11C5CDA6: 'uMenuGalleryBookFilePath_GuideXBOjp01',
-    0x08CC9C1C: 'uMenuGalleryBookFilePath_GuideXBOjp02',
-    0x7FCBAC8A: 'uMenuGalleryBookFilePath_GuideXBOjp03',
-    0x61AF3929: 'uMenuGalleryBookFilePath_GuideXBOjp04',
-    0x16A809BF: 'uMenuGalleryBookFilePath_GuideXBOjp05',
-    0x0FA15805: 'uMenuGalleryBookFilePath_GuideXBOjp06',
-    0x78A66893: 'uMenuGalleryBookFilePath_GuideXBOjp07',
-    0x68197502: 'uMenuGalleryBookFilePath_GuideXBOjp08',
-    0x1F1E4594: 'uMenuGalleryBookFilePath_GuideXBOjp09',
-    0x7FD9CC71: 'uMenuGalleryBookFilePath_GuideXBOjp10',
-    0x08DEFCE7: 'uMenuGalleryBookFilePath_GuideXBOjp11',
-    0x2819631C: 'uMenuGalleryBookFilePath_GuideXBOen00',
-    0x5F1E538A: 'uMenuGalleryBookFilePath_GuideXBOen01',
-    0x46170230: 'uMenuGalleryBookFilePath_GuideXBOen02',
-    0x311032A6: 'uMenuGalleryBookFilePath_GuideXBOen03',
-    0x2F74A705: 'uMenuGalleryBookFilePath_GuideXBOen04',
-    0x58739793: 'uMenuGalleryBookFilePath_GuideXBOen05',
-    0x417AC629: 'uMenuGalleryBookFilePath_GuideXBOen06',
-    0x367DF6BF: 'uMenuGalleryBookFilePath_GuideXBOen07',
-    0x26C2EB2E: 'uMenuGalleryBookFilePath_GuideXBOen08',
-    0x51C5DBB8: 'uMenuGalleryBookFilePath_GuideXBOen09',
-    0x3102525D: 'uMenuGalleryBookFilePath_GuideXBOen10',
-    0x460562CB: 'uMenuGalleryBookFilePath_GuideXBOen11',
-    0x2F9096E6: 'uMenuGalleryBookFilePath_GuideXBOfr00',
-    0x5897A670: 'uMenuGalleryBookFilePath_GuideXBOfr01',
-    0x419EF7CA: 'uMenuGalleryBookFilePath_GuideXBOfr02',
-    0x3699C75C: 'uMenuGalleryBookFilePath_GuideXBOfr03',
-    0x28FD52FF: 'uMenuGalleryBookFilePath_GuideXBOfr04',
-    0x5FFA6269: 'uMenuGalleryBookFilePath_GuideXBOfr05',
-    0x46F333D3: 'uMenuGalleryBookFilePath_GuideXBOfr06',
-    0x31F40345: 'uMenuGalleryBookFilePath_GuideXBOfr07',
-    0x214B1ED4: 'uMenuGalleryBookFilePath_GuideXBOfr08',
-    0x564C2E42: 'uMenuGalleryBookFilePath_GuideXBOfr09',
-    0x368BA7A7: 'uMenuGalleryBookFilePath_GuideXBOfr10',
-    0x418C9731: 'uMenuGalleryBookFilePath_GuideXBOfr11',
-    0x737EFA02: 'uMenuGalleryBookFilePath_GuideXBOit00',
-    0x0479CA94: 'uMenuGalleryBookFilePath_GuideXBOit01',
-    0x1D709B2E: 'uMenuGalleryBookFilePath_GuideXBOit02',
-    0x6A77ABB8: 'uMenuGalleryBookFilePath_GuideXBOit03',
-    0x74133E1B: 'uMenuGalleryBookFilePath_GuideXBOit04',
-    0x03140E8D: 'uMenuGalleryBookFilePath_GuideXBOit05',
-    0x1A1D5F37: 'uMenuGalleryBookFilePath_GuideXBOit06',
-    0x6D1A6FA1: 'uMenuGalleryBookFilePath_GuideXBOit07',
-    0x7DA57230: 'uMenuGalleryBookFilePath_GuideXBOit08',
-    0x0AA242A6: 'uMenuGalleryBookFilePath_GuideXBOit09',
-    0x6A65CB43: 'uMenuGalleryBookFilePath_GuideXBOit10',
-    0x1D62FBD5: 'uMenuGalleryBookFilePath_GuideXBOit11',
-    0x4BD3E525: 'uMenuGalleryBookFilePath_GuideXBOsp00',
-    0x3CD4D5B3: 'uMenuGalleryBookFilePath_GuideXBOsp01',
-    0x25DD8409: 'uMenuGalleryBookFilePath_GuideXBOsp02',
-    0x52DAB49F: 'uMenuGalleryBookFilePath_GuideXBOsp03',
-    0x4CBE213C: 'uMenuGalleryBookFilePath_GuideXBOsp04',
-    0x3BB911AA: 'uMenuGalleryBookFilePath_GuideXBOsp05',
-    0x22B04010: 'uMenuGalleryBookFilePath_GuideXBOsp06',
-    0x55B77086: 'uMenuGalleryBookFilePath_GuideXBOsp07',
-    0x45086D17: 'uMenuGalleryBookFilePath_GuideXBOsp08',
-    0x320F5D81: 'uMenuGalleryBookFilePath_GuideXBOsp09',
-    0x52C8D464: 'uMenuGalleryBookFilePath_GuideXBOsp10',
-    0x25CFE4F2: 'uMenuGalleryBookFilePath_GuideXBOsp11',
-    0x0E454476: 'uMenuGalleryBookFilePath_GuideXBOge00',
-    0x794274E0: 'uMenuGalleryBookFilePath_GuideXBOge01',
-    0x604B255A: 'uMenuGalleryBookFilePath_GuideXBOge02',
-    0x174C15CC: 'uMenuGalleryBookFilePath_GuideXBOge03',
-    0x0928806F: 'uMenuGalleryBookFilePath_GuideXBOge04',
-    0x7E2FB0F9: 'uMenuGalleryBookFilePath_GuideXBOge05',
-    0x6726E143: 'uMenuGalleryBookFilePath_GuideXBOge06',
-    0x1021D1D5: 'uMenuGalleryBookFilePath_GuideXBOge07',
-    0x009ECC44: 'uMenuGalleryBookFilePath_GuideXBOge08',
-    0x7799FCD2: 'uMenuGalleryBookFilePath_GuideXBOge09',
-    0x175E7537: 'uMenuGalleryBookFilePath_GuideXBOge10',
-    0x605945A1: 'uMenuGalleryBookFilePath_GuideXBOge11',
-    0x63D16798: 'uMenuGalleryBookFilePath_GuidePCjp00',
-    0x14D6570E: 'uMenuGalleryBookFilePath_GuidePCjp01',
-    0x0DDF06B4: 'uMenuGalleryBookFilePath_GuidePCjp02',
-    0x7AD83622: 'uMenuGalleryBookFilePath_GuidePCjp03',
-    0x64BCA381: 'uMenuGalleryBookFilePath_GuidePCjp04',
-    0x13BB9317: 'uMenuGalleryBookFilePath_GuidePCjp05',
-    0x0AB2C2AD: 'uMenuGalleryBookFilePath_GuidePCjp06',
-    0x7DB5F23B: 'uMenuGalleryBookFilePath_GuidePCjp07',
-    0x6D0AEFAA: 'uMenuGalleryBookFilePath_GuidePCjp08',
-    0x1A0DDF3C: 'uMenuGalleryBookFilePath_GuidePCjp09',
-    0x7ACA56D9: 'uMenuGalleryBookFilePath_GuidePCjp10',
-    0x0DCD664F: 'uMenuGalleryBookFilePath_GuidePCjp11',
-    0x2D0AF9B4: 'uMenuGalleryBookFilePath_GuidePCen00',
-    0x5A0DC922: 'uMenuGalleryBookFilePath_GuidePCen01',
-    0x43049898: 'uMenuGalleryBookFilePath_GuidePCen02',
-    0x3403A80E: 'uMenuGalleryBookFilePath_GuidePCen03',
-    0x2A673DAD: 'uMenuGalleryBookFilePath_GuidePCen04',
-    0x5D600D3B: 'uMenuGalleryBookFilePath_GuidePCen05',
-    0x44695C81: 'uMenuGalleryBookFilePath_GuidePCen06',
-    0x336E6C17: 'uMenuGalleryBookFilePath_GuidePCen07',
-    0x23D17186: 'uMenuGalleryBookFilePath_GuidePCen08',
-    0x54D64110: 'uMenuGalleryBookFilePath_GuidePCen09',
-    0x3411C8F5: 'uMenuGalleryBookFilePath_GuidePCen10',
-    0x4316F863: 'uMenuGalleryBookFilePath_GuidePCen11',
-    0x2A830C4E: 'uMenuGalleryBookFilePath_GuidePCfr00',
-    0x5D843CD8: 'uMenuGalleryBookFilePath_GuidePCfr01',
-    0x448D6D62: 'uMenuGalleryBookFilePath_GuidePCfr02',
-    0x338A5DF4: 'uMenuGalleryBookFilePath_GuidePCfr03',
-    0x2DEEC857: 'uMenuGalleryBookFilePath_GuidePCfr04',
-    0x5AE9F8C1: 'uMenuGalleryBookFilePath_GuidePCfr05',
-    0x43E0A97B: 'uMenuGalleryBookFilePath_GuidePCfr06',
-    0x34E799ED: 'uMenuGalleryBookFilePath_GuidePCfr07',
-    0x2458847C: 'uMenuGalleryBookFilePath_GuidePCfr08',
-    0x535FB4EA: 'uMenuGalleryBookFilePath_GuidePCfr09',
-    0x33983D0F: 'uMenuGalleryBookFilePath_GuidePCfr10',
-    0x449F0D99: 'uMenuGalleryBookFilePath_GuidePCfr11',
-    0x766D60AA: 'uMenuGalleryBookFilePath_GuidePCit00',
-    0x016A503C: 'uMenuGalleryBookFilePath_GuidePCit01',
-    0x18630186: 'uMenuGalleryBookFilePath_GuidePCit02',
-    0x6F643110: 'uMenuGalleryBookFilePath_GuidePCit03',
-    0x7100A4B3: 'uMenuGalleryBookFilePath_GuidePCit04',
-    0x06079425: 'uMenuGalleryBookFilePath_GuidePCit05',
-    0x1F0EC59F: 'uMenuGalleryBookFilePath_GuidePCit06',
-    0x6809F509: 'uMenuGalleryBookFilePath_GuidePCit07',
-    0x78B6E898: 'uMenuGalleryBookFilePath_GuidePCit08',
-    0x0FB1D80E: 'uMenuGalleryBookFilePath_GuidePCit09',
-    0x6F7651EB: 'uMenuGalleryBookFilePath_GuidePCit10',
-    0x1871617D: 'uMenuGalleryBookFilePath_GuidePCit11',
-    0x4EC07F8D: 'uMenuGalleryBookFilePath_GuidePCsp00',
-    0x39C74F1B: 'uMenuGalleryBookFilePath_GuidePCsp01',
-    0x20CE1EA1: 'uMenuGalleryBookFilePath_GuidePCsp02',
-    0x57C92E37: 'uMenuGalleryBookFilePath_GuidePCsp03',
-    0x49ADBB94: 'uMenuGalleryBookFilePath_GuidePCsp04',
-    0x3EAA8B02: 'uMenuGalleryBookFilePath_GuidePCsp05',
-    0x27A3DAB8: 'uMenuGalleryBookFilePath_GuidePCsp06',
-    0x50A4EA2E: 'uMenuGalleryBookFilePath_GuidePCsp07',
-    0x401BF7BF: 'uMenuGalleryBookFilePath_GuidePCsp08',
-    0x371CC729: 'uMenuGalleryBookFilePath_GuidePCsp09',
-    0x57DB4ECC: 'uMenuGalleryBookFilePath_GuidePCsp10',
-    0x20DC7E5A: 'uMenuGalleryBookFilePath_GuidePCsp11',
-    0x0B56DEDE: 'uMenuGalleryBookFilePath_GuidePCge00',
-    0x7C51EE48: 'uMenuGalleryBookFilePath_GuidePCge01',
-    0x6558BFF2: 'uMenuGalleryBookFilePath_GuidePCge02',
-    0x125F8F64: 'uMenuGalleryBookFilePath_GuidePCge03',
-    0x0C3B1AC7: 'uMenuGalleryBookFilePath_GuidePCge04',
-    0x7B3C2A51: 'uMenuGalleryBookFilePath_GuidePCge05',
-    0x62357BEB: 'uMenuGalleryBookFilePath_GuidePCge06',
-    0x15324B7D: 'uMenuGalleryBookFilePath_GuidePCge07',
-    0x058D56EC: 'uMenuGalleryBookFilePath_GuidePCge08',
-    0x728A667A: 'uMenuGalleryBookFilePath_GuidePCge09',
-    0x124DEF9F: 'uMenuGalleryBookFilePath_GuidePCge10',
-    0x654ADF09: 'uMenuGalleryBookFilePath_GuidePCge11',
-    0x6AD6A61B: 'uMenuGalleryVoiceMapFilePath',
-    0x6F943A95: 'uMenuGalleryVoiceMapFilePath_Ryu',
-    0x037687A1: 'uMenuGalleryVoiceMapFilePath_Chunli',
-    0x252F3358: 'uMenuGalleryVoiceMapFilePath_Gouki',
-    0x0763205C: 'uMenuGalleryVoiceMapFilePath_Chris',
-    0x1BA6EC0F: 'uMenuGalleryVoiceMapFilePath_Wesker',
-    0x24305063: 'uMenuGalleryVoiceMapFilePath_VJoe',
-    0x56CF309F: 'uMenuGalleryVoiceMapFilePath_Dante',
-    0x403CA393: 'uMenuGalleryVoiceMapFilePath_Trish',
-    0x326A0B6F: 'uMenuGalleryVoiceMapFilePath_Frank',
-    0x508B7662: 'uMenuGalleryVoiceMapFilePath_Spencer',
-    0x49BAD2AA: 'uMenuGalleryVoiceMapFilePath_Arthur',
-    0x25B4EE6D: 'uMenuGalleryVoiceMapFilePath_Amaterasu',
-    0x424E6B04: 'uMenuGalleryVoiceMapFilePath_Zero',
-    0x3393F548: 'uMenuGalleryVoiceMapFilePath_Tron',
-    0x4754355B: 'uMenuGalleryVoiceMapFilePath_Morrigan',
-    0x423976C5: 'uMenuGalleryVoiceMapFilePath_Leilei',
-    0x0EBA0239: 'uMenuGalleryVoiceMapFilePath_Felicia',
-    0x4AB795BE: 'uMenuGalleryVoiceMapFilePath_CViper',
-    0x2EAB0629: 'uMenuGalleryVoiceMapFilePath_Haggar',
-    0x5605AB9A: 'uMenuGalleryVoiceMapFilePath_Jill',
-    0x6BAEC14C: 'uMenuGalleryVoiceMapFilePath_Hiryu',
-    0x37E6D3C4: 'uMenuGalleryVoiceMapFilePath_Vergil',
-    0x171B67FB: 'uMenuGalleryVoiceMapFilePath_Naruhodo',
-    0x059C9C26: 'uMenuGalleryVoiceMapFilePath_RedArremer',
-    0x257C086E: 'uMenuGalleryVoiceMapFilePath_Nemesis',
-    0x33C3EA27: 'uMenuGalleryVoiceMapFilePath_SpiderMan',
-    0x508EC253: 'uMenuGalleryVoiceMapFilePath_CapAmerica',
-    0x789C3FE0: 'uMenuGalleryVoiceMapFilePath_Wolverine',
-    0x617220D4: 'uMenuGalleryVoiceMapFilePath_Magneto',
-    0x7754ACA6: 'uMenuGalleryVoiceMapFilePath_Hulk',
-    0x1755CA3D: 'uMenuGalleryVoiceMapFilePath_SheHulk',
-    0x7C342B1B: 'uMenuGalleryVoiceMapFilePath_TaskMaster',
-    0x56E3FEE9: 'uMenuGalleryVoiceMapFilePath_IronMan',
-    0x36238FA1: 'uMenuGalleryVoiceMapFilePath_Thor',
-    0x51365A13: 'uMenuGalleryVoiceMapFilePath_DrDoom',
-    0x57EF46E8: 'uMenuGalleryVoiceMapFilePath_Phoenix',
-    0x75191517: 'uMenuGalleryVoiceMapFilePath_Shuma',
-    0x78194696: 'uMenuGalleryVoiceMapFilePath_Modok',
-    0x545805FA: 'uMenuGalleryVoiceMapFilePath_Dormammu',
-    0x6534C918: 'uMenuGalleryVoiceMapFilePath_DeadPool',
-    0x3A8B9923: 'uMenuGalleryVoiceMapFilePath_Storm',
-    0x4F61A67F: 'uMenuGalleryVoiceMapFilePath_SuperSkrull',
-    0x74F2E1EB: 'uMenuGalleryVoiceMapFilePath_Sentinel',
-    0x6E31CD28: 'uMenuGalleryVoiceMapFilePath_X23',
-    0x1376C619: 'uMenuGalleryVoiceMapFilePath_Nova',
-    0x0C94801B: 'uMenuGalleryVoiceMapFilePath_RRaccoon',
-    0x055DD1DE: 'uMenuGalleryVoiceMapFilePath_GhostRider',
-    0x2816B6A2: 'uMenuGalleryVoiceMapFilePath_IronFist',
-    0x5D6D0F31: 'uMenuGalleryVoiceMapFilePath_DrStrange',
-    0x0942B970: 'uMenuGalleryVoiceMapFilePath_HawkEye',
-    0x24429AB6: 'uMenuGalleryVoiceMapFilePath_Galactus',
-    0x0ADA5663: 'uMenuBase',
-    0x35F815F3: 'uMenuEarthAtk',
-    0x379068E1: 'uMenuLocal',
-    0x75466566: 'uMenuMain',
-    0x7A67C147: 'uMenuMainBase',
-    0x193ACDD3: 'uMenuMainBaseChild',
-    0x207685B4: 'uMenuMission',
-    0x5095F034: 'uMenuNetwork',
-    0x71641179: 'uMenuOption',
-    0x32D7FE26: 'uMenuOptionTus',
-    0x24E71094: 'uMenuSPCGallery',
-    0x0922545C: 'uMenuSubBase',
-    0x17709862: 'uMenuTitle',
-    0x4452D82A: 'uMenuCam',
-    0x61732C1D: 'uMenuCancelCut',
-    0x6E9D7B47: 'uMenuCursor',
-    0x0E97A7BF: 'uMenuCut',
-    0x130B9DE5: 'uMenuDlc',
-    0x5566CE10: 'uMenuHelpMsg',
-    0x062CB0C0: 'uMenuHHManual',
-    0x504E3591: 'uMenuSPCDeckCreate',
-    0x0E9CEDFB: 'uMenuSPCSelect',
-    0x266BF137: 'uMenuUnlockAnnounce',
-    0x5B64AE7C: 'uMenuWindowEarth',
-    0x79F4D428: 'uMnChrToonModel',
-    0x01A140EE: 'uMnMainRoom',
-    0x4607CE33: 'uMnNextBt',
-    0x0F44C4C5: 'uMnNextBtLast',
-    0x35A0CFF1: 'uPadInit',
-    0x67798391: 'uMenuLicense',
-    0x18DFF086: 'cCountSort',
-    0x2F464CA5: 'uMenuLicenseIcon',
-    0x0B8033C5: 'uMenuNetLeaderBoard',
-    0x11B9AF9E: 'uMenuNetLeaderBoardSub',
-    0x138E11D6: 'uMenuNetRankMatch',
-    0x7759E92B: 'uMenuNetReady',
-    0x1210061C: 'uMenuNetRoomMain',
-    0x503DF1EB: 'uMenuNetRoomMenu',
-    0x39E39612: 'uMenuNetRoomResult',
-    0x617BBDC1: 'uMenuNetRoomSelect',
-    0x082BCC90: 'uMenuNetRoomSub',
-    0x25180CD8: 'uUiTournamentResult',
-    0x43AC4B20: 'uMenuOptionCtrl',
-    0x3D1270C8: 'uMenuOptionDisplay',
-    0x597135B9: 'uMenuOptionFantastic',
-    0x21731AD9: 'uMenuOptionSound',
-    0x0ECC2E96: 'uMenuOptionSystem',
-    0x3E068166: 'uMenuOptionVoice',
-    0x35340260: 'uAnaglyphFilter',
-    0x7C8C0E64: 'uAntiEdgeBrightnessFilter',
-    0x15164CC6: 'uBlurFilterEx',
-    0x75C1D9B2: 'uCnsTSR',
-    0x0E29C886: 'uCutIn',
-    0x292D2EAD: 'uCutIn::uCutInCam',
-    0x46A74A6E: 'uDemoPlayWatcher',
-    0x6C4830B1: 'uDistortionFilter',
-    0x43CCFADF: 'uFade',
-    0x78B04DE6: 'uFadeCapture',
-    0x22227080: 'uHatchingFilter',
-    0x59264990: 'uMakeUiMask',
-    0x18F53C1B: 'uMaterialControlEx::ControllerEx',
-    0x0B8FA27C: 'uMaterialControlEx',
-    0x50154009: 'uMayaMotionCamera',
-    0x25C8862C: 'uMvc3LightSpaceShadow',
-    0x7ABFF1E9: 'uSerialWatch',
-    0x0999ADF0: 'uToonLight',
-    0x351683DE: 'uToonModel',
-    0x37AAE744: 'uToonModel::cToonParam',
-    0x15F2C30D: 'uTVNoisePrimitive',
-    0x67FA79BD: 'uUserName',
-    0x4CEAF1A7: 'uViewDraw',
-    0x585E54A3: 'uViewDrawUi',
-    0x66B27D53: 'uWhiteBlackFilter',
-    0x014C52F2: 'cAim',
-    0x090C5010: 'cAimF32',
-    0x65A768D0: 'cAimVec',
-    0x6B0492B9: 'cAppUtl',
-    0x1B4DBB12: 'cMessageTypeSet',
-    0x20D55153: 'cMessage',
-    0x0C0A2DF1: 'cCommunicator',
-    0x18A0DB34: 'nNet::cRanking',
-    0x485C3730: 'nNet::cSession',
-    0x4536D875: 'NetworkSessionInfo',
-    0x327C456A: 'NetworkStorage',
-    0x167C7D80: 'NetworkUniqueId',
-    0x7007166A: 'nNet::cCommunityEventListener',
-    0x09017E80: 'nNet::sCommunity',
-    0x5B9F9FE4: 'nNet::sComponent',
-    0x03233C68: 'nNet::sGuide',
-    0x5C6E6078: 'sMessage',
-    0x681077DF: 'nNet::cRankingEventListener',
-    0x641BEA1F: 'nNet::sRanking',
-    0x5FFB20C3: 'nNet::cSessionEventListener',
-    0x34E7061B: 'nNet::sSession',
-    0x56CF0C17: 'sNetworkLibrary',
-    0x2EA10CEB: 'MtObject',
-    0x2A031018: 'MtPropertyList',
-    0x53783AD4: 'MtGeometry',
-    0x325A839F: 'MtGeomConvex',
-    0x0EB22BED: 'MtGeomSphere',
-    0x3D568D05: 'MtGeomCapsule',
-    0x71134D41: 'MtArray',
-    0x0B4B4CE7: 'MtHeapArray',
-    0x29429698: 'MtMap',
-    0x014BB288: 'MtTree::Node',
-    0x47E12F1F: 'MtTree',
-    0x559F244C: 'MtFile::FileInfo',
-    0x7C4047D3: 'MtFile',
-    0x0B822975: 'MtRegistry',
-    0x5F813CB8: 'MtAllocator',
-    0x5AF0348C: 'MtDefaultAllocator',
-    0x74F15F28: 'MtHeapAllocator',
-    0x1FBE1059: 'MtBlockAllocator',
-    0x5759AC30: 'MtVirtualAllocator',
-    0x1A762E98: 'MtScalableAllocator',
-    0x4B9AE971: 'MtNetServiceError',
-    0x6746C8B8: 'MtNetUniqueId',
-    0x7EB9B212: 'MtNetObject',
-    0x162D34C5: 'MtNetRanking::Score',
-    0x08E91D5F: 'MtNetRanking',
-    0x4B1EC9A0: 'MtExHeapAllocator',
-    0x76E5191B: 'MtStream',
-    0x1F3422D8: 'MtFileStream',
-    0x167A6809: 'MtClipboardStream',
-    0x5BC443CD: 'MtMemoryStream',
-    0x162C4EA7: 'MtMemoryCachedStream',
-    0x7AA7094D: 'MtCipherStream',
-    0x1AF46990: 'MtCollisionGjk',
-    0x4325BE5D: 'MtCollisionMpr',
-    0x3A82790E: 'cUnit',
-    0x5CDD1F19: 'cResource',
-    0x2ED1A340: 'uScheduler',
-    0x049CECAD: 'uSchedulerEdit',
-    0x15D8846F: 'sPad::Pad',
-    0x1BFC6031: 'sPad::Map',
-    0x7DB4FE86: 'sPad',
-    0x241F5DEB: 'rTexture',
-    0x7B92638D: 'sResource::RemoteInfo',
-    0x22BD36F5: 'sResource::DecompressStream',
-    0x3EB07876: 'sResource::TypeInfo',
-    0x701D5D68: 'sResource',
-    0x1D963488: 'sUnit::UnitGroup',
-    0x44D32983: 'sUnit::MoveLine',
-    0x5A62EE8C: 'sUnit',
-    0x2953C0AC: 'sApp',
-    0x58C72E3D: 'sApp::Item',
-    0x39F12FBB: 'sMain',
-    0x4C0DB839: 'rScheduler',
-    0x5A4279D6: 'sVibration',
-    0x56F5B156: 'uModel::Motion',
-    0x27EEC3E7: 'cSystem',
-    0x342A0C36: 'sCamera::Viewport',
-    0x3261A0A7: 'sCamera',
-    0x1D21D7C8: 'sRender',
-    0x20C62339: 'nPrim::PrimVertex',
-    0x3F1DDF50: 'sEffect',
-    0x74221BC8: 'sArea::AreaInfo',
-    0x514DDFB7: 'sArea',
-    0x18E87CF1: 'sToolBase',
-    0x51B1959D: 'uCamera',
-    0x247EEB9B: 'rArchive::DecompressStream',
-    0x73850D05: 'rArchive',
-    0x7D9935CA: 'uCoord',
-    0x16E4BF67: 'uMaterialControl::Controller',
-    0x230A9EB3: 'uMaterialControl',
-    0x288F7E74: 'uJointAnimator',
-    0x233302FD: 'uChain',
-    0x35FFAC6E: 'uBaseModel',
-    0x45A468EE: 'uModel',
-    0x3816638E: 'uModel::Constraint',
-    0x6DA7651F: 'uModel::JointDAGNode',
-    0x40E80DD6: 'uModel::Joint',
-    0x58A15856: 'rModel',
-    0x76820D81: 'rMotionList',
-    0x05CD6DF7: 'nCollision::cMotionSequenceSupport',
-    0x1D2D7175: 'nCollision::cObjectBase',
-    0x411CCDC2: 'nCollision::cGeometry',
-    0x07799B24: 'nCollision::cGeometryExpansion',
-    0x71BA0D2E: 'nCollision::cGeometryJoint',
-    0x49AEA40C: 'nCollision::cCollisionNode',
-    0x5F6C35AD: 'nCollision::cCollisionNodeObject',
-    0x2404E3E2: 'nCollision::cCollisionNodeGroup',
-    0x1855E615: 'nCollision::cGeometryJointGroup',
-    0x10B479D2: 'sCollision::ActiveNodeInfo',
-    0x2C15D09A: 'sCollision::ColliderActiveNodeInfo',
-    0x2161DCF0: 'sCollision::ColliderPassiveNodeInfo',
-    0x665BC6EF: 'sCollision::NodeList',
-    0x1B639153: 'sCollision::Collider::cNodeListArray',
-    0x76D2EF9F: 'sCollision::Collider',
-    0x1291FE17: 'sCollision::cSystemInitializeParam',
-    0x0B3DCD99: 'sCollision::cSbcMoveMatrix',
-    0x281AE264: 'sCollision::cColArray',
-    0x3E3E1CA1: 'sCollision',
-    0x3E363245: 'rChain',
-    0x0026E7FF: 'rChainCol',
-    0x0328E34B: 'sCollision::Node',
-    0x3CE63AAE: 'sSound',
-    0x16F39ED6: 'sSound::NativeSystemXAudio2::WinProperty',
-    0x1E08DE68: 'nDraw::Animation',
-    0x044D51A4: 'nDraw::CBuffer',
-    0x16AA28A1: 'nDraw::CBufferSystem',
-    0x4516E7AB: 'nDraw::Material',
-    0x5CCDEA6A: 'uEffect',
-    0x20EB23B5: 'uConstraint::cConstraint',
-    0x0E9055F6: 'uConstraint',
-    0x6D5AE854: 'rEffectList',
-    0x3105328E: 'uBaseEffect',
-    0x15692485: 'uFilter',
-    0x11A7E0D4: 'uDOFFilter',
-    0x3C14AD49: 'uTVNoiseFilter',
-    0x14A4CC49: 'uImagePlaneFilter',
-    0x6752005F: 'uCrossFadeFilter',
-    0x193EA064: 'uVolumeNoiseFilter',
-    0x785BD903: 'uNoiseFogFilter',
-    0x11EDABFE: 'uRadialBlurFilter',
-    0x43BCBC9C: 'uMotionBlurFilter',
-    0x70CC7783: 'uHazeFilter',
-    0x7AD567B0: 'uFishEyeFilter',
-    0x369C12D5: 'uColorFogFilter',
-    0x6DF8B0F1: 'uBlurFilter',
-    0x2ACD1930: 'uColorCorrectFilter::Corrector',
-    0x1265A094: 'uColorCorrectFilter',
-    0x3A9B7358: 'uLightScatteringFilter',
-    0x54E6A16B: 'uBloomFilter',
-    0x59351470: 'uToneMapControl',
-    0x659CD65D: 'uAmbientOcclusionFilter',
-    0x1EF724EF: 'uOutlineFilter::Detector',
-    0x46393159: 'uOutlineFilter',
-    0x21C5780B: 'uBokehFilter',
-    0x604366C3: 'uEdgeAntiAliasingFilter',
-    0x6B71A237: 'uGodRaysFilter',
-    0x57D3DD05: 'uChromaticAberrationFilter',
-    0x37AC8D4B: 'uTangentBlurFilter',
-    0x16CBC852: 'cDraw',
-    0x30782E08: 'sCollision::SbcInfoBase',
-    0x72991E73: 'sCollision::SbcInfo',
-    0x2ED47FDC: 'sCollision::TriangleInfo',
-    0x709FD39D: 'sCollision::SbcLockInfo',
-    0x11C6E908: 'sCollision::Param',
-    0x306B7794: 'sAI',
-    0x58CFB9DF: 'cAISvUserProcess',
-    0x58C75F69: 'cAISvUserProcess::UserObjectInfo',
-    0x2E3E872E: 'cAIFSM',
-    0x59F986BD: 'cAIFSM::Core',
-    0x6293217B: 'cAIFSM::Core::ClearTransitionFromAllOnceParam',
-    0x57A76BC8: 'cAIFSM::Core::ClusterDriveInfo',
-    0x16DC8964: 'cAIFSM::Core::ClusterWork',
-    0x0D624460: 'cAIFSMProcessContainer',
-    0x78B9C3DB: 'cAIFSMData',
-    0x365184B8: 'cAIFSMData::Cluster',
-    0x40FD6484: 'cAIFSMData::ClusterLog',
-    0x296A2C1E: 'cAIFSMData::Core',
-    0x567FAB90: 'cAIObject',
-    0x7EC22EC1: 'cAIResource',
-    0x1F4939F1: 'cAIUserProcessContainer',
-    0x2BF30A0A: 'cAIUserProcess',
-    0x750AFF3D: 'cAIUserProcessCallback',
-    0x01209ECA: 'cAICopiableParameter',
-    0x76489CF9: 'cAIUserProcessReference',
-    0x18FE11E3: 'cPrimBuffer',
-    0x5F5F8708: 'cPrimTexHandle',
-    0x44ACF2C4: 'sPrimitive',
-    0x4323D83A: 'rSceneTexture',
-    0x31AD4835: 'cArea',
-    0x454CB56E: 'sShader2',
-    0x02358E1A: 'rShaderPackage',
-    0x358012E8: 'rVibration',
-    0x1A0BAB1B: 'uFreeCamera',
-    0x1FDBF9B5: 'uShadow',
-    0x194984AA: 'uLightSpaceShadow',
-    0x032CE905: 'uStableShadow',
-    0x26F86FEB: 'uUniformShadow',
-    0x6B792EAB: 'uSpotShadow',
-    0x0E0F1A5B: 'uPointShadow',
-    0x0F6FE858: 'uMovie',
-    0x126AD8E0: 'rMovie',
-    0x5F84F7C4: 'rMovieOnMemory',
-    0x31F693D6: 'rMovieOnDisk',
-    0x17A69ACE: 'rMovieOnMemoryInterMediate',
-    0x71950384: 'rMovieOnDiskInterMediate',
-    0x7808EA10: 'rRenderTargetTexture',
-    0x0A57D7BB: 'sNetwork',
-    0x3694A441: 'rSoundCurveXml::Element',
-    0x2E60C5BF: 'rSoundCurveXml::Curve',
-    0x592D804B: 'rSoundCurveXml',
-    0x3A962172: 'rSoundDirectionalCurveXml::Element',
-    0x6CC76A1B: 'rSoundDirectionalCurveXml::Curve',
-    0x3A96D8A0: 'rSoundDirectionalCurveXml',
-    0x0315E81F: 'rSoundDirectionalSet',
-    0x1BCC4966: 'rSoundRequest',
-    0x167DBBFF: 'rSoundStreamRequest',
-    0x0A359448: 'rSoundPhysicsRigidBody::cSoundFirstRequestData',
-    0x781A43FA: 'rSoundPhysicsRigidBody::cSoundFinishRequestData',
-    0x528FCFDB: 'rSoundPhysicsRigidBody::cSoundSlideRequestData',
-    0x365F18CD: 'rSoundPhysicsRigidBody::cSoundRollRequestData',
-    0x246A7743: 'rSoundPhysicsRigidBody::cSoundPhysicsRequestData',
-    0x1EB3767C: 'rSoundPhysicsRigidBody',
-    0x51A10298: 'rSoundPhysicsSoftBody::cSoundPhysicsRequestData',
-    0x7BEC319A: 'rSoundPhysicsSoftBody',
-    0x24068902: 'rSoundPhysicsJoint::cSoundJointRequestData',
-    0x31EDC625: 'rSoundPhysicsJoint',
-    0x09E6B5F0: 'rShader2',
-    0x792B46C0: 'uLight',
-    0x5982031D: 'uInfiniteLight',
-    0x7DCCE7A6: 'uAmbientLight',
-    0x49A43F8E: 'uPointLight',
-    0x22F683F8: 'uCapsuleLight',
-    0x6A2EC243: 'uSpotLight',
-    0x7DE525E7: 'uCuboidLight',
-    0x60C10879: 'uHemiSphereLight',
-    0x24BCE4BF: 'uCubeMapLight',
-    0x3261DF4B: 'uPointCubeMapLight',
-    0x137CB3C6: 'uCapsuleCubeMapLight',
-    0x14D8E98F: 'uCuboidCubeMapLight',
-    0x54A47FFE: 'uBackLight',
-    0x612DF6E2: 'sCapture',
-    0x2E804724: 'sGpuParticle',
-    0x4FF829EB: 'sKeyboard',
-    0x114842D4: 'sPlatformUtil',
-    0x6B5D4FC7: 'sMouse',
-    0x50003FDC: 'uShadowRegion',
-    0x46DD0428: 'uPointShadowRegion',
-    0x6693EE7C: 'uSpotShadowRegion',
-    0x67C068A5: 'uCapsuleShadowRegion',
-    0x606432EC: 'uCuboidShadowRegion',
-    0x28924381: 'uWind',
-    0x27DCDC08: 'uWind::WindGenerator',
-    0x09C893DB: 'uShallowWind',
-    0x7C832B6A: 'rImplicitSurface',
-    0x47FE02AC: 'uFog',
-    0x19E8A182: 'uColorFog',
-    0x4C335ED1: 'uLightScatteringFog',
-    0x4EA2D091: 'uDPEnvMap',
-    0x3FA147F7: 'uEnvMap',
-    0x77E7B756: 'uFacial',
-    0x510228B3: 'uOrthoCamera',
-    0x31743660: 'uLightShaft',
-    0x310A60D2: 'uMirror',
-    0x3D9C4B1E: 'uActorModel::Constraint',
-    0x4CE3C431: 'uActorModel',
-    0x1EC9902C: 'uModelSky',
-    0x1496D88C: 'uModelPlaneClip',
-    0x113ADA76: 'uModelSymmetry',
-    0x6AE27F28: 'uMotionCamera',
-    0x64EA1111: 'uScreenMap',
-    0x3623018E: 'cShadowPriorityState',
-    0x5B54154D: 'sShadow::Resource',
-    0x2FBE769A: 'sShadow::ViewConsistentResource',
-    0x24FE3D31: 'sShadow::ResourceGroup',
-    0x0390A969: 'sShadow::Node',
-    0x7C0BCC8F: 'sShadow',
-    0x6A7F1378: 'uTextureBlend',
-    0x56EEB230: 'uProjectionTexture',
-    0x49935268: 'uProjectionShadow',
-    0x0A8541B7: 'uProjectionEffect',
-    0x70A0F5E2: 'uCameraEffect',
-    0x2D585975: 'uMetaSet',
-    0x60F09AE5: 'uScreenSpace',
-    0x1AAA8680: 'rAIWayPointGraph::Node',
-    0x2979F734: 'rAIWayPointGraph::Link',
-    0x13B0A6DD: 'rAIWayPointGraph::NodeGraph',
-    0x25FA21CB: 'rAIWayPointGraph',
-    0x070D8334: 'uCnsIK::uCnsJoint',
-    0x7E087781: 'uCnsIK::JointInfo',
-    0x477ADADA: 'uCnsIK',
-    0x2946D6A8: 'uCnsScaleNormalize',
-    0x0EB59CB3: 'uCnsRotateLimit',
-    0x09DEBCD6: 'uCnsLookAt',
-    0x3DB67BF2: 'uCnsMatrix',
-    0x5107CE62: 'uCnsJointOffset',
-    0x780B5A72: 'uCnsParent',
-    0x72D96061: 'uCnsParentN::cParentNode',
-    0x2F1777DD: 'uCnsParentN',
-    0x640E20C1: 'uCnsChain',
-    0x64A5BD88: 'uCnsChain::cCnsChild',
-    0x4AF2141C: 'uCnsTinyChain::cChainNode',
-    0x2DBACFE4: 'uCnsTinyChain::cChainGroup',
-    0x2E2E90C7: 'uCnsTinyChain',
-    0x6A5CDD23: 'rOccluder',
-    0x740641F7: 'rOccluder::cQuad',
-    0x7D27C960: 'sOccluder',
-    0x0E3DB0EA: 'uOccluder',
-    0x437EB25F: 'uOccluderMover',
-    0x0DB4743A: 'uSoftBody',
-    0x69A5C538: 'rDeformWeightMap',
-    0x773724E9: 'uSimSoftBody',
-    0x4AD71F90: 'uVtxDisplacementCtrl',
-    0x0352D8BF: 'uISC',
-    0x7BEE2FF5: 'uISC::ISC',
-    0x1E85E006: 'rISC',
-    0x64607234: 'uMirage',
-    0x3B8EDA79: 'uAmbientShadow',
-    0x26AE9DAB: 'sSavedata',
-    0x4878F43E: 'uGraphPatch',
-    0x1C643F6B: 'sSyncPoint',
-    0x6C454D60: 'sSyncPoint::syncPointElement',
-    0x5EA7A3E9: 'rSky',
-    0x3E356F93: 'rStarCatalog',
-    0x6BA87EFF: 'uSkyFog',
-    0x43709B50: 'uSky',
-    0x3D683C5B: 'rCloud',
-    0x206D0CE3: 'uCloud',
-    0x3B10AA9A: 'uCloudControl',
-    0x606C8AEE: 'uWeather',
-    0x0163E64B: 'uReflectionMap',
-    0x05396628: 'nDraw::Resource',
-    0x5FB0EBE4: 'nDraw::MaterialStd',
-    0x7D2B31B3: 'nDraw::MaterialStdEst',
-    0x6A469AD6: 'nNetwork::SessionListener',
-    0x4CD24D24: 'cRemoteCall',
-    0x3F44B436: 'cRemoteProcedure',
-    0x4043581F: 'cRemoteProcedureAsync',
-    0x7C907717: 'cRemoteProcedureAsync::MsgMTFN_Async',
-    0x63E6A949: 'cAIFSMLink',
-    0x609DB540: 'cAIFSMNodeProcess',
-    0x5035D8FD: 'cAIFSMNode',
-    0x18868106: 'cAIFSMCluster',
-    0x66B45610: 'rAIFSM',
-    0x59EE2276: 'rAIFSMList',
-    0x560D6F95: 'rAIFSMList::Info',
-    0x232E228C: 'rSoundReverb',
-    0x4E1ECA49: 'rSoundReverb::cSoundReverbData',
-    0x2B40AE8F: 'rSoundEQ',
-    0x52D40310: 'rSoundEQ::cEQData',
-    0x0ECD7DF4: 'rSoundCurveSet',
-    0x78F4208B: 'sScene::TextureInfo',
-    0x1D1116F0: 'sScene',
-    0x262ADC0E: 'sTool',
-    0x7E585852: 'nDraw::RenderTargetView',
-    0x61C5DF74: 'nDraw::DepthStencilView',
-    0x262D81B7: 'nDraw::Texture',
-    0x7C0B7BE8: 'cPrim',
-    0x33E60382: 'nNetwork::Storage',
-    0x59638AA8: 'sRemoteProcedure',
-    0x3EA2644A: 'sRemoteProcedure::cTemporaryRemoteCall',
-    0x24170508: 'nNetwork::nAchievement::Object',
-    0x2926F69A: 'nNetwork::VoiceChat',
-    0x2D8CFE2B: 'nNetwork::VoiceChat::Talker',
-    0x6D87005E: 'nNetwork::nRanking::Object',
-    0x4B9A365C: 'nNetwork::nRanking::Object::StateBase',
-    0x50402394: 'nNetwork::SessionDriver',
-    0x3689A8DA: 'nNetwork::SessionDatabase',
-    0x37D8CD62: 'nNetwork::Session',
-    0x37AA37A4: 'nDraw::ExternalRegion',
-    0x53F155D9: 'sBenchmark::BenchmarkInfo',
-    0x52FF77E1: 'sBenchmark',
-    0x7896F970: 'nDraw::VertexBuffer',
-    0x04C94B3D: 'nDraw::IndexBuffer',
-    0x36450705: 'nDraw::Query',
-    0x406C27FC: 'nDraw::OcclusionQuery',
-    0x4B815D34: 'nDraw::Scene',
-    0x247828B2: 'nDraw::Buffer',
-    0x473221A3: 'cWind',
-    0x276DE8B7: 'rEffect2D',
-    0x4E397417: 'rEffectAnim',
-    0x02833703: 'rEffectStrip',
-    0x1AE50150: 'rVertices',
-    0x727C7279: 'rNulls',
-    0x430C857E: 'uEffect2D',
-    0x3D52F96F: 'uSimpleEffect',
-    0x42412AD7: 'uEffectEmitter',
-    0x70B6CA24: 'uMultiFilter',
-    0x002B7F3C: 'uMultiBlurFilter',
-    0x21BEEFA6: 'uMultiGodRaysFilter',
-    0x3C9BC06D: 'uMultiColorCorrectFilter',
-    0x315ECCA9: 'uMultiBloomFilter',
-    0x6D5941C5: 'CoprocessorObject',
-    0x0854D484: 'nDraw::MaterialNull',
-    0x0AF5188C: 'nDraw::CommandCache',
-    0x2749C8A8: 'rMaterial',
-    0x4E69163E: 'nCollision::cAllocaterIntermediate',
-    0x26213251: 'nCollision::cScrCommonFilter',
-    0x33C3EFB0: 'nCollision::cScrCollisionMoveMatrix',
-    0x12F8D464: 'nCollision::uPreviewModel',
-    0x3923B05F: 'nCollisionUtil::cOwnerSystem',
-    0x21828CA0: 'cGeomConvexHull',
-    0x1EF5E639: 'rConvexHull',
-    0x5F78F725: 'cDynamicBVHCollision::Node',
-    0x11ED3ABD: 'cDynamicBVHCollision',
-    0x6158A4A8: 'rCollisionHeightField',
-    0x724DA3EA: 'cBVHCollision::cWorkBuildOnlineFast',
-    0x3DB9C302: 'cBVHCollision',
-    0x0FF88A5A: 'sCollision::ScrCollisionInfoBase',
-    0x2FEF117C: 'sCollision::ScrCollisionInfo',
-    0x06E2103F: 'sCollision::ScrCollisionInfoFind',
-    0x6FD96CF3: 'sCollision::ScrCollisionInfoCastConvex',
-    0x33CB93A0: 'sCollision::ScrCollisionInfoAdjustPosition',
-    0x16C3E84A: 'sCollision::ScrCollisionInfoGetAreaPoly',
-    0x2DF3CF9D: 'sCollision::ScrCollisionInfoOriginal',
-    0x189DA90B: 'sCollision::ScrCollisionInfoPreTraverse',
-    0x17D43B98: 'sCollision::ScrCollisionInfoFind4',
-    0x1E744687: 'sCollision::cSbcArrayBP::cDBVTMaster',
-    0x69708D8D: 'sCollision::cSbcArrayBP',
-    0x5A2E584C: 'sCollision::Sbc::Parts',
-    0x21359C2A: 'sCollision::Sbc',
-    0x0216607F: 'sCollision::SbcObject::cRegisterInfo',
-    0x334DDCFC: 'sCollision::SbcObject',
-    0x097B7A83: 'sCollision::cSbcSkinMesh::cRegisterInfo',
-    0x0BF2A44A: 'sCollision::cSbcSkinMesh',
-    0x6634BDF3: 'sCollision::cSbcHeightField::cHeightField',
-    0x217D9560: 'sCollision::cSbcHeightField',
-    0x05D4C4EF: 'sCollision::cSbcMoveReserveInfoAll',
-    0x4EF19179: 'sCollision::cSbcMoveReserveInfo',
-    0x0525BF55: 'sCollision::cSbcMoveResetReserveInfoAll',
-    0x0329BA31: 'sCollision::cSbcMoveResetReserveInfo',
-    0x674D6873: 'sCollision::cSbcRegistReserveInfo',
-    0x51FC779F: 'rCollision',
-    0x4835674D: 'rCollisionObj::cPartsData',
-    0x2350E584: 'rCollisionObj',
-    0x1AD71D56: 'cGridCollision',
-    0x15D782FB: 'rSoundBank',
-    0x64A34520: 'rSoundSource',
-    0x465CB860: 'rSoundSourcePC',
-    0x724DF879: 'rSoundSourceMSADPCM',
-    0x255D51CD: 'rSoundSourceOggVorbis',
-    0x329D963D: 'cSoundMultiBandEQ',
-    0x064A3AD8: 'rSoundSpeakerSetXml',
-    0x7A827C0C: 'cParticleManager',
-    0x6E7799F6: 'cParticleNode',
-    0x0F37245A: 'cParticleNodeInfinite',
-    0x0072DA84: 'cParticleGenerator',
-    0x725034E7: 'cEffectUnitGenerator',
-    0x45075F6E: 'cParticleGeneratorBillboard',
-    0x158CE421: 'cParticleGeneratorBillboardStrip',
-    0x487A14A0: 'cParticleGeneratorSizeBillboard',
-    0x097B4C49: 'cParticleGeneratorLiteBillboard',
-    0x4D54925E: 'cParticleGeneratorPolyline',
-    0x5857EB7F: 'cParticleGeneratorLitePolyline',
-    0x599B85F7: 'cParticleGeneratorPolygon',
-    0x7A666120: 'cParticleGeneratorClothPolygon',
-    0x47706084: 'cParticleGeneratorAdhesion',
-    0x646CD7F1: 'cParticleGeneratorAxisPolygon',
-    0x00CFEDAA: 'cParticleGeneratorLitePolygon',
-    0x7ABFD1AE: 'cParticleGeneratorTexline',
-    0x2F4E4E2A: 'cParticleGeneratorLine',
-    0x0A8C5951: 'cParticleGeneratorModel',
-    0x3186927C: 'cParticleGeneratorPrimModel',
-    0x6E862668: 'cParticleGeneratorLensFlare',
-    0x516A071E: 'cParticleGeneratorMassBillboard',
-    0x4EF8A2A9: 'cParticleGeneratorFilter',
-    0x3603777F: 'cParticleGeneratorLight',
-    0x3E3E376A: 'cParticleGeneratorHit',
-    0x298E7C3F: 'cParticleGeneratorPolygonStrip',
-    0x44B8EB2F: 'cParticleGeneratorCustom',
-    0x2ACB72F3: 'cParticleGeneratorLightShaft',
-    0x6ABCD8AC: 'cParticleGeneratorPoint',
-    0x4A71A8A0: 'cParticleGeneratorForce',
-    0x6F71AE07: 'cParticleGeneratorTrail',
-    0x27AB4075: 'rConstraint',
-    0x0437BCF2: 'rGrassWind',
-    0x298E79A3: 'rGrassWind::cParamSet',
-    0x5CAD6F55: 'uDynamicSbc',
-    0x66540C1A: 'uScrollCollisionGeometry::cGeometryInfo',
-    0x2199744B: 'uScrollCollisionGeometry',
-    0x12BB3956: 'nAI::TaskPerformanceInfo',
-    0x0058F667: 'nAI::TaskPerformanceInfo::LOD',
-    0x1A223E0F: 'cAITask',
-    0x40ABA692: 'cAITaskJobPrim',
-    0x342DA475: 'cAITaskJobPrimList',
-    0x31A91DA3: 'rAI',
-    0x56DBE48A: 'rAI::TaskPerformanceInfo',
-    0x7F22DC11: 'rAI::TaskPerformanceInfo::LOD',
-    0x6AD29A48: 'cAIService',
-    0x3D2F51F7: 'cAIConditionTreeNode',
-    0x3011C92D: 'cAIConditionTree',
-    0x1BF4EAB6: 'cAIConditionTree::TreeInfo',
-    0x6EEDC18B: 'cAIConditionTree::OperationWorkNode',
-    0x51A80B30: 'cAIConditionTree::ConstWorkNode',
-    0x565DE033: 'cAIConditionTree::ConstEnumWorkNode',
-    0x4CD105C1: 'cAIConditionTree::VariableWorkNode',
-    0x52992A34: 'cAISvFSM',
-    0x568283E5: 'cAISvFSM::FSMInfo',
-    0x7D82B3CF: 'cPrimObj',
-    0x1054BF40: 'cPrimTagList',
-    0x3182EEB2: 'cPrimTexHandleManager',
-    0x214B855A: 'cPrimTagManager',
-    0x5DC78998: 'cPrimBufferManager',
-    0x09C1C5CE: 'cBlendState',
-    0x6645D200: 'nDraw::BlendState',
-    0x15386913: 'nDraw::RasterizerState',
-    0x2C661E00: 'nDraw::DepthStencilState',
-    0x459E980F: 'nDraw::InputLayout',
-    0x274D62E1: 'nDraw::SamplerState',
-    0x294E9E8A: 'rShaderCache',
-    0x05C19DC8: 'nNetwork::Context',
-    0x40693273: 'nNetwork::BlockPool',
-    0x7E95D2C1: 'nNetwork::BlockBuffer',
-    0x60476EE6: 'nNetwork::BlockQueue',
-    0x099E110A: 'nNetwork::Callback',
-    0x17AD750E: 'nNetwork::Callback::Entry',
-    0x4371971D: 'nNetwork::Callback::Queue',
-    0x49E0D383: 'BitIO',
-    0x798B44D5: 'nNetwork::nSharedMemory2::CNode',
-    0x2555700F: 'nNetwork::nSharedMemory2::CConsistentHash',
-    0x2DC53F5E: 'nNetwork::nSharedMemory2::CProtocol',
-    0x329D27C7: 'nNetwork::nSharedMemory2::Object',
-    0x74CC9443: 'nNetwork::nSharedMemory2::CRecord',
-    0x07B8BCDE: 'rFacialAnimation',
-    0x279D506C: 'rMetaSet',
-    0x0E7C72A5: 'rMetaSetXml::ObjectData',
-    0x0330C7DF: 'rMetaSetXml',
-    0x4293A408: 'cAIPacket',
-    0x717D2F2C: 'cAIPacketList',
-    0x0CFED18C: 'cAIPacketQueue',
-    0x00347F62: 'cAIGraph',
-    0x0B8EAA32: 'cAIGraph::Node',
-    0x59657F1F: 'cAIGraph::Area',
-    0x23ACF968: 'cAIAStar',
-    0x3CB5B341: 'cAITreeBase',
-    0x3FF20E5A: 'cAITreeBase::Node',
-    0x608948B0: 'cAIQuadTree',
-    0x5E9A0BCA: 'rCnsIK::JointInfo',
-    0x5A7FEA62: 'rCnsIK',
-    0x4868DCCC: 'rCnsScaleNormalize',
-    0x15B493A9: 'rCnsRotateLimit',
-    0x6B02A7AF: 'rCnsLookAt',
-    0x5F6A608B: 'rCnsMatrix',
-    0x4A06C178: 'rCnsJointOffset',
-    0x1AD7410B: 'rCnsParent',
-    0x23A33A26: 'uCnsSkeleton::cCnsChild',
-    0x7EA1C56F: 'uCnsSkeleton::cNode',
-    0x30E56F5C: 'uCnsSkeleton',
-    0x062C625E: 'rCnsParentN',
-    0x0AD1B7D5: 'uCnsGroup::cNode',
-    0x4FC29653: 'uCnsGroup::cGroup',
-    0x13F66715: 'uCnsGroup::cCnsChild',
-    0x38CC7CCE: 'uCnsGroup',
-    0x535D969F: 'rCnsTinyChain',
-    0x66EBA78B: 'uGrassWind',
-    0x07FA0E53: 'uGrassWind::cSwingParameters',
-    0x5F803DCB: 'uGrassWindDirection',
-    0x0B5FE029: 'uGrassWindPoint',
-    0x42EED361: 'uGrassWindLine',
-    0x440AE2A0: 'uGrassWindGlobal',
-    0x6143E1BD: 'rGraphPatch',
-    0x701DB53B: 'nAI::LocalPropertyList',
-    0x2934CACD: 'nAI::EnumObject',
-    0x68328AAC: 'nAI::EnumProp',
-    0x2C29825D: 'cAIDEnum',
-    0x388EC194: 'rAIConditionTreeNode',
-    0x785E6622: 'rAIConditionTree',
-    0x1C328079: 'rAIConditionTree::OperationNode',
-    0x7954D98C: 'rAIConditionTree::StateNode',
-    0x3D9510A8: 'rAIConditionTree::VariableNode',
-    0x3E1F9629: 'rAIConditionTree::VariableNode::VariableInfo',
-    0x3280309B: 'rAIConditionTree::ConstS32Node',
-    0x6D0D5488: 'rAIConditionTree::ConstS64Node',
-    0x076683F2: 'rAIConditionTree::ConstF32Node',
-    0x58EBE7E1: 'rAIConditionTree::ConstF64Node',
-    0x5EC17F62: 'rAIConditionTree::ConstStringNode',
-    0x3B9D960B: 'rAIConditionTree::ConstEnumNode',
-    0x56BB1759: 'rAIConditionTree::TreeInfo',
-    0x01456AF8: 'uGrassEffect',
-    0x29C19CCC: 'cStateMachineBase::StateBase',
-    0x26EC282D: 'nNetwork::SearchKeyPtr',
-    0x7697A150: 'nNetwork::SearchKeyListPtr',
-    0x0F2BEFDD: 'nNetwork::SearchFilterPtr',
-    0x4FA06DF7: 'nNetwork::SearchFilterListPtr',
-    0x26AA4D21: 'nNetwork::UpdaterPtr',
-    0x7F59BB1D: 'nNetwork::ScoreOptionPtr',
-    0x43288400: 'nNetwork::TagChecker',
-    0x5C34DFC5: 'nNetwork::TagChecker::RpcSyncReq',
-    0x4FAE7A0B: 'nNetwork::TagChecker::RpcSyncAns',
-    0x3E926E9B: 'nNetwork::RpcNetSystem_TryConnect',
-    0x665443AF: 'nNetwork::RpcNetSystem_ReqDetour',
-    0x39EC3064: 'nNetwork::RpcNetSystem_AnsDetour',
-    0x75B10DEF: 'nNetwork::RpcNetSystem_RouteKey',
-    0x4E9E0DFC: 'nNetwork::RpcNetSystem_RouteKeyAck',
-    0x0CA2406D: 'nNetwork::RpcNetSystem_LinkState',
-    0x3DDC4535: 'nNetwork::RpcNetSystem_Core',
-    0x1266DC19: 'nNetwork::RpcNetSystem_HealthCheck',
-    0x7934A6BF: 'nNetwork::RpcNetSystem_Leave',
-    0x49A5BB1F: 'nNetwork::RpcNetSystem_Entry',
-    0x18DFE36A: 'nNetwork::RpcNetSystem_Match',
-    0x6E07B730: 'nNetwork::RpcNetSystem_Terminate',
-    0x5BE7381E: 'nNetwork::RpcNetSystem_Config',
-    0x1353E1A9: 'nNetwork::Connect',
-    0x3127B9BD: 'nNetwork::Route',
-    0x3EDCF0C5: 'nNetwork::Member',
-    0x49B85CC1: 'nNetwork::Match',
-    0x0681C525: 'nNetwork::Transport',
-    0x1F3FD829: 'nNetwork::Transport::ForwardQueue',
-    0x38A7D960: 'nNetwork::Protocol',
-    0x775B5E84: 'nNetwork::ProtocolStandard',
-    0x4F430E0F: 'nNetwork::ProtocolStandard::Queue',
-    0x02506161: 'nNetwork::ProtocolMinimum',
-    0x501D6E4B: 'nNetwork::ProtocolBroadcast',
-    0x3DC8FC8E: 'nDraw::MaterialSSS',
-    0x2615636B: 'nDraw::MaterialStdPN',
-    0x11B2E584: 'nDraw::MaterialStdDM',
-    0x23823D1B: 'nDraw::MaterialConstant',
-    0x33A9D93B: 'uGeometry2',
-    0x44AEE9AD: 'uGeometry3',
-    0x7D8CEB43: 'uGeometry2Collider::cContactInfo',
-    0x564820FD: 'uGeometry2Collider::cNodeGeometryInfo',
-    0x68077325: 'uGeometry2Collider',
-    0x454CE087: 'uGeometry2Group',
-    0x55587F80: 'uGeometry2GroupCollider',
-    0x5ED6FA84: 'uScrollCollisionGeometryModel',
-    0x54FA049E: 'uScrollCollisionGeometryGroupModel',
-    0x24E6FDAF: 'uScrollCollisionSbc',
-    0x6772D35D: 'cColliderNodeParam',
-    0x58E0BBE8: 'cColliderGeometryParam',
-    0x63BB1AAE: 'sDLC',
-    0x7A9A76AE: 'uAdhesion',
-    0x62377681: 'uSynchroModel',
-    0x3B8DC0B2: 'uSynchroGrassWindPoint',
-    0x185B8ABF: 'uSynchroGrassWindDirection',
-    0x2531A18E: 'uSynchroGrassWindLine',
-    0x04560735: 'uSynchroAdhesion',
-    0x7C13D339: 'uSynchroPointLight',
-    0x0D0D44FE: 'uSynchroSpotLight',
-    0x04C3DAD7: 'uSynchroLightShaft',
-    0x75967AD6: 'rDynamicSbc',
-    0x776D9118: 'uScrollCollision',
-    0x5B118136: 'rGeometry2::cGeometry',
-    0x19C0E70E: 'rGeometry2::cGeometryArray',
-    0x5175C242: 'rGeometry2',
-    0x2672F2D4: 'rGeometry3',
-    0x01144469: 'nCollision::cScrGeometryParam',
-    0x3A212D6C: 'nCollision::cScrGeometryGroupParam',
-    0x05A58C51: 'cMetaSetPropertyData',
-    0x54FC9262: 'nGraphComponent::Base',
-    0x614EBF65: 'nGraphComponent::Edge',
-    0x5134A71A: 'nGraphComponent::Filter',
-    0x2DC9BEB2: 'nGraphComponent::Color',
-    0x71B3576B: 'nGraphComponent::Variable',
-    0x5E278448: 'nGraphComponent::Add',
-    0x7B3F7573: 'nGraphComponent::Sub',
-    0x0A3FD60E: 'nGraphComponent::Mul',
-    0x1EFB49A6: 'nGraphComponent::Div',
-    0x2AD42DB5: 'nGraphComponent::Oscillator',
-    0x688E7CFC: 'nGraphComponent::BaseMap',
-    0x24A599EA: 'uGeometry2Base',
-    0x5E4DEF9D: 'rGeometry2Group',
-    0x4F3C7D65: 'MtPerformanceCounter',
-    0x42AA5A99: 'MtPerformance',
-    0x03355995: 'MtPerformanceTimer',
-    0x30C5FA11: 'MtGeomAABB',
-    0x113DFED1: 'MtCollisionUtil::MtDtiObject',
-    0x6165159E: 'MtCollisionUtil::MtDtiSelecterIntermediate',
-    0x5C4DCC7D: 'MtCollisionUtil::MtDtiSelecter',
-    0x4407637B: 'MtCollisionUtil::MtArrayElement',
-    0x13AE871E: 'MtCollisionUtil::MtArrayEx',
-    0x739EE5D9: 'MtCollisionUtil::MtDataBuffer',
-    0x7D68E873: 'MtCollisionUtil::MtFuncBase',
-    0x6FF6DDE7: 'MtCollisionUtil::MtFunc',
-    0x55E11004: 'MtCollisionUtil::MtFunc32',
-    0x436E865D: 'MtCollisionUtil::MtFunc32X2',
-    0x5501A8E3: 'MtCollisionUtil::MtFuncPtr',
-    0x11E2EA44: 'MtCollisionUtil::MtFuncPtr32',
-    0x46927FD6: 'MtCollisionUtil::MtListElement',
-    0x69C88E4C: 'MtCollisionUtil::MtList',
-    0x555EBD5B: 'MtCollisionUtil::MtTreeDTI',
-    0x031F8368: 'MtGeomLineSegment',
-    0x34D14DF1: 'MtGeomOBB',
-    0x4DA2AC5E: 'MtGeomCylinder',
-    0x09319A33: 'MtGeomTriangle',
-    0x3F3305F5: 'MtGeomLineSweptSphere',
-    0x372CEB84: 'MtThread',
-    0x4BB411BD: 'MtGeomAABB4',
-    0x5C4D7A1A: 'MtFCurve::Key',
-    0x39196F4D: 'MtFCurve',
-    0x2F8DE397: 'MtGeomRay',
-    0x7CF36254: 'MtGeomRayY',
-    0x62DE025C: 'MtGeomLineSegment4',
-    0x34BC3DBB: 'MtDtiSelecter',
-    0x68CAEB51: 'MtGeomLine',
-    0x5B3A2A19: 'MtGeomPlane',
-    0x39675442: 'MtGeomPlaneXZ',
-}
+import os
+import pickle
+from typing import Dict
 
-typeHashByName = {
-    'uMenuOptionKbd': 0x23FD1B3A,
-    'uMenuOptionPC': 0x41235E57,
-    'cAtkCtrl': 0x5BC0F1D0,
-    'cAtkCtrl::TargetInfo': 0x0BD05F38,
-    'cHitPrimSphere': 0x63652058,
-    'cHitPrimCapsule': 0x06301D0D,
-    'rAtkInfo': 0x227A8048,
-    'sHitSolver': 0x25B70ECB,
-    'sHitSolver::cNode': 0x5F2BDC1F,
-    'cActionTime': 0x4EAE654D,
-    'cActorGameModelAnm': 0x714909F0,
-    'cAimInfo': 0x22635518,
-    'cMayaMotionWork': 0x25C29D56,
-    'uActionCamera': 0x65F2A06E,
-    'uActionSideCamera': 0x75204BC4,
-    'uCollectionCamera': 0x2CFEA369,
-    'uStageScreenCamera': 0x0ECE755D,
-    'cChrArchive': 0x26200CA6,
-    'cChrArchive::Prim': 0x22466B65,
-    'cChrChgOrder': 0x7059E4BE,
-    'cChrTeam': 0x1379008F,
-    'cChrAbility': 0x4613BF06,
-    'cChrAbility::Prim': 0x27418FA0,
-    'cChrCmd': 0x5125D992,
-    'cChrCmd::Line': 0x51FEEA53,
-    'cChrCmdBtnChrg': 0x3E303415,
-    'cChrCmdCombo': 0x60E01A65,
-    'cChrCmdLimit': 0x2E4AC24F,
-    'cChrCmdSpatk': 0x1A954284,
-    'cChrInput': 0x7A72D7B8,
-    'cChrJointHold': 0x60AD2F8D,
-    'cChrMessage': 0x45616145,
-    'cChrNode': 0x52E64ED5,
-    'cChrPause': 0x75C07782,
-    'cChrStatus': 0x742DACBD,
-    'cChrTargetInfo': 0x13B8EEAB,
-    'cChrTrace': 0x130130CE,
-    'cFollowEyes': 0x125ED139,
-    'uChrCamera': 0x1E81D60B,
-    'uChrChain': 0x4C82C65E,
-    'uChrWeapon': 0x4CAE9FE8,
-    'uCharacter': 0x7B97FF6C,
-    'sCharacter': 0x76898F2B,
-    'cChrCommand': 0x7D16BBEE,
-    'rChrCombo': 0x28DD8317,
-    'rChrCommand': 0x126EA0E5,
-    'rChrSpatk': 0x52A8DBF6,
-    'rChrBaseact': 0x3C6EA504,
-    'rChrColList': 0x5B486CCE,
-    'rChrCpu': 0x05500206,
-    'rChrProfile': 0x1DF3E03E,
-    'rChrStatus': 0x3C41466B,
-    'uCharacterPre': 0x70EF6939,
-    'uCharacterPost': 0x00FB57B0,
-    'uAmaterasu': 0x4EECED46,
-    'uArthur': 0x550F859B,
-    'uCapAmerica': 0x7C596310,
-    'uChris': 0x5E55730D,
-    'uChunli': 0x1FC3D090,
-    'uCViper': 0x5602C28F,
-    'uDante': 0x0FF963CE,
-    'uDeadPool': 0x56661648,
-    'uDormammu': 0x670ADAAA,
-    'uDrDoom': 0x4D830D22,
-    'uDrStrange': 0x36350C1A,
-    'uDrStrangeSh': 0x6B64E738,
-    'uFelicia': 0x5F78B754,
-    'uFeliciaC': 0x030CFD70,
-    'uFeliciaF': 0x736609FF,
-    'uFrank': 0x6B5C583E,
-    'uGalactus': 0x171045E6,
-    'uGhostRider': 0x298A709D,
-    'uGouki': 0x7C196009,
-    'uHaggar': 0x321E5118,
-    'uHawkEye': 0x58800C1D,
-    'uHiryu': 0x3298921D,
-    'uHulk': 0x175D214F,
-    'uIronFist': 0x1B4469F2,
-    'uIronMan': 0x07214B84,
-    'uJill': 0x360C2673,
-    'uKobun': 0x6AA59281,
-    'uLeilei': 0x5E8C21F4,
-    'uLinlin': 0x347A2EE3,
-    'uMagneto': 0x30B095B9,
-    'uMayoi': 0x3B0033FB,
-    'uModok': 0x212F15C7,
-    'uMorrigan': 0x7406EA0B,
-    'uMorriganSh': 0x71D44156,
-    'uNaruhodo': 0x2449B8AB,
-    'uNemesis': 0x74BEBD03,
-    'uNova': 0x737F4BF0,
-    'uPhoenix': 0x062DF385,
-    'uRedArremer': 0x294B3D65,
-    'uRedArremerSh': 0x121D1D45,
-    'uRRaccoon': 0x3FC65F4B,
-    'uRyu': 0x33F0CD9F,
-    'uSentinel': 0x47A03EBB,
-    'uSheHulk': 0x46977F50,
-    'uShuma': 0x2C2F4646,
-    'uSpencer': 0x0149C30F,
-    'uSpiderMan': 0x589BE90C,
-    'uStorm': 0x63BDCA72,
-    'uSuperSkrull': 0x201861F4,
-    'uTaskMaster': 0x50E38A58,
-    'uThor': 0x562A0248,
-    'uTrish': 0x190AF0C2,
-    'uTron': 0x539A78A1,
-    'uVergil': 0x2B5384F5,
-    'uVJoe': 0x4439DD8A,
-    'uWesker': 0x0713BB3E,
-    'uWolverine': 0x13C43CCB,
-    'uX23': 0x32553A22,
-    'uZero': 0x2247E6ED,
-    'uZeroSh': 0x70460F56,
-    'uZombie': 0x614C61A9,
-    'uCnsLock': 0x01FBCF9F,
-    'uCnsLockChr': 0x71B1DD7F,
-    'uCnsLockChr::cLimitParam': 0x263EF9C8,
-    'uCnsShare': 0x3A0AA551,
-    'uChrCpu': 0x40F73C88,
-    'uChrCpu::_ActHistory': 0x34915C02,
-    'sGameEffect': 0x56A81090,
-    'uGameEffectPreProcess': 0x097DD25A,
-    'uKirigakureEffect': 0x0DD27182,
-    'uKirigakureScreenEffect': 0x2AB7A441,
-    'uGameEffectModelKobunHead': 0x586D6CA0,
-    'uGameEffectModelZombie': 0x15501DDE,
-    'uHellBikeFireEffect': 0x55EF5CFC,
-    'uHellBikeLightEffect': 0x60DC2091,
-    'uNetArrowHitEffect': 0x4D3D50CD,
-    'uGameEffectModelHawk': 0x6C212413,
-    'uGameEffectModelRagnarok': 0x7FD46D35,
-    'uGameEffectModelRagnarokCipher': 0x551AFC49,
-    'uGameEffectModelTiger': 0x58D8AC78,
-    'uGameEffectModelForm3': 0x347CADD3,
-    'uSyokusyuEffect': 0x06C0138C,
-    'uGameEffectModelDigHole': 0x6D6EAE97,
-    'uGameEffectModelNetTrap': 0x4FDE9E52,
-    'uGameEffectModelWebBallBind': 0x3A5EF005,
-    'uAkebonoFinishEffect': 0x04EC60C6,
-    'uAnaglyphEffect': 0x7C90CC8F,
-    'uDamageBlockingEffect': 0x7C9BED97,
-    'uExAtkSpace': 0x1957CD7A,
-    'uExAtkSpaceLv1': 0x03062AA5,
-    'uExAtkSpaceLv2': 0x1A0F7B1F,
-    'uExAtkSpaceLv3': 0x6D084B89,
-    'uExAtkSpaceLv4': 0x736CDE2A,
-    'uExAtkSpaceLv5': 0x046BEEBC,
-    'uExAtkSpaceLv6': 0x1D62BF06,
-    'uExAtkSpaceLv7': 0x6A658F90,
-    'uExAtkSpaceLv8': 0x7ADA9201,
-    'uFlameYarareEffect': 0x3C806875,
-    'uIceYarareEffect': 0x574B5CE7,
-    'uSnapBackEffect': 0x79D11A59,
-    'uThunderYarareEffect': 0x7E4E2BFE,
-    'uWinEffect': 0x0E054CA5,
-    'uXFactorOutlineFilter': 0x3B93EB54,
-    'uGameEffectModelFilm': 0x42B86C37,
-    'uVSinkenSlowEffect': 0x59D99FDA,
-    'uX23HairEffect': 0x28B3A7CC,
-    'uGameEffect': 0x3E1DDAD3,
-    'uGameEffectModel': 0x397245A1,
-    'uGameEffectModel2D': 0x2D6BD03D,
-    'uMaterialVjob': 0x045ED8F9,
-    'uMaterialVjobSetColor': 0x482DC544,
-    'uMaterialVjobSetUV': 0x41FD4A92,
-    'uMaterialVjobCngColor': 0x33D3D0A0,
-    'uMaterialVjobCngUV': 0x687C4738,
-    'uMaterialVjobAddUV': 0x7F474A65,
-    'uMaterialVjobPatAnm': 0x526771FE,
-    'uMaterialVjobCngReflectiveColor': 0x2FFDE9BA,
-    'uMaterialVjobCngSpecularColor': 0x00025186,
-    'uMaterialVjobAnimation': 0x6E7CDA45,
-    'uMaterialVjobAddUVScale': 0x13AC4385,
-    'cMissionWork': 0x138FF06E,
-    'sMission': 0x7AB4A23B,
-    'uMission': 0x3CDBABBC,
-    'uMissionFilePath': 0x3C2143E8,
-    'uMissionFilePath_Tutorial': 0x4B5ADF72,
-    'uMissionFilePath_Ryu': 0x6023910C,
-    'uMissionFilePath_Chunli': 0x694247DC,
-    'uMissionFilePath_Gouki': 0x44A877DC,
-    'uMissionFilePath_Chris': 0x66E464D8,
-    'uMissionFilePath_Wesker': 0x71922C72,
-    'uMissionFilePath_VJoe': 0x2DECCC28,
-    'uMissionFilePath_Dante': 0x3748741B,
-    'uMissionFilePath_Trish': 0x21BBE717,
-    'uMissionFilePath_Frank': 0x53ED4FEB,
-    'uMissionFilePath_Spencer': 0x7ED54F23,
-    'uMissionFilePath_Arthur': 0x238E12D7,
-    'uMissionFilePath_Amaterasu': 0x13D3367F,
-    'uMissionFilePath_Zero': 0x4B92F74F,
-    'uMissionFilePath_Tron': 0x3A4F6903,
-    'uMissionFilePath_Morrigan': 0x46A11A64,
-    'uMissionFilePath_Leilei': 0x280DB6B8,
-    'uMissionFilePath_Felicia': 0x20E43B78,
-    'uMissionFilePath_CViper': 0x208355C3,
-    'uMissionFilePath_Haggar': 0x449FC654,
-    'uMissionFilePath_Jill': 0x5FD937D1,
-    'uMissionFilePath_Hiryu': 0x0A2985C8,
-    'uMissionFilePath_Vergil': 0x5DD213B9,
-    'uMissionFilePath_Naruhodo': 0x16EE48C4,
-    'uMissionFilePath_RedArremer': 0x76938AB6,
-    'uMissionFilePath_Nemesis': 0x0B22312F,
-    'uMissionFilePath_SpiderMan': 0x05A43235,
-    'uMissionFilePath_CapAmerica': 0x2381D4C3,
-    'uMissionFilePath_Wolverine': 0x4EFBE7F2,
-    'uMissionFilePath_Magneto': 0x4F2C1995,
-    'uMissionFilePath_Hulk': 0x7E8830ED,
-    'uMissionFilePath_SheHulk': 0x390BF37C,
-    'uMissionFilePath_TaskMaster': 0x0F3B3D8B,
-    'uMissionFilePath_IronMan': 0x78BDC7A8,
-    'uMissionFilePath_Thor': 0x3FFF13EA,
-    'uMissionFilePath_DrDoom': 0x3B029A6E,
-    'uMissionFilePath_Phoenix': 0x79B17FA9,
-    'uMissionFilePath_Shuma': 0x149E5193,
-    'uMissionFilePath_Modok': 0x199E0212,
-    'uMissionFilePath_Dormammu': 0x55AD2AC5,
-    'uMissionFilePath_DeadPool': 0x64C1E627,
-    'uMissionFilePath_Storm': 0x5B0CDDA7,
-    'uMissionFilePath_SuperSkrull': 0x3F9D3A2D,
-    'uMissionFilePath_Sentinel': 0x7507CED4,
-    'uMissionFilePath_X23': 0x618666B1,
-    'uMissionFilePath_Nova': 0x1AAA5A52,
-    'uMissionFilePath_RRaccoon': 0x0D61AF24,
-    'uMissionFilePath_GhostRider': 0x7652C74E,
-    'uMissionFilePath_IronFist': 0x29E3999D,
-    'uMissionFilePath_DrStrange': 0x6B0AD723,
-    'uMissionFilePath_HawkEye': 0x271C8031,
-    'uMissionFilePath_Galactus': 0x25B7B589,
-    'rActionParam': 0x6FBF8058,
-    'sAction': 0x4EB1C230,
-    'cArm': 0x287A9968,
-    'sShot': 0x2DDE6A64,
-    'sShot::cNodeList': 0x5D5F7465,
-    'uShotLaser': 0x472610E6,
-    'uShotMissile': 0x4E267F5F,
-    'uShotOption': 0x53914C5F,
-    'uShotShield': 0x17849E07,
-    'uShotVulcan': 0x39114754,
-    'uShotVulcanBakuen': 0x35B9C743,
-    'uShotVulcanExtentThunder': 0x679005D9,
-    'uShotVulcanHyoran': 0x2AF37CB0,
-    'uShotVulcanMagatama': 0x6CC92E1A,
-    'uShotVulcanOneSpark': 0x6C6063B4,
-    'uShotVulcanOneSparkZan': 0x76F2B243,
-    'uShotVulcanRaikou': 0x7A54A24F,
-    'uShotVulcanRaikouSub': 0x14FF9C2F,
-    'uShotVulcanTekadama': 0x5CA9B7ED,
-    'uShotVulcanTekadamaExplode': 0x1FF66388,
-    'uShotVulcanTsutamaki': 0x456483BF,
-    'uShotMissileArrow': 0x3F721E65,
-    'uShotOptionSickleBoomerang': 0x48B7E249,
-    'uShotShieldKnightShield': 0x3DC1E142,
-    'uShotVulcanAxe': 0x155BFE3B,
-    'uShotVulcanBraceletOfGoddess': 0x1FC7E4A7,
-    'uShotVulcanCrossSword': 0x60D33C12,
-    'uShotVulcanGreatSorcery': 0x610EFF3B,
-    'uShotVulcanJavelin': 0x7E7C0231,
-    'uShotVulcanKnife': 0x5E109508,
-    'uShotVulcanTorch': 0x17A93657,
-    'uShotVulcanTorchFirePillar': 0x2F7BE2FB,
-    'uShotOptionShieldSlash': 0x7D7EFE20,
-    'uShotLaserSatelliteLaser': 0x554DA965,
-    'uShotMissileGrenadeLauncher': 0x7CCACBDD,
-    'uShotShieldFlameGun': 0x6252C644,
-    'uShotVulcanFireGrenadeBomb': 0x30C119C5,
-    'uShotVulcanFireGrenadeExplode': 0x3C1E9061,
-    'uShotVulcanFireGrenadeGroundFlame': 0x2F1CD297,
-    'uShotVulcanGrenadeLauncherExplode': 0x08E7DD3A,
-    'uShotVulcanHandGrenadeBomb': 0x5BF34CC8,
-    'uShotVulcanHandGrenadeExplode': 0x3BDDFBC8,
-    'uShotVulcanHandGun': 0x53A05C62,
-    'uShotVulcanLandMine': 0x60FC8175,
-    'uShotVulcanLandMineExplode': 0x5BFCB8C1,
-    'uShotVulcanMachineGun': 0x41070531,
-    'uShotVulcanMagnumGun': 0x4A104CB5,
-    'uShotVulcanRocketLauncher': 0x73B448F8,
-    'uShotVulcanSatelliteLaserLock': 0x7450FBFD,
-    'uShotVulcanShotGun': 0x7C0FBBB1,
-    'uShotShieldKikousyou': 0x0E0375DB,
-    'uShotVulcanKikouken': 0x3CF662CA,
-    'uShotLaserOpticBlast': 0x466316A4,
-    'uShotVulcanBurningKick': 0x5B12FD8F,
-    'uShotVulcanSeismoHammer': 0x3C9434E6,
-    'uShotLaserCrystal': 0x7EBFD26D,
-    'uShotLaserMillionCarat': 0x65A1FFC3,
-    'uShotLaserThunderBolt': 0x07FBCE75,
-    'uShotLaserTwister': 0x72888E7B,
-    'uShotMissileHysteric': 0x2893DFFA,
-    'uShotOptionGrapple': 0x30933DD5,
-    'uShotShieldJamSession': 0x1E782F67,
-    'uShotShieldTempest': 0x733BE63F,
-    'uShotVulcanAcidRain': 0x2F99EC0B,
-    'uShotVulcanAirPlay': 0x6957753A,
-    'uShotVulcanBulletDanceFinish': 0x759CAB03,
-    'uShotVulcanDrive': 0x0C4DF8AF,
-    'uShotVulcanEbonyAndIvory': 0x65AD68F2,
-    'uShotVulcanFireWorks': 0x406E4AE5,
-    'uShotVulcanMultiLock': 0x7599E2BB,
-    'uShotVulcanDualShot': 0x23018021,
-    'uShotVulcanSomersaultGrenade': 0x2BA02B05,
-    'uShotVulcanSomersaultGrenadeExplode': 0x3EE5A794,
-    'uShotVulcanSomersaultLasso': 0x45C8C7C1,
-    'uShotVulcanSomersaultShuriken': 0x093AF360,
-    'uShotLaserDarkDimension': 0x7FC20C5B,
-    'uShotMissileFloatBomb': 0x46A51E49,
-    'uShotVulcanBlackHole': 0x2352A176,
-    'uShotVulcanChaosticFlame': 0x7C5B9936,
-    'uShotVulcanFireCarpet': 0x2CD4CA32,
-    'uShotVulcanInferno': 0x70DC15D0,
-    'uShotVulcanMagicCreate': 0x11BA578C,
-    'uShotVulcanMagicDestroy': 0x6037E1DE,
-    'uShotVulcanMagicMagma': 0x614B22B2,
-    'uShotVulcanMagicMagmaSpread': 0x42EDAF5C,
-    'uShotVulcanMagicMeteor': 0x3C39AB15,
-    'uShotVulcanSpiralArrow': 0x42800839,
-    'uShotLaserDrDoomJS': 0x1B726F4E,
-    'uShotLaserPlasmaBeam': 0x4AD71D0D,
-    'uShotMissileDoomsMissile': 0x306C179C,
-    'uShotVulcanMissileEmplacement': 0x4F5283B4,
-    'uShotVulcanMolecularShield': 0x44095156,
-    'uShotVulcanMolecularShieldPre': 0x7E202664,
-    'uShotVulcanPhotonShot': 0x35621CDB,
-    'uShotVulcanSphereFlame': 0x0FB5018C,
-    'uShotLaserBoltsOfBalthakk': 0x6D5B50D5,
-    'uShotLaserFlamesOfFaltine': 0x423E3B46,
-    'uShotLaserStrangeReflector': 0x19A80043,
-    'uShotMissileOpticalMagicSpread': 0x50C0F59B,
-    'uShotVulcanAstralProjection': 0x6D1F4A79,
-    'uShotVulcanElementalSummon': 0x33835CBB,
-    'uShotVulcanElementalSummonExplode': 0x4B4484B4,
-    'uShotVulcanElementalSummonShot': 0x2ADA4C48,
-    'uShotVulcanMagicSword': 0x78CAA8BB,
-    'uShotVulcanOpticalMagic': 0x5D64877F,
-    'uShotVulcanOpticalMagicS': 0x32850864,
-    'uShotVulcanOpticalMagicSpread': 0x63490ACC,
-    'uShotVulcanSpellOfVishanti': 0x6633B6AA,
-    'uShotVulcanThrowRose': 0x0ED811B9,
-    'uShotVulcanPleaseHelpMe': 0x6240F456,
-    'uShotVulcanSandSplash': 0x2005B18C,
-    'uShotLaserLikeAMegaman': 0x76542BE8,
-    'uShotShieldWeaponCartSpread': 0x7C839716,
-    'uShotShieldWildPitchHit': 0x17FD4493,
-    'uShotVulcanThrowWeapon': 0x6D587771,
-    'uShotVulcanThrowWeaponB': 0x3F3D3961,
-    'uShotVulcanWeaponCart': 0x6790D6D8,
-    'uShotVulcanWeaponCartSpread': 0x23EE37D7,
-    'uShotVulcanWildPitch': 0x5612947B,
-    'uShotLaserCosmicBeam': 0x57EDDB90,
-    'uShotShieldHellFire': 0x3B798FBE,
-    'uShotVulcanBigFirePillar': 0x3F75D1D7,
-    'uShotVulcanBreakFireChain': 0x48F23B31,
-    'uShotVulcanFireWall': 0x71FA04EF,
-    'uShotLaserMessatsuGouHadou': 0x79683B0E,
-    'uShotVulcanGouHadouken': 0x56F568C1,
-    'uShotVulcanTenmaGouZanku': 0x146DA4F5,
-    'uShotVulcanBodyPressFinish': 0x1AD465F6,
-    'uShotVulcanIronPipeRolling': 0x4DBF21C2,
-    'uShotVulcanAntmanArrow': 0x38A1E3C2,
-    'uShotVulcanBombArrow': 0x79AC228C,
-    'uShotVulcanBombArrowExplode': 0x20907355,
-    'uShotVulcanHyperAimArrow': 0x4920D6B1,
-    'uShotVulcanIceArrow': 0x0EFC2AE0,
-    'uShotVulcanNetArrow': 0x2F63C7FD,
-    'uShotVulcanNormalArrow': 0x7A49A4BB,
-    'uShotVulcanPierceArrow': 0x567D77EF,
-    'uShotVulcanPoisonArrow': 0x5C9A6E95,
-    'uShotVulcanRangingBladeArrow': 0x2B0AE474,
-    'uShotVulcanSpreadArrow': 0x76386ECA,
-    'uShotVulcanThunderCartridge': 0x6858C0F8,
-    'uShotVulcanThunderCartridgeExplode': 0x5B734DB8,
-    'uShotShieldFormationD': 0x4179442B,
-    'uShotShieldOuroboros': 0x278430CF,
-    'uShotShieldOuroborosExit': 0x086784E8,
-    'uShotVulcanFormationATiger': 0x16807465,
-    'uShotVulcanFormationBHawk': 0x12BDDCB4,
-    'uShotVulcanFormationCBom': 0x5CFFD275,
-    'uShotVulcanFormationCExplode': 0x039B7231,
-    'uShotVulcanFormationCSpread': 0x165382BF,
-    'uShotVulcanFormationDSpread': 0x53F4BC31,
-    'uShotVulcanLegionHawk': 0x2B8902EC,
-    'uShotVulcanLegionTiger': 0x759DEBD3,
-    'uShotVulcanOuroborosShot': 0x5DEDBBEB,
-    'uShotVulcanGammaQuake': 0x71FF8ECD,
-    'uShotVulcanGammaSlam': 0x7BF17AF5,
-    'uShotLaserDragonAura': 0x3A532A5C,
-    'uShotLaserProtonCannon': 0x487BFD3D,
-    'uShotLaserUniBeam': 0x4C3148EE,
-    'uShotShieldRepulsarBlastSP': 0x3FD6A01E,
-    'uShotVulcan2CMissile': 0x2916BD86,
-    'uShotVulcanRepulsarBlastSPExpload': 0x048123A0,
-    'uShotVulcanSmartBomb': 0x16BB6231,
-    'uShotVulcanJillMachineGun': 0x6EAB9C41,
-    'uShotVulcanAnkihouBomb': 0x7EC9A643,
-    'uShotVulcanAnkihouBombExplode': 0x53E10A7D,
-    'uShotVulcanAnkihouKobun': 0x466E3409,
-    'uShotVulcanAnkihouRolling': 0x3DF6D2AC,
-    'uShotVulcanHenkyouKi': 0x562F49CA,
-    'uShotVulcanTenraiha': 0x6F9E9EC3,
-    'uShotVulcanZireitou': 0x1FB13581,
-    'uShotLaserEMDisruptor': 0x74ED065C,
-    'uShotLaserMagneticShockWave': 0x6B9F3037,
-    'uShotMissileGravitySqueeze': 0x494BFCE5,
-    'uShotVulcanHyperGravitation': 0x673B3E2D,
-    'uShotVulcanMagneticBlast': 0x08C88C7C,
-    'uShotVulcanMagneticTempst': 0x511D546F,
-    'uShotVulcanMagnetoAtkSitM': 0x648BC7A8,
-    'uShotLaserPsionicBlaster': 0x787F0187,
-    'uShotMissileJammingBomb': 0x18786113,
-    'uShotOptionPsionicCubeDamage': 0x14865C0F,
-    'uShotVulcanJammingBomb': 0x2CB81109,
-    'uShotVulcanJammingBombExplode': 0x11E30DD1,
-    'uShotVulcanLightWall': 0x33EF634D,
-    'uShotVulcanModokSitM': 0x63A51A17,
-    'uShotVulcanModokStandM': 0x34A181E0,
-    'uShotVulcanPsionicCube': 0x41A0EABB,
-    'uShotOptionSoulFistAbsorb': 0x2E9E7683,
-    'uShotVulcanFinishingShower': 0x42414817,
-    'uShotVulcanShilhouetteBlade': 0x6930D705,
-    'uShotVulcanSoulFist': 0x0EE4ABD9,
-    'uShotLaserEvidencePhoto': 0x2ACD7CCC,
-    'uShotVulcanBreakClock': 0x258B3F68,
-    'uShotVulcanBreakVase': 0x04E6044F,
-    'uShotVulcanBrownEnvelope': 0x502AE095,
-    'uShotVulcanBrownEnvelopeExplode': 0x0033064A,
-    'uShotVulcanDogMissile': 0x3F1CADA2,
-    'uShotVulcanFileStorm': 0x70E67F70,
-    'uShotVulcanHammerImpact': 0x533E9B85,
-    'uShotVulcanItemThrow': 0x0F35C297,
-    'uShotVulcanMobilePhone': 0x1181C7DA,
-    'uShotVulcanNaruhodoKnife': 0x0769A411,
-    'uShotVulcanExatkRocketLauncher': 0x7C1BF533,
-    'uShotVulcanNemesisRocketLauncher': 0x1EF8E2A1,
-    'uShotVulcanRocketLauncherExplode': 0x43AC214D,
-    'uShotLaserGMBeam': 0x52AB7CE8,
-    'uShotLaserGMPulse': 0x057B6B10,
-    'uShotShieldBodyBeam': 0x23D6F134,
-    'uShotVulcanEnergySpear': 0x2CF28271,
-    'uShotVulcanEnergySpearSpread': 0x3D8E4353,
-    'uShotVulcanGMPulse': 0x56A208D4,
-    'uShotMissileTKShot': 0x0A7F5DB4,
-    'uShotOptionHealingFieldGathering': 0x52FF40C4,
-    'uShotShieldHealingField': 0x16E27D1F,
-    'uShotVulcanDarkPhoenixFire': 0x375D7301,
-    'uShotVulcanKaiserPhoenix': 0x4FC63EC8,
-    'uShotVulcanTKBind': 0x20609B15,
-    'uShotVulcanTKBindSpread': 0x3C7D3027,
-    'uShotVulcanTKShotExplode': 0x169F12A8,
-    'uShotLaserDarkFire': 0x68F1CA67,
-    'uShotVulcanFire': 0x09765265,
-    'uShotVulcanFirePillar': 0x3113EB4F,
-    'uShotLaserRRaccoonPistol': 0x61915E00,
-    'uShotMissileHomingEnergyGun': 0x20D0583A,
-    'uShotVulcanClaymoreMine': 0x5A45F410,
-    'uShotVulcanClaymoreSpread': 0x08C8FF89,
-    'uShotVulcanDigHole': 0x252BA144,
-    'uShotVulcanEnergyGun': 0x0E382BE2,
-    'uShotVulcanFallRock': 0x52651F46,
-    'uShotVulcanGatlingGun': 0x7E1D4152,
-    'uShotVulcanHomingEnergyGunExplode': 0x7E991E77,
-    'uShotVulcanHomingEnergyGunGroundExplode': 0x73598585,
-    'uShotVulcanHyperTrap': 0x2E65D791,
-    'uShotVulcanHyperTrapSpread': 0x191F0E99,
-    'uShotVulcanJDBomb': 0x5D2FE56B,
-    'uShotVulcanJDBombExplode': 0x336C37EB,
-    'uShotVulcanOilBalloon': 0x212F706E,
-    'uShotVulcanOilBalloonExplode': 0x0D168098,
-    'uShotVulcanOilBalloonGroundFire': 0x645DC99F,
-    'uShotVulcanOilBalloonGroundOil': 0x26D89205,
-    'uShotVulcanPendulumLog': 0x3858485D,
-    'uShotVulcanPrickleBoard': 0x78972521,
-    'uShotVulcanTrapLandMine': 0x5E715B30,
-    'uShotLaserReflectSinkuHadouken': 0x3E29340C,
-    'uShotLaserSinkuHadouken': 0x755CC92B,
-    'uShotVulcanHadouken': 0x70C0999B,
-    'uShotLaserAttackS': 0x68190BBE,
-    'uShotVulcanDirectAttackBomb': 0x69579272,
-    'uShotVulcanDirectAttackBombExplode': 0x0CBFA14C,
-    'uShotVulcanMiniSentinel': 0x327CBFE0,
-    'uShotVulcanPlasmaStorm': 0x4307EA09,
-    'uShotVulcanCar': 0x0E0C068A,
-    'uShotLaserHyperMysticBlast': 0x34C0C0C7,
-    'uShotLaserMysticBlast': 0x15CB4B46,
-    'uShotVulcanHyperMysticSmash': 0x544398D4,
-    'uShotVulcanMysticStare': 0x52D36AA7,
-    'uShotVulcanMysticStareBomb': 0x3BF5C07B,
-    'uShotVulcanMysticStareExplode': 0x0290C913,
-    'uShotOptionAttackWire': 0x09CD3E50,
-    'uShotOptionSwingWire': 0x4BF93EB8,
-    'uShotVulcanFurisosoguShi': 0x5EEAAD0D,
-    'uShotVulcanSwingWire': 0x2B0F6E25,
-    'uShotVulcanWebBall': 0x50C01DD6,
-    'uShotVulcanWebMove': 0x4BCC62F5,
-    'uShotVulcanWebThrow': 0x0EBCA372,
-    'uShotLaserDoubleTyphoon': 0x38F17356,
-    'uShotLaserWildStorm': 0x7B2C0B96,
-    'uShotVulcanIceStorm': 0x2747149B,
-    'uShotVulcanLightningSphere': 0x49EE84F7,
-    'uShotVulcanLightningSphereBurst': 0x6035DC6E,
-    'uShotVulcanLightningStorm': 0x0565B232,
-    'uShotVulcanWhirlWind': 0x41CC8294,
-    'uShotShieldSuperBurningSkrull': 0x184470A4,
-    'uShotVulcanDivePunch': 0x40D3346B,
-    'uShotVulcanArrowRain': 0x2895353D,
-    'uShotVulcanArrowShot': 0x34C0372B,
-    'uShotVulcanBullet': 0x539BAF3D,
-    'uShotLaserBigThunder': 0x288115B3,
-    'uShotLaserMujoThunder': 0x470E38DA,
-    'uShotVulcanBigTornado': 0x5C0B0A33,
-    'uShotVulcanMujoSyoryuThunder': 0x30671052,
-    'uShotVulcanMujoThunderCharge': 0x220D5C0C,
-    'uShotMissileTrishBullet': 0x2E239536,
-    'uShotOptionSpadaBoomerang': 0x0DAD20CD,
-    'uShotVulcanBarrier': 0x4BA25418,
-    'uShotVulcanBarrierSpread': 0x73605EBF,
-    'uShotVulcanEnergyBolt': 0x0DBBBA4C,
-    'uShotVulcanChushokuRash': 0x5A9AE0FB,
-    'uShotVulcanKingKobun': 0x52E670F6,
-    'uShotVulcanKobunLauncher': 0x7B60D628,
-    'uShotVulcanRockThrow': 0x35F8E561,
-    'uShotVulcanShikiDan': 0x402568D5,
-    'uShotVulcanShikiDanKobun': 0x358C2C2F,
-    'uShotOptionRoundTrip': 0x522F4001,
-    'uShotShieldRaidSword': 0x6C49A571,
-    'uShotShieldSpiralSword': 0x7DCFCC61,
-    'uShotShieldStormSword': 0x31BF74A0,
-    'uShotVulcanJigenZan': 0x0BF320B3,
-    'uShotVulcanRapidSlash': 0x583FFAAA,
-    'uShotVulcanStormSwordSpread': 0x604022A6,
-    'uShotVulcanBoomerang': 0x31E834B8,
-    'uShotVulcanShockingPinkBomb': 0x00E7F455,
-    'uShotVulcanShockingPinkExplode': 0x78D0207D,
-    'uShotVulcanSixCannon': 0x57372D34,
-    'uShotVulcanWeskerHandGun': 0x49801F12,
-    'uShotLaserRaikousen': 0x14EB75C4,
-    'uShotLaserRekkouha': 0x7DF501E9,
-    'uShotVulcanGenmuZero': 0x260B0B6B,
-    'uShotVulcanHadangeki': 0x4958DFB7,
-    'uShotVulcanZeroBuster': 0x5BE88F65,
-    'uShot': 0x229E9FC4,
-    'uShotPreProcess': 0x2DD690F2,
-    'sReplay': 0x504ABA50,
-    'uStgObj000_LightBeam': 0x7E288789,
-    'uStgObj002_Cage': 0x307AE152,
-    'uStgObj002_CityObj': 0x483B6CE7,
-    'uStgObj002_Heli': 0x0A305B6F,
-    'uStgObj002_HeliCrew': 0x3400C979,
-    'uStgObj002_OnCageMan': 0x3C037BE4,
-    'uStgObj003_MadGear': 0x1EA39127,
-    'uStgObj003_MadGear::cState': 0x485A9EDB,
-    'uStgObj003_MetroCity': 0x589C4DD1,
-    'uStgObj003_MetroDrum': 0x56F9DCC5,
-    'uStgObj003_MetroPnt': 0x4047803F,
-    'uStgObj003_MetroShadow': 0x71C53EBD,
-    'uStgObj004_Astaroth': 0x7F1241D4,
-    'uStgObj004_DvlFlw': 0x3C091063,
-    'uStgObj004_DvlFlw::cState': 0x798C4DF4,
-    'uStgObj004_MoveLandObj': 0x2ED58338,
-    'uStgObj005_FireFlower': 0x78903828,
-    'uStgObj005_Kobun': 0x765ED4A0,
-    'uStgObj005_SyncKobun': 0x3C23EA8E,
-    'uStgObj005_TeiselBorn': 0x48F7340A,
-    'uStgObj005_TronBorn': 0x26AF818A,
-    'uStgObj005_WaterFF': 0x26D4283F,
-    'uStgObj005_ZufuGeredo': 0x11595F24,
-    'uStgObj005_ZufuGeredoObj': 0x11BA0DF8,
-    'uStgObj006_Buddhist': 0x3DE72F1A,
-    'uStgObj006_GeninFollow': 0x2D4FFD51,
-    'uStgObj006_GeninPnt': 0x3A6FB7B8,
-    'uStgObj006_GeninScreen': 0x1A37D811,
-    'uStgObj007_Helicarrier': 0x125101AB,
-    'uStgObj009_Peg': 0x42C252B6,
-    'uStgObj009_Scale': 0x252C13E6,
-    'uStgObj010_Corpse': 0x710E09C9,
-    'uStgObj010_Glass': 0x0893CC70,
-    'uStgObj010_LaboBack': 0x50B3F938,
-    'uStgObj010_LaboBase': 0x7DC9C66E,
-    'uStgObj010_LaboDust': 0x293DB2EC,
-    'uStgObj010_LaboFire': 0x65A331C0,
-    'uStgObj010_LaboItem': 0x22661D11,
-    'uStgObj010_LaboPoint': 0x75A57C00,
-    'uStgObj010_Licker': 0x688502C7,
-    'uStgObj010_Licker::cState': 0x032B94CD,
-    'uStgObj010_Licker::cDeadAnm': 0x44E5EC64,
-    'uStgObj010_Licker::uCnsPosInter': 0x4D404FA6,
-    'uStgObj010_LickerCmn': 0x3381FF2C,
-    'uStgObj010_Shutter': 0x1E9495B9,
-    'uStgObj010_Tank': 0x2071B285,
-    'uStgObj011_BreakGround': 0x3555417B,
-    'uStgObj011_Earth': 0x7D0A0E7B,
-    'uStgObj011_Galactus': 0x6AB6D500,
-    'uStgObj011_Meteo': 0x0B2818EC,
-    'uStgObj100_CopyRobot': 0x33E5D5A8,
-    'uStgObj100_Monitor': 0x55903737,
-    'uStgObj100_ProfessorX': 0x1A059D4E,
-    'uStgObj100_SearchRobot': 0x50F4066E,
-    'uStgObj102_Monitor': 0x7B661FB1,
-    'uStgObj103_MadGear': 0x5F2D4EE7,
-    'uStgObj103_MadGear::cState': 0x1FB81E83,
-    'uStgObj103_Sentinel': 0x64D8EDCF,
-    'uStgObj103_Sentinel::cState': 0x50C6AFAE,
-    'uStgObj104_DvlFlw': 0x53CB7B5D,
-    'uStgObj104_DvlFlw::cState': 0x16DEFB15,
-    'uStgObj104_MoveLandObj': 0x172E58D0,
-    'uStgObj104_RainCtrl': 0x520980CA,
-    'uStgObj105_Kobun': 0x6125C0E3,
-    'uStgObj105_Pnt': 0x460F2C16,
-    'uStgObj105_SnowCtrl': 0x3C808D6D,
-    'uStgObj105_TreeObj': 0x61F3D8E3,
-    'uStgObj106_DD': 0x64551523,
-    'uStgObj106_DD::cState': 0x7106EC38,
-    'uStgObj107_Jet': 0x4E8A801B,
-    'uStgObj107_Trail': 0x3C46DCF3,
-    'uStgObj109_Meteor': 0x3C60F293,
-    'uStgObj109_Peg': 0x64B55902,
-    'uStgObj110_LaboBack': 0x4B16B557,
-    'uStgObjCameraFollow': 0x70D76EDE,
-    'uStgObjSceneCopy': 0x4683C369,
-    'uStageObject': 0x704601CD,
-    'uStageObjectBase000': 0x2558E6D5,
-    'uStageObjectBase001': 0x525FD643,
-    'uStageObjectBase002': 0x4B5687F9,
-    'uStageObjectBase003': 0x3C51B76F,
-    'uStageObjectBase004': 0x223522CC,
-    'uStageObjectBase005': 0x5532125A,
-    'uStageObjectBase006': 0x4C3B43E0,
-    'uStageObjectBase007': 0x3B3C7376,
-    'uStageObjectBase008': 0x2B836EE7,
-    'uStageObjectBase009': 0x5C845E71,
-    'uStageObjectBase010': 0x3C43D794,
-    'uStageObjectBase011': 0x4B44E702,
-    'uStageObjectBase100': 0x249A8CE2,
-    'uStageObjectBase102': 0x4A94EDCE,
-    'uStageObjectBase103': 0x3D93DD58,
-    'uStageObjectBase104': 0x23F748FB,
-    'uStageObjectBase105': 0x54F0786D,
-    'uStageObjectBase106': 0x4DF929D7,
-    'uStageObjectBase107': 0x3AFE1941,
-    'uStageObjectBase109': 0x5D463446,
-    'uStageObjectBase110': 0x3D81BDA3,
-    'uStageObjectBaseCmn': 0x70296F36,
-    'cBackupBase': 0x3833B1E9,
-    'cChrFlag': 0x066D4D0A,
-    'cHitParam': 0x2BE46D19,
-    'cExciteParam': 0x502A3F19,
-    'cExcite': 0x56E4C74F,
-    'cFSMDummyParameter': 0x2EFF2A70,
-    'cFSMAnmSetParameter': 0x4157A52B,
-    'cFSMU32DataSetParameter': 0x6D722634,
-    'cFSMS32DataSetParameter': 0x70AE2D27,
-    'cFSMF32DataSetParameter': 0x5D669B97,
-    'cFSMS32RangeSetParameter': 0x2FC507E0,
-    'cFSMF32RangeSetParameter': 0x64897CDA,
-    'cFSMBoolDataSetParameter': 0x6830F693,
-    'cFSMVec3DataSetParameter': 0x2B621BCD,
-    'cFSMTransRotateSetParameter': 0x46C40CB2,
-    'cFSMVjobDescSetParameter': 0x3658B92B,
-    'cShake': 0x33B8CFF3,
-    'cShakeParam': 0x0606229E,
-    'sStage': 0x06146A43,
-    'uStageScheduler': 0x63C27696,
-    'uStageStaticModel': 0x24DC0CED,
-    'uStage': 0x504D895E,
-    'uStage000': 0x59FAFE8A,
-    'uStage002': 0x37F49FA6,
-    'uStage002::Parameter': 0x453AE833,
-    'uStage003': 0x40F3AF30,
-    'uStage004': 0x5E973A93,
-    'uStage004::cChrParam': 0x7B3E3879,
-    'uStage005': 0x29900A05,
-    'uStage005::cChrParam': 0x609B7416,
-    'uStage006': 0x30995BBF,
-    'uStage007': 0x479E6B29,
-    'uStage009': 0x2026462E,
-    'uStage009::cChrParam': 0x65913997,
-    'uStage010': 0x40E1CFCB,
-    'uStage011': 0x37E6FF5D,
-    'uStage011::cRoundBackup': 0x19E176ED,
-    'uStage100': 0x583894BD,
-    'uStage102': 0x3636F591,
-    'uStage103': 0x4131C507,
-    'uStage104': 0x5F5550A4,
-    'uStage104::cChrParam': 0x6631D90F,
-    'uStage105': 0x28526032,
-    'uStage105::cChrParam': 0x7D949560,
-    'uStage106': 0x315B3188,
-    'uStage107': 0x465C011E,
-    'uStage109': 0x21E42C19,
-    'uStage109::cChrParam': 0x789ED8E1,
-    'uStage110': 0x4123A5FC,
-    'uStageMenu': 0x7A41F1B3,
-    'uAction': 0x2D61F70A,
-    'uActorGameModel': 0x2038621F,
-    'uActorShareModel': 0x69639562,
-    'aAction': 0x3EF04FD7,
-    'aBoot': 0x5A1488F9,
-    'aChrSelect': 0x402AF35C,
-    'aChrSelectBlank': 0x175B0BCC,
-    'aChrSelectResten': 0x43AB6D19,
-    'aCredit': 0x65FDADBB,
-    'aEarthAtk': 0x4A132392,
-    'aEnding': 0x6D2F170A,
-    'aFinalResut': 0x6C6C080F,
-    'aGame': 0x3FD217B1,
-    'aGameDataInstall': 0x29CA7FF8,
-    'aGameOver': 0x0C45C5D1,
-    'aMenu': 0x61FC1CAE,
-    'aMission': 0x442A946D,
-    'aModelViewer': 0x6A4D42C4,
-    'aMovie': 0x1728A8D5,
-    'aMvcArea': 0x764B3A01,
-    'aNetworkRoom': 0x29E81959,
-    'aNewChallenger': 0x4370D5C4,
-    'aNextBattle': 0x51C039AF,
-    'aPadInit': 0x4D51F020,
-    'aRoomJump': 0x06D6CE46,
-    'aTitle': 0x214022D1,
-    'aTitleLogo': 0x11717A38,
-    'aStage000': 0x28D6EDF7,
-    'aStage002': 0x46D88CDB,
-    'aStage003': 0x31DFBC4D,
-    'aStage004': 0x2FBB29EE,
-    'aStage005': 0x58BC1978,
-    'aStage006': 0x41B548C2,
-    'aStage007': 0x36B27854,
-    'aStage009': 0x510A5553,
-    'aStage010': 0x31CDDCB6,
-    'aStage011': 0x46CAEC20,
-    'aStage100': 0x291487C0,
-    'aStage102': 0x471AE6EC,
-    'aStage103': 0x301DD67A,
-    'aStage104': 0x2E7943D9,
-    'aStage105': 0x597E734F,
-    'aStage106': 0x407722F5,
-    'aStage107': 0x37701263,
-    'aStage109': 0x50C83F64,
-    'aStage110': 0x300FB681,
-    'cClearFlag': 0x0F483566,
-    'cEventData': 0x13383E83,
-    'cExtraCpu': 0x2F55A737,
-    'cPlayData': 0x7EC75E67,
-    'cPlayDataAccumulate': 0x7A0B5A2C,
-    'cSecret': 0x32013A89,
-    'cSPCData': 0x69DCDDCB,
-    'sBattleSetting': 0x08CC92A7,
-    'sBattleSetting::cChr': 0x7A725087,
-    'sBattleSetting::cMainChr': 0x6BE1ED74,
-    'sBattleSetting::cSubChr': 0x4A86842A,
-    'sBattleSetting::cOnePlay': 0x2D2D4F07,
-    'sGameConfig': 0x3442AE1E,
-    'sMvc3Main': 0x3B472488,
-    'sMvc3Manager': 0x772CE107,
-    'nDraw::MaterialChar': 0x21617F54,
-    'nDraw::MaterialCharAlpha': 0x6C468C46,
-    'nDraw::MaterialStgSimple': 0x6EBE0B47,
-    'nDraw::MaterialStgSimple2': 0x20813BB8,
-    'nDraw::MaterialUI': 0x3B5107CA,
-    'sId': 0x3D6DA1E9,
-    'sId::Id': 0x26F84990,
-    'sId::Map': 0x5A5246A8,
-    'sId::rIdMapList': 0x2447D742,
-    'cDlcFile': 0x58B0522A,
-    'cNetAcBase': 0x6B8DF09F,
-    'cNetAcBase::MsgNetArcade': 0x60E2D65F,
-    'cNetAcBase::MsgNetPlayerStatus': 0x14A16F15,
-    'cNetAcBase::MsgNetPlayerVer': 0x6A08F7B2,
-    'cMatchListener': 0x0DF6C9DB,
-    'cNetAcCustom': 0x59DACE69,
-    'cNetAcRank': 0x2340E61B,
-    'cNetChrSel': 0x6315A4A9,
-    'cNetChrSel::MsgChrTypeSel': 0x53165401,
-    'cNetChrSel::MsgChrType': 0x53F3D1A6,
-    'cNetChrSel::MsgChrAssistSel': 0x1E7D3968,
-    'cNetChrSel::MsgChrAssist': 0x58F7E8CD,
-    'cNetChrSel::MsgStg': 0x4E4BB431,
-    'cNetChrSel::MsgBattleData': 0x70B794AD,
-    'cNetChrSel::MsgFinish': 0x7210C0AC,
-    'cNetChrSel::MsgCurrentMember': 0x75EB49D4,
-    'cNetChrSel::MsgManner': 0x4C122186,
-    'cNetChrSel::MsgSpCard': 0x001DFD46,
-    'cNetChrSel::MsgBattleInfo': 0x16CD5699,
-    'cNetFriendList': 0x27B0F843,
-    'cNetFriendListListener': 0x2186685E,
-    'cNetLicense': 0x666AC043,
-    'cNetLicenseUpload': 0x38FE69E6,
-    'cNetLicenseDownload': 0x01BA7B89,
-    'cNetMannerBase': 0x43C4B47B,
-    'cNetMannerUpload': 0x7040A5C5,
-    'cNetMannerDownload': 0x2DC1CACD,
-    'cNetTitleStorageDownload': 0x13C84CA5,
-    'cNetRoomCmu': 0x7EF5FB2B,
-    'cNetRoomCmuEventListener': 0x3646DA99,
-    'cNetRoomCmu::MsgPlayerInfoAll': 0x09E969E3,
-    'cNetRoomCmu::MsgPlayerInfo': 0x2FEDE634,
-    'cNetRoomCmu::MsgPlayerResult': 0x04D4489B,
-    'cNetRoomCmu::MsgPlayerBattleRecord': 0x14884E20,
-    'cNetRoomCmu::MsgPlayerBattleRecordAfter': 0x75250B3F,
-    'cNetRoomCmu::MsgPlayerBattleAfterState': 0x5C6E73F7,
-    'cNetRoomCmu::MsgRoomID': 0x24F279F2,
-    'cNetRoomCmu::MsgRoomState': 0x7EEB0925,
-    'cNetRoomCmu::MsgParam': 0x3DEA208F,
-    'cNetRoomCmu::MsgRoomRecord': 0x2800F714,
-    'cNetRoomCmu::MsgRoomInfo': 0x54239D8B,
-    'cNetRoomCmu::MsgBattleResult': 0x229D626F,
-    'cNetRoomCmu::MsgRoomLog': 0x707AAA30,
-    'cNetRoomCmu::MsgRoomVer': 0x76F980F7,
-    'cNetRoomCmu::MsgMatchReadyInfo': 0x1BA8D549,
-    'cNetRoomCmu::MsgMatchReadyOk': 0x6AAC3A83,
-    'cNetRoomCmu::MsgMatchNext': 0x4FA06983,
-    'cNetRoomCmu::MsgMatchCountDown': 0x2C3F61D5,
-    'cNetRoomCmu::MsgEarthAtkPlayerInfo': 0x3D27E5E8,
-    'cNetRoomCmu::MsgAreaJumpCall': 0x31AFCE73,
-    'cNetScoreDownload': 0x324FEC17,
-    'cNetScoreDownloadListener': 0x2FBF9E81,
-    'cNetScoreUpload': 0x0BA35F33,
-    'cNetScoreUploadListener': 0x3F4F168C,
-    'cNetStep': 0x4629DF12,
-    'cNetStep::MsgToHost': 0x2D0B9EDF,
-    'cNetStep::MsgFromHost': 0x2DCACB0F,
-    'cNetStep::MsgFromHostFlag': 0x61D191FE,
-    'cNetworkHandshake': 0x0B22E02E,
-    'cNetworkHandshake::MsgNetworkHandshake': 0x08D70263,
-    'cNetworkHandshake::MsgNetworkHandshakeGallery': 0x1C0DE20D,
-    'sAgentSession': 0x2C7CE84D,
-    'cMvc3SessionEventListener': 0x2C44A685,
-    'sAppNetwork': 0x6C662564,
-    'sEarthAtk': 0x48254965,
-    'sLicense': 0x3DBBA41E,
-    'sMvc3Guide': 0x3124E902,
-    'sMvc3Guide::uErrDialog': 0x7FD99AB8,
-    'sMvc3Ranking': 0x0DB0FD6E,
-    'sMvc3SyncPad::cCommunicationTool': 0x4ABE8A72,
-    'sMvc3SyncPad::cCommunicationTool::MsgInputData': 0x26FCF949,
-    'sMvc3SyncPad::cCommunicationTool::MsgInputActData': 0x3ED1CFA1,
-    'sMvc3SyncPad::cCommunicationTool::MsgInputActData2': 0x69B81331,
-    'sMvc3SyncPad::cCommunicationTool::MsgInputActData3': 0x1EBF23A7,
-    'sMvc3SyncPad::cCommunicationTool::MsgInputActData4': 0x00DBB604,
-    'sMvc3SyncPad::cCommunicationTool::MsgInputActData5': 0x77DC8692,
-    'sMvc3SyncPad::cCommunicationTool::MsgInputActData6': 0x6ED5D728,
-    'sMvc3SyncPad::cCommunicationTool::MsgInputActData7': 0x19D2E7BE,
-    'sMvc3SyncPad::cCommunicationTool::MsgInputActData8': 0x096DFA2F,
-    'sMvc3SyncPad::cCommunicationTool::MsgInputActData9': 0x7E6ACAB9,
-    'sMvc3SyncPad::cCommunicationTool::MsgInputActDataRep': 0x42BB0A2A,
-    'sMvc3SyncPad::cCommunicationTool::MsgInputCmd': 0x74E36729,
-    'sMvc3SyncPad::cCommunicationTool::MsgGalleryData': 0x2D7049F2,
-    'sMvc3SyncPad::cCommunicationTool::MsgCrcData': 0x0B3D1ACE,
-    'sMvc3SyncPad': 0x34DDCDA9,
-    'sNetworkRoom': 0x49CB6A3A,
-    'cNetRoomBootupBase': 0x03155298,
-    'cNetRoomBootupCreate': 0x54110492,
-    'cNetRoomBootupSearch': 0x6F373FCE,
-    'sPeripheral': 0x6D0C5A4E,
-    'rAnmCmd': 0x5A7E5D8A,
-    'rBattleSetting': 0x15C373D1,
-    'rChainSetup': 0x326F732E,
-    'rChrSelAssist': 0x7D37E18C,
-    'rCredit': 0x33CB2BE8,
-    'rCredit::Command': 0x04BFFE96,
-    'rDlcFile': 0x68A1639F,
-    'rEarthAtkVingo': 0x53E132D0,
-    'rEarthAtkVingo::cEarthAtkVingoParam': 0x7D8FCA3C,
-    'rEnding': 0x3B199159,
-    'rEnding::Command': 0x4C997026,
-    'rExCpuInfo': 0x007542AE,
-    'rFontSize': 0x1DB58B09,
-    'rGameConfig': 0x75CC71DE,
-    'rGameDataInstallList': 0x08B15B78,
-    'rGameEffectModel': 0x448BBDD4,
-    'rIdConvertList': 0x7359DE6B,
-    'rMayaCameraXml': 0x682F6B29,
-    'rMayaCameraList': 0x009A64A8,
-    'rMayaCameraListXml::CameraInfo': 0x6C9FD2CA,
-    'rMayaCameraListXml': 0x30D89FB0,
-    'rMenuMain': 0x112708AF,
-    'rMission': 0x361EA2A5,
-    'rMsgData': 0x5B55F5B1,
-    'rMvc3Setting': 0x09D93049,
-    'rPowerGrid': 0x48E25BBB,
-    'rReplay': 0x763DB1E4,
-    'rResourcePathList': 0x357EF6D4,
-    'rSPCList': 0x30F6E705,
-    'rSPCList::cUserData': 0x7061F3E6,
-    'rSPCList::cUserDataU32': 0x7E809739,
-    'rSPCList::cUserDataF32': 0x60E08A10,
-    'rSPCUseTable': 0x1AB9DAF6,
-    'rStageParam': 0x642AE284,
-    'rStageParam::cStageParam': 0x2450435F,
-    'rStgObjLayout': 0x2C7171FA,
-    'rStgObjLayout::cUserData': 0x5CF454DA,
-    'rStgObjLayout::cUserDataU32': 0x32D2C684,
-    'rStgObjLayout::cUserDataF32': 0x2CB2DBAD,
-    'rSubTitleLabel': 0x501ACD5C,
-    'rShot': 0x10BE43D4,
-    'rShot::cCommonData': 0x4C01F8B2,
-    'rShot::cAtkData': 0x3753A9BA,
-    'rShot::cHitData': 0x7F33FD7F,
-    'rShotList': 0x141D851F,
-    'rGalleryChrVoiceMap': 0x60B821BB,
-    'sGSound': 0x5223CB7E,
-    'uGSoundProcess': 0x0C13623E,
-    'uStorage': 0x78C642B4,
-    'uStoragePC': 0x4D157EB8,
-    'sGameDataInstall': 0x484D6405,
-    'sMovie2': 0x4EB8D294,
-    'sMvc3Area': 0x53FBD484,
-    'sMvc3Effect': 0x5CA4615E,
-    'sMvc3Pad': 0x262CC745,
-    'sMvc3Render': 0x7E9869C6,
-    'sMvc3Resource': 0x42478DD4,
-    'sMvc3Resource::cLoadResource': 0x6A17CAF7,
-    'sMvc3Resource::cFNFResource': 0x38856C99,
-    'sMvc3Resource::cLoadArea': 0x57F8A548,
-    'sMvc3Scene': 0x22C3C1ED,
-    'sMvc3Setting': 0x127C7C26,
-    'sMvc3Shader2': 0x229721D7,
-    'sMvc3Tool': 0x249CD73D,
-    'sMvc3Vibration': 0x1827DCA1,
-    'cGameUiResManager': 0x38A84664,
-    'cMsgWindowManager': 0x597C4874,
-    'sGameUi': 0x7DEED8E6,
-    'cActorGameSpriteAnm': 0x5BE6C32F,
-    'uActorGameSprite': 0x156FAA86,
-    'uBaseSprite': 0x32782CE2,
-    'uBaseSpriteVjob': 0x65577EFD,
-    'uBaseSpriteVjobu32': 0x1729EEC2,
-    'uBaseSpriteVjobFloat': 0x047B6218,
-    'uBaseSpriteVjobMtFloat2': 0x1EC89196,
-    'uBaseSpriteVjobMtVector3': 0x244E1BC8,
-    'uBaseSpriteVjobMtVector3Ref': 0x748DC100,
-    'uBaseSpriteVjobMtVector4': 0x3A2A8E6B,
-    'uBaseSpriteVjobMtColor': 0x6690E8DC,
-    'uUiAnmSprite': 0x7942324B,
-    'uUiAnmSpriteFont': 0x518E722D,
-    'uUiAnmSpriteFont::cFontVertex': 0x31CEC9D8,
-    'cMsgChgData': 0x33D9AE47,
-    'uUiAnmSpriteFrame': 0x4AF926B7,
-    'uUiAnmSpriteRadar': 0x3498E7A4,
-    'uBattleUi': 0x3514D74F,
-    'uBattleUiBase': 0x1FD675CB,
-    'uBattleUiCommandList': 0x28F031E1,
-    'uHitModel': 0x075158B2,
-    'uBattleUiHit': 0x32BBF45E,
-    'uHitDamageModel': 0x6EBA9E72,
-    'uCmbTextModel': 0x7608D966,
-    'uCmbText': 0x66EB3FCA,
-    'uBattleUiMission': 0x4002B233,
-    'uBattleUiMissionCommand': 0x1E1FBCE1,
-    'uBattleUiMissionList': 0x48A85539,
-    'uBattleUiNaruhodo': 0x5932FF03,
-    'uBattleUiPause': 0x33C4551D,
-    'uBattleUiPauseBlur': 0x44D12F14,
-    'uBattleUiPauseNetGallery': 0x26950A29,
-    'uBattleUiPhase': 0x55E3113B,
-    'uBattleUiTime': 0x30F613EF,
-    'uBattleUiTraining': 0x17FF1DD3,
-    'uBattleUiTrainingAttack': 0x5B2D1C98,
-    'uBattleUiTrainingRecord': 0x07D9AE32,
-    'uBtChrIcon': 0x22DF653B,
-    'uBtAssistChrIcon': 0x49B8448A,
-    'uBtChr2Icon': 0x4AAF2CBF,
-    'uBtContinue': 0x23BA6206,
-    'uBtGameOver': 0x72A64E81,
-    'uBtGaugeCardIcon': 0x3A1F1831,
-    'uBtGaugeHc': 0x23ABA697,
-    'uBtGaugeLife': 0x0D3FF2DC,
-    'uBtKeyDisp': 0x39FB34A6,
-    'uBtKeyDispBtn': 0x5EF7508B,
-    'uBtNewChallenger': 0x5B2311B4,
-    'uBtNewChallenger1647': 0x4BBA3CA9,
-    'uBtResult': 0x755939E5,
-    'uBtResultScore': 0x69488840,
-    'uBtResultScoreArcade': 0x0CB1D9AA,
-    'uBtResultScoreEAOffline': 0x7DAD7C0F,
-    'uBtResultScoreEarthAtk': 0x7DB0A661,
-    'uBtResultScoreFree': 0x34A4BF1E,
-    'uBtResultScoreRank': 0x71F39633,
-    'uBtResultScoreVersus': 0x10A871BE,
-    'uBtScore': 0x08307BAD,
-    'uBtSimpleLicense': 0x6C92B102,
-    'uBtStatusGauge': 0x581807E1,
-    'uBtStatusGaugeManager': 0x23571375,
-    'uBtSubTitle': 0x201DF06C,
-    'uBtUiSubSysMsg': 0x059C13E4,
-    'uBtVsSpcCard': 0x3A3DFFB0,
-    'u2PCtrlSelect': 0x50C1D306,
-    'uCreditMsg': 0x106DBCDE,
-    'uCreditNames': 0x3CCD582D,
-    'uDelayFunc': 0x2F9C86C0,
-    'uDelayUnit': 0x31D12120,
-    'uE3Thank': 0x31BA79B6,
-    'uEarthAtkVingo': 0x362C9810,
-    'uEarthAtkVingo::uVingoEffect': 0x03905A0A,
-    'uEnding': 0x7EBEAFD7,
-    'uFinishScreen': 0x6FDD9E2F,
-    'uLoading': 0x7BDC6134,
-    'uSaveDataAccess': 0x16990E0B,
-    'uSPCCard': 0x68EF8ED7,
-    'uSPCWindow': 0x5A85658C,
-    'uUiArcDisp': 0x0617DDAA,
-    'uUiBase': 0x5560DD36,
-    'uUiChoiceWindow': 0x709F0E54,
-    'uUiCursor': 0x533B5744,
-    'uUiDepthClear': 0x6B3651FA,
-    'uUiEffectBase': 0x0301B847,
-    'uUiEffect': 0x2024AC38,
-    'uUiErrorFade': 0x2CCC13AD,
-    'uUiKeyInfo': 0x5B7C1A5D,
-    'uUiKeyInfoDraw': 0x26618272,
-    'uUiModelBase': 0x000E25FF,
-    'uUiModel': 0x700D8D20,
-    'uUiMaskModel': 0x40814A32,
-    'uUiToonModel': 0x25DBCB23,
-    'uUiPageChange': 0x5F8470B1,
-    'uUiPopup2D': 0x4C003B0D,
-    'uUiPopupWindow': 0x7C75DA70,
-    'uUiPreMenu': 0x33EA910D,
-    'uUiRoomWatch': 0x57CBF8F8,
-    'uUiScheduler': 0x3E1CEBBD,
-    'uUiScreenCopy': 0x6AD01AAB,
-    'uUiSdlAnimeFrame': 0x460A2262,
-    'uUiSprite': 0x2359B254,
-    'uUiSprite::rTmpTexture': 0x723D4571,
-    'uUiSprite3D': 0x7E628910,
-    'uUiSpriteCore': 0x2150D089,
-    'uUiSpriteMove': 0x25E362BE,
-    'uBtFilePath': 0x7917FB8B,
-    'uBtFinalResultFilePath': 0x31DA65FA,
-    'uBtMsgFilePath': 0x57AF4D08,
-    'uLogoFilePath': 0x44EEB174,
-    'uMenuEndingFilePath': 0x12326765,
-    'uMenuEndingFilePath_Ryu': 0x7D6D5D8B,
-    'uMenuEndingFilePath_Chunli': 0x7B13BE91,
-    'uMenuEndingFilePath_Gouki': 0x22B86A85,
-    'uMenuEndingFilePath_Chris': 0x00F47981,
-    'uMenuEndingFilePath_Wesker': 0x63C3D53F,
-    'uMenuEndingFilePath_VJoe': 0x5EAD9467,
-    'uMenuEndingFilePath_Dante': 0x51586942,
-    'uMenuEndingFilePath_Trish': 0x47ABFA4E,
-    'uMenuEndingFilePath_Frank': 0x35FD52B2,
-    'uMenuEndingFilePath_Spencer': 0x76AA23F7,
-    'uMenuEndingFilePath_Arthur': 0x31DFEB9A,
-    'uMenuEndingFilePath_Amaterasu': 0x32831368,
-    'uMenuEndingFilePath_Zero': 0x38D3AF00,
-    'uMenuEndingFilePath_Tron': 0x490E314C,
-    'uMenuEndingFilePath_Morrigan': 0x471773C5,
-    'uMenuEndingFilePath_Leilei': 0x3A5C4FF5,
-    'uMenuEndingFilePath_Felicia': 0x289B57AC,
-    'uMenuEndingFilePath_CViper': 0x32D2AC8E,
-    'uMenuEndingFilePath_Haggar': 0x56CE3F19,
-    'uMenuEndingFilePath_Jill': 0x2C986F9E,
-    'uMenuEndingFilePath_Hiryu': 0x6C399891,
-    'uMenuEndingFilePath_Vergil': 0x4F83EAF4,
-    'uMenuEndingFilePath_Naruhodo': 0x17582165,
-    'uMenuEndingFilePath_RedArremer': 0x75E15F54,
-    'uMenuEndingFilePath_Nemesis': 0x035D5DFB,
-    'uMenuEndingFilePath_SpiderMan': 0x24F41722,
-    'uMenuEndingFilePath_CapAmerica': 0x20F30121,
-    'uMenuEndingFilePath_Wolverine': 0x6FABC2E5,
-    'uMenuEndingFilePath_Magneto': 0x47537541,
-    'uMenuEndingFilePath_Hulk': 0x0DC968A2,
-    'uMenuEndingFilePath_SheHulk': 0x31749FA8,
-    'uMenuEndingFilePath_TaskMaster': 0x0C49E869,
-    'uMenuEndingFilePath_IronMan': 0x70C2AB7C,
-    'uMenuEndingFilePath_Thor': 0x4CBE4BA5,
-    'uMenuEndingFilePath_DrDoom': 0x29536323,
-    'uMenuEndingFilePath_Phoenix': 0x71CE137D,
-    'uMenuEndingFilePath_Shuma': 0x728E4CCA,
-    'uMenuEndingFilePath_Modok': 0x7F8E1F4B,
-    'uMenuEndingFilePath_Dormammu': 0x541B4364,
-    'uMenuEndingFilePath_DeadPool': 0x65778F86,
-    'uMenuEndingFilePath_Storm': 0x3D1CC0FE,
-    'uMenuEndingFilePath_SuperSkrull': 0x711ACBAC,
-    'uMenuEndingFilePath_Sentinel': 0x74B1A775,
-    'uMenuEndingFilePath_X23': 0x7CC8AA36,
-    'uMenuEndingFilePath_Nova': 0x69EB021D,
-    'uMenuEndingFilePath_RRaccoon': 0x0CD7C685,
-    'uMenuEndingFilePath_GhostRider': 0x752012AC,
-    'uMenuEndingFilePath_IronFist': 0x2855F03C,
-    'uMenuEndingFilePath_DrStrange': 0x4A5AF234,
-    'uMenuEndingFilePath_HawkEye': 0x2F63ECE5,
-    'uMenuEndingFilePath_Galactus': 0x2401DC28,
-    'uMenuEndingMsgFilePath': 0x6223A198,
-    'uMenuEndingMsgFilePath_Ryu': 0x7227A80F,
-    'uMenuEndingMsgFilePath_Chunli': 0x62EDB0B4,
-    'uMenuEndingMsgFilePath_Gouki': 0x30803E13,
-    'uMenuEndingMsgFilePath_Chris': 0x12CC2D17,
-    'uMenuEndingMsgFilePath_Wesker': 0x7A3DDB1A,
-    'uMenuEndingMsgFilePath_VJoe': 0x347799AB,
-    'uMenuEndingMsgFilePath_Dante': 0x43603DD4,
-    'uMenuEndingMsgFilePath_Trish': 0x5593AED8,
-    'uMenuEndingMsgFilePath_Frank': 0x27C50624,
-    'uMenuEndingMsgFilePath_Spencer': 0x3DB709BE,
-    'uMenuEndingMsgFilePath_Arthur': 0x2821E5BF,
-    'uMenuEndingMsgFilePath_Amaterasu': 0x488365EF,
-    'uMenuEndingMsgFilePath_Zero': 0x5209A2CC,
-    'uMenuEndingMsgFilePath_Tron': 0x23D43C80,
-    'uMenuEndingMsgFilePath_Morrigan': 0x485C97DB,
-    'uMenuEndingMsgFilePath_Leilei': 0x23A241D0,
-    'uMenuEndingMsgFilePath_Felicia': 0x63867DE5,
-    'uMenuEndingMsgFilePath_CViper': 0x2B2CA2AB,
-    'uMenuEndingMsgFilePath_Haggar': 0x4F30313C,
-    'uMenuEndingMsgFilePath_Jill': 0x46426252,
-    'uMenuEndingMsgFilePath_Hiryu': 0x7E01CC07,
-    'uMenuEndingMsgFilePath_Vergil': 0x567DE4D1,
-    'uMenuEndingMsgFilePath_Naruhodo': 0x1813C57B,
-    'uMenuEndingMsgFilePath_RedArremer': 0x06C749A1,
-    'uMenuEndingMsgFilePath_Nemesis': 0x484077B2,
-    'uMenuEndingMsgFilePath_SpiderMan': 0x5EF461A5,
-    'uMenuEndingMsgFilePath_CapAmerica': 0x53D517D4,
-    'uMenuEndingMsgFilePath_Wolverine': 0x15ABB462,
-    'uMenuEndingMsgFilePath_Magneto': 0x0C4E5F08,
-    'uMenuEndingMsgFilePath_Hulk': 0x6713656E,
-    'uMenuEndingMsgFilePath_SheHulk': 0x7A69B5E1,
-    'uMenuEndingMsgFilePath_TaskMaster': 0x7F6FFE9C,
-    'uMenuEndingMsgFilePath_IronMan': 0x3BDF8135,
-    'uMenuEndingMsgFilePath_Thor': 0x26644669,
-    'uMenuEndingMsgFilePath_DrDoom': 0x30AD6D06,
-    'uMenuEndingMsgFilePath_Phoenix': 0x3AD33934,
-    'uMenuEndingMsgFilePath_Shuma': 0x60B6185C,
-    'uMenuEndingMsgFilePath_Modok': 0x6DB64BDD,
-    'uMenuEndingMsgFilePath_Dormammu': 0x5B50A77A,
-    'uMenuEndingMsgFilePath_DeadPool': 0x6A3C6B98,
-    'uMenuEndingMsgFilePath_Storm': 0x2F249468,
-    'uMenuEndingMsgFilePath_SuperSkrull': 0x3CBEEB29,
-    'uMenuEndingMsgFilePath_Sentinel': 0x7BFA436B,
-    'uMenuEndingMsgFilePath_X23': 0x73825FB2,
-    'uMenuEndingMsgFilePath_Nova': 0x03310FD1,
-    'uMenuEndingMsgFilePath_RRaccoon': 0x039C229B,
-    'uMenuEndingMsgFilePath_GhostRider': 0x06060459,
-    'uMenuEndingMsgFilePath_IronFist': 0x271E1422,
-    'uMenuEndingMsgFilePath_DrStrange': 0x305A84B3,
-    'uMenuEndingMsgFilePath_HawkEye': 0x647EC6AC,
-    'uMenuEndingMsgFilePath_Galactus': 0x2B4A3836,
-    'uMenuExtraCPUFilePath': 0x3F49954C,
-    'uMenuExtraCPUSingleFilePath': 0x146B020D,
-    'uMenuLicenseCmnFilePath': 0x398DE4CF,
-    'uMenuLicenseCmnMsgFilePath': 0x7DBC1C90,
-    'uMenuLicenseFilePath': 0x08F1BD39,
-    'uMenuNetRoomFilePath': 0x6483FE32,
-    'uMnChrSelCmnFilePath': 0x35150CE9,
-    'uMnChrSelEAFilePath': 0x234B271E,
-    'uMnChrSelFilePath': 0x36F50936,
-    'uMnChrSelSDCC11FilePath': 0x34B927DC,
-    'uMnChrSelGC11FilePath': 0x1996D0AC,
-    'uMnChrSelTGS11FilePath': 0x020C7A96,
-    'uMnChrSelNYCC11FilePath': 0x16DAAD4F,
-    'uMnChrSelMsgFilePath': 0x72A720EF,
-    'uMnChrSelMsgSDCC11FilePath': 0x3AFBDEFB,
-    'uMnChrSelMsgGC11FilePath': 0x61D262AF,
-    'uMnChrSelMsgTGS11FilePath': 0x1B7D6F9E,
-    'uMnChrSelMsgNYCC11FilePath': 0x18985468,
-    'uMnChrSelStgFilePath': 0x6CFBD45B,
-    'uMnCntFilePath': 0x039BC24A,
-    'uMnEarthFilePath': 0x3FD0E8A3,
-    'uMnEarthManualFilePath': 0x6A9EDB6A,
-    'uMnGameOverFilePath': 0x700C968F,
-    'uMnMainFilePath': 0x4C7E4D7C,
-    'uMnMainSDCC11FilePath': 0x54372CE3,
-    'uMnMainGC11FilePath': 0x720B944B,
-    'uMnMainTGS11FilePath': 0x3C899009,
-    'uMnMainNYCC11FilePath': 0x7654A670,
-    'uMnMainMsgFilePath': 0x61D5F82A,
-    'uMnMainMsgSDCC11FilePath': 0x7C380BDA,
-    'uMnMainMsgGC11FilePath': 0x57D4C199,
-    'uMnMainMsgTGS11FilePath': 0x5471FCA4,
-    'uMnMainMsgNYCC11FilePath': 0x5E5B8149,
-    'uMnNextBtFilePath': 0x392A93E6,
-    'uMnNextBtFilePath_Stage00': 0x1BD7CF36,
-    'uMnNextBtFilePath_Stage00b': 0x6C9D4222,
-    'uMnNextBtFilePath_Stage01': 0x6CD0FFA0,
-    'uMnNextBtFilePath_Stage01b': 0x75867363,
-    'uMnNextBtFilePath_Stage02': 0x75D9AE1A,
-    'uMnNextBtFilePath_Stage02b': 0x5EAB20A0,
-    'uMnNextBtFilePath_Stage03': 0x02DE9E8C,
-    'uMnNextBtFilePath_Stage03b': 0x47B011E1,
-    'uMnNextBtFilePath_Stage04': 0x1CBA0B2F,
-    'uMnNextBtFilePath_Stage04b': 0x08F18726,
-    'uMnNextBtFilePath_Stage05': 0x6BBD3BB9,
-    'uMnNextBtFilePath_Stage05b': 0x11EAB667,
-    'uMnNextBtFilePath_Stage06': 0x72B46A03,
-    'uMnNextBtFilePath_Stage06b': 0x3AC7E5A4,
-    'uMnNextBtFilePath_Stage07': 0x05B35A95,
-    'uMnNextBtFilePath_Stage07b': 0x23DCD4E5,
-    'uMnNextBtFilePath_Stage08': 0x150C4704,
-    'uMnNextBtFilePath_Stage08b': 0x2444C82A,
-    'uMnNextBtFilePath_Stage09': 0x620B7792,
-    'uMnNextBtFilePath_Stage09b': 0x3D5FF96B,
-    'uMnNextBtFilePath_Stage10': 0x02CCFE77,
-    'uMnNextBtFilePath_Stage10b': 0x6D5F2815,
-    'uMnNextBtFilePath_Stage11': 0x75CBCEE1,
-    'uNaruhodo07FilePath': 0x508B9C56,
-    'uNextBattleFilePath': 0x753DD5EB,
-    'uUiCmnFilePath': 0x4BDE2D9E,
-    'uUiCmnShowFilePath': 0x3B876ED4,
-    'uUiCmnMsgFilePath': 0x7898342C,
-    'uUiCreditFilePath': 0x426D3D0A,
-    'uUiCreditMsgFilePath': 0x1A28D46E,
-    'uUiFilePathBase': 0x1E053E4E,
-    'uUiGameEAFilePath': 0x2449B7F8,
-    'uUiReadyFilePath': 0x3085FF46,
-    'uUiSPCFilePath_all': 0x689404BD,
-    'uUiSPCFilePath_0': 0x426E92E8,
-    'uUiSPCFilePath_1': 0x3569A27E,
-    'uUiSPCFilePath_2': 0x2C60F3C4,
-    'uUiSPCFilePath_3': 0x5B67C352,
-    'uUiSPCFilePath_4': 0x450356F1,
-    'uUiSPCFilePath_5': 0x32046667,
-    'uUiSPCFilePath_6': 0x2B0D37DD,
-    'uUiSPCFilePath_7': 0x5C0A074B,
-    'uUiSPCFilePath_8': 0x4CB51ADA,
-    'uUiSPCFilePath_9': 0x3BB22A4C,
-    'uUiSPCFilePath_10': 0x11D10535,
-    'uUiSPCFilePath_11': 0x66D635A3,
-    'uUiSPCFilePath_12': 0x7FDF6419,
-    'uUiSPCFilePath_13': 0x08D8548F,
-    'uUiSPCFilePath_14': 0x16BCC12C,
-    'uUiSPCFilePath_15': 0x61BBF1BA,
-    'uUiSPCFilePath_16': 0x78B2A000,
-    'uUiSPCFilePath_17': 0x0FB59096,
-    'uUiSPCFilePath_18': 0x1F0A8D07,
-    'uUiSPCFilePath_19': 0x680DBD91,
-    'uUiSPCFilePath_20': 0x3AFC56F6,
-    'uUiSPCFilePath_21': 0x4DFB6660,
-    'uUiSPCFilePath_22': 0x54F237DA,
-    'uUiSPCFilePath_23': 0x23F5074C,
-    'uUiSPCFilePath_24': 0x3D9192EF,
-    'uUiSPCFilePath_25': 0x4A96A279,
-    'uUiSPCFilePath_26': 0x539FF3C3,
-    'uUiSPCFilePath_27': 0x2498C355,
-    'uUiSPCFilePath_28': 0x3427DEC4,
-    'uUiSPCFilePath_29': 0x4320EE52,
-    'uUiSPCFilePath_30': 0x23E767B7,
-    'uUiSPCFilePath_31': 0x54E05721,
-    'uUiSPCFilePath_32': 0x4DE9069B,
-    'uUiSPCFilePath_33': 0x3AEE360D,
-    'uUiSPCFilePath_34': 0x248AA3AE,
-    'uUiSPCFilePath_35': 0x538D9338,
-    'uUiSPCFilePath_b35': 0x4546122F,
-    'uUiSPCFilePath_36': 0x4A84C282,
-    'uUiSPCFilePath_37': 0x3D83F214,
-    'uUiSPCFilePath_38': 0x2D3CEF85,
-    'uUiSPCFilePath_39': 0x5A3BDF13,
-    'uUiSPCFilePath_40': 0x6CA6F170,
-    'uUiSPCFilePath_41': 0x1BA1C1E6,
-    'uUiSPCFilePath_42': 0x02A8905C,
-    'uUiSPCFilePath_43': 0x75AFA0CA,
-    'uUiSPCFilePath_44': 0x6BCB3569,
-    'uUiSPCFilePath_45': 0x1CCC05FF,
-    'uUiSPCFilePath_46': 0x05C55445,
-    'uUiSPCFilePath_47': 0x72C264D3,
-    'uUiSPCFilePath_48': 0x627D7942,
-    'uUiSPCFilePath_49': 0x157A49D4,
-    'uUiSPCFilePath_50': 0x75BDC031,
-    'uUiSPCFilePath_51': 0x02BAF0A7,
-    'uUiSPCFilePath_52': 0x1BB3A11D,
-    'uUiSPCFilePath_53': 0x6CB4918B,
-    'uUiSPCFilePath_54': 0x72D00428,
-    'uUiSPCFilePath_55': 0x05D734BE,
-    'uUiSPCFilePath_56': 0x1CDE6504,
-    'uUiSPCFilePath_57': 0x6BD95592,
-    'uUiSPCFilePath_58': 0x7B664803,
-    'uUiSPCFilePath_59': 0x0C617895,
-    'uUiSPCFilePath_60': 0x5E9093F2,
-    'uUiSPCFilePath_61': 0x2997A364,
-    'uUiSPCFilePath_62': 0x309EF2DE,
-    'uUiSPCFilePath_63': 0x4799C248,
-    'uUiSPCFilePath_64': 0x59FD57EB,
-    'uUiSPCFilePath_65': 0x2EFA677D,
-    'uUiSPCFilePath_66': 0x37F336C7,
-    'uUiSPCFilePath_67': 0x40F40651,
-    'uUiSPCFilePath_68': 0x504B1BC0,
-    'uUiSPCFilePath_69': 0x274C2B56,
-    'uUiSPCFilePath_70': 0x478BA2B3,
-    'uUiSPCFilePath_71': 0x308C9225,
-    'uUiSPCFilePath_72': 0x2985C39F,
-    'uUiSPCFilePath_73': 0x5E82F309,
-    'uUiSPCFilePath_74': 0x40E666AA,
-    'uUiSPCFilePath_75': 0x37E1563C,
-    'uUiSPCFilePath_76': 0x2EE80786,
-    'uUiSPCFilePath_77': 0x59EF3710,
-    'uUiSPCFilePath_78': 0x49502A81,
-    'uUiSPCFilePath_79': 0x3E571A17,
-    'uUiSPCFilePath_80': 0x4013BE7C,
-    'uUiSPCFilePath_81': 0x37148EEA,
-    'uUiSPCFilePath_82': 0x2E1DDF50,
-    'uUiSPCFilePath_83': 0x591AEFC6,
-    'uUiSPCFilePath_84': 0x477E7A65,
-    'uUiSPCFilePath_85': 0x30794AF3,
-    'uUiSPCFilePath_86': 0x29701B49,
-    'uUiSPCFilePath_87': 0x5E772BDF,
-    'uUiSPCFilePath_88': 0x4EC8364E,
-    'uUiSPCFilePath_89': 0x39CF06D8,
-    'uUiSPCFilePath_90': 0x59088F3D,
-    'uUiSPCFilePath_91': 0x2E0FBFAB,
-    'uUiSPCFilePath_92': 0x3706EE11,
-    'uUiSPCFilePath_93': 0x4001DE87,
-    'uUiSPCFilePath_94': 0x5E654B24,
-    'uUiSPCFilePath_95': 0x29627BB2,
-    'uUiSPCFilePath_96': 0x306B2A08,
-    'uUiSPCFilePath_97': 0x476C1A9E,
-    'uUiSPCFilePath_98': 0x57D3070F,
-    'uUiSPCFilePath_99': 0x20D43799,
-    'uUiSPCFilePath_100': 0x70FB258A,
-    'uUiSPCFilePath_101': 0x07FC151C,
-    'uUiSPCFilePath_102': 0x1EF544A6,
-    'uUiSPCFilePath_103': 0x69F27430,
-    'uUiSPCFilePath_i_base0': 0x5B1AF4CB,
-    'uUiSPCFilePath_i_base1': 0x2C1DC45D,
-    'uUiSPCFilePath_i_base2': 0x351495E7,
-    'uUiSPCFilePath_i_base3': 0x4213A571,
-    'uUiSPCFilePath_i_base100': 0x6A830FF2,
-    'uUiSPCFilePath_i_base101': 0x1D843F64,
-    'uUiSPCFilePath_i_base102': 0x048D6EDE,
-    'uUiSPCFilePath_i_base103': 0x738A5E48,
-    'uUiSPCFilePath_i_base200': 0x68C5B1AB,
-    'uUiSPCFilePath_i_base201': 0x1FC2813D,
-    'uUiSPCFilePath_i_base202': 0x06CBD087,
-    'uUiSPCFilePath_i_base203': 0x71CCE011,
-    'uUiSPCFilePath_i_base300': 0x6907DB9C,
-    'uUiSPCFilePath_i_base301': 0x1E00EB0A,
-    'uUiSPCFilePath_i_base302': 0x0709BAB0,
-    'uUiSPCFilePath_i_base303': 0x700E8A26,
-    'uUiSPCFilePath_i_base400': 0x6C48CD19,
-    'uUiSPCFilePath_i_base401': 0x1B4FFD8F,
-    'uUiSPCFilePath_i_base402': 0x0246AC35,
-    'uUiSPCFilePath_i_base403': 0x75419CA3,
-    'uUiSPCFilePath_i_base500': 0x6D8AA72E,
-    'uUiSPCFilePath_i_base501': 0x1A8D97B8,
-    'uUiSPCFilePath_i_base502': 0x0384C602,
-    'uUiSPCFilePath_i_base503': 0x7483F694,
-    'uUiSPCFilePath_i_base600': 0x6FCC1977,
-    'uUiSPCFilePath_i_base601': 0x18CB29E1,
-    'uUiSPCFilePath_i_base602': 0x01C2785B,
-    'uUiSPCFilePath_i_base603': 0x76C548CD,
-    'uUiSPCFilePath_i_base700': 0x6E0E7340,
-    'uUiSPCFilePath_i_base701': 0x190943D6,
-    'uUiSPCFilePath_i_base702': 0x0000126C,
-    'uUiSPCFilePath_i_base703': 0x770722FA,
-    'uUiSPCFilePath_i_base800': 0x6552347D,
-    'uUiSPCFilePath_i_base801': 0x125504EB,
-    'uUiSPCFilePath_i_base802': 0x0B5C5551,
-    'uUiSPCFilePath_i_base803': 0x7C5B65C7,
-    'uUiSPCFilePath_icon0': 0x61F4EF33,
-    'uUiSPCFilePath_icon1': 0x16F3DFA5,
-    'uUiSPCFilePath_icon2': 0x0FFA8E1F,
-    'uUiSPCFilePath_icon3': 0x78FDBE89,
-    'uUiSPCFilePath_icon4': 0x66992B2A,
-    'uUiSPCFilePath_icon100': 0x3C831745,
-    'uUiSPCFilePath_icon101': 0x4B8427D3,
-    'uUiSPCFilePath_icon102': 0x528D7669,
-    'uUiSPCFilePath_icon103': 0x258A46FF,
-    'uUiSPCFilePath_icon104': 0x3BEED35C,
-    'uUiSPCFilePath_icon105': 0x4CE9E3CA,
-    'uUiSPCFilePath_icon106': 0x55E0B270,
-    'uUiSPCFilePath_icon107': 0x22E782E6,
-    'uUiSPCFilePath_icon108': 0x32589F77,
-    'uUiSPCFilePath_icon109': 0x455FAFE1,
-    'uUiSPCFilePath_icon110': 0x25982604,
-    'uUiSPCFilePath_icon111': 0x529F1692,
-    'uUiSPCFilePath_icon112': 0x4B964728,
-    'uUiSPCFilePath_icon113': 0x3C9177BE,
-    'uUiSPCFilePath_icon114': 0x22F5E21D,
-    'uUiSPCFilePath_icon115': 0x55F2D28B,
-    'uUiSPCFilePath_icon116': 0x4CFB8331,
-    'uUiSPCFilePath_icon117': 0x3BFCB3A7,
-    'uUiSPCFilePath_icon118': 0x2B43AE36,
-    'uUiSPCFilePath_icon119': 0x5C449EA0,
-    'uUiSPCFilePath_icon200': 0x3EC5A91C,
-    'uUiSPCFilePath_icon201': 0x49C2998A,
-    'uUiSPCFilePath_icon202': 0x50CBC830,
-    'uUiSPCFilePath_icon203': 0x27CCF8A6,
-    'uUiSPCFilePath_icon204': 0x39A86D05,
-    'uUiSPCFilePath_icon205': 0x4EAF5D93,
-    'uUiSPCFilePath_icon206': 0x57A60C29,
-    'uUiSPCFilePath_icon207': 0x20A13CBF,
-    'uUiSPCFilePath_icon208': 0x301E212E,
-    'uUiSPCFilePath_icon209': 0x471911B8,
-    'uUiSPCFilePath_icon210': 0x27DE985D,
-    'uUiSPCFilePath_icon300': 0x3F07C32B,
-    'uUiSPCFilePath_icon301': 0x4800F3BD,
-    'uUiSPCFilePath_icon302': 0x5109A207,
-    'uUiSPCFilePath_icon303': 0x260E9291,
-    'uUiSPCFilePath_icon304': 0x386A0732,
-    'uUiSPCFilePath_icon305': 0x4F6D37A4,
-    'uUiSPCFilePath_icon306': 0x5664661E,
-    'uUiSPCFilePath_icon307': 0x21635688,
-    'uUiSPCFilePath_icon308': 0x31DC4B19,
-    'uUiSPCFilePath_icon400': 0x3A48D5AE,
-    'uUiSPCFilePath_icon401': 0x4D4FE538,
-    'uUiSPCFilePath_icon402': 0x5446B482,
-    'uUiSPCFilePath_icon403': 0x23418414,
-    'uUiSPCFilePath_icon404': 0x3D2511B7,
-    'uUiSPCFilePath_icon405': 0x4A222121,
-    'uUiSPCFilePath_icon406': 0x532B709B,
-    'uUiSPCFilePath_icon500': 0x3B8ABF99,
-    'uUiSPCFilePath_icon501': 0x4C8D8F0F,
-    'uUiSPCFilePath_icon502': 0x5584DEB5,
-    'uUiSPCFilePath_icon503': 0x2283EE23,
-    'uUiSPCFilePath_icon600': 0x39CC01C0,
-    'uUiSPCFilePath_icon601': 0x4ECB3156,
-    'uUiSPCFilePath_icon602': 0x57C260EC,
-    'uUiSPCFilePath_icon603': 0x20C5507A,
-    'uUiSPCFilePath_icon604': 0x3EA1C5D9,
-    'uUiSPCFilePath_icon605': 0x49A6F54F,
-    'uUiSPCFilePath_icon606': 0x50AFA4F5,
-    'uUiSPCFilePath_icon607': 0x27A89463,
-    'uUiSPCFilePath_icon608': 0x371789F2,
-    'uUiSPCFilePath_icon609': 0x4010B964,
-    'uUiSPCFilePath_icon610': 0x20D73081,
-    'uUiSPCFilePath_icon611': 0x57D00017,
-    'uUiSPCFilePath_icon612': 0x4ED951AD,
-    'uUiSPCFilePath_icon700': 0x380E6BF7,
-    'uUiSPCFilePath_icon701': 0x4F095B61,
-    'uUiSPCFilePath_icon702': 0x56000ADB,
-    'uUiSPCFilePath_icon703': 0x21073A4D,
-    'uUiSPCFilePath_icon800': 0x33522CCA,
-    'uUiSPCFilePath_icon801': 0x44551C5C,
-    'uUiSPCFilePath_icon802': 0x5D5C4DE6,
-    'uUiSPCFilePath_icon803': 0x2A5B7D70,
-    'uUiSPCFilePath_i_lv0': 0x5B548E2A,
-    'uUiSPCFilePath_i_lv1': 0x2C53BEBC,
-    'uUiSPCFilePath_i_lv2': 0x355AEF06,
-    'uUiSPCFilePath_i_lv3': 0x425DDF90,
-    'uUiSPCFilePath_i_lv4': 0x5C394A33,
-    'uFont': 0x590D1FAD,
-    'uFont::cFontVertex': 0x3C889B42,
-    'uFont2D': 0x0A6047A4,
-    'uFont3D': 0x137B76E5,
-    'uFontBase': 0x4EA03CCB,
-    'uFontModel': 0x331AC360,
-    'uChrColorType': 0x5DDCB35D,
-    'uChrUvOffset': 0x161669BB,
-    'uMenuChrSel': 0x4E40BB7D,
-    'uMenuChrSelAssist': 0x470EE776,
-    'uMenuChrSelBgMain': 0x07527911,
-    'uMenuChrSelCardPlayer': 0x7D577FFC,
-    'uMenuChrSelCtrlMode': 0x7FFBF3F4,
-    'uMenuChrSelCursor': 0x239F0A76,
-    'uMenuChrSelCursor::uCursor': 0x7622F76C,
-    'uMenuChrSelHandicap': 0x65F30449,
-    'uMenuChrSelMakeTex': 0x1A5CFA8A,
-    'uMenuChrSelNetInfoPlayer': 0x42F85C03,
-    'uMenuChrSelOption': 0x3C666048,
-    'uMenuChrSelReserveUnit': 0x1EB468B4,
-    'uMenuGallery': 0x773A0FB2,
-    'uMenuGalleryArtWork': 0x213958F4,
-    'uMenuGalleryArtworkFilePath_Ryu00': 0x6CFD4F2C,
-    'uMenuGalleryArtworkFilePath_Chunli00': 0x4C63F38C,
-    'uMenuGalleryArtworkFilePath_Gouki00': 0x39C5127E,
-    'uMenuGalleryArtworkFilePath_Chris00': 0x591734E8,
-    'uMenuGalleryArtworkFilePath_Wesker00': 0x2687C2EB,
-    'uMenuGalleryArtworkFilePath_VJoe00': 0x3C2E7AE0,
-    'uMenuGalleryArtworkFilePath_Dante00': 0x247771AD,
-    'uMenuGalleryArtworkFilePath_Trish00': 0x61C4EAAC,
-    'uMenuGalleryArtworkFilePath_Frank00': 0x01C01D91,
-    'uMenuGalleryArtworkFilePath_Spencer00': 0x1D4319B2,
-    'uMenuGalleryArtworkFilePath_Arthur00': 0x349645F0,
-    'uMenuGalleryArtworkFilePath_Amaterasu00': 0x7AE926E8,
-    'uMenuGalleryArtworkFilePath_Zero00': 0x279908DA,
-    'uMenuGalleryArtworkFilePath_Tron00': 0x6CE2C74D,
-    'uMenuGalleryArtworkFilePath_Morrigan00': 0x6060D8AB,
-    'uMenuGalleryArtworkFilePath_Leilei00': 0x07485EEA,
-    'uMenuGalleryArtworkFilePath_Felicia00': 0x1364F639,
-    'uMenuGalleryArtworkFilePath_CViper00': 0x7280C59B,
-    'uMenuGalleryArtworkFilePath_Haggar00': 0x2586FFA4,
-    'uMenuGalleryArtworkFilePath_Jill00': 0x533F79B5,
-    'uMenuGalleryArtworkFilePath_Hiryu00': 0x44D8989A,
-    'uMenuGalleryArtworkFilePath_Vergil00': 0x38EFCD13,
-    'uMenuGalleryArtworkFilePath_Naruhodo00': 0x4B0284D5,
-    'uMenuGalleryArtworkFilePath_RedArremer00': 0x5A807EA6,
-    'uMenuGalleryArtworkFilePath_Nemesis00': 0x064B7F72,
-    'uMenuGalleryArtworkFilePath_SpiderMan00': 0x7712D309,
-    'uMenuGalleryArtworkFilePath_CapAmerica00': 0x041BDAF4,
-    'uMenuGalleryArtworkFilePath_Wolverine00': 0x05107F84,
-    'uMenuGalleryArtworkFilePath_Magneto00': 0x2DD455B4,
-    'uMenuGalleryArtworkFilePath_Hulk00': 0x3EA8B4B8,
-    'uMenuGalleryArtworkFilePath_SheHulk00': 0x62B76050,
-    'uMenuGalleryArtworkFilePath_TaskMaster00': 0x656DE99F,
-    'uMenuGalleryArtworkFilePath_IronMan00': 0x2657D548,
-    'uMenuGalleryArtworkFilePath_Thor00': 0x538E127A,
-    'uMenuGalleryArtworkFilePath_DrDoom00': 0x62F2C39F,
-    'uMenuGalleryArtworkFilePath_Phoenix00': 0x7AF65EBB,
-    'uMenuGalleryArtworkFilePath_Shuma00': 0x1C29947F,
-    'uMenuGalleryArtworkFilePath_Modok00': 0x4CD3B03B,
-    'uMenuGalleryArtworkFilePath_Dormammu00': 0x71A576A3,
-    'uMenuGalleryArtworkFilePath_DeadPool00': 0x0F3F583A,
-    'uMenuGalleryArtworkFilePath_Storm00': 0x430D6711,
-    'uMenuGalleryArtworkFilePath_SuperSkrull00': 0x32425FB4,
-    'uMenuGalleryArtworkFilePath_Sentinel00': 0x051BD378,
-    'uMenuGalleryArtworkFilePath_X2300': 0x1E4F79C3,
-    'uMenuGalleryArtworkFilePath_Nova00': 0x7092EAAB,
-    'uMenuGalleryArtworkFilePath_RRaccoon00': 0x2B129B6D,
-    'uMenuGalleryArtworkFilePath_GhostRider00': 0x0E8828FF,
-    'uMenuGalleryArtworkFilePath_IronFist00': 0x51AFBF87,
-    'uMenuGalleryArtworkFilePath_DrStrange00': 0x3BEA9E87,
-    'uMenuGalleryArtworkFilePath_HawkEye00': 0x6E6C6F89,
-    'uMenuGalleryArtworkFilePath_Galactus00': 0x4DD90865,
-    'uMenuGalleryArtworkFilePath_Ryu01': 0x1BFA7FBA,
-    'uMenuGalleryArtworkFilePath_Chunli01': 0x3B64C31A,
-    'uMenuGalleryArtworkFilePath_Gouki01': 0x4EC222E8,
-    'uMenuGalleryArtworkFilePath_Chris01': 0x2E10047E,
-    'uMenuGalleryArtworkFilePath_Wesker01': 0x5180F27D,
-    'uMenuGalleryArtworkFilePath_VJoe01': 0x4B294A76,
-    'uMenuGalleryArtworkFilePath_Dante01': 0x5370413B,
-    'uMenuGalleryArtworkFilePath_Trish01': 0x16C3DA3A,
-    'uMenuGalleryArtworkFilePath_Frank01': 0x76C72D07,
-    'uMenuGalleryArtworkFilePath_Spencer01': 0x6A442924,
-    'uMenuGalleryArtworkFilePath_Arthur01': 0x43917566,
-    'uMenuGalleryArtworkFilePath_Amaterasu01': 0x0DEE167E,
-    'uMenuGalleryArtworkFilePath_Zero01': 0x509E384C,
-    'uMenuGalleryArtworkFilePath_Tron01': 0x1BE5F7DB,
-    'uMenuGalleryArtworkFilePath_Morrigan01': 0x1767E83D,
-    'uMenuGalleryArtworkFilePath_Leilei01': 0x704F6E7C,
-    'uMenuGalleryArtworkFilePath_Felicia01': 0x6463C6AF,
-    'uMenuGalleryArtworkFilePath_CViper01': 0x0587F50D,
-    'uMenuGalleryArtworkFilePath_Haggar01': 0x5281CF32,
-    'uMenuGalleryArtworkFilePath_Jill01': 0x24384923,
-    'uMenuGalleryArtworkFilePath_Hiryu01': 0x33DFA80C,
-    'uMenuGalleryArtworkFilePath_Vergil01': 0x4FE8FD85,
-    'uMenuGalleryArtworkFilePath_Naruhodo01': 0x3C05B443,
-    'uMenuGalleryArtworkFilePath_RedArremer01': 0x2D874E30,
-    'uMenuGalleryArtworkFilePath_Nemesis01': 0x714C4FE4,
-    'uMenuGalleryArtworkFilePath_SpiderMan01': 0x0015E39F,
-    'uMenuGalleryArtworkFilePath_CapAmerica01': 0x731CEA62,
-    'uMenuGalleryArtworkFilePath_Wolverine01': 0x72174F12,
-    'uMenuGalleryArtworkFilePath_Magneto01': 0x5AD36522,
-    'uMenuGalleryArtworkFilePath_Hulk01': 0x49AF842E,
-    'uMenuGalleryArtworkFilePath_SheHulk01': 0x15B050C6,
-    'uMenuGalleryArtworkFilePath_TaskMaster01': 0x126AD909,
-    'uMenuGalleryArtworkFilePath_IronMan01': 0x5150E5DE,
-    'uMenuGalleryArtworkFilePath_Thor01': 0x248922EC,
-    'uMenuGalleryArtworkFilePath_DrDoom01': 0x15F5F309,
-    'uMenuGalleryArtworkFilePath_Phoenix01': 0x0DF16E2D,
-    'uMenuGalleryArtworkFilePath_Shuma01': 0x6B2EA4E9,
-    'uMenuGalleryArtworkFilePath_Modok01': 0x3BD480AD,
-    'uMenuGalleryArtworkFilePath_Dormammu01': 0x06A24635,
-    'uMenuGalleryArtworkFilePath_DeadPool01': 0x783868AC,
-    'uMenuGalleryArtworkFilePath_Storm01': 0x340A5787,
-    'uMenuGalleryArtworkFilePath_SuperSkrull01': 0x45456F22,
-    'uMenuGalleryArtworkFilePath_Sentinel01': 0x721CE3EE,
-    'uMenuGalleryArtworkFilePath_X2301': 0x69484955,
-    'uMenuGalleryArtworkFilePath_Nova01': 0x0795DA3D,
-    'uMenuGalleryArtworkFilePath_RRaccoon01': 0x5C15ABFB,
-    'uMenuGalleryArtworkFilePath_GhostRider01': 0x798F1869,
-    'uMenuGalleryArtworkFilePath_IronFist01': 0x26A88F11,
-    'uMenuGalleryArtworkFilePath_DrStrange01': 0x4CEDAE11,
-    'uMenuGalleryArtworkFilePath_HawkEye01': 0x196B5F1F,
-    'uMenuGalleryArtworkFilePath_Galactus01': 0x3ADE38F3,
-    'uMenuGalleryArtworkFilePath_Ryu02': 0x02F32E00,
-    'uMenuGalleryArtworkFilePath_Chunli02': 0x226D92A0,
-    'uMenuGalleryArtworkFilePath_Gouki02': 0x57CB7352,
-    'uMenuGalleryArtworkFilePath_Chris02': 0x371955C4,
-    'uMenuGalleryArtworkFilePath_Wesker02': 0x4889A3C7,
-    'uMenuGalleryArtworkFilePath_VJoe02': 0x52201BCC,
-    'uMenuGalleryArtworkFilePath_Dante02': 0x4A791081,
-    'uMenuGalleryArtworkFilePath_Trish02': 0x0FCA8B80,
-    'uMenuGalleryArtworkFilePath_Frank02': 0x6FCE7CBD,
-    'uMenuGalleryArtworkFilePath_Spencer02': 0x734D789E,
-    'uMenuGalleryArtworkFilePath_Arthur02': 0x5A9824DC,
-    'uMenuGalleryArtworkFilePath_Amaterasu02': 0x14E747C4,
-    'uMenuGalleryArtworkFilePath_Zero02': 0x499769F6,
-    'uMenuGalleryArtworkFilePath_Tron02': 0x02ECA661,
-    'uMenuGalleryArtworkFilePath_Morrigan02': 0x0E6EB987,
-    'uMenuGalleryArtworkFilePath_Leilei02': 0x69463FC6,
-    'uMenuGalleryArtworkFilePath_Felicia02': 0x7D6A9715,
-    'uMenuGalleryArtworkFilePath_CViper02': 0x1C8EA4B7,
-    'uMenuGalleryArtworkFilePath_Haggar02': 0x4B889E88,
-    'uMenuGalleryArtworkFilePath_Jill02': 0x3D311899,
-    'uMenuGalleryArtworkFilePath_Hiryu02': 0x2AD6F9B6,
-    'uMenuGalleryArtworkFilePath_Vergil02': 0x56E1AC3F,
-    'uMenuGalleryArtworkFilePath_Naruhodo02': 0x250CE5F9,
-    'uMenuGalleryArtworkFilePath_RedArremer02': 0x348E1F8A,
-    'uMenuGalleryArtworkFilePath_Nemesis02': 0x68451E5E,
-    'uMenuGalleryArtworkFilePath_SpiderMan02': 0x191CB225,
-    'uMenuGalleryArtworkFilePath_CapAmerica02': 0x6A15BBD8,
-    'uMenuGalleryArtworkFilePath_Wolverine02': 0x6B1E1EA8,
-    'uMenuGalleryArtworkFilePath_Magneto02': 0x43DA3498,
-    'uMenuGalleryArtworkFilePath_Hulk02': 0x50A6D594,
-    'uMenuGalleryArtworkFilePath_SheHulk02': 0x0CB9017C,
-    'uMenuGalleryArtworkFilePath_TaskMaster02': 0x0B6388B3,
-    'uMenuGalleryArtworkFilePath_IronMan02': 0x4859B464,
-    'uMenuGalleryArtworkFilePath_Thor02': 0x3D807356,
-    'uMenuGalleryArtworkFilePath_DrDoom02': 0x0CFCA2B3,
-    'uMenuGalleryArtworkFilePath_Phoenix02': 0x14F83F97,
-    'uMenuGalleryArtworkFilePath_Shuma02': 0x7227F553,
-    'uMenuGalleryArtworkFilePath_Modok02': 0x22DDD117,
-    'uMenuGalleryArtworkFilePath_Dormammu02': 0x1FAB178F,
-    'uMenuGalleryArtworkFilePath_DeadPool02': 0x61313916,
-    'uMenuGalleryArtworkFilePath_Storm02': 0x2D03063D,
-    'uMenuGalleryArtworkFilePath_SuperSkrull02': 0x5C4C3E98,
-    'uMenuGalleryArtworkFilePath_Sentinel02': 0x6B15B254,
-    'uMenuGalleryArtworkFilePath_X2302': 0x704118EF,
-    'uMenuGalleryArtworkFilePath_Nova02': 0x1E9C8B87,
-    'uMenuGalleryArtworkFilePath_RRaccoon02': 0x451CFA41,
-    'uMenuGalleryArtworkFilePath_GhostRider02': 0x608649D3,
-    'uMenuGalleryArtworkFilePath_IronFist02': 0x3FA1DEAB,
-    'uMenuGalleryArtworkFilePath_DrStrange02': 0x55E4FFAB,
-    'uMenuGalleryArtworkFilePath_HawkEye02': 0x00620EA5,
-    'uMenuGalleryArtworkFilePath_Galactus02': 0x23D76949,
-    'uMenuGalleryArtworkFilePath_Stage00a': 0x07F82D36,
-    'uMenuGalleryArtworkFilePath_Stage01a': 0x1EE31C77,
-    'uMenuGalleryArtworkFilePath_Stage02a': 0x35CE4FB4,
-    'uMenuGalleryArtworkFilePath_Stage03a': 0x2CD57EF5,
-    'uMenuGalleryArtworkFilePath_Stage04a': 0x6394E832,
-    'uMenuGalleryArtworkFilePath_Stage05a': 0x7A8FD973,
-    'uMenuGalleryArtworkFilePath_Stage06a': 0x51A28AB0,
-    'uMenuGalleryArtworkFilePath_Stage07a': 0x48B9BBF1,
-    'uMenuGalleryArtworkFilePath_Stage08a': 0x4F21A73E,
-    'uMenuGalleryArtworkFilePath_Stage09a': 0x563A967F,
-    'uMenuGalleryArtworkFilePath_Stage10a': 0x063A4701,
-    'uMenuGalleryArtworkFilePath_Stage11a': 0x1F217640,
-    'uMenuGalleryArtworkFilePath_Stage12a': 0x340C2583,
-    'uMenuGalleryArtworkFilePath_Stage13a': 0x2D1714C2,
-    'uMenuGalleryArtworkFilePath_Stage14a': 0x62568205,
-    'uMenuGalleryArtworkFilePath_Stage15a': 0x7B4DB344,
-    'uMenuGalleryArtworkFilePath_Stage16a': 0x5060E087,
-    'uMenuGalleryArtworkFilePath_Stage17a': 0x497BD1C6,
-    'uMenuGalleryArtworkFilePath_Stage18a': 0x4EE3CD09,
-    'uMenuGalleryArtworkFilePath_Stage00b': 0x1EF17C8C,
-    'uMenuGalleryArtworkFilePath_Stage01b': 0x07EA4DCD,
-    'uMenuGalleryArtworkFilePath_Stage02b': 0x2CC71E0E,
-    'uMenuGalleryArtworkFilePath_Stage03b': 0x35DC2F4F,
-    'uMenuGalleryArtworkFilePath_Stage04b': 0x7A9DB988,
-    'uMenuGalleryArtworkFilePath_Stage05b': 0x638688C9,
-    'uMenuGalleryArtworkFilePath_Stage06b': 0x48ABDB0A,
-    'uMenuGalleryArtworkFilePath_Stage07b': 0x51B0EA4B,
-    'uMenuGalleryArtworkFilePath_Stage08b': 0x5628F684,
-    'uMenuGalleryArtworkFilePath_Stage09b': 0x4F33C7C5,
-    'uMenuGalleryArtworkFilePath_Stage10b': 0x1F3316BB,
-    'uMenuGalleryArtworkFilePath_Stage11b': 0x062827FA,
-    'uMenuGalleryArtworkFilePath_Stage12b': 0x2D057439,
-    'uMenuGalleryArtworkFilePath_Stage13b': 0x341E4578,
-    'uMenuGalleryArtworkFilePath_Stage14b': 0x7B5FD3BF,
-    'uMenuGalleryArtworkFilePath_Stage15b': 0x6244E2FE,
-    'uMenuGalleryArtworkFilePath_Stage16b': 0x4969B13D,
-    'uMenuGalleryArtworkFilePath_Stage17b': 0x5072807C,
-    'uMenuGalleryArtworkFilePath_Stage18b': 0x57EA9CB3,
-    'uMenuGalleryArtworkFilePath_Special00': 0x72B70BE0,
-    'uMenuGalleryArtworkFilePath_Special01': 0x05B03B76,
-    'uMenuGalleryArtworkFilePath_Special02': 0x1CB96ACC,
-    'uMenuGalleryArtworkFilePath_Special03': 0x6BBE5A5A,
-    'uMenuGalleryArtworkFilePath_Special04': 0x75DACFF9,
-    'uMenuGalleryArtworkFilePath_Special05': 0x02DDFF6F,
-    'uMenuGalleryArtworkFilePath_Special06': 0x1BD4AED5,
-    'uMenuGalleryArtworkFilePath_Special07': 0x6CD39E43,
-    'uMenuGalleryArtworkFilePath_Special08': 0x7C6C83D2,
-    'uMenuGalleryArtworkFilePath_Special09': 0x0B6BB344,
-    'uMenuGalleryArtworkFilePath_Special10': 0x6BAC3AA1,
-    'uMenuGalleryArtworkFilePath_Special11': 0x1CAB0A37,
-    'uMenuGalleryArtworkFilePath_Special12': 0x05A25B8D,
-    'uMenuGalleryArtworkFilePath_Special13': 0x72A56B1B,
-    'uMenuGalleryArtworkFilePath_Special14': 0x6CC1FEB8,
-    'uMenuGalleryArtworkFilePath_Concept00': 0x468B11DF,
-    'uMenuGalleryArtworkFilePath_Concept01': 0x318C2149,
-    'uMenuGalleryArtworkFilePath_Concept02': 0x288570F3,
-    'uMenuGalleryArtworkFilePath_Concept03': 0x5F824065,
-    'uMenuGalleryArtworkFilePath_Concept04': 0x41E6D5C6,
-    'uMenuGalleryArtworkFilePath_Concept05': 0x36E1E550,
-    'uMenuGalleryArtworkFilePath_Concept06': 0x2FE8B4EA,
-    'uMenuGalleryArtworkFilePath_Concept07': 0x58EF847C,
-    'uMenuGalleryArtworkFilePath_Concept08': 0x485099ED,
-    'uMenuGalleryArtworkFilePath_Concept09': 0x3F57A97B,
-    'uMenuGalleryArtworkFilePath_Comic00': 0x3A84A773,
-    'uMenuGalleryArtworkFilePath_Comic01': 0x4D8397E5,
-    'uMenuGalleryArtworkFilePath_Comic02': 0x548AC65F,
-    'uMenuGalleryArtworkFilePath_Comic03': 0x238DF6C9,
-    'uMenuGalleryArtworkFilePath_Comic04': 0x3DE9636A,
-    'uMenuGalleryArtworkFilePath_Comic05': 0x4AEE53FC,
-    'uMenuGalleryArtworkFilePath_Comic06': 0x53E70246,
-    'uMenuGalleryArtworkFilePath_Comic07': 0x24E032D0,
-    'uMenuGalleryArtworkFilePath_Comic08': 0x345F2F41,
-    'uMenuGalleryArtworkFilePath_Comic09': 0x43581FD7,
-    'uMenuGalleryArtworkFilePath_Comic10': 0x239F9632,
-    'uMenuGalleryArtworkFilePath_Comic11': 0x5498A6A4,
-    'uMenuGalleryArtworkFilePath_Comic12': 0x4D91F71E,
-    'uMenuGalleryArtworkFilePath_Comic13': 0x3A96C788,
-    'uMenuGalleryBios': 0x0A9DCC3D,
-    'uMenuGalleryBiosFaceFilePath': 0x37742E87,
-    'uMenuGalleryBiosFaceFilePath_Ryu': 0x7ECFDD93,
-    'uMenuGalleryBiosFaceFilePath_Chunli': 0x6A7D16D5,
-    'uMenuGalleryBiosFaceFilePath_Gouki': 0x4D1B725E,
-    'uMenuGalleryBiosFaceFilePath_Chris': 0x6F57615A,
-    'uMenuGalleryBiosFaceFilePath_Wesker': 0x72AD7D7B,
-    'uMenuGalleryBiosFaceFilePath_VJoe': 0x4DC2AEB1,
-    'uMenuGalleryBiosFaceFilePath_Dante': 0x3EFB7199,
-    'uMenuGalleryBiosFaceFilePath_Trish': 0x2808E295,
-    'uMenuGalleryBiosFaceFilePath_Frank': 0x5A5E4A69,
-    'uMenuGalleryBiosFaceFilePath_Spencer': 0x070AC8D6,
-    'uMenuGalleryBiosFaceFilePath_Arthur': 0x20B143DE,
-    'uMenuGalleryBiosFaceFilePath_Amaterasu': 0x09C44CDB,
-    'uMenuGalleryBiosFaceFilePath_Zero': 0x2BBC95D6,
-    'uMenuGalleryBiosFaceFilePath_Tron': 0x5A610B9A,
-    'uMenuGalleryBiosFaceFilePath_Morrigan': 0x0B0FC370,
-    'uMenuGalleryBiosFaceFilePath_Leilei': 0x2B32E7B1,
-    'uMenuGalleryBiosFaceFilePath_Felicia': 0x593BBC8D,
-    'uMenuGalleryBiosFaceFilePath_CViper': 0x23BC04CA,
-    'uMenuGalleryBiosFaceFilePath_Haggar': 0x47A0975D,
-    'uMenuGalleryBiosFaceFilePath_Jill': 0x3FF75548,
-    'uMenuGalleryBiosFaceFilePath_Hiryu': 0x039A804A,
-    'uMenuGalleryBiosFaceFilePath_Vergil': 0x5EED42B0,
-    'uMenuGalleryBiosFaceFilePath_Naruhodo': 0x5B4091D0,
-    'uMenuGalleryBiosFaceFilePath_RedArremer': 0x2732FA3D,
-    'uMenuGalleryBiosFaceFilePath_Nemesis': 0x72FDB6DA,
-    'uMenuGalleryBiosFaceFilePath_SpiderMan': 0x1FB34891,
-    'uMenuGalleryBiosFaceFilePath_CapAmerica': 0x7220A448,
-    'uMenuGalleryBiosFaceFilePath_Wolverine': 0x54EC9D56,
-    'uMenuGalleryBiosFaceFilePath_Magneto': 0x36F39E60,
-    'uMenuGalleryBiosFaceFilePath_Hulk': 0x1EA65274,
-    'uMenuGalleryBiosFaceFilePath_SheHulk': 0x40D47489,
-    'uMenuGalleryBiosFaceFilePath_TaskMaster': 0x5E9A4D00,
-    'uMenuGalleryBiosFaceFilePath_IronMan': 0x0162405D,
-    'uMenuGalleryBiosFaceFilePath_Thor': 0x5FD17173,
-    'uMenuGalleryBiosFaceFilePath_DrDoom': 0x383DCB67,
-    'uMenuGalleryBiosFaceFilePath_Phoenix': 0x006EF85C,
-    'uMenuGalleryBiosFaceFilePath_Shuma': 0x1D2D5411,
-    'uMenuGalleryBiosFaceFilePath_Modok': 0x102D0790,
-    'uMenuGalleryBiosFaceFilePath_Dormammu': 0x1803F3D1,
-    'uMenuGalleryBiosFaceFilePath_DeadPool': 0x296F3F33,
-    'uMenuGalleryBiosFaceFilePath_Storm': 0x52BFD825,
-    'uMenuGalleryBiosFaceFilePath_SuperSkrull': 0x4526C1F5,
-    'uMenuGalleryBiosFaceFilePath_Sentinel': 0x38A917C0,
-    'uMenuGalleryBiosFaceFilePath_X23': 0x7F6A2A2E,
-    'uMenuGalleryBiosFaceFilePath_Nova': 0x7A8438CB,
-    'uMenuGalleryBiosFaceFilePath_RRaccoon': 0x40CF7630,
-    'uMenuGalleryBiosFaceFilePath_GhostRider': 0x27F3B7C5,
-    'uMenuGalleryBiosFaceFilePath_IronFist': 0x644D4089,
-    'uMenuGalleryBiosFaceFilePath_DrStrange': 0x711DAD87,
-    'uMenuGalleryBiosFaceFilePath_HawkEye': 0x5EC307C4,
-    'uMenuGalleryBiosFaceFilePath_Galactus': 0x68196C9D,
-    'uMenuGalleryBiosFilePath': 0x2B27A002,
-    'uMenuGalleryBook': 0x1D7C28D9,
-    'uMenuGalleryBookFilePath_Book000': 0x78CCD90E,
-    'uMenuGalleryBookFilePath_Book001': 0x0FCBE998,
-    'uMenuGalleryBookFilePath_Book002': 0x16C2B822,
-    'uMenuGalleryBookFilePath_Book003': 0x61C588B4,
-    'uMenuGalleryBookFilePath_Book004': 0x7FA11D17,
-    'uMenuGalleryBookFilePath_Book005': 0x08A62D81,
-    'uMenuGalleryBookFilePath_Book006': 0x11AF7C3B,
-    'uMenuGalleryBookFilePath_Book007': 0x66A84CAD,
-    'uMenuGalleryBookFilePath_Book008': 0x7617513C,
-    'uMenuGalleryBookFilePath_Book009': 0x011061AA,
-    'uMenuGalleryBookFilePath_Book010': 0x61D7E84F,
-    'uMenuGalleryBookFilePath_Book011': 0x16D0D8D9,
-    'uMenuGalleryBookFilePath_Book012': 0x0FD98963,
-    'uMenuGalleryBookFilePath_Book013': 0x78DEB9F5,
-    'uMenuGalleryBookFilePath_Book014': 0x66BA2C56,
-    'uMenuGalleryBookFilePath_Book015': 0x11BD1CC0,
-    'uMenuGalleryBookFilePath_Book016': 0x08B44D7A,
-    'uMenuGalleryBookFilePath_Book017': 0x7FB37DEC,
-    'uMenuGalleryBookFilePath_Book018': 0x6F0C607D,
-    'uMenuGalleryBookFilePath_Book019': 0x180B50EB,
-    'uMenuGalleryBookFilePath_Book020': 0x4AFABB8C,
-    'uMenuGalleryBookFilePath_Book021': 0x3DFD8B1A,
-    'uMenuGalleryBookFilePath_Book022': 0x24F4DAA0,
-    'uMenuGalleryBookFilePath_Book023': 0x53F3EA36,
-    'uMenuGalleryBookFilePath_Book024': 0x4D977F95,
-    'uMenuGalleryBookFilePath_Book025': 0x3A904F03,
-    'uMenuGalleryBookFilePath_Book026': 0x23991EB9,
-    'uMenuGalleryBookFilePath_Book027': 0x549E2E2F,
-    'uMenuGalleryBookFilePath_Book028': 0x442133BE,
-    'uMenuGalleryBookFilePath_Book029': 0x33260328,
-    'uMenuGalleryBookFilePath_Book030': 0x53E18ACD,
-    'uMenuGalleryBookFilePath_Book031': 0x24E6BA5B,
-    'uMenuGalleryBookFilePath_Book032': 0x3DEFEBE1,
-    'uMenuGalleryBookFilePath_Book033': 0x4AE8DB77,
-    'uMenuGalleryBookFilePath_Book034': 0x548C4ED4,
-    'uMenuGalleryBookFilePath_Book035': 0x238B7E42,
-    'uMenuGalleryBookFilePath_Book036': 0x3A822FF8,
-    'uMenuGalleryBookFilePath_Book037': 0x4D851F6E,
-    'uMenuGalleryBookFilePath_Book038': 0x5D3A02FF,
-    'uMenuGalleryBookFilePath_Book039': 0x2A3D3269,
-    'uMenuGalleryBookFilePath_Book040': 0x1CA01C0A,
-    'uMenuGalleryBookFilePath_Book041': 0x6BA72C9C,
-    'uMenuGalleryBookFilePath_Book042': 0x72AE7D26,
-    'uMenuGalleryBookFilePath_Book043': 0x05A94DB0,
-    'uMenuGalleryBookFilePath_Book044': 0x1BCDD813,
-    'uMenuGalleryBookFilePath_Book045': 0x6CCAE885,
-    'uMenuGalleryBookFilePath_Book046': 0x75C3B93F,
-    'uMenuGalleryBookFilePath_Book047': 0x02C489A9,
-    'uMenuGalleryBookFilePath_Book048': 0x127B9438,
-    'uMenuGalleryBookFilePath_Book049': 0x657CA4AE,
-    'uMenuGalleryBookFilePath_Book050': 0x05BB2D4B,
-    'uMenuGalleryBookFilePath_Book051': 0x72BC1DDD,
-    'uMenuGalleryBookFilePath_Book052': 0x6BB54C67,
-    'uMenuGalleryBookFilePath_Book053': 0x1CB27CF1,
-    'uMenuGalleryBookFilePath_Book054': 0x02D6E952,
-    'uMenuGalleryBookFilePath_Book055': 0x75D1D9C4,
-    'uMenuGalleryBookFilePath_Book056': 0x6CD8887E,
-    'uMenuGalleryBookFilePath_Book057': 0x1BDFB8E8,
-    'uMenuGalleryBookFilePath_Book058': 0x0B60A579,
-    'uMenuGalleryBookFilePath_Book059': 0x7C6795EF,
-    'uMenuGalleryBookFilePath_Book060': 0x2E967E88,
-    'uMenuGalleryBookFilePath_Book061': 0x59914E1E,
-    'uMenuGalleryBookFilePath_Book062': 0x40981FA4,
-    'uMenuGalleryBookFilePath_Book063': 0x379F2F32,
-    'uMenuGalleryBookFilePath_Book064': 0x29FBBA91,
-    'uMenuGalleryBookFilePath_Book065': 0x5EFC8A07,
-    'uMenuGalleryBookFilePath_Book066': 0x47F5DBBD,
-    'uMenuGalleryBookFilePath_Book067': 0x30F2EB2B,
-    'uMenuGalleryBookFilePath_Book068': 0x204DF6BA,
-    'uMenuGalleryBookFilePath_Book069': 0x574AC62C,
-    'uMenuGalleryBookFilePath_Book070': 0x378D4FC9,
-    'uMenuGalleryBookFilePath_Book071': 0x408A7F5F,
-    'uMenuGalleryBookFilePath_Book072': 0x59832EE5,
-    'uMenuGalleryBookFilePath_Book073': 0x2E841E73,
-    'uMenuGalleryBookFilePath_Book074': 0x30E08BD0,
-    'uMenuGalleryBookFilePath_Book075': 0x47E7BB46,
-    'uMenuGalleryBookFilePath_Book076': 0x5EEEEAFC,
-    'uMenuGalleryBookFilePath_Book077': 0x29E9DA6A,
-    'uMenuGalleryBookFilePath_Book078': 0x3956C7FB,
-    'uMenuGalleryBookFilePath_Book079': 0x4E51F76D,
-    'uMenuGalleryBookFilePath_Book080': 0x30155306,
-    'uMenuGalleryBookFilePath_Book081': 0x47126390,
-    'uMenuGalleryBookFilePath_Book082': 0x5E1B322A,
-    'uMenuGalleryBookFilePath_Book083': 0x291C02BC,
-    'uMenuGalleryBookFilePath_Book084': 0x3778971F,
-    'uMenuGalleryBookFilePath_Book085': 0x407FA789,
-    'uMenuGalleryBookFilePath_Book086': 0x5976F633,
-    'uMenuGalleryBookFilePath_Book087': 0x2E71C6A5,
-    'uMenuGalleryBookFilePath_Book088': 0x3ECEDB34,
-    'uMenuGalleryBookFilePath_Book089': 0x49C9EBA2,
-    'uMenuGalleryBookFilePath_Book090': 0x290E6247,
-    'uMenuGalleryBookFilePath_Book091': 0x5E0952D1,
-    'uMenuGalleryBookFilePath_Book092': 0x4700036B,
-    'uMenuGalleryBookFilePath_Book093': 0x300733FD,
-    'uMenuGalleryBookFilePath_Book094': 0x2E63A65E,
-    'uMenuGalleryBookFilePath_Book095': 0x596496C8,
-    'uMenuGalleryBookFilePath_Book096': 0x406DC772,
-    'uMenuGalleryBookFilePath_Book097': 0x376AF7E4,
-    'uMenuGalleryBookFilePath_Book098': 0x27D5EA75,
-    'uMenuGalleryBookFilePath_Book099': 0x50D2DAE3,
-    'uMenuGalleryBookFilePath_Book100': 0x790EB339,
-    'uMenuGalleryBookFilePath_Book101': 0x0E0983AF,
-    'uMenuGalleryBookFilePath_Book102': 0x1700D215,
-    'uMenuGalleryBookFilePath_Book103': 0x6007E283,
-    'uMenuGalleryBookFilePath_Book104': 0x7E637720,
-    'uMenuGalleryBookFilePath_Book105': 0x096447B6,
-    'uMenuGalleryBookFilePath_Book106': 0x106D160C,
-    'uMenuGalleryBookFilePath_Book107': 0x676A269A,
-    'uMenuGalleryBookFilePath_Book108': 0x77D53B0B,
-    'uMenuGalleryBookFilePath_Book109': 0x00D20B9D,
-    'uMenuGalleryBookFilePath_Book110': 0x60158278,
-    'uMenuGalleryBookFilePath_Book111': 0x1712B2EE,
-    'uMenuGalleryBookFilePath_Book112': 0x0E1BE354,
-    'uMenuGalleryBookFilePath_Book113': 0x791CD3C2,
-    'uMenuGalleryBookFilePath_Book114': 0x67784661,
-    'uMenuGalleryBookFilePath_Book115': 0x107F76F7,
-    'uMenuGalleryBookFilePath_Book116': 0x0976274D,
-    'uMenuGalleryBookFilePath_Book117': 0x7E7117DB,
-    'uMenuGalleryBookFilePath_Book118': 0x6ECE0A4A,
-    'uMenuGalleryBookFilePath_Book119': 0x19C93ADC,
-    'uMenuGalleryBookFilePath_Book120': 0x4B38D1BB,
-    'uMenuGalleryBookFilePath_Book121': 0x3C3FE12D,
-    'uMenuGalleryBookFilePath_Book122': 0x2536B097,
-    'uMenuGalleryBookFilePath_Book123': 0x52318001,
-    'uMenuGalleryBookFilePath_Book124': 0x4C5515A2,
-    'uMenuGalleryBookFilePath_Book125': 0x3B522534,
-    'uMenuGalleryBookFilePath_Book126': 0x225B748E,
-    'uMenuGalleryBookFilePath_Book127': 0x555C4418,
-    'uMenuGalleryBookFilePath_Book128': 0x45E35989,
-    'uMenuGalleryBookFilePath_Book129': 0x32E4691F,
-    'uMenuGalleryBookFilePath_Book130': 0x5223E0FA,
-    'uMenuGalleryBookFilePath_Book131': 0x2524D06C,
-    'uMenuGalleryBookFilePath_Book132': 0x3C2D81D6,
-    'uMenuGalleryBookFilePath_Book133': 0x4B2AB140,
-    'uMenuGalleryBookFilePath_Book134': 0x554E24E3,
-    'uMenuGalleryBookFilePath_Book135': 0x22491475,
-    'uMenuGalleryBookFilePath_Book136': 0x3B4045CF,
-    'uMenuGalleryBookFilePath_Book137': 0x4C477559,
-    'uMenuGalleryBookFilePath_Book138': 0x5CF868C8,
-    'uMenuGalleryBookFilePath_Book139': 0x2BFF585E,
-    'uMenuGalleryBookFilePath_Book140': 0x1D62763D,
-    'uMenuGalleryBookFilePath_Book141': 0x6A6546AB,
-    'uMenuGalleryBookFilePath_Book142': 0x736C1711,
-    'uMenuGalleryBookFilePath_Book143': 0x046B2787,
-    'uMenuGalleryBookFilePath_Book144': 0x1A0FB224,
-    'uMenuGalleryBookFilePath_Book145': 0x6D0882B2,
-    'uMenuGalleryBookFilePath_Book146': 0x7401D308,
-    'uMenuGalleryBookFilePath_Book147': 0x0306E39E,
-    'uMenuGalleryBookFilePath_Book148': 0x13B9FE0F,
-    'uMenuGalleryBookFilePath_Book149': 0x64BECE99,
-    'uMenuGalleryBookFilePath_Book150': 0x0479477C,
-    'uMenuGalleryBookFilePath_Book151': 0x737E77EA,
-    'uMenuGalleryBookFilePath_Book152': 0x6A772650,
-    'uMenuGalleryBookFilePath_Book153': 0x1D7016C6,
-    'uMenuGalleryBookFilePath_Book154': 0x03148365,
-    'uMenuGalleryBookFilePath_Book155': 0x7413B3F3,
-    'uMenuGalleryBookFilePath_Book156': 0x6D1AE249,
-    'uMenuGalleryBookFilePath_Book157': 0x1A1DD2DF,
-    'uMenuGalleryBookFilePath_Book158': 0x0AA2CF4E,
-    'uMenuGalleryBookFilePath_Book159': 0x7DA5FFD8,
-    'uMenuGalleryBookFilePath_Book160': 0x2F5414BF,
-    'uMenuGalleryBookFilePath_Book161': 0x58532429,
-    'uMenuGalleryBookFilePath_Book162': 0x415A7593,
-    'uMenuGalleryBookFilePath_Book163': 0x365D4505,
-    'uMenuGalleryBookFilePath_Book164': 0x2839D0A6,
-    'uMenuGalleryBookFilePath_Book165': 0x5F3EE030,
-    'uMenuGalleryBookFilePath_Book166': 0x4637B18A,
-    'uMenuGalleryBookFilePath_Book167': 0x3130811C,
-    'uMenuGalleryBookFilePath_Book168': 0x218F9C8D,
-    'uMenuGalleryBookFilePath_Book169': 0x5688AC1B,
-    'uMenuGalleryBookFilePath_Book170': 0x364F25FE,
-    'uMenuGalleryBookFilePath_Book171': 0x41481568,
-    'uMenuGalleryBookFilePath_Book172': 0x584144D2,
-    'uMenuGalleryBookFilePath_Book173': 0x2F467444,
-    'uMenuGalleryBookFilePath_Book174': 0x3122E1E7,
-    'uMenuGalleryBookFilePath_Book175': 0x4625D171,
-    'uMenuGalleryBookFilePath_Book176': 0x5F2C80CB,
-    'uMenuGalleryBookFilePath_Book177': 0x282BB05D,
-    'uMenuGalleryBookFilePath_Book178': 0x3894ADCC,
-    'uMenuGalleryBookFilePath_Book179': 0x4F939D5A,
-    'uMenuGalleryBookFilePath_Book180': 0x31D73931,
-    'uMenuGalleryBookFilePath_Book181': 0x46D009A7,
-    'uMenuGalleryBookFilePath_Book182': 0x5FD9581D,
-    'uMenuGalleryBookFilePath_Book183': 0x28DE688B,
-    'uMenuGalleryBookFilePath_Book184': 0x36BAFD28,
-    'uMenuGalleryBookFilePath_Book185': 0x41BDCDBE,
-    'uMenuGalleryBookFilePath_Book186': 0x58B49C04,
-    'uMenuGalleryBookFilePath_Book187': 0x2FB3AC92,
-    'uMenuGalleryBookFilePath_Book188': 0x3F0CB103,
-    'uMenuGalleryBookFilePath_Book189': 0x480B8195,
-    'uMenuGalleryBookFilePath_Book190': 0x28CC0870,
-    'uMenuGalleryBookFilePath_Book191': 0x5FCB38E6,
-    'uMenuGalleryBookFilePath_Book192': 0x46C2695C,
-    'uMenuGalleryBookFilePath_Book193': 0x31C559CA,
-    'uMenuGalleryBookFilePath_Book194': 0x2FA1CC69,
-    'uMenuGalleryBookFilePath_Book195': 0x58A6FCFF,
-    'uMenuGalleryBookFilePath_Book196': 0x41AFAD45,
-    'uMenuGalleryBookFilePath_Book197': 0x36A89DD3,
-    'uMenuGalleryBookFilePath_Book198': 0x26178042,
-    'uMenuGalleryBookFilePath_Book199': 0x5110B0D4,
-    'uMenuGalleryBookFilePath_GuidePS4jp00': 0x13A5B3B7,
-    'uMenuGalleryBookFilePath_GuidePS4jp01': 0x64A28321,
-    'uMenuGalleryBookFilePath_GuidePS4jp02': 0x7DABD29B,
-    'uMenuGalleryBookFilePath_GuidePS4jp03': 0x0AACE20D,
-    'uMenuGalleryBookFilePath_GuidePS4jp04': 0x14C877AE,
-    'uMenuGalleryBookFilePath_GuidePS4jp05': 0x63CF4738,
-    'uMenuGalleryBookFilePath_GuidePS4jp06': 0x7AC61682,
-    'uMenuGalleryBookFilePath_GuidePS4jp07': 0x0DC12614,
-    'uMenuGalleryBookFilePath_GuidePS4jp08': 0x1D7E3B85,
-    'uMenuGalleryBookFilePath_GuidePS4jp09': 0x6A790B13,
-    'uMenuGalleryBookFilePath_GuidePS4jp10': 0x0ABE82F6,
-    'uMenuGalleryBookFilePath_GuidePS4jp11': 0x7DB9B260,
-    'uMenuGalleryBookFilePath_GuidePS4en00': 0x5D7E2D9B,
-    'uMenuGalleryBookFilePath_GuidePS4en01': 0x2A791D0D,
-    'uMenuGalleryBookFilePath_GuidePS4en02': 0x33704CB7,
-    'uMenuGalleryBookFilePath_GuidePS4en03': 0x44777C21,
-    'uMenuGalleryBookFilePath_GuidePS4en04': 0x5A13E982,
-    'uMenuGalleryBookFilePath_GuidePS4en05': 0x2D14D914,
-    'uMenuGalleryBookFilePath_GuidePS4en06': 0x341D88AE,
-    'uMenuGalleryBookFilePath_GuidePS4en07': 0x431AB838,
-    'uMenuGalleryBookFilePath_GuidePS4en08': 0x53A5A5A9,
-    'uMenuGalleryBookFilePath_GuidePS4en09': 0x24A2953F,
-    'uMenuGalleryBookFilePath_GuidePS4en10': 0x44651CDA,
-    'uMenuGalleryBookFilePath_GuidePS4en11': 0x33622C4C,
-    'uMenuGalleryBookFilePath_GuidePS4fr00': 0x5AF7D861,
-    'uMenuGalleryBookFilePath_GuidePS4fr01': 0x2DF0E8F7,
-    'uMenuGalleryBookFilePath_GuidePS4fr02': 0x34F9B94D,
-    'uMenuGalleryBookFilePath_GuidePS4fr03': 0x43FE89DB,
-    'uMenuGalleryBookFilePath_GuidePS4fr04': 0x5D9A1C78,
-    'uMenuGalleryBookFilePath_GuidePS4fr05': 0x2A9D2CEE,
-    'uMenuGalleryBookFilePath_GuidePS4fr06': 0x33947D54,
-    'uMenuGalleryBookFilePath_GuidePS4fr07': 0x44934DC2,
-    'uMenuGalleryBookFilePath_GuidePS4fr08': 0x542C5053,
-    'uMenuGalleryBookFilePath_GuidePS4fr09': 0x232B60C5,
-    'uMenuGalleryBookFilePath_GuidePS4fr10': 0x43ECE920,
-    'uMenuGalleryBookFilePath_GuidePS4fr11': 0x34EBD9B6,
-    'uMenuGalleryBookFilePath_GuidePS4it00': 0x0619B485,
-    'uMenuGalleryBookFilePath_GuidePS4it01': 0x711E8413,
-    'uMenuGalleryBookFilePath_GuidePS4it02': 0x6817D5A9,
-    'uMenuGalleryBookFilePath_GuidePS4it03': 0x1F10E53F,
-    'uMenuGalleryBookFilePath_GuidePS4it04': 0x0174709C,
-    'uMenuGalleryBookFilePath_GuidePS4it05': 0x7673400A,
-    'uMenuGalleryBookFilePath_GuidePS4it06': 0x6F7A11B0,
-    'uMenuGalleryBookFilePath_GuidePS4it07': 0x187D2126,
-    'uMenuGalleryBookFilePath_GuidePS4it08': 0x08C23CB7,
-    'uMenuGalleryBookFilePath_GuidePS4it09': 0x7FC50C21,
-    'uMenuGalleryBookFilePath_GuidePS4it10': 0x1F0285C4,
-    'uMenuGalleryBookFilePath_GuidePS4it11': 0x6805B552,
-    'uMenuGalleryBookFilePath_GuidePS4sp00': 0x3EB4ABA2,
-    'uMenuGalleryBookFilePath_GuidePS4sp01': 0x49B39B34,
-    'uMenuGalleryBookFilePath_GuidePS4sp02': 0x50BACA8E,
-    'uMenuGalleryBookFilePath_GuidePS4sp03': 0x27BDFA18,
-    'uMenuGalleryBookFilePath_GuidePS4sp04': 0x39D96FBB,
-    'uMenuGalleryBookFilePath_GuidePS4sp05': 0x4EDE5F2D,
-    'uMenuGalleryBookFilePath_GuidePS4sp06': 0x57D70E97,
-    'uMenuGalleryBookFilePath_GuidePS4sp07': 0x20D03E01,
-    'uMenuGalleryBookFilePath_GuidePS4sp08': 0x306F2390,
-    'uMenuGalleryBookFilePath_GuidePS4sp09': 0x47681306,
-    'uMenuGalleryBookFilePath_GuidePS4sp10': 0x27AF9AE3,
-    'uMenuGalleryBookFilePath_GuidePS4sp11': 0x50A8AA75,
-    'uMenuGalleryBookFilePath_GuidePS4ge00': 0x7B220AF1,
-    'uMenuGalleryBookFilePath_GuidePS4ge01': 0x0C253A67,
-    'uMenuGalleryBookFilePath_GuidePS4ge02': 0x152C6BDD,
-    'uMenuGalleryBookFilePath_GuidePS4ge03': 0x622B5B4B,
-    'uMenuGalleryBookFilePath_GuidePS4ge04': 0x7C4FCEE8,
-    'uMenuGalleryBookFilePath_GuidePS4ge05': 0x0B48FE7E,
-    'uMenuGalleryBookFilePath_GuidePS4ge06': 0x1241AFC4,
-    'uMenuGalleryBookFilePath_GuidePS4ge07': 0x65469F52,
-    'uMenuGalleryBookFilePath_GuidePS4ge08': 0x75F982C3,
-    'uMenuGalleryBookFilePath_GuidePS4ge09': 0x02FEB255,
-    'uMenuGalleryBookFilePath_GuidePS4ge10': 0x62393BB0,
-    'uMenuGalleryBookFilePath_GuidePS4ge11': 0x153E0B26,
-    'uMenuGalleryBookFilePath_GuideXBOjp00': 0x66C2FD30,
-    'uMenuGalleryBookFilePath_GuideXBOjp01': 0x11C5CDA6,
-    'uMenuGalleryBookFilePath_GuideXBOjp02': 0x08CC9C1C,
-    'uMenuGalleryBookFilePath_GuideXBOjp03': 0x7FCBAC8A,
-    'uMenuGalleryBookFilePath_GuideXBOjp04': 0x61AF3929,
-    'uMenuGalleryBookFilePath_GuideXBOjp05': 0x16A809BF,
-    'uMenuGalleryBookFilePath_GuideXBOjp06': 0x0FA15805,
-    'uMenuGalleryBookFilePath_GuideXBOjp07': 0x78A66893,
-    'uMenuGalleryBookFilePath_GuideXBOjp08': 0x68197502,
-    'uMenuGalleryBookFilePath_GuideXBOjp09': 0x1F1E4594,
-    'uMenuGalleryBookFilePath_GuideXBOjp10': 0x7FD9CC71,
-    'uMenuGalleryBookFilePath_GuideXBOjp11': 0x08DEFCE7,
-    'uMenuGalleryBookFilePath_GuideXBOen00': 0x2819631C,
-    'uMenuGalleryBookFilePath_GuideXBOen01': 0x5F1E538A,
-    'uMenuGalleryBookFilePath_GuideXBOen02': 0x46170230,
-    'uMenuGalleryBookFilePath_GuideXBOen03': 0x311032A6,
-    'uMenuGalleryBookFilePath_GuideXBOen04': 0x2F74A705,
-    'uMenuGalleryBookFilePath_GuideXBOen05': 0x58739793,
-    'uMenuGalleryBookFilePath_GuideXBOen06': 0x417AC629,
-    'uMenuGalleryBookFilePath_GuideXBOen07': 0x367DF6BF,
-    'uMenuGalleryBookFilePath_GuideXBOen08': 0x26C2EB2E,
-    'uMenuGalleryBookFilePath_GuideXBOen09': 0x51C5DBB8,
-    'uMenuGalleryBookFilePath_GuideXBOen10': 0x3102525D,
-    'uMenuGalleryBookFilePath_GuideXBOen11': 0x460562CB,
-    'uMenuGalleryBookFilePath_GuideXBOfr00': 0x2F9096E6,
-    'uMenuGalleryBookFilePath_GuideXBOfr01': 0x5897A670,
-    'uMenuGalleryBookFilePath_GuideXBOfr02': 0x419EF7CA,
-    'uMenuGalleryBookFilePath_GuideXBOfr03': 0x3699C75C,
-    'uMenuGalleryBookFilePath_GuideXBOfr04': 0x28FD52FF,
-    'uMenuGalleryBookFilePath_GuideXBOfr05': 0x5FFA6269,
-    'uMenuGalleryBookFilePath_GuideXBOfr06': 0x46F333D3,
-    'uMenuGalleryBookFilePath_GuideXBOfr07': 0x31F40345,
-    'uMenuGalleryBookFilePath_GuideXBOfr08': 0x214B1ED4,
-    'uMenuGalleryBookFilePath_GuideXBOfr09': 0x564C2E42,
-    'uMenuGalleryBookFilePath_GuideXBOfr10': 0x368BA7A7,
-    'uMenuGalleryBookFilePath_GuideXBOfr11': 0x418C9731,
-    'uMenuGalleryBookFilePath_GuideXBOit00': 0x737EFA02,
-    'uMenuGalleryBookFilePath_GuideXBOit01': 0x0479CA94,
-    'uMenuGalleryBookFilePath_GuideXBOit02': 0x1D709B2E,
-    'uMenuGalleryBookFilePath_GuideXBOit03': 0x6A77ABB8,
-    'uMenuGalleryBookFilePath_GuideXBOit04': 0x74133E1B,
-    'uMenuGalleryBookFilePath_GuideXBOit05': 0x03140E8D,
-    'uMenuGalleryBookFilePath_GuideXBOit06': 0x1A1D5F37,
-    'uMenuGalleryBookFilePath_GuideXBOit07': 0x6D1A6FA1,
-    'uMenuGalleryBookFilePath_GuideXBOit08': 0x7DA57230,
-    'uMenuGalleryBookFilePath_GuideXBOit09': 0x0AA242A6,
-    'uMenuGalleryBookFilePath_GuideXBOit10': 0x6A65CB43,
-    'uMenuGalleryBookFilePath_GuideXBOit11': 0x1D62FBD5,
-    'uMenuGalleryBookFilePath_GuideXBOsp00': 0x4BD3E525,
-    'uMenuGalleryBookFilePath_GuideXBOsp01': 0x3CD4D5B3,
-    'uMenuGalleryBookFilePath_GuideXBOsp02': 0x25DD8409,
-    'uMenuGalleryBookFilePath_GuideXBOsp03': 0x52DAB49F,
-    'uMenuGalleryBookFilePath_GuideXBOsp04': 0x4CBE213C,
-    'uMenuGalleryBookFilePath_GuideXBOsp05': 0x3BB911AA,
-    'uMenuGalleryBookFilePath_GuideXBOsp06': 0x22B04010,
-    'uMenuGalleryBookFilePath_GuideXBOsp07': 0x55B77086,
-    'uMenuGalleryBookFilePath_GuideXBOsp08': 0x45086D17,
-    'uMenuGalleryBookFilePath_GuideXBOsp09': 0x320F5D81,
-    'uMenuGalleryBookFilePath_GuideXBOsp10': 0x52C8D464,
-    'uMenuGalleryBookFilePath_GuideXBOsp11': 0x25CFE4F2,
-    'uMenuGalleryBookFilePath_GuideXBOge00': 0x0E454476,
-    'uMenuGalleryBookFilePath_GuideXBOge01': 0x794274E0,
-    'uMenuGalleryBookFilePath_GuideXBOge02': 0x604B255A,
-    'uMenuGalleryBookFilePath_GuideXBOge03': 0x174C15CC,
-    'uMenuGalleryBookFilePath_GuideXBOge04': 0x0928806F,
-    'uMenuGalleryBookFilePath_GuideXBOge05': 0x7E2FB0F9,
-    'uMenuGalleryBookFilePath_GuideXBOge06': 0x6726E143,
-    'uMenuGalleryBookFilePath_GuideXBOge07': 0x1021D1D5,
-    'uMenuGalleryBookFilePath_GuideXBOge08': 0x009ECC44,
-    'uMenuGalleryBookFilePath_GuideXBOge09': 0x7799FCD2,
-    'uMenuGalleryBookFilePath_GuideXBOge10': 0x175E7537,
-    'uMenuGalleryBookFilePath_GuideXBOge11': 0x605945A1,
-    'uMenuGalleryBookFilePath_GuidePCjp00': 0x63D16798,
-    'uMenuGalleryBookFilePath_GuidePCjp01': 0x14D6570E,
-    'uMenuGalleryBookFilePath_GuidePCjp02': 0x0DDF06B4,
-    'uMenuGalleryBookFilePath_GuidePCjp03': 0x7AD83622,
-    'uMenuGalleryBookFilePath_GuidePCjp04': 0x64BCA381,
-    'uMenuGalleryBookFilePath_GuidePCjp05': 0x13BB9317,
-    'uMenuGalleryBookFilePath_GuidePCjp06': 0x0AB2C2AD,
-    'uMenuGalleryBookFilePath_GuidePCjp07': 0x7DB5F23B,
-    'uMenuGalleryBookFilePath_GuidePCjp08': 0x6D0AEFAA,
-    'uMenuGalleryBookFilePath_GuidePCjp09': 0x1A0DDF3C,
-    'uMenuGalleryBookFilePath_GuidePCjp10': 0x7ACA56D9,
-    'uMenuGalleryBookFilePath_GuidePCjp11': 0x0DCD664F,
-    'uMenuGalleryBookFilePath_GuidePCen00': 0x2D0AF9B4,
-    'uMenuGalleryBookFilePath_GuidePCen01': 0x5A0DC922,
-    'uMenuGalleryBookFilePath_GuidePCen02': 0x43049898,
-    'uMenuGalleryBookFilePath_GuidePCen03': 0x3403A80E,
-    'uMenuGalleryBookFilePath_GuidePCen04': 0x2A673DAD,
-    'uMenuGalleryBookFilePath_GuidePCen05': 0x5D600D3B,
-    'uMenuGalleryBookFilePath_GuidePCen06': 0x44695C81,
-    'uMenuGalleryBookFilePath_GuidePCen07': 0x336E6C17,
-    'uMenuGalleryBookFilePath_GuidePCen08': 0x23D17186,
-    'uMenuGalleryBookFilePath_GuidePCen09': 0x54D64110,
-    'uMenuGalleryBookFilePath_GuidePCen10': 0x3411C8F5,
-    'uMenuGalleryBookFilePath_GuidePCen11': 0x4316F863,
-    'uMenuGalleryBookFilePath_GuidePCfr00': 0x2A830C4E,
-    'uMenuGalleryBookFilePath_GuidePCfr01': 0x5D843CD8,
-    'uMenuGalleryBookFilePath_GuidePCfr02': 0x448D6D62,
-    'uMenuGalleryBookFilePath_GuidePCfr03': 0x338A5DF4,
-    'uMenuGalleryBookFilePath_GuidePCfr04': 0x2DEEC857,
-    'uMenuGalleryBookFilePath_GuidePCfr05': 0x5AE9F8C1,
-    'uMenuGalleryBookFilePath_GuidePCfr06': 0x43E0A97B,
-    'uMenuGalleryBookFilePath_GuidePCfr07': 0x34E799ED,
-    'uMenuGalleryBookFilePath_GuidePCfr08': 0x2458847C,
-    'uMenuGalleryBookFilePath_GuidePCfr09': 0x535FB4EA,
-    'uMenuGalleryBookFilePath_GuidePCfr10': 0x33983D0F,
-    'uMenuGalleryBookFilePath_GuidePCfr11': 0x449F0D99,
-    'uMenuGalleryBookFilePath_GuidePCit00': 0x766D60AA,
-    'uMenuGalleryBookFilePath_GuidePCit01': 0x016A503C,
-    'uMenuGalleryBookFilePath_GuidePCit02': 0x18630186,
-    'uMenuGalleryBookFilePath_GuidePCit03': 0x6F643110,
-    'uMenuGalleryBookFilePath_GuidePCit04': 0x7100A4B3,
-    'uMenuGalleryBookFilePath_GuidePCit05': 0x06079425,
-    'uMenuGalleryBookFilePath_GuidePCit06': 0x1F0EC59F,
-    'uMenuGalleryBookFilePath_GuidePCit07': 0x6809F509,
-    'uMenuGalleryBookFilePath_GuidePCit08': 0x78B6E898,
-    'uMenuGalleryBookFilePath_GuidePCit09': 0x0FB1D80E,
-    'uMenuGalleryBookFilePath_GuidePCit10': 0x6F7651EB,
-    'uMenuGalleryBookFilePath_GuidePCit11': 0x1871617D,
-    'uMenuGalleryBookFilePath_GuidePCsp00': 0x4EC07F8D,
-    'uMenuGalleryBookFilePath_GuidePCsp01': 0x39C74F1B,
-    'uMenuGalleryBookFilePath_GuidePCsp02': 0x20CE1EA1,
-    'uMenuGalleryBookFilePath_GuidePCsp03': 0x57C92E37,
-    'uMenuGalleryBookFilePath_GuidePCsp04': 0x49ADBB94,
-    'uMenuGalleryBookFilePath_GuidePCsp05': 0x3EAA8B02,
-    'uMenuGalleryBookFilePath_GuidePCsp06': 0x27A3DAB8,
-    'uMenuGalleryBookFilePath_GuidePCsp07': 0x50A4EA2E,
-    'uMenuGalleryBookFilePath_GuidePCsp08': 0x401BF7BF,
-    'uMenuGalleryBookFilePath_GuidePCsp09': 0x371CC729,
-    'uMenuGalleryBookFilePath_GuidePCsp10': 0x57DB4ECC,
-    'uMenuGalleryBookFilePath_GuidePCsp11': 0x20DC7E5A,
-    'uMenuGalleryBookFilePath_GuidePCge00': 0x0B56DEDE,
-    'uMenuGalleryBookFilePath_GuidePCge01': 0x7C51EE48,
-    'uMenuGalleryBookFilePath_GuidePCge02': 0x6558BFF2,
-    'uMenuGalleryBookFilePath_GuidePCge03': 0x125F8F64,
-    'uMenuGalleryBookFilePath_GuidePCge04': 0x0C3B1AC7,
-    'uMenuGalleryBookFilePath_GuidePCge05': 0x7B3C2A51,
-    'uMenuGalleryBookFilePath_GuidePCge06': 0x62357BEB,
-    'uMenuGalleryBookFilePath_GuidePCge07': 0x15324B7D,
-    'uMenuGalleryBookFilePath_GuidePCge08': 0x058D56EC,
-    'uMenuGalleryBookFilePath_GuidePCge09': 0x728A667A,
-    'uMenuGalleryBookFilePath_GuidePCge10': 0x124DEF9F,
-    'uMenuGalleryBookFilePath_GuidePCge11': 0x654ADF09,
-    'uMenuGalleryVoiceMapFilePath': 0x6AD6A61B,
-    'uMenuGalleryVoiceMapFilePath_Ryu': 0x6F943A95,
-    'uMenuGalleryVoiceMapFilePath_Chunli': 0x037687A1,
-    'uMenuGalleryVoiceMapFilePath_Gouki': 0x252F3358,
-    'uMenuGalleryVoiceMapFilePath_Chris': 0x0763205C,
-    'uMenuGalleryVoiceMapFilePath_Wesker': 0x1BA6EC0F,
-    'uMenuGalleryVoiceMapFilePath_VJoe': 0x24305063,
-    'uMenuGalleryVoiceMapFilePath_Dante': 0x56CF309F,
-    'uMenuGalleryVoiceMapFilePath_Trish': 0x403CA393,
-    'uMenuGalleryVoiceMapFilePath_Frank': 0x326A0B6F,
-    'uMenuGalleryVoiceMapFilePath_Spencer': 0x508B7662,
-    'uMenuGalleryVoiceMapFilePath_Arthur': 0x49BAD2AA,
-    'uMenuGalleryVoiceMapFilePath_Amaterasu': 0x25B4EE6D,
-    'uMenuGalleryVoiceMapFilePath_Zero': 0x424E6B04,
-    'uMenuGalleryVoiceMapFilePath_Tron': 0x3393F548,
-    'uMenuGalleryVoiceMapFilePath_Morrigan': 0x4754355B,
-    'uMenuGalleryVoiceMapFilePath_Leilei': 0x423976C5,
-    'uMenuGalleryVoiceMapFilePath_Felicia': 0x0EBA0239,
-    'uMenuGalleryVoiceMapFilePath_CViper': 0x4AB795BE,
-    'uMenuGalleryVoiceMapFilePath_Haggar': 0x2EAB0629,
-    'uMenuGalleryVoiceMapFilePath_Jill': 0x5605AB9A,
-    'uMenuGalleryVoiceMapFilePath_Hiryu': 0x6BAEC14C,
-    'uMenuGalleryVoiceMapFilePath_Vergil': 0x37E6D3C4,
-    'uMenuGalleryVoiceMapFilePath_Naruhodo': 0x171B67FB,
-    'uMenuGalleryVoiceMapFilePath_RedArremer': 0x059C9C26,
-    'uMenuGalleryVoiceMapFilePath_Nemesis': 0x257C086E,
-    'uMenuGalleryVoiceMapFilePath_SpiderMan': 0x33C3EA27,
-    'uMenuGalleryVoiceMapFilePath_CapAmerica': 0x508EC253,
-    'uMenuGalleryVoiceMapFilePath_Wolverine': 0x789C3FE0,
-    'uMenuGalleryVoiceMapFilePath_Magneto': 0x617220D4,
-    'uMenuGalleryVoiceMapFilePath_Hulk': 0x7754ACA6,
-    'uMenuGalleryVoiceMapFilePath_SheHulk': 0x1755CA3D,
-    'uMenuGalleryVoiceMapFilePath_TaskMaster': 0x7C342B1B,
-    'uMenuGalleryVoiceMapFilePath_IronMan': 0x56E3FEE9,
-    'uMenuGalleryVoiceMapFilePath_Thor': 0x36238FA1,
-    'uMenuGalleryVoiceMapFilePath_DrDoom': 0x51365A13,
-    'uMenuGalleryVoiceMapFilePath_Phoenix': 0x57EF46E8,
-    'uMenuGalleryVoiceMapFilePath_Shuma': 0x75191517,
-    'uMenuGalleryVoiceMapFilePath_Modok': 0x78194696,
-    'uMenuGalleryVoiceMapFilePath_Dormammu': 0x545805FA,
-    'uMenuGalleryVoiceMapFilePath_DeadPool': 0x6534C918,
-    'uMenuGalleryVoiceMapFilePath_Storm': 0x3A8B9923,
-    'uMenuGalleryVoiceMapFilePath_SuperSkrull': 0x4F61A67F,
-    'uMenuGalleryVoiceMapFilePath_Sentinel': 0x74F2E1EB,
-    'uMenuGalleryVoiceMapFilePath_X23': 0x6E31CD28,
-    'uMenuGalleryVoiceMapFilePath_Nova': 0x1376C619,
-    'uMenuGalleryVoiceMapFilePath_RRaccoon': 0x0C94801B,
-    'uMenuGalleryVoiceMapFilePath_GhostRider': 0x055DD1DE,
-    'uMenuGalleryVoiceMapFilePath_IronFist': 0x2816B6A2,
-    'uMenuGalleryVoiceMapFilePath_DrStrange': 0x5D6D0F31,
-    'uMenuGalleryVoiceMapFilePath_HawkEye': 0x0942B970,
-    'uMenuGalleryVoiceMapFilePath_Galactus': 0x24429AB6,
-    'uMenuBase': 0x0ADA5663,
-    'uMenuEarthAtk': 0x35F815F3,
-    'uMenuLocal': 0x379068E1,
-    'uMenuMain': 0x75466566,
-    'uMenuMainBase': 0x7A67C147,
-    'uMenuMainBaseChild': 0x193ACDD3,
-    'uMenuMission': 0x207685B4,
-    'uMenuNetwork': 0x5095F034,
-    'uMenuOption': 0x71641179,
-    'uMenuOptionTus': 0x32D7FE26,
-    'uMenuSPCGallery': 0x24E71094,
-    'uMenuSubBase': 0x0922545C,
-    'uMenuTitle': 0x17709862,
-    'uMenuCam': 0x4452D82A,
-    'uMenuCancelCut': 0x61732C1D,
-    'uMenuCursor': 0x6E9D7B47,
-    'uMenuCut': 0x0E97A7BF,
-    'uMenuDlc': 0x130B9DE5,
-    'uMenuHelpMsg': 0x5566CE10,
-    'uMenuHHManual': 0x062CB0C0,
-    'uMenuSPCDeckCreate': 0x504E3591,
-    'uMenuSPCSelect': 0x0E9CEDFB,
-    'uMenuUnlockAnnounce': 0x266BF137,
-    'uMenuWindowEarth': 0x5B64AE7C,
-    'uMnChrToonModel': 0x79F4D428,
-    'uMnMainRoom': 0x01A140EE,
-    'uMnNextBt': 0x4607CE33,
-    'uMnNextBtLast': 0x0F44C4C5,
-    'uPadInit': 0x35A0CFF1,
-    'uMenuLicense': 0x67798391,
-    'cCountSort': 0x18DFF086,
-    'uMenuLicenseIcon': 0x2F464CA5,
-    'uMenuNetLeaderBoard': 0x0B8033C5,
-    'uMenuNetLeaderBoardSub': 0x11B9AF9E,
-    'uMenuNetRankMatch': 0x138E11D6,
-    'uMenuNetReady': 0x7759E92B,
-    'uMenuNetRoomMain': 0x1210061C,
-    'uMenuNetRoomMenu': 0x503DF1EB,
-    'uMenuNetRoomResult': 0x39E39612,
-    'uMenuNetRoomSelect': 0x617BBDC1,
-    'uMenuNetRoomSub': 0x082BCC90,
-    'uUiTournamentResult': 0x25180CD8,
-    'uMenuOptionCtrl': 0x43AC4B20,
-    'uMenuOptionDisplay': 0x3D1270C8,
-    'uMenuOptionFantastic': 0x597135B9,
-    'uMenuOptionSound': 0x21731AD9,
-    'uMenuOptionSystem': 0x0ECC2E96,
-    'uMenuOptionVoice': 0x3E068166,
-    'uAnaglyphFilter': 0x35340260,
-    'uAntiEdgeBrightnessFilter': 0x7C8C0E64,
-    'uBlurFilterEx': 0x15164CC6,
-    'uCnsTSR': 0x75C1D9B2,
-    'uCutIn': 0x0E29C886,
-    'uCutIn::uCutInCam': 0x292D2EAD,
-    'uDemoPlayWatcher': 0x46A74A6E,
-    'uDistortionFilter': 0x6C4830B1,
-    'uFade': 0x43CCFADF,
-    'uFadeCapture': 0x78B04DE6,
-    'uHatchingFilter': 0x22227080,
-    'uMakeUiMask': 0x59264990,
-    'uMaterialControlEx::ControllerEx': 0x18F53C1B,
-    'uMaterialControlEx': 0x0B8FA27C,
-    'uMayaMotionCamera': 0x50154009,
-    'uMvc3LightSpaceShadow': 0x25C8862C,
-    'uSerialWatch': 0x7ABFF1E9,
-    'uToonLight': 0x0999ADF0,
-    'uToonModel': 0x351683DE,
-    'uToonModel::cToonParam': 0x37AAE744,
-    'uTVNoisePrimitive': 0x15F2C30D,
-    'uUserName': 0x67FA79BD,
-    'uViewDraw': 0x4CEAF1A7,
-    'uViewDrawUi': 0x585E54A3,
-    'uWhiteBlackFilter': 0x66B27D53,
-    'cAim': 0x014C52F2,
-    'cAimF32': 0x090C5010,
-    'cAimVec': 0x65A768D0,
-    'cAppUtl': 0x6B0492B9,
-    'cMessageTypeSet': 0x1B4DBB12,
-    'cMessage': 0x20D55153,
-    'cCommunicator': 0x0C0A2DF1,
-    'nNet::cRanking': 0x18A0DB34,
-    'nNet::cSession': 0x485C3730,
-    'NetworkSessionInfo': 0x4536D875,
-    'NetworkStorage': 0x327C456A,
-    'NetworkUniqueId': 0x167C7D80,
-    'nNet::cCommunityEventListener': 0x7007166A,
-    'nNet::sCommunity': 0x09017E80,
-    'nNet::sComponent': 0x5B9F9FE4,
-    'nNet::sGuide': 0x03233C68,
-    'sMessage': 0x5C6E6078,
-    'nNet::cRankingEventListener': 0x681077DF,
-    'nNet::sRanking': 0x641BEA1F,
-    'nNet::cSessionEventListener': 0x5FFB20C3,
-    'nNet::sSession': 0x34E7061B,
-    'sNetworkLibrary': 0x56CF0C17,
-    'MtObject': 0x2EA10CEB,
-    'MtPropertyList': 0x2A031018,
-    'MtGeometry': 0x53783AD4,
-    'MtGeomConvex': 0x325A839F,
-    'MtGeomSphere': 0x0EB22BED,
-    'MtGeomCapsule': 0x3D568D05,
-    'MtArray': 0x71134D41,
-    'MtHeapArray': 0x0B4B4CE7,
-    'MtMap': 0x29429698,
-    'MtTree::Node': 0x014BB288,
-    'MtTree': 0x47E12F1F,
-    'MtFile::FileInfo': 0x559F244C,
-    'MtFile': 0x7C4047D3,
-    'MtRegistry': 0x0B822975,
-    'MtAllocator': 0x5F813CB8,
-    'MtDefaultAllocator': 0x5AF0348C,
-    'MtHeapAllocator': 0x74F15F28,
-    'MtBlockAllocator': 0x1FBE1059,
-    'MtVirtualAllocator': 0x5759AC30,
-    'MtScalableAllocator': 0x1A762E98,
-    'MtNetServiceError': 0x4B9AE971,
-    'MtNetUniqueId': 0x6746C8B8,
-    'MtNetObject': 0x7EB9B212,
-    'MtNetRanking::Score': 0x162D34C5,
-    'MtNetRanking': 0x08E91D5F,
-    'MtExHeapAllocator': 0x4B1EC9A0,
-    'MtStream': 0x76E5191B,
-    'MtFileStream': 0x1F3422D8,
-    'MtClipboardStream': 0x167A6809,
-    'MtMemoryStream': 0x5BC443CD,
-    'MtMemoryCachedStream': 0x162C4EA7,
-    'MtCipherStream': 0x7AA7094D,
-    'MtCollisionGjk': 0x1AF46990,
-    'MtCollisionMpr': 0x4325BE5D,
-    'cUnit': 0x3A82790E,
-    'cResource': 0x5CDD1F19,
-    'uScheduler': 0x2ED1A340,
-    'uSchedulerEdit': 0x049CECAD,
-    'sPad::Pad': 0x15D8846F,
-    'sPad::Map': 0x1BFC6031,
-    'sPad': 0x7DB4FE86,
-    'rTexture': 0x241F5DEB,
-    'sResource::RemoteInfo': 0x7B92638D,
-    'sResource::DecompressStream': 0x22BD36F5,
-    'sResource::TypeInfo': 0x3EB07876,
-    'sResource': 0x701D5D68,
-    'sUnit::UnitGroup': 0x1D963488,
-    'sUnit::MoveLine': 0x44D32983,
-    'sUnit': 0x5A62EE8C,
-    'sApp': 0x2953C0AC,
-    'sApp::Item': 0x58C72E3D,
-    'sMain': 0x39F12FBB,
-    'rScheduler': 0x4C0DB839,
-    'sVibration': 0x5A4279D6,
-    'uModel::Motion': 0x56F5B156,
-    'cSystem': 0x27EEC3E7,
-    'sCamera::Viewport': 0x342A0C36,
-    'sCamera': 0x3261A0A7,
-    'sRender': 0x1D21D7C8,
-    'nPrim::PrimVertex': 0x20C62339,
-    'sEffect': 0x3F1DDF50,
-    'sArea::AreaInfo': 0x74221BC8,
-    'sArea': 0x514DDFB7,
-    'sToolBase': 0x18E87CF1,
-    'uCamera': 0x51B1959D,
-    'rArchive::DecompressStream': 0x247EEB9B,
-    'rArchive': 0x73850D05,
-    'uCoord': 0x7D9935CA,
-    'uMaterialControl::Controller': 0x16E4BF67,
-    'uMaterialControl': 0x230A9EB3,
-    'uJointAnimator': 0x288F7E74,
-    'uChain': 0x233302FD,
-    'uBaseModel': 0x35FFAC6E,
-    'uModel': 0x45A468EE,
-    'uModel::Constraint': 0x3816638E,
-    'uModel::JointDAGNode': 0x6DA7651F,
-    'uModel::Joint': 0x40E80DD6,
-    'rModel': 0x58A15856,
-    'rMotionList': 0x76820D81,
-    'nCollision::cMotionSequenceSupport': 0x05CD6DF7,
-    'nCollision::cObjectBase': 0x1D2D7175,
-    'nCollision::cGeometry': 0x411CCDC2,
-    'nCollision::cGeometryExpansion': 0x07799B24,
-    'nCollision::cGeometryJoint': 0x71BA0D2E,
-    'nCollision::cCollisionNode': 0x49AEA40C,
-    'nCollision::cCollisionNodeObject': 0x5F6C35AD,
-    'nCollision::cCollisionNodeGroup': 0x2404E3E2,
-    'nCollision::cGeometryJointGroup': 0x1855E615,
-    'sCollision::ActiveNodeInfo': 0x10B479D2,
-    'sCollision::ColliderActiveNodeInfo': 0x2C15D09A,
-    'sCollision::ColliderPassiveNodeInfo': 0x2161DCF0,
-    'sCollision::NodeList': 0x665BC6EF,
-    'sCollision::Collider::cNodeListArray': 0x1B639153,
-    'sCollision::Collider': 0x76D2EF9F,
-    'sCollision::cSystemInitializeParam': 0x1291FE17,
-    'sCollision::cSbcMoveMatrix': 0x0B3DCD99,
-    'sCollision::cColArray': 0x281AE264,
-    'sCollision': 0x3E3E1CA1,
-    'rChain': 0x3E363245,
-    'rChainCol': 0x0026E7FF,
-    'sCollision::Node': 0x0328E34B,
-    'sSound': 0x3CE63AAE,
-    'sSound::NativeSystemXAudio2::WinProperty': 0x16F39ED6,
-    'nDraw::Animation': 0x1E08DE68,
-    'nDraw::CBuffer': 0x044D51A4,
-    'nDraw::CBufferSystem': 0x16AA28A1,
-    'nDraw::Material': 0x4516E7AB,
-    'uEffect': 0x5CCDEA6A,
-    'uConstraint::cConstraint': 0x20EB23B5,
-    'uConstraint': 0x0E9055F6,
-    'rEffectList': 0x6D5AE854,
-    'uBaseEffect': 0x3105328E,
-    'uFilter': 0x15692485,
-    'uDOFFilter': 0x11A7E0D4,
-    'uTVNoiseFilter': 0x3C14AD49,
-    'uImagePlaneFilter': 0x14A4CC49,
-    'uCrossFadeFilter': 0x6752005F,
-    'uVolumeNoiseFilter': 0x193EA064,
-    'uNoiseFogFilter': 0x785BD903,
-    'uRadialBlurFilter': 0x11EDABFE,
-    'uMotionBlurFilter': 0x43BCBC9C,
-    'uHazeFilter': 0x70CC7783,
-    'uFishEyeFilter': 0x7AD567B0,
-    'uColorFogFilter': 0x369C12D5,
-    'uBlurFilter': 0x6DF8B0F1,
-    'uColorCorrectFilter::Corrector': 0x2ACD1930,
-    'uColorCorrectFilter': 0x1265A094,
-    'uLightScatteringFilter': 0x3A9B7358,
-    'uBloomFilter': 0x54E6A16B,
-    'uToneMapControl': 0x59351470,
-    'uAmbientOcclusionFilter': 0x659CD65D,
-    'uOutlineFilter::Detector': 0x1EF724EF,
-    'uOutlineFilter': 0x46393159,
-    'uBokehFilter': 0x21C5780B,
-    'uEdgeAntiAliasingFilter': 0x604366C3,
-    'uGodRaysFilter': 0x6B71A237,
-    'uChromaticAberrationFilter': 0x57D3DD05,
-    'uTangentBlurFilter': 0x37AC8D4B,
-    'cDraw': 0x16CBC852,
-    'sCollision::SbcInfoBase': 0x30782E08,
-    'sCollision::SbcInfo': 0x72991E73,
-    'sCollision::TriangleInfo': 0x2ED47FDC,
-    'sCollision::SbcLockInfo': 0x709FD39D,
-    'sCollision::Param': 0x11C6E908,
-    'sAI': 0x306B7794,
-    'cAISvUserProcess': 0x58CFB9DF,
-    'cAISvUserProcess::UserObjectInfo': 0x58C75F69,
-    'cAIFSM': 0x2E3E872E,
-    'cAIFSM::Core': 0x59F986BD,
-    'cAIFSM::Core::ClearTransitionFromAllOnceParam': 0x6293217B,
-    'cAIFSM::Core::ClusterDriveInfo': 0x57A76BC8,
-    'cAIFSM::Core::ClusterWork': 0x16DC8964,
-    'cAIFSMProcessContainer': 0x0D624460,
-    'cAIFSMData': 0x78B9C3DB,
-    'cAIFSMData::Cluster': 0x365184B8,
-    'cAIFSMData::ClusterLog': 0x40FD6484,
-    'cAIFSMData::Core': 0x296A2C1E,
-    'cAIObject': 0x567FAB90,
-    'cAIResource': 0x7EC22EC1,
-    'cAIUserProcessContainer': 0x1F4939F1,
-    'cAIUserProcess': 0x2BF30A0A,
-    'cAIUserProcessCallback': 0x750AFF3D,
-    'cAICopiableParameter': 0x01209ECA,
-    'cAIUserProcessReference': 0x76489CF9,
-    'cPrimBuffer': 0x18FE11E3,
-    'cPrimTexHandle': 0x5F5F8708,
-    'sPrimitive': 0x44ACF2C4,
-    'rSceneTexture': 0x4323D83A,
-    'cArea': 0x31AD4835,
-    'sShader2': 0x454CB56E,
-    'rShaderPackage': 0x02358E1A,
-    'rVibration': 0x358012E8,
-    'uFreeCamera': 0x1A0BAB1B,
-    'uShadow': 0x1FDBF9B5,
-    'uLightSpaceShadow': 0x194984AA,
-    'uStableShadow': 0x032CE905,
-    'uUniformShadow': 0x26F86FEB,
-    'uSpotShadow': 0x6B792EAB,
-    'uPointShadow': 0x0E0F1A5B,
-    'uMovie': 0x0F6FE858,
-    'rMovie': 0x126AD8E0,
-    'rMovieOnMemory': 0x5F84F7C4,
-    'rMovieOnDisk': 0x31F693D6,
-    'rMovieOnMemoryInterMediate': 0x17A69ACE,
-    'rMovieOnDiskInterMediate': 0x71950384,
-    'rRenderTargetTexture': 0x7808EA10,
-    'sNetwork': 0x0A57D7BB,
-    'rSoundCurveXml::Element': 0x3694A441,
-    'rSoundCurveXml::Curve': 0x2E60C5BF,
-    'rSoundCurveXml': 0x592D804B,
-    'rSoundDirectionalCurveXml::Element': 0x3A962172,
-    'rSoundDirectionalCurveXml::Curve': 0x6CC76A1B,
-    'rSoundDirectionalCurveXml': 0x3A96D8A0,
-    'rSoundDirectionalSet': 0x0315E81F,
-    'rSoundRequest': 0x1BCC4966,
-    'rSoundStreamRequest': 0x167DBBFF,
-    'rSoundPhysicsRigidBody::cSoundFirstRequestData': 0x0A359448,
-    'rSoundPhysicsRigidBody::cSoundFinishRequestData': 0x781A43FA,
-    'rSoundPhysicsRigidBody::cSoundSlideRequestData': 0x528FCFDB,
-    'rSoundPhysicsRigidBody::cSoundRollRequestData': 0x365F18CD,
-    'rSoundPhysicsRigidBody::cSoundPhysicsRequestData': 0x246A7743,
-    'rSoundPhysicsRigidBody': 0x1EB3767C,
-    'rSoundPhysicsSoftBody::cSoundPhysicsRequestData': 0x51A10298,
-    'rSoundPhysicsSoftBody': 0x7BEC319A,
-    'rSoundPhysicsJoint::cSoundJointRequestData': 0x24068902,
-    'rSoundPhysicsJoint': 0x31EDC625,
-    'rShader2': 0x09E6B5F0,
-    'uLight': 0x792B46C0,
-    'uInfiniteLight': 0x5982031D,
-    'uAmbientLight': 0x7DCCE7A6,
-    'uPointLight': 0x49A43F8E,
-    'uCapsuleLight': 0x22F683F8,
-    'uSpotLight': 0x6A2EC243,
-    'uCuboidLight': 0x7DE525E7,
-    'uHemiSphereLight': 0x60C10879,
-    'uCubeMapLight': 0x24BCE4BF,
-    'uPointCubeMapLight': 0x3261DF4B,
-    'uCapsuleCubeMapLight': 0x137CB3C6,
-    'uCuboidCubeMapLight': 0x14D8E98F,
-    'uBackLight': 0x54A47FFE,
-    'sCapture': 0x612DF6E2,
-    'sGpuParticle': 0x2E804724,
-    'sKeyboard': 0x4FF829EB,
-    'sPlatformUtil': 0x114842D4,
-    'sMouse': 0x6B5D4FC7,
-    'uShadowRegion': 0x50003FDC,
-    'uPointShadowRegion': 0x46DD0428,
-    'uSpotShadowRegion': 0x6693EE7C,
-    'uCapsuleShadowRegion': 0x67C068A5,
-    'uCuboidShadowRegion': 0x606432EC,
-    'uWind': 0x28924381,
-    'uWind::WindGenerator': 0x27DCDC08,
-    'uShallowWind': 0x09C893DB,
-    'rImplicitSurface': 0x7C832B6A,
-    'uFog': 0x47FE02AC,
-    'uColorFog': 0x19E8A182,
-    'uLightScatteringFog': 0x4C335ED1,
-    'uDPEnvMap': 0x4EA2D091,
-    'uEnvMap': 0x3FA147F7,
-    'uFacial': 0x77E7B756,
-    'uOrthoCamera': 0x510228B3,
-    'uLightShaft': 0x31743660,
-    'uMirror': 0x310A60D2,
-    'uActorModel::Constraint': 0x3D9C4B1E,
-    'uActorModel': 0x4CE3C431,
-    'uModelSky': 0x1EC9902C,
-    'uModelPlaneClip': 0x1496D88C,
-    'uModelSymmetry': 0x113ADA76,
-    'uMotionCamera': 0x6AE27F28,
-    'uScreenMap': 0x64EA1111,
-    'cShadowPriorityState': 0x3623018E,
-    'sShadow::Resource': 0x5B54154D,
-    'sShadow::ViewConsistentResource': 0x2FBE769A,
-    'sShadow::ResourceGroup': 0x24FE3D31,
-    'sShadow::Node': 0x0390A969,
-    'sShadow': 0x7C0BCC8F,
-    'uTextureBlend': 0x6A7F1378,
-    'uProjectionTexture': 0x56EEB230,
-    'uProjectionShadow': 0x49935268,
-    'uProjectionEffect': 0x0A8541B7,
-    'uCameraEffect': 0x70A0F5E2,
-    'uMetaSet': 0x2D585975,
-    'uScreenSpace': 0x60F09AE5,
-    'rAIWayPointGraph::Node': 0x1AAA8680,
-    'rAIWayPointGraph::Link': 0x2979F734,
-    'rAIWayPointGraph::NodeGraph': 0x13B0A6DD,
-    'rAIWayPointGraph': 0x25FA21CB,
-    'uCnsIK::uCnsJoint': 0x070D8334,
-    'uCnsIK::JointInfo': 0x7E087781,
-    'uCnsIK': 0x477ADADA,
-    'uCnsScaleNormalize': 0x2946D6A8,
-    'uCnsRotateLimit': 0x0EB59CB3,
-    'uCnsLookAt': 0x09DEBCD6,
-    'uCnsMatrix': 0x3DB67BF2,
-    'uCnsJointOffset': 0x5107CE62,
-    'uCnsParent': 0x780B5A72,
-    'uCnsParentN::cParentNode': 0x72D96061,
-    'uCnsParentN': 0x2F1777DD,
-    'uCnsChain': 0x640E20C1,
-    'uCnsChain::cCnsChild': 0x64A5BD88,
-    'uCnsTinyChain::cChainNode': 0x4AF2141C,
-    'uCnsTinyChain::cChainGroup': 0x2DBACFE4,
-    'uCnsTinyChain': 0x2E2E90C7,
-    'rOccluder': 0x6A5CDD23,
-    'rOccluder::cQuad': 0x740641F7,
-    'sOccluder': 0x7D27C960,
-    'uOccluder': 0x0E3DB0EA,
-    'uOccluderMover': 0x437EB25F,
-    'uSoftBody': 0x0DB4743A,
-    'rDeformWeightMap': 0x69A5C538,
-    'uSimSoftBody': 0x773724E9,
-    'uVtxDisplacementCtrl': 0x4AD71F90,
-    'uISC': 0x0352D8BF,
-    'uISC::ISC': 0x7BEE2FF5,
-    'rISC': 0x1E85E006,
-    'uMirage': 0x64607234,
-    'uAmbientShadow': 0x3B8EDA79,
-    'sSavedata': 0x26AE9DAB,
-    'uGraphPatch': 0x4878F43E,
-    'sSyncPoint': 0x1C643F6B,
-    'sSyncPoint::syncPointElement': 0x6C454D60,
-    'rSky': 0x5EA7A3E9,
-    'rStarCatalog': 0x3E356F93,
-    'uSkyFog': 0x6BA87EFF,
-    'uSky': 0x43709B50,
-    'rCloud': 0x3D683C5B,
-    'uCloud': 0x206D0CE3,
-    'uCloudControl': 0x3B10AA9A,
-    'uWeather': 0x606C8AEE,
-    'uReflectionMap': 0x0163E64B,
-    'nDraw::Resource': 0x05396628,
-    'nDraw::MaterialStd': 0x5FB0EBE4,
-    'nDraw::MaterialStdEst': 0x7D2B31B3,
-    'nNetwork::SessionListener': 0x6A469AD6,
-    'cRemoteCall': 0x4CD24D24,
-    'cRemoteProcedure': 0x3F44B436,
-    'cRemoteProcedureAsync': 0x4043581F,
-    'cRemoteProcedureAsync::MsgMTFN_Async': 0x7C907717,
-    'cAIFSMLink': 0x63E6A949,
-    'cAIFSMNodeProcess': 0x609DB540,
-    'cAIFSMNode': 0x5035D8FD,
-    'cAIFSMCluster': 0x18868106,
-    'rAIFSM': 0x66B45610,
-    'rAIFSMList': 0x59EE2276,
-    'rAIFSMList::Info': 0x560D6F95,
-    'rSoundReverb': 0x232E228C,
-    'rSoundReverb::cSoundReverbData': 0x4E1ECA49,
-    'rSoundEQ': 0x2B40AE8F,
-    'rSoundEQ::cEQData': 0x52D40310,
-    'rSoundCurveSet': 0x0ECD7DF4,
-    'sScene::TextureInfo': 0x78F4208B,
-    'sScene': 0x1D1116F0,
-    'sTool': 0x262ADC0E,
-    'nDraw::RenderTargetView': 0x7E585852,
-    'nDraw::DepthStencilView': 0x61C5DF74,
-    'nDraw::Texture': 0x262D81B7,
-    'cPrim': 0x7C0B7BE8,
-    'nNetwork::Storage': 0x33E60382,
-    'sRemoteProcedure': 0x59638AA8,
-    'sRemoteProcedure::cTemporaryRemoteCall': 0x3EA2644A,
-    'nNetwork::nAchievement::Object': 0x24170508,
-    'nNetwork::VoiceChat': 0x2926F69A,
-    'nNetwork::VoiceChat::Talker': 0x2D8CFE2B,
-    'nNetwork::nRanking::Object': 0x6D87005E,
-    'nNetwork::nRanking::Object::StateBase': 0x4B9A365C,
-    'nNetwork::SessionDriver': 0x50402394,
-    'nNetwork::SessionDatabase': 0x3689A8DA,
-    'nNetwork::Session': 0x37D8CD62,
-    'nDraw::ExternalRegion': 0x37AA37A4,
-    'sBenchmark::BenchmarkInfo': 0x53F155D9,
-    'sBenchmark': 0x52FF77E1,
-    'nDraw::VertexBuffer': 0x7896F970,
-    'nDraw::IndexBuffer': 0x04C94B3D,
-    'nDraw::Query': 0x36450705,
-    'nDraw::OcclusionQuery': 0x406C27FC,
-    'nDraw::Scene': 0x4B815D34,
-    'nDraw::Buffer': 0x247828B2,
-    'cWind': 0x473221A3,
-    'rEffect2D': 0x276DE8B7,
-    'rEffectAnim': 0x4E397417,
-    'rEffectStrip': 0x02833703,
-    'rVertices': 0x1AE50150,
-    'rNulls': 0x727C7279,
-    'uEffect2D': 0x430C857E,
-    'uSimpleEffect': 0x3D52F96F,
-    'uEffectEmitter': 0x42412AD7,
-    'uMultiFilter': 0x70B6CA24,
-    'uMultiBlurFilter': 0x002B7F3C,
-    'uMultiGodRaysFilter': 0x21BEEFA6,
-    'uMultiColorCorrectFilter': 0x3C9BC06D,
-    'uMultiBloomFilter': 0x315ECCA9,
-    'CoprocessorObject': 0x6D5941C5,
-    'nDraw::MaterialNull': 0x0854D484,
-    'nDraw::CommandCache': 0x0AF5188C,
-    'rMaterial': 0x2749C8A8,
-    'nCollision::cAllocaterIntermediate': 0x4E69163E,
-    'nCollision::cScrCommonFilter': 0x26213251,
-    'nCollision::cScrCollisionMoveMatrix': 0x33C3EFB0,
-    'nCollision::uPreviewModel': 0x12F8D464,
-    'nCollisionUtil::cOwnerSystem': 0x3923B05F,
-    'cGeomConvexHull': 0x21828CA0,
-    'rConvexHull': 0x1EF5E639,
-    'cDynamicBVHCollision::Node': 0x5F78F725,
-    'cDynamicBVHCollision': 0x11ED3ABD,
-    'rCollisionHeightField': 0x6158A4A8,
-    'cBVHCollision::cWorkBuildOnlineFast': 0x724DA3EA,
-    'cBVHCollision': 0x3DB9C302,
-    'sCollision::ScrCollisionInfoBase': 0x0FF88A5A,
-    'sCollision::ScrCollisionInfo': 0x2FEF117C,
-    'sCollision::ScrCollisionInfoFind': 0x06E2103F,
-    'sCollision::ScrCollisionInfoCastConvex': 0x6FD96CF3,
-    'sCollision::ScrCollisionInfoAdjustPosition': 0x33CB93A0,
-    'sCollision::ScrCollisionInfoGetAreaPoly': 0x16C3E84A,
-    'sCollision::ScrCollisionInfoOriginal': 0x2DF3CF9D,
-    'sCollision::ScrCollisionInfoPreTraverse': 0x189DA90B,
-    'sCollision::ScrCollisionInfoFind4': 0x17D43B98,
-    'sCollision::cSbcArrayBP::cDBVTMaster': 0x1E744687,
-    'sCollision::cSbcArrayBP': 0x69708D8D,
-    'sCollision::Sbc::Parts': 0x5A2E584C,
-    'sCollision::Sbc': 0x21359C2A,
-    'sCollision::SbcObject::cRegisterInfo': 0x0216607F,
-    'sCollision::SbcObject': 0x334DDCFC,
-    'sCollision::cSbcSkinMesh::cRegisterInfo': 0x097B7A83,
-    'sCollision::cSbcSkinMesh': 0x0BF2A44A,
-    'sCollision::cSbcHeightField::cHeightField': 0x6634BDF3,
-    'sCollision::cSbcHeightField': 0x217D9560,
-    'sCollision::cSbcMoveReserveInfoAll': 0x05D4C4EF,
-    'sCollision::cSbcMoveReserveInfo': 0x4EF19179,
-    'sCollision::cSbcMoveResetReserveInfoAll': 0x0525BF55,
-    'sCollision::cSbcMoveResetReserveInfo': 0x0329BA31,
-    'sCollision::cSbcRegistReserveInfo': 0x674D6873,
-    'rCollision': 0x51FC779F,
-    'rCollisionObj::cPartsData': 0x4835674D,
-    'rCollisionObj': 0x2350E584,
-    'cGridCollision': 0x1AD71D56,
-    'rSoundBank': 0x15D782FB,
-    'rSoundSource': 0x64A34520,
-    'rSoundSourcePC': 0x465CB860,
-    'rSoundSourceMSADPCM': 0x724DF879,
-    'rSoundSourceOggVorbis': 0x255D51CD,
-    'cSoundMultiBandEQ': 0x329D963D,
-    'rSoundSpeakerSetXml': 0x064A3AD8,
-    'cParticleManager': 0x7A827C0C,
-    'cParticleNode': 0x6E7799F6,
-    'cParticleNodeInfinite': 0x0F37245A,
-    'cParticleGenerator': 0x0072DA84,
-    'cEffectUnitGenerator': 0x725034E7,
-    'cParticleGeneratorBillboard': 0x45075F6E,
-    'cParticleGeneratorBillboardStrip': 0x158CE421,
-    'cParticleGeneratorSizeBillboard': 0x487A14A0,
-    'cParticleGeneratorLiteBillboard': 0x097B4C49,
-    'cParticleGeneratorPolyline': 0x4D54925E,
-    'cParticleGeneratorLitePolyline': 0x5857EB7F,
-    'cParticleGeneratorPolygon': 0x599B85F7,
-    'cParticleGeneratorClothPolygon': 0x7A666120,
-    'cParticleGeneratorAdhesion': 0x47706084,
-    'cParticleGeneratorAxisPolygon': 0x646CD7F1,
-    'cParticleGeneratorLitePolygon': 0x00CFEDAA,
-    'cParticleGeneratorTexline': 0x7ABFD1AE,
-    'cParticleGeneratorLine': 0x2F4E4E2A,
-    'cParticleGeneratorModel': 0x0A8C5951,
-    'cParticleGeneratorPrimModel': 0x3186927C,
-    'cParticleGeneratorLensFlare': 0x6E862668,
-    'cParticleGeneratorMassBillboard': 0x516A071E,
-    'cParticleGeneratorFilter': 0x4EF8A2A9,
-    'cParticleGeneratorLight': 0x3603777F,
-    'cParticleGeneratorHit': 0x3E3E376A,
-    'cParticleGeneratorPolygonStrip': 0x298E7C3F,
-    'cParticleGeneratorCustom': 0x44B8EB2F,
-    'cParticleGeneratorLightShaft': 0x2ACB72F3,
-    'cParticleGeneratorPoint': 0x6ABCD8AC,
-    'cParticleGeneratorForce': 0x4A71A8A0,
-    'cParticleGeneratorTrail': 0x6F71AE07,
-    'rConstraint': 0x27AB4075,
-    'rGrassWind': 0x0437BCF2,
-    'rGrassWind::cParamSet': 0x298E79A3,
-    'uDynamicSbc': 0x5CAD6F55,
-    'uScrollCollisionGeometry::cGeometryInfo': 0x66540C1A,
-    'uScrollCollisionGeometry': 0x2199744B,
-    'nAI::TaskPerformanceInfo': 0x12BB3956,
-    'nAI::TaskPerformanceInfo::LOD': 0x0058F667,
-    'cAITask': 0x1A223E0F,
-    'cAITaskJobPrim': 0x40ABA692,
-    'cAITaskJobPrimList': 0x342DA475,
-    'rAI': 0x31A91DA3,
-    'rAI::TaskPerformanceInfo': 0x56DBE48A,
-    'rAI::TaskPerformanceInfo::LOD': 0x7F22DC11,
-    'cAIService': 0x6AD29A48,
-    'cAIConditionTreeNode': 0x3D2F51F7,
-    'cAIConditionTree': 0x3011C92D,
-    'cAIConditionTree::TreeInfo': 0x1BF4EAB6,
-    'cAIConditionTree::OperationWorkNode': 0x6EEDC18B,
-    'cAIConditionTree::ConstWorkNode': 0x51A80B30,
-    'cAIConditionTree::ConstEnumWorkNode': 0x565DE033,
-    'cAIConditionTree::VariableWorkNode': 0x4CD105C1,
-    'cAISvFSM': 0x52992A34,
-    'cAISvFSM::FSMInfo': 0x568283E5,
-    'cPrimObj': 0x7D82B3CF,
-    'cPrimTagList': 0x1054BF40,
-    'cPrimTexHandleManager': 0x3182EEB2,
-    'cPrimTagManager': 0x214B855A,
-    'cPrimBufferManager': 0x5DC78998,
-    'cBlendState': 0x09C1C5CE,
-    'nDraw::BlendState': 0x6645D200,
-    'nDraw::RasterizerState': 0x15386913,
-    'nDraw::DepthStencilState': 0x2C661E00,
-    'nDraw::InputLayout': 0x459E980F,
-    'nDraw::SamplerState': 0x274D62E1,
-    'rShaderCache': 0x294E9E8A,
-    'nNetwork::Context': 0x05C19DC8,
-    'nNetwork::BlockPool': 0x40693273,
-    'nNetwork::BlockBuffer': 0x7E95D2C1,
-    'nNetwork::BlockQueue': 0x60476EE6,
-    'nNetwork::Callback': 0x099E110A,
-    'nNetwork::Callback::Entry': 0x17AD750E,
-    'nNetwork::Callback::Queue': 0x4371971D,
-    'BitIO': 0x49E0D383,
-    'nNetwork::nSharedMemory2::CNode': 0x798B44D5,
-    'nNetwork::nSharedMemory2::CConsistentHash': 0x2555700F,
-    'nNetwork::nSharedMemory2::CProtocol': 0x2DC53F5E,
-    'nNetwork::nSharedMemory2::Object': 0x329D27C7,
-    'nNetwork::nSharedMemory2::CRecord': 0x74CC9443,
-    'rFacialAnimation': 0x07B8BCDE,
-    'rMetaSet': 0x279D506C,
-    'rMetaSetXml::ObjectData': 0x0E7C72A5,
-    'rMetaSetXml': 0x0330C7DF,
-    'cAIPacket': 0x4293A408,
-    'cAIPacketList': 0x717D2F2C,
-    'cAIPacketQueue': 0x0CFED18C,
-    'cAIGraph': 0x00347F62,
-    'cAIGraph::Node': 0x0B8EAA32,
-    'cAIGraph::Area': 0x59657F1F,
-    'cAIAStar': 0x23ACF968,
-    'cAITreeBase': 0x3CB5B341,
-    'cAITreeBase::Node': 0x3FF20E5A,
-    'cAIQuadTree': 0x608948B0,
-    'rCnsIK::JointInfo': 0x5E9A0BCA,
-    'rCnsIK': 0x5A7FEA62,
-    'rCnsScaleNormalize': 0x4868DCCC,
-    'rCnsRotateLimit': 0x15B493A9,
-    'rCnsLookAt': 0x6B02A7AF,
-    'rCnsMatrix': 0x5F6A608B,
-    'rCnsJointOffset': 0x4A06C178,
-    'rCnsParent': 0x1AD7410B,
-    'uCnsSkeleton::cCnsChild': 0x23A33A26,
-    'uCnsSkeleton::cNode': 0x7EA1C56F,
-    'uCnsSkeleton': 0x30E56F5C,
-    'rCnsParentN': 0x062C625E,
-    'uCnsGroup::cNode': 0x0AD1B7D5,
-    'uCnsGroup::cGroup': 0x4FC29653,
-    'uCnsGroup::cCnsChild': 0x13F66715,
-    'uCnsGroup': 0x38CC7CCE,
-    'rCnsTinyChain': 0x535D969F,
-    'uGrassWind': 0x66EBA78B,
-    'uGrassWind::cSwingParameters': 0x07FA0E53,
-    'uGrassWindDirection': 0x5F803DCB,
-    'uGrassWindPoint': 0x0B5FE029,
-    'uGrassWindLine': 0x42EED361,
-    'uGrassWindGlobal': 0x440AE2A0,
-    'rGraphPatch': 0x6143E1BD,
-    'nAI::LocalPropertyList': 0x701DB53B,
-    'nAI::EnumObject': 0x2934CACD,
-    'nAI::EnumProp': 0x68328AAC,
-    'cAIDEnum': 0x2C29825D,
-    'rAIConditionTreeNode': 0x388EC194,
-    'rAIConditionTree': 0x785E6622,
-    'rAIConditionTree::OperationNode': 0x1C328079,
-    'rAIConditionTree::StateNode': 0x7954D98C,
-    'rAIConditionTree::VariableNode': 0x3D9510A8,
-    'rAIConditionTree::VariableNode::VariableInfo': 0x3E1F9629,
-    'rAIConditionTree::ConstS32Node': 0x3280309B,
-    'rAIConditionTree::ConstS64Node': 0x6D0D5488,
-    'rAIConditionTree::ConstF32Node': 0x076683F2,
-    'rAIConditionTree::ConstF64Node': 0x58EBE7E1,
-    'rAIConditionTree::ConstStringNode': 0x5EC17F62,
-    'rAIConditionTree::ConstEnumNode': 0x3B9D960B,
-    'rAIConditionTree::TreeInfo': 0x56BB1759,
-    'uGrassEffect': 0x01456AF8,
-    'cStateMachineBase::StateBase': 0x29C19CCC,
-    'nNetwork::SearchKeyPtr': 0x26EC282D,
-    'nNetwork::SearchKeyListPtr': 0x7697A150,
-    'nNetwork::SearchFilterPtr': 0x0F2BEFDD,
-    'nNetwork::SearchFilterListPtr': 0x4FA06DF7,
-    'nNetwork::UpdaterPtr': 0x26AA4D21,
-    'nNetwork::ScoreOptionPtr': 0x7F59BB1D,
-    'nNetwork::TagChecker': 0x43288400,
-    'nNetwork::TagChecker::RpcSyncReq': 0x5C34DFC5,
-    'nNetwork::TagChecker::RpcSyncAns': 0x4FAE7A0B,
-    'nNetwork::RpcNetSystem_TryConnect': 0x3E926E9B,
-    'nNetwork::RpcNetSystem_ReqDetour': 0x665443AF,
-    'nNetwork::RpcNetSystem_AnsDetour': 0x39EC3064,
-    'nNetwork::RpcNetSystem_RouteKey': 0x75B10DEF,
-    'nNetwork::RpcNetSystem_RouteKeyAck': 0x4E9E0DFC,
-    'nNetwork::RpcNetSystem_LinkState': 0x0CA2406D,
-    'nNetwork::RpcNetSystem_Core': 0x3DDC4535,
-    'nNetwork::RpcNetSystem_HealthCheck': 0x1266DC19,
-    'nNetwork::RpcNetSystem_Leave': 0x7934A6BF,
-    'nNetwork::RpcNetSystem_Entry': 0x49A5BB1F,
-    'nNetwork::RpcNetSystem_Match': 0x18DFE36A,
-    'nNetwork::RpcNetSystem_Terminate': 0x6E07B730,
-    'nNetwork::RpcNetSystem_Config': 0x5BE7381E,
-    'nNetwork::Connect': 0x1353E1A9,
-    'nNetwork::Route': 0x3127B9BD,
-    'nNetwork::Member': 0x3EDCF0C5,
-    'nNetwork::Match': 0x49B85CC1,
-    'nNetwork::Transport': 0x0681C525,
-    'nNetwork::Transport::ForwardQueue': 0x1F3FD829,
-    'nNetwork::Protocol': 0x38A7D960,
-    'nNetwork::ProtocolStandard': 0x775B5E84,
-    'nNetwork::ProtocolStandard::Queue': 0x4F430E0F,
-    'nNetwork::ProtocolMinimum': 0x02506161,
-    'nNetwork::ProtocolBroadcast': 0x501D6E4B,
-    'nDraw::MaterialSSS': 0x3DC8FC8E,
-    'nDraw::MaterialStdPN': 0x2615636B,
-    'nDraw::MaterialStdDM': 0x11B2E584,
-    'nDraw::MaterialConstant': 0x23823D1B,
-    'uGeometry2': 0x33A9D93B,
-    'uGeometry3': 0x44AEE9AD,
-    'uGeometry2Collider::cContactInfo': 0x7D8CEB43,
-    'uGeometry2Collider::cNodeGeometryInfo': 0x564820FD,
-    'uGeometry2Collider': 0x68077325,
-    'uGeometry2Group': 0x454CE087,
-    'uGeometry2GroupCollider': 0x55587F80,
-    'uScrollCollisionGeometryModel': 0x5ED6FA84,
-    'uScrollCollisionGeometryGroupModel': 0x54FA049E,
-    'uScrollCollisionSbc': 0x24E6FDAF,
-    'cColliderNodeParam': 0x6772D35D,
-    'cColliderGeometryParam': 0x58E0BBE8,
-    'sDLC': 0x63BB1AAE,
-    'uAdhesion': 0x7A9A76AE,
-    'uSynchroModel': 0x62377681,
-    'uSynchroGrassWindPoint': 0x3B8DC0B2,
-    'uSynchroGrassWindDirection': 0x185B8ABF,
-    'uSynchroGrassWindLine': 0x2531A18E,
-    'uSynchroAdhesion': 0x04560735,
-    'uSynchroPointLight': 0x7C13D339,
-    'uSynchroSpotLight': 0x0D0D44FE,
-    'uSynchroLightShaft': 0x04C3DAD7,
-    'rDynamicSbc': 0x75967AD6,
-    'uScrollCollision': 0x776D9118,
-    'rGeometry2::cGeometry': 0x5B118136,
-    'rGeometry2::cGeometryArray': 0x19C0E70E,
-    'rGeometry2': 0x5175C242,
-    'rGeometry3': 0x2672F2D4,
-    'nCollision::cScrGeometryParam': 0x01144469,
-    'nCollision::cScrGeometryGroupParam': 0x3A212D6C,
-    'cMetaSetPropertyData': 0x05A58C51,
-    'nGraphComponent::Base': 0x54FC9262,
-    'nGraphComponent::Edge': 0x614EBF65,
-    'nGraphComponent::Filter': 0x5134A71A,
-    'nGraphComponent::Color': 0x2DC9BEB2,
-    'nGraphComponent::Variable': 0x71B3576B,
-    'nGraphComponent::Add': 0x5E278448,
-    'nGraphComponent::Sub': 0x7B3F7573,
-    'nGraphComponent::Mul': 0x0A3FD60E,
-    'nGraphComponent::Div': 0x1EFB49A6,
-    'nGraphComponent::Oscillator': 0x2AD42DB5,
-    'nGraphComponent::BaseMap': 0x688E7CFC,
-    'uGeometry2Base': 0x24A599EA,
-    'rGeometry2Group': 0x5E4DEF9D,
-    'MtPerformanceCounter': 0x4F3C7D65,
-    'MtPerformance': 0x42AA5A99,
-    'MtPerformanceTimer': 0x03355995,
-    'MtGeomAABB': 0x30C5FA11,
-    'MtCollisionUtil::MtDtiObject': 0x113DFED1,
-    'MtCollisionUtil::MtDtiSelecterIntermediate': 0x6165159E,
-    'MtCollisionUtil::MtDtiSelecter': 0x5C4DCC7D,
-    'MtCollisionUtil::MtArrayElement': 0x4407637B,
-    'MtCollisionUtil::MtArrayEx': 0x13AE871E,
-    'MtCollisionUtil::MtDataBuffer': 0x739EE5D9,
-    'MtCollisionUtil::MtFuncBase': 0x7D68E873,
-    'MtCollisionUtil::MtFunc': 0x6FF6DDE7,
-    'MtCollisionUtil::MtFunc32': 0x55E11004,
-    'MtCollisionUtil::MtFunc32X2': 0x436E865D,
-    'MtCollisionUtil::MtFuncPtr': 0x5501A8E3,
-    'MtCollisionUtil::MtFuncPtr32': 0x11E2EA44,
-    'MtCollisionUtil::MtListElement': 0x46927FD6,
-    'MtCollisionUtil::MtList': 0x69C88E4C,
-    'MtCollisionUtil::MtTreeDTI': 0x555EBD5B,
-    'MtGeomLineSegment': 0x031F8368,
-    'MtGeomOBB': 0x34D14DF1,
-    'MtGeomCylinder': 0x4DA2AC5E,
-    'MtGeomTriangle': 0x09319A33,
-    'MtGeomLineSweptSphere': 0x3F3305F5,
-    'MtThread': 0x372CEB84,
-    'MtGeomAABB4': 0x4BB411BD,
-    'MtFCurve::Key': 0x5C4D7A1A,
-    'MtFCurve': 0x39196F4D,
-    'MtGeomRay': 0x2F8DE397,
-    'MtGeomRayY': 0x7CF36254,
-    'MtGeomLineSegment4': 0x62DE025C,
-    'MtDtiSelecter': 0x34BC3DBB,
-    'MtGeomLine': 0x68CAEB51,
-    'MtGeomPlane': 0x5B3A2A19,
-    'MtGeomPlaneXZ': 0x39675442,
-}
+DATABASE_VERSION = 1
+DATABASE_PATH = os.path.join( os.path.dirname( os.path.realpath( __file__ ) ), 'res', 'mvc3types.pickle' )
+
+_typeNameByHash: Dict[int, str] = None
+_typeHashByName: Dict[str, int] = None
+
+def saveDatabase( typeNameByHash, path=DATABASE_PATH ):
+    '''Saves the given type names to the precompiled database file'''
+
+    with open( path, 'wb' ) as f:
+        pickle.dump( ( DATABASE_VERSION, dict( typeNameByHash ) ), f, protocol=4 )
+
+def _load():
+    global _typeNameByHash, _typeHashByName
+
+    with open( DATABASE_PATH, 'rb' ) as f:
+        version, typeNameByHash = pickle.load( f )
+    if version != DATABASE_VERSION:
+        raise Exception( f'unsupported type database version {version}: {DATABASE_PATH}' )
+
+    _typeHashByName = { name: hashVal for hashVal, name in typeNameByHash.items() }
+    _typeNameByHash = typeNameByHash
+
+def getTypeNameByHash() -> Dict[int, str]:
+    if _typeNameByHash is None:
+        _load()
+    return _typeNameByHash
+
+def getTypeHashByName() -> Dict[str, int]:
+    if _typeHashByName is None:
+        _load()
+    return _typeHashByName
+
+def __getattr__( name ):
+    # tables are loaded on first access
+    if name == 'typeNameByHash':
+        return getTypeNameByHash()
+    elif name == 'typeHashByName':
+        return getTypeHashByName()
+    raise AttributeError( f"module '{__name__}' has no attribute '{name}'" )
 
 def getTypeName( hashVal: int ):
+    typeNameByHash = getTypeNameByHash()
     if hashVal in typeNameByHash:
         return typeNameByHash[hashVal]
     else:
@@ -5958,4 +61,4 @@ def getTypeHash( name: str ):
         # fallback
         return int(name[3:], base=16)
     else:
-        return typeHashByName[ name ]
\ No newline at end of file
+        return getTypeHashByName()[ name ]
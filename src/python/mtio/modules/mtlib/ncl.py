@@ -4,6 +4,8 @@ Wraps types in an interface mirroring that of Noesis' types.
 '''
 import struct
 import math
+import array
+import sys
 import libtarget
 
 def nclTupleToList( tup ):
@@ -18,6 +20,7 @@ class Endian:
     LITTLE = 0
     BIG = 1
     STRUCT_FORMAT = ['<', '>']
+    NATIVE = LITTLE if sys.byteorder == 'little' else BIG
 
 if not libtarget.noesis:
     import glm
@@ -120,6 +123,9 @@ if not libtarget.noesis:
     def nclMultiply( mtxL, mtxR ):
         return mtxR * mtxL
         
+    # precompiled struct formats shared by all streams, per endian
+    _nclStructCache = [ {}, {} ]
+    
     class NclBitStream:
         def __init__( self, buffer = None, endian = Endian.LITTLE ):
             self.buffer = buffer
@@ -127,6 +133,9 @@ if not libtarget.noesis:
             self.offset = 0
             self.capacity = 0
             self.setEndian( endian )
+            
+            # streams over a memoryview (eg. a mapped file) are read-only, and readBytes returns views into it
+            self.readOnly = isinstance( buffer, memoryview )
 
             if self.buffer != None:
                 self.size = len( self.buffer )
@@ -137,27 +146,57 @@ if not libtarget.noesis:
                 self.capacity = len( self.buffer )
                 
         def _ensureCapacity( self, size ):
+            if self.readOnly:
+                raise IOError( "Attempted to write to a read-only stream" )
+            
             while self.offset + size > self.capacity:
                 oldCapacity = self.capacity
                 self.capacity *= 2
-                self.buffer.extend([0] * ( self.capacity - oldCapacity ) )
+                self.buffer.extend( bytes( self.capacity - oldCapacity ) )
+                
+        def _getStruct( self, fmt ):
+            s = self.structs.get( fmt )
+            if s is None:
+                s = struct.Struct( self.endianFmt + fmt )
+                self.structs[ fmt ] = s
+            return s
             
         def _writeArray( self, size, fmt, *data ):
             self._ensureCapacity( size )
-            struct.pack_into( self.endianFmt + fmt, self.buffer, self.offset, *data )
+            self._getStruct( fmt ).pack_into( self.buffer, self.offset, *data )
             self.offset += size
             self.size = max( self.size, self.offset )
             
         def _write( self, size, fmt, data ):
             self._ensureCapacity( size )
-            struct.pack_into( self.endianFmt + fmt, self.buffer, self.offset, data )
+            self._getStruct( fmt ).pack_into( self.buffer, self.offset, data )
             self.offset += size
             self.size = max( self.size, self.offset )
             
         def _read( self, size, fmt ):
-            data = struct.unpack_from( self.endianFmt + fmt, self.buffer, self.offset )
+            data = self._getStruct( fmt ).unpack_from( self.buffer, self.offset )
             self.offset += size
             return data
+        
+        def _readBulk( self, typeCode, count ):
+            values = array.array( typeCode )
+            size = values.itemsize * count
+            if self.offset + size > self.size:
+                raise struct.error( "unpack_from requires a buffer of at least {} bytes".format( self.offset + size ) )
+            values.frombytes( self.buffer[ self.offset : self.offset + size ] )
+            if self.endian != Endian.NATIVE:
+                values.byteswap()
+            self.offset += size
+            return values.tolist()
+        
+        def _writeBulk( self, values ):
+            if self.endian != Endian.NATIVE:
+                values.byteswap()
+            size = values.itemsize * len( values )
+            self._ensureCapacity( size )
+            self.buffer[ self.offset : self.offset + size ] = values.tobytes()
+            self.offset += size
+            self.size = max( self.size, self.offset )
                 
         def getBuffer( self ):
             if self.capacity > self.size:
@@ -177,12 +216,17 @@ if not libtarget.noesis:
         def setEndian( self, endian ):
             self.endian = endian
             self.endianFmt = Endian.STRUCT_FORMAT[ self.endian ]
+            self.structs = _nclStructCache[ self.endian ]
             
         def checkEOF( self ):
             return self.getOffset() >= self.getSize()
         
         def writeBytes( self, data ):
-            self._writeArray( len(data), "B" * len(data), *data )
+            size = len( data )
+            self._ensureCapacity( size )
+            self.buffer[ self.offset : self.offset + size ] = data
+            self.offset += size
+            self.size = max( self.size, self.offset )
                 
         def writeByte( self, data ):
             self._ensureCapacity( 1 )
@@ -220,7 +264,18 @@ if not libtarget.noesis:
             self._write( 8, "d", data )
             
         def readBytes( self, count ):
-            return bytes( self._read( count, "B" * count ) )
+            if self.readOnly:
+                if self.offset + count > self.size:
+                    raise struct.error( "unpack_from requires a buffer of at least {} bytes".format( self.offset + count ) )
+                view = self.buffer[ self.offset : self.offset + count ]
+                self.offset += count
+                return view
+            
+            if self.offset + count > self.size:
+                raise struct.error( "unpack_from requires a buffer of at least {} bytes".format( self.offset + count ) )
+            data = bytes( self.buffer[ self.offset : self.offset + count ] )
+            self.offset += count
+            return data
             
         def readBool( self ):
             return self._read( 1, "B" )[0] != 0
@@ -255,6 +310,22 @@ if not libtarget.noesis:
         def readUInt64( self ):
             return self._read( 8, "Q" )[0]
         
+        def readFloats( self, count ):
+            return self._readBulk( 'f', count )
+        
+        def readUShorts( self, count ):
+            return self._readBulk( 'H', count )
+        
+        def writeFloats( self, values ):
+            self._writeBulk( array.array( 'f', values ) )
+        
+        def writeUShorts( self, values ):
+            try:
+                values = array.array( 'H', values )
+            except OverflowError:
+                values = array.array( 'H', [ x & 0xFFFF for x in values ] )
+            self._writeBulk( values )
+            
         def readString( self ):
             buffer = bytearray()
             b = self.readByte()
@@ -419,7 +490,8 @@ def readVec4( self ):
     return NclVec4( ( self.readFloat(), self.readFloat(), self.readFloat(), self.readFloat() ) )
 
 def readMat44( self ):
-    return nclCreateMat44( ( self.readVec4(), self.readVec4(), self.readVec4(), self.readVec4() ) )
+    v = self.readFloats( 16 )
+    return nclCreateMat44( ( NclVec4( tuple( v[0:4] ) ), NclVec4( tuple( v[4:8] ) ), NclVec4( tuple( v[8:12] ) ), NclVec4( tuple( v[12:16] ) ) ) )
 
 def readMat43( self ):
     return nclCreateMat43( ( self.readVec3(), self.readVec3(), self.readVec3(), self.readVec3() ) )
@@ -436,8 +508,26 @@ NclBitStream.readVec4 = readVec4
 NclBitStream.readMat44 = readMat44
 NclBitStream.readMat43 = readMat43
 
+def readFloats( self, count ):
+    return [ self.readFloat() for i in range( count ) ]
+
+def readUShorts( self, count ):
+    return [ self.readUShort() for i in range( count ) ]
+
+def writeFloats( self, values ):
+    for value in values:
+        self.writeFloat( value )
+        
+def writeUShorts( self, values ):
+    for value in values:
+        self.writeUShort( value )
+
 if libtarget.noesis:
     # bind extensions to NoeBitStream as well
+    NoeBitStream.readFloats = readFloats
+    NoeBitStream.readUShorts = readUShorts
+    NoeBitStream.writeFloats = writeFloats
+    NoeBitStream.writeUShorts = writeUShorts
     NoeBitStream.writeVec2 = writeVec2
     NoeBitStream.writeVec3 = writeVec3
     NoeBitStream.writeVec4 = writeVec4
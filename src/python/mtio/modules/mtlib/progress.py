@@ -0,0 +1,154 @@
+'''
+Throttled, hierarchical progress reporting for long running conversions.
+
+A ProgressReporter forwards progress to a callback that takes ( depth, what, value, count ), where depth is the
+nesting level of the stage being reported. Stages are opened with stage() and nest under the innermost stage that
+is still open, so eg. the per vertex work of a primitive reports as a sub stage of the mesh being processed.
+Updates are only forwarded once the value advanced by a minimum percentage, and at most once per interval for
+each depth, so that updating from an inner loop stays cheap even when the callback goes through an editor UI.
+Stages always report when they begin at the top level and when they end. An optional refresh callback, eg. to let the
+editor redraw, is called after emitted reports at most once per interval, and for every top level report.
+'''
+
+import time
+
+class NullProgress:
+    '''Progress handle that ignores all updates. Used when no progress callback is attached.'''
+
+    def stage( self, what, count = 0 ):
+        return self
+
+    def update( self, value ):
+        pass
+
+    def advance( self, step = 1 ):
+        pass
+
+    def done( self ):
+        pass
+
+    def __bool__( self ):
+        return False
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, *args ):
+        pass
+
+NULL_PROGRESS = NullProgress()
+
+class ProgressStage:
+    '''Handle to a single stage of work, with count steps. If count is 0, the value is a percentage instead.'''
+
+    __slots__ = ( 'reporter', 'parent', 'what', 'count', 'depth', 'value', '_step', '_nextValue' )
+
+    def __init__( self, reporter, parent, what, count ):
+        self.reporter = reporter
+        self.parent = parent
+        self.what = what
+        self.count = count
+        self.depth = parent.depth + 1 if parent is not None else 0
+        self.value = 0
+        self._step = max( 1, count * reporter.minPercentStep / 100 ) if count > 0 else reporter.minPercentStep
+        self._nextValue = self._step
+
+    def stage( self, what, count = 0 ):
+        '''Opens a sub stage of this stage'''
+        return self.reporter._begin( self, what, count )
+
+    def update( self, value ):
+        self.value = value
+        if value >= self._nextValue:
+            self._nextValue = value + self._step
+            self.reporter._report( self, False )
+
+    def advance( self, step = 1 ):
+        self.update( self.value + step )
+
+    def done( self ):
+        '''Closes the stage, along with any of its sub stages that were left open'''
+        self.value = self.count if self.count > 0 else 100
+        self.reporter._end( self )
+
+    def __bool__( self ):
+        return True
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, *args ):
+        self.done()
+
+class ProgressReporter:
+    '''Forwards progress of nested stages to a callback, throttled by time and percentage.'''
+
+    def __init__( self, callback, minInterval = 0.1, minPercentStep = 1.0, refresh = None ):
+        self.callback = callback
+        self.refresh = refresh
+        self.minInterval = minInterval
+        self.minPercentStep = minPercentStep
+        self._stack = []
+        self._lastTimes = []
+        self._lastRefreshTime = None
+
+    @property
+    def current( self ):
+        '''The innermost stage that is still open, or None'''
+        return self._stack[-1] if len( self._stack ) > 0 else None
+
+    def stage( self, what, count = 0 ):
+        '''Opens a stage under the innermost stage that is still open'''
+        return self._begin( self.current, what, count )
+
+    def reset( self ):
+        self._stack = []
+        self._lastTimes = []
+        self._lastRefreshTime = None
+
+    def _begin( self, parent, what, count ):
+        if parent is not None and parent in self._stack:
+            del self._stack[ self._stack.index( parent ) + 1: ]
+        else:
+            self._stack = []
+
+        stage = ProgressStage( self, parent, what, count )
+        self._stack.append( stage )
+        # top level stages are always shown, as they change rarely
+        self._report( stage, stage.depth == 0 )
+        return stage
+
+    def _end( self, stage ):
+        if stage in self._stack:
+            del self._stack[ self._stack.index( stage ): ]
+        # always show the final value, so that a stage is never left displayed as unfinished
+        self._report( stage, True )
+
+    def _report( self, stage, force ):
+        depth = stage.depth
+        while len( self._lastTimes ) <= depth:
+            self._lastTimes.append( None )
+
+        now = time.perf_counter()
+        lastTime = self._lastTimes[ depth ]
+        if force or lastTime is None or now - lastTime >= self.minInterval:
+            self._lastTimes[ depth ] = now
+            self.callback( depth, stage.what, stage.value, stage.count )
+            
+            if self.refresh is not None and \
+                ( depth == 0 or self._lastRefreshTime is None or now - self._lastRefreshTime >= self.minInterval ):
+                self._lastRefreshTime = now
+                self.refresh()
+
+def beginProgress( progress, what, count = 0 ):
+    '''
+    Opens a stage for the given progress argument, which may be None, a ProgressReporter or stage,
+    or a legacy callback that takes ( what, value, count ).
+    '''
+    if progress is None:
+        return NULL_PROGRESS
+    elif isinstance( progress, ( ProgressReporter, ProgressStage, NullProgress ) ):
+        return progress.stage( what, count )
+    else:
+        callback = progress
+        return ProgressReporter( lambda depth, what, value, count: callback( what, value, count ) ).stage( what, count )
@@ -2,6 +2,8 @@
 Classes and functions for serializing MRL material libraries.
 '''
 
+import array
+import struct
 import yaml
 from collections import namedtuple
 from ncl import NclBitStream
@@ -109,129 +111,74 @@ class rMaterialCmdInfo:
     def setValue( self, val ):
         self.value = val
         
-class rMaterialCBMaterial:
-    def __init__( self ):
-        self.field00 = 0.3471069931983948
-        self.field04 = 0.3471069931983948
-        self.field08 = 0.3471069931983948
-        self.field0c = 1.0
-        
-        self.field10 = 1.0
-        self.field14 = 1.0
-        self.field18 = 1.0
-        self.field1c = 10.0
-        
-        self.field20 = 1.0
-        self.field24 = -0.0
-        self.field28 = 0.0
-        self.field2c = 5.0
-        
-        self.field30 = 0.0
-        self.field34 = 1.0
-        self.field38 = 0.0
-        self.field3c = 0.0
-        
-        self.field40 = 1.0
-        self.field44 = 0.0
-        self.field48 = 0.0
-        self.field4c = 0.0
-        
-        self.field50 = 0.0
-        self.field54 = 1.0
-        self.field58 = 0.0
-        self.field5c = 0.0
-        
-        self.field60 = 1.0
-        self.field64 = 0.0
-        self.field68 = 0.0
-        self.field6c = 0.0
-        
-        self.field70 = 0.0
-        self.field74 = 1.0
-        self.field78 = 0.0
-        self.field7c = 0.0
-        
-    def read( self, stream ):
-        self.field00 = stream.readFloat()
-        self.field04 = stream.readFloat()
-        self.field08 = stream.readFloat()
-        self.field0c = stream.readFloat()
-        
-        self.field10 = stream.readFloat()
-        self.field14 = stream.readFloat()
-        self.field18 = stream.readFloat()
-        self.field1c = stream.readFloat()
-        
-        self.field20 = stream.readFloat()
-        self.field24 = stream.readFloat()
-        self.field28 = stream.readFloat()
-        self.field2c = stream.readFloat()
-        
-        self.field30 = stream.readFloat()
-        self.field34 = stream.readFloat()
-        self.field38 = stream.readFloat()
-        self.field3c = stream.readFloat()
-        
-        self.field40 = stream.readFloat()
-        self.field44 = stream.readFloat()
-        self.field48 = stream.readFloat()
-        self.field4c = stream.readFloat()
-        
-        self.field50 = stream.readFloat()
-        self.field54 = stream.readFloat()
-        self.field58 = stream.readFloat()
-        self.field5c = stream.readFloat()
-        
-        self.field60 = stream.readFloat()
-        self.field64 = stream.readFloat()
-        self.field68 = stream.readFloat()
-        self.field6c = stream.readFloat()
-        
-        self.field70 = stream.readFloat()
-        self.field74 = stream.readFloat()
-        self.field78 = stream.readFloat()
-        self.field7c = stream.readFloat()
+_rMaterialCBMaterialFields = namedtuple( '_rMaterialCBMaterialFields', [ 'field{:02x}'.format( i * 4 ) for i in range( 32 ) ] )
+
+class rMaterialCBMaterial(_rMaterialCBMaterialFields):
+    '''
+    CBMaterial constant buffer (mvc3-pc). An immutable tuple of its floats, with the fields (field00 to field7c, named after 
+    their offset) as named views, so identical buffers can be shared between materials. Use _replace to change fields.
+    '''
+    __slots__ = ()
+    COUNT = 32
+    SIZE = COUNT * 4
+    STRUCT = struct.Struct( '<32f' )
+    FIELD_NAMES = _rMaterialCBMaterialFields._fields
+    DEFAULT_VALUES = (
+        0.3471069931983948, 0.3471069931983948, 0.3471069931983948, 1.0,
+        1.0, 1.0, 1.0, 10.0,
+        1.0, -0.0, 0.0, 5.0,
+        0.0, 1.0, 0.0, 0.0,
+        1.0, 0.0, 0.0, 0.0,
+        0.0, 1.0, 0.0, 0.0,
+        1.0, 0.0, 0.0, 0.0,
+        0.0, 1.0, 0.0, 0.0,
+    )
+    
+    def __new__( cls, values = None ):
+        return cls._make( values if values is not None else cls.DEFAULT_VALUES )
+    
+    @classmethod
+    def unpack( cls, buffer, offset = 0 ):
+        return cls._make( cls.STRUCT.unpack_from( buffer, offset ) )
+    
+    @staticmethod
+    def read( stream ):
+        return rMaterialCBMaterial.unpack( stream.readBytes( rMaterialCBMaterial.SIZE ) )
         
     def write( self, stream ):
-        stream.writeFloat( self.field00 )
-        stream.writeFloat( self.field04 )
-        stream.writeFloat( self.field08 )
-        stream.writeFloat( self.field0c )
-        
-        stream.writeFloat( self.field10 )
-        stream.writeFloat( self.field14 )
-        stream.writeFloat( self.field18 )
-        stream.writeFloat( self.field1c )
-        
-        stream.writeFloat( self.field20 )
-        stream.writeFloat( self.field24 )
-        stream.writeFloat( self.field28 )
-        stream.writeFloat( self.field2c )
-        
-        stream.writeFloat( self.field30 )
-        stream.writeFloat( self.field34 )
-        stream.writeFloat( self.field38 )
-        stream.writeFloat( self.field3c )
-        
-        stream.writeFloat( self.field40 )
-        stream.writeFloat( self.field44 )
-        stream.writeFloat( self.field48 )
-        stream.writeFloat( self.field4c )
-        
-        stream.writeFloat( self.field50 )
-        stream.writeFloat( self.field54 )
-        stream.writeFloat( self.field58 )
-        stream.writeFloat( self.field5c )
-        
-        stream.writeFloat( self.field60 )
-        stream.writeFloat( self.field64 )
-        stream.writeFloat( self.field68 )
-        stream.writeFloat( self.field6c )
-        
-        stream.writeFloat( self.field70 )
-        stream.writeFloat( self.field74 )
-        stream.writeFloat( self.field78 )
-        stream.writeFloat( self.field7c )
+        stream.writeBytes( self.STRUCT.pack( *self ) )
+    
+_constantBufferSizes = dict()
+
+def getConstantBufferSizes():
+    '''Gets the number of floats in each constant buffer of the current target, by shader object hash'''
+    sizes = _constantBufferSizes.get( target.current.name )
+    if sizes == None:
+        if target.current.name in ['mvc3-pc']:
+            sizes = {
+                mvc3shaderdb.CBMaterial.hash: rMaterialCBMaterial.COUNT,
+                mvc3shaderdb._DOLLAR_Globals.hash: 76,
+                mvc3shaderdb.CBDiffuseColorCorect.hash: 4,
+                mvc3shaderdb.CBHalfLambert.hash: 4,
+                mvc3shaderdb.CBToon2.hash: 4,
+                mvc3shaderdb.CBIndirectUser.hash: 12,
+            }
+        elif target.current.name in ['aa-pc']:
+            sizes = {
+                mvc3shaderdb.CBMaterial.hash: 48,
+                0x000798AA: 36, # TODO get proper name (aa-pc)
+                0x0007D913: 8, # TODO get proper name (aa-pc)
+            }
+        else:
+            raise Exception(f'Unhandled target: {target.current.name}')
+        _constantBufferSizes[ target.current.name ] = sizes
+    return sizes
+
+def unpackConstantBuffer( shaderObjectHash, buffer ):
+    '''Unpacks constant buffer data from its raw bytes, CBMaterial (mvc3-pc) to an rMaterialCBMaterial and any other buffer to a tuple of floats'''
+    if len( buffer ) == rMaterialCBMaterial.SIZE and target.current.name in ['mvc3-pc'] and shaderObjectHash == mvc3shaderdb.CBMaterial.hash:
+        return rMaterialCBMaterial.unpack( buffer )
+    return struct.unpack( '<{}f'.format( len( buffer ) // 4 ), buffer )
     
 # union
 class rMaterialCmdData:
@@ -551,27 +498,56 @@ class MaterialInfoWriteContext:
         self.data = None
         self.cmds = []
         self.animData = None
+        
+class rMaterialWriteStats:
+    '''Counts the command and animation data blocks written by rMaterialStreamWriter, and the bytes saved by sharing identical blocks'''
+    
+    def __init__( self ):
+        self.cmdBlockCount = 0
+        self.sharedCmdBlockCount = 0
+        self.animBlockCount = 0
+        self.sharedAnimBlockCount = 0
+        self.bytesWritten = 0
+        self.bytesSaved = 0
+        
+    def __str__( self ):
+        return '{} of {} command blocks and {} of {} animation blocks shared, {} block bytes written, {} bytes saved'.format( 
+            self.sharedCmdBlockCount, self.cmdBlockCount, self.sharedAnimBlockCount, self.animBlockCount, self.bytesWritten, self.bytesSaved )
+        
+def _seekStream( stream, pos ):
+    # pad with zeros when seeking past the end
+    diff = pos - stream.getSize()
+    if diff > 0:
+        stream.setOffset( stream.getSize() )
+        stream.writeBytes( bytes( diff ) )
+    stream.setOffset( pos )
+    
+def _getAligned( val, alignment ):
+    return ( val + alignment - 1 ) // alignment * alignment
            
 class rMaterialStreamWriter:
-    def __init__(self, stream):
+    def __init__( self, stream, deduplicate = False ):
+        '''
+        Writes a material library to the stream. If deduplicate is set, materials with identical commands, constant buffers
+        or animation data point to a single copy of the data instead of writing it again.
+        '''
         self.stream = stream
         self.header = rMaterialHeader()
         self.headerStart = self.stream.getOffset()
         self.seek( self.headerStart + rMaterialHeader.SIZE )
         self.matInfoCtxs = []
         self.matInfoCtx = None
+        self.deduplicate = deduplicate
+        self.stats = rMaterialWriteStats()
+        self.cmdBlockOffsets = dict()
+        self.animBlockOffsets = dict()
         
     def seek( self, pos ):
-        diff = pos - self.stream.getSize()
-        if diff > 0:
-            self.stream.setOffset( self.stream.getSize() )
-            for i in range( diff ):
-                self.stream.writeByte( 0 )
-        self.stream.setOffset( pos )
+        _seekStream( self.stream, pos )
         
     def align( self, alignment ):
-        while ( self.stream.getOffset() - self.headerStart ) % alignment != 0:
-            self.stream.writeByte( 0 )
+        pos = self.stream.getOffset() - self.headerStart
+        self.seek( self.headerStart + _getAligned( pos, alignment ) )
         
     def setHash( self, val ):
         self.header.hash = val
@@ -658,10 +634,103 @@ class rMaterialStreamWriter:
         self.matInfoCtx.animData.header.entryCount += 1
         pass
     
-    def _getAligned( self, val, alignment ):
-        while val % alignment != 0:
-            val += 1
-        return val
+    def _serializeCmdBlock( self, ctx ):
+        # the command list is followed by the constant buffers of the commands, whose offsets are relative to 
+        # the start of the command list, so the block can be shared by any material with the same commands
+        stream = NclBitStream()
+        
+        # reserve space for cmd info
+        _seekStream( stream, rMaterialCmd.SIZE * len( ctx.cmds ) )
+            
+        # write command constant buffers so we can fix up command buffer offsets
+        _seekStream( stream, _getAligned( stream.getOffset(), 16 ) )
+        for cmd, cmdData in ctx.cmds:
+            if cmd.info.getType() == rMaterialCmdType.SetConstantBuffer:
+                cmd.data.setConstantDataBufferOffset( stream.getOffset() )
+                assert( isinstance( cmdData, ( list, tuple ) ) )
+                assert( len( cmdData ) > 0 )
+                assert( isinstance( cmdData[0], float ) )
+                if isinstance( cmdData, rMaterialCBMaterial ):
+                    cmdData.write( stream )
+                else:
+                    stream.writeFloats( cmdData )
+            # the rest are stored inside the comand header
+            elif cmd.info.getType() in [rMaterialCmdType.SetFlag, rMaterialCmdType.SetSamplerState]:
+                cmd.data.setShaderObjectId( cmdData )
+            elif cmd.info.getType() == rMaterialCmdType.SetTexture:
+                cmd.data.setTextureIndex( cmdData )
+        
+        # pad the cmd buffer
+        blockSize = _getAligned( stream.getOffset(), 16 )
+        _seekStream( stream, blockSize )
+        
+        # write command info now that they're all fixed up
+        stream.setOffset( 0 )
+        for cmd, cmdData in ctx.cmds:
+            cmd.write( stream )
+            
+        stream.setOffset( 0 )
+        return stream.readBytes( blockSize )
+    
+    def _serializeAnimBlock( self, animData, pos ):
+        # the entry data is 16 byte aligned in the file, so the block is serialized at the same alignment as the position 
+        # it will be written to, the offsets in the block are relative to its start
+        stream = NclBitStream()
+        animDataHeaderPos = pos % 16
+        _seekStream( stream, animDataHeaderPos )
+        animData.header.write( stream )
+        
+        # write entries
+        nextOffsetPos = stream.getOffset()
+        nextDataPos = _getAligned( nextOffsetPos + animData.header.entryCount * 8, 16 )
+        
+        for entry in animData.entries: 
+            # reserve space for the entry header        
+            dataPos = nextDataPos
+            _seekStream( stream, nextDataPos + rMaterialAnimEntryHeader.SIZE )
+            
+            # write sub entries
+            entryList1Pos = stream.getOffset()
+            for entry1 in entry.entryList1:
+                entry1.write( stream )
+                
+            entryList2Pos = stream.getOffset()
+            for entry2 in entry.entryList2:
+                entry2.header.write( stream )
+                stream.writeBytes( entry2.entryListHeader )
+                for subEntry in entry2.entries:
+                    stream.writeBytes( subEntry )
+                    
+            nextDataPos = stream.getOffset()
+            
+            # write entry after populating offsets
+            _seekStream( stream, dataPos )
+            entry.header.entryList1Offset = entryList1Pos - animDataHeaderPos
+            entry.header.entryList2Offset = entryList2Pos - animDataHeaderPos
+            entry.header.write( stream )
+            
+            # write entry offset
+            _seekStream( stream, nextOffsetPos )
+            stream.writeUInt64( dataPos - animDataHeaderPos )
+            nextOffsetPos = stream.getOffset()
+        
+        stream.setOffset( animDataHeaderPos )
+        return stream.readBytes( nextDataPos - animDataHeaderPos ), nextDataPos - nextOffsetPos
+    
+    def _writeBlock( self, block, blockOffsets ):
+        # returns the position of the block, and whether it is shared with a previously written one
+        if self.deduplicate:
+            pos = blockOffsets.get( block )
+            if pos is not None:
+                self.stats.bytesSaved += len( block )
+                return pos, True
+            
+        pos = self.stream.getOffset()
+        self.stream.writeBytes( block )
+        self.stats.bytesWritten += len( block )
+        if self.deduplicate:
+            blockOffsets[ block ] = pos
+        return pos, False
     
     def endMaterialInfoList( self ):
         # material info list has ended
@@ -670,94 +739,29 @@ class rMaterialStreamWriter:
         # write command data
         self.align( 16 )
         for ctx in self.matInfoCtxs:
+            block = self._serializeCmdBlock( ctx )
+            materialCmdPos, shared = self._writeBlock( block, self.cmdBlockOffsets )
+            
             # fill in command list fields
-            materialCmdPos = self.stream.getOffset()
             ctx.data.cmdListOffset = materialCmdPos - self.headerStart
             ctx.data.cmdListInfo.setCount( len( ctx.cmds ) )
-            
-            # reserve space for cmd info
-            self.seek( self.stream.getOffset() + rMaterialCmd.SIZE * len( ctx.cmds ) )
-                
-            # write command constant buffers so we can fix up command buffer offsets
-            self.align( 16 ) 
-            for cmd, cmdData in ctx.cmds:
-                if cmd.info.getType() == rMaterialCmdType.SetConstantBuffer:
-                    cmd.data.setConstantDataBufferOffset( self.stream.getOffset() - ctx.data.cmdListOffset )
-                    assert( isinstance( cmdData, list ) )
-                    assert( len( cmdData ) > 0 )
-                    assert( isinstance( cmdData[0], float ) )
-                    for v in cmdData:
-                        self.stream.writeFloat( v )
-                # the rest are stored inside the comand header
-                elif cmd.info.getType() in [rMaterialCmdType.SetFlag, rMaterialCmdType.SetSamplerState]:
-                    cmd.data.setShaderObjectId( cmdData )
-                elif cmd.info.getType() == rMaterialCmdType.SetTexture:
-                    cmd.data.setTextureIndex( cmdData )
-            
-            # calculate cmd buffer size     
-            self.align( 16 ) 
-            cmdBufferEndPos = self.stream.getOffset()
-            ctx.data.cmdBufferSize = cmdBufferEndPos - materialCmdPos
-            
-            # write command info now that they're all fixed up
-            self.seek( materialCmdPos )
-            for cmd, cmdData in ctx.cmds:
-                cmd.write( self.stream )
-                
-            # done
-            self.seek( cmdBufferEndPos )
+            ctx.data.cmdBufferSize = len( block )
+            self.stats.cmdBlockCount += 1
+            self.stats.sharedCmdBlockCount += shared
             
         # now we write the animation data
         for ctx in self.matInfoCtxs:
             if ctx.animData != None:
                 if isinstance( ctx.animData, bytes ):
-                    ctx.data.animDataOffset = self.stream.getOffset()
-                    ctx.data.animDataSize = len( ctx.animData )
-                    self.stream.writeBytes( ctx.animData )
+                    block = ctx.animData
+                    animDataSize = len( ctx.animData )
                 else:
-                    # write header
-                    animDataHeaderPos = self.stream.getOffset()
-                    ctx.animData.header.write( self.stream )
-                    
-                    # write entries
-                    nextOffsetPos = self.stream.getOffset()
-                    nextDataPos = self._getAligned( nextOffsetPos + ctx.animData.header.entryCount * 8, 16 )
+                    block, animDataSize = self._serializeAnimBlock( ctx.animData, self.stream.getOffset() )
                     
-                    for entry in ctx.animData.entries: 
-                        # reserve space for the entry header        
-                        dataPos = nextDataPos
-                        self.seek( nextDataPos + rMaterialAnimEntryHeader.SIZE )
-                        
-                        # write sub entries
-                        entryList1Pos = self.stream.getOffset()
-                        for entry1 in entry.entryList1:
-                            entry1.write( self.stream )
-                            
-                        entryList2Pos = self.stream.getOffset()
-                        for entry2 in entry.entryList2:
-                            entry2.header.write( self.stream )
-                            self.stream.writeBytes( entry2.entryListHeader )
-                            for subEntry in entry2.entries:
-                                self.stream.writeBytes( subEntry )
-                                
-                        nextDataPos = self.stream.getOffset()
-                        
-                        # write entry after populating offsets
-                        self.seek( dataPos )
-                        entry.header.entryList1Offset = entryList1Pos - animDataHeaderPos
-                        entry.header.entryList2Offset = entryList2Pos - animDataHeaderPos
-                        entry.header.write( self.stream )
-                        
-                        # write entry offset
-                        self.seek( nextOffsetPos )
-                        self.stream.writeUInt64( dataPos - animDataHeaderPos )
-                        nextOffsetPos = self.stream.getOffset()
-                        
-                    ctx.data.animDataOffset = animDataHeaderPos
-                    ctx.data.animDataSize = nextDataPos - nextOffsetPos
-                    self.seek( nextDataPos )
-                
-                
+                ctx.data.animDataOffset, shared = self._writeBlock( block, self.animBlockOffsets )
+                ctx.data.animDataSize = animDataSize
+                self.stats.animBlockCount += 1
+                self.stats.sharedAnimBlockCount += shared
         
         materialCmdEndPos = self.stream.getOffset()
         
@@ -777,6 +781,7 @@ class rMaterialStreamReader:
         self.header = rMaterialHeader()
         self.header.read( self.stream )
         self.objectToOffset = dict()
+        self.constantBufferCache = dict()
         
     def _readBytesAtOffset( self, offset, count ):
         p = self.stream.getOffset()
@@ -894,34 +899,17 @@ class rMaterialStreamReader:
         elif ( cmdType == rMaterialCmdType.SetConstantBuffer ):
             temp = self.stream.getOffset()
             self.stream.setOffset( materialInfo.cmdListOffset + materialCmd.data.getConstantBufferDataOffset() )
-            data = None
             shaderObjectHash = materialCmd.shaderObjectId.getHash() 
-            if target.current.name in ['mvc3-pc']:
-                if ( shaderObjectHash == mvc3shaderdb.CBMaterial.hash ):
-                    data = util.readFloatBuffer( self.stream, 32 )
-                elif ( shaderObjectHash == mvc3shaderdb._DOLLAR_Globals.hash ):
-                    data = util.readFloatBuffer( self.stream, 76 )
-                elif ( shaderObjectHash == mvc3shaderdb.CBDiffuseColorCorect.hash ):
-                    data = util.readFloatBuffer( self.stream, 4 )
-                elif ( shaderObjectHash == mvc3shaderdb.CBHalfLambert.hash ):
-                    data = util.readFloatBuffer( self.stream, 4 )
-                elif ( shaderObjectHash == mvc3shaderdb.CBToon2.hash ):
-                    data = util.readFloatBuffer( self.stream, 4 )
-                elif ( shaderObjectHash == mvc3shaderdb.CBIndirectUser.hash ):
-                    data = util.readFloatBuffer( self.stream, 12 )
-                else:
-                    raise Exception( "Unhandled constant buffer: {}".format( hex( shaderObjectHash ) ) )
-            elif target.current.name in ['aa-pc']:
-                if ( shaderObjectHash == mvc3shaderdb.CBMaterial.hash ):
-                    data = util.readFloatBuffer( self.stream, 48 )
-                elif ( shaderObjectHash == 0x000798AA ): # TODO get proper name (aa-pc)
-                    data = util.readFloatBuffer( self.stream, 36 )
-                elif ( shaderObjectHash == 0x0007D913 ): # TODO get proper name (aa-pc)
-                    data = util.readFloatBuffer( self.stream, 8 )
-                else:
-                    raise Exception( "Unhandled constant buffer: {}".format( hex( shaderObjectHash ) ) )
-            else:
-                raise Exception(f'Unhandled target: {target.current.name}')
+            count = getConstantBufferSizes().get( shaderObjectHash )
+            if count == None:
+                raise Exception( "Unhandled constant buffer: {}".format( hex( shaderObjectHash ) ) )
+            
+            # identical constant buffers share a single immutable tuple
+            key = ( shaderObjectHash, bytes( self.stream.readBytes( count * 4 ) ) )
+            data = self.constantBufferCache.get( key )
+            if data == None:
+                data = unpackConstantBuffer( shaderObjectHash, key[1] )
+                self.constantBufferCache[ key ] = data
                 
             self.stream.setOffset( temp )
             return data
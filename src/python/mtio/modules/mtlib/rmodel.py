@@ -3,13 +3,98 @@
 '''
 
 from typing import List
+import sys
+import array
 from rshader import rShaderObjectId
 from ncl import *
 import util
 import mvc3shaderdb
+import libtarget
+
+if libtarget.numpy:
+    import numpy as np
 
 class rModelConstants:
     MATERIAL_NAME_LENGTH = 128
+    STRIP_RESTART_INDEX = 0xFFFF
+    
+def indexBufferToArray( buffer ):
+    '''
+    Converts an index buffer to an array of uint16 indices. This is a numpy array that shares memory with the buffer 
+    when numpy is available, and an array('H') otherwise.
+    '''
+    count = len( buffer ) // 2
+    if libtarget.numpy:
+        return np.frombuffer( buffer, dtype='<u2', count=count )
+    
+    indices = array.array( 'H' )
+    indices.frombytes( memoryview( buffer )[0:count * 2] )
+    if sys.byteorder != 'little':
+        indices.byteswap()
+    return indices
+
+def indexArrayToBuffer( indices ):
+    '''Converts an array or list of indices to an index buffer of little endian uint16 values'''
+    if libtarget.numpy:
+        return np.asarray( indices ).astype( '<u2' ).tobytes()
+    
+    try:
+        values = array.array( 'H', indices )
+    except OverflowError:
+        values = array.array( 'H', [ x & 0xFFFF for x in indices ] )
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values.tobytes()
+
+def hasStripRestart( indices ):
+    '''Returns if the indices contain a triangle strip restart marker'''
+    if libtarget.numpy and isinstance( indices, np.ndarray ):
+        return bool( np.any( indices == rModelConstants.STRIP_RESTART_INDEX ) )
+    return rModelConstants.STRIP_RESTART_INDEX in indices
+    
+def rebaseIndices( indices, vertexStartIndex ):
+    '''Subtracts the vertex start index from all indices except strip restart markers. The result is signed.'''
+    if libtarget.numpy:
+        rebased = np.asarray( indices ).astype( np.int32 )
+        rebased[ rebased != rModelConstants.STRIP_RESTART_INDEX ] -= vertexStartIndex
+        return rebased
+    
+    return array.array( 'l', [ x - vertexStartIndex if x != rModelConstants.STRIP_RESTART_INDEX else x for x in indices ] )
+
+def expandTriStrips( indices ):
+    '''
+    Expands restart separated triangle strips to a flat triangle list. Every other triangle of a strip is flipped
+    to keep a consistent winding, and degenerate triangles are kept so that triangles map 1:1 to strip positions.
+    '''
+    if libtarget.numpy:
+        indices = np.asarray( indices )
+        count = len( indices )
+        if count < 3:
+            return np.zeros( 0, dtype=indices.dtype )
+        
+        # position at which the strip containing each index starts
+        isRestart = indices == rModelConstants.STRIP_RESTART_INDEX
+        positions = np.arange( count )
+        stripStart = np.maximum.accumulate( np.where( isRestart, positions + 1, 0 ) )
+        
+        # a triangle ends at every index that has 2 indices of the same strip before it
+        ends = positions[2:][ ( positions[2:] - stripStart[2:] >= 2 ) & ~isRestart[2:] ]
+        triangles = np.stack( ( indices[ends - 2], indices[ends - 1], indices[ends] ), axis=1 )
+        flip = ( ends - stripStart[ends] ) % 2 == 1
+        triangles[flip] = triangles[flip][:, ::-1]
+        return triangles.reshape( -1 )
+    
+    triangles = array.array( 'l' )
+    start = 0
+    for i, index in enumerate( indices ):
+        if index == rModelConstants.STRIP_RESTART_INDEX:
+            start = i + 1
+        elif i - start >= 2:
+            if ( i - start ) % 2 == 0:
+                triangles.extend( ( indices[i - 2], indices[i - 1], index ) )
+            else:
+                triangles.extend( ( index, indices[i - 1], indices[i - 2] ) )
+    return triangles
 
 class rModelPrimitiveIndices:
     '''rModel joint packed joint, material and lod indices'''
@@ -449,6 +534,20 @@ class rModelStreamReader(rModelStreamBase):
             value = func()
             offset = self.stream.getOffset()
             yield value
+            
+    def _readInstance( self, offset, index, count, type ):
+        if index < 0 or index >= count:
+            raise IndexError( f'{type.__name__} index {index} out of range' )
+        self.stream.setOffset( offset )
+        value = type()
+        value.read( self.stream )
+        return value
+    
+    def _readMat44( self, offset, index, count ):
+        if index < 0 or index >= count:
+            raise IndexError( f'matrix index {index} out of range' )
+        self.stream.setOffset( offset )
+        return self.stream.readMat44()
     
     def iterJoints( self ):
         return self._iterInstanceReadFn( self.getJointPos(), self.header.jointCount, rModelJoint )
@@ -466,20 +565,41 @@ class rModelStreamReader(rModelStreamBase):
         return self._iterInstanceReadFn( self.getGroupPos(), self.header.groupCount, rModelGroup )
             
     def iterMaterials( self ):
-        offset = self.getMaterialPos()
         for i in range( self.header.materialCount ):
-            self.stream.setOffset( offset )
-            name = self.stream.readBytes( rModelConstants.MATERIAL_NAME_LENGTH ).decode( "ASCII" ).rstrip( '\0' )
-            offset = self.stream.getOffset()
-            yield name
+            yield self.readMaterial( i )
             
     def iterPrimitives( self ):
         return self._iterInstanceReadFn( self.getPrimitivePos(), self.header.primitiveCount, rModelPrimitive )
     
     def iterEnvelopes( self ):
         return self._iterInstanceReadFn( self.getPrimitiveLinkPos(), self.header.envelopeCount, rModelEnvelope )
+    
+    def readJoint( self, i ):
+        return self._readInstance( self.getJointPos( i ), i, self.header.jointCount, rModelJoint )
+    
+    def readJointLocalMtx( self, i ):
+        return self._readMat44( self.getJointLocalMtxPos( i ), i, self.header.jointCount )
+    
+    def readJointWorldMtx( self, i ):
+        return self._readMat44( self.getJointWorldMtxPos( i ), i, self.header.jointCount )
+    
+    def readGroup( self, i ):
+        return self._readInstance( self.getGroupPos( i ), i, self.header.groupCount, rModelGroup )
+    
+    def readMaterial( self, i ):
+        if i < 0 or i >= self.header.materialCount:
+            raise IndexError( f'material index {i} out of range' )
+        self.stream.setOffset( self.getMaterialPos( i ) )
+        return bytes( self.stream.readBytes( rModelConstants.MATERIAL_NAME_LENGTH ) ).decode( "ASCII" ).rstrip( '\0' )
+    
+    def readPrimitive( self, i ):
+        return self._readInstance( self.getPrimitivePos( i ), i, self.header.primitiveCount, rModelPrimitive )
+    
+    def readEnvelope( self, i ):
+        return self._readInstance( self.getPrimitiveLinkPos( i ), i, self.header.envelopeCount, rModelEnvelope )
 
     def getVertexBuffer( self ):
+        '''Returns the vertex buffer. When reading from a read-only stream this is a view into the stream's buffer.'''
         self.stream.setOffset( self.getVertexBufferPos() )
         return self.stream.readBytes( self.header.vertexBufferSize )
     
@@ -491,6 +611,7 @@ class rModelStreamReader(rModelStreamBase):
         return self.stream.readBytes( self.header.vertexBuffer2Size )
     
     def getIndexBuffer( self ):
+        '''Returns the index buffer. When reading from a read-only stream this is a view into the stream's buffer.'''
         self.stream.setOffset( self.getIndexBufferPos() )
         return self.stream.readBytes( self.header.indexCount * 2 )
     
@@ -819,8 +940,117 @@ class rModelData:
     def usesTriStrips( self ):
         if self.indexBuffer is None:
             return False
-        for i in range(0, len(self.indexBuffer), 2):
-            if i + 2 <= len(self.indexBuffer) and struct.unpack_from('H', self.indexBuffer, i)[0] == 0xFFFF:
-                return True
-        return False
-        
\ No newline at end of file
+        return hasStripRestart( self.getIndices() )
+    
+    def getIndices( self ):
+        '''Gets the index buffer as an array of uint16 indices'''
+        return indexBufferToArray( self.indexBuffer )
+    
+    def getPrimitiveIndices( self, primitive: rModelPrimitive, rebase=False ):
+        '''Gets the indices of a primitive, optionally with the vertex start index subtracted'''
+        start = primitive.indexBufferOffset + primitive.indexStartIndex
+        indices = self.getIndices()[start:start + primitive.indexCount]
+        if rebase:
+            indices = rebaseIndices( indices, primitive.vertexStartIndex )
+        return indices
+    
+    def getPrimitiveTriangles( self, primitive: rModelPrimitive, isStrip: bool ):
+        '''Gets the indices of a primitive as a flat triangle list, relative to the first vertex of the primitive'''
+        indices = self.getPrimitiveIndices( primitive, rebase=True )
+        if isStrip:
+            indices = expandTriStrips( indices )
+        else:
+            indices = indices[0:len( indices ) - len( indices ) % 3]
+        return indices
+        
+
+class rModelView:
+    '''
+    Lazily parsed view of an rModel resource with the same attributes as rModelData.
+    Only the header is parsed up front; each section is read from the stream on first access, 
+    and single entries can be read directly without parsing the whole section.
+    '''
+    
+    def __init__( self, stream ):
+        self.reader = rModelStreamReader( stream )
+        self.header = self.reader.getHeader()
+        self._sections = dict()
+        
+    def _getSection( self, name, loadFn ):
+        if name not in self._sections:
+            self._sections[ name ] = loadFn()
+        return self._sections[ name ]
+    
+    def _getEntry( self, name, i, readFn ):
+        if name in self._sections:
+            return self._sections[ name ][ i ]
+        return readFn( i )
+    
+    @property
+    def joints( self ) -> List[rModelJoint]:
+        return self._getSection( 'joints', lambda: list( self.reader.iterJoints() ) )
+    
+    @property
+    def jointLocalMtx( self ) -> List[NclMat44]:
+        return self._getSection( 'jointLocalMtx', lambda: list( self.reader.iterJointLocalMtx() ) )
+    
+    @property
+    def jointInvBindMtx( self ) -> List[NclMat44]:
+        return self._getSection( 'jointInvBindMtx', lambda: list( self.reader.iterJointWorldMtx() ) )
+    
+    @property
+    def boneMap( self ) -> List[int]:
+        return self._getSection( 'boneMap', lambda: list( self.reader.iterBoneMap() ) )
+    
+    @property
+    def groups( self ) -> List[rModelGroup]:
+        return self._getSection( 'groups', lambda: list( self.reader.iterGroups() ) )
+    
+    @property
+    def materials( self ) -> List[str]:
+        return self._getSection( 'materials', lambda: list( self.reader.iterMaterials() ) )
+    
+    @property
+    def primitives( self ) -> List[rModelPrimitive]:
+        return self._getSection( 'primitives', lambda: list( self.reader.iterPrimitives() ) )
+    
+    @property
+    def envelopes( self ) -> List[rModelEnvelope]:
+        return self._getSection( 'envelopes', lambda: list( self.reader.iterEnvelopes() ) )
+    
+    @property
+    def vertexBuffer( self ) -> bytes:
+        return self._getSection( 'vertexBuffer', self.reader.getVertexBuffer )
+    
+    @property
+    def vertexBuffer2( self ) -> bytes:
+        return self._getSection( 'vertexBuffer2', self.reader.getVertexBuffer2 )
+    
+    @property
+    def indexBuffer( self ) -> bytes:
+        return self._getSection( 'indexBuffer', self.reader.getIndexBuffer )
+    
+    @property
+    def exData( self ) -> rModelExData:
+        return self._getSection( 'exData', self.reader.getExData )
+    
+    def joint( self, i ) -> rModelJoint:
+        return self._getEntry( 'joints', i, self.reader.readJoint )
+    
+    def group( self, i ) -> rModelGroup:
+        return self._getEntry( 'groups', i, self.reader.readGroup )
+    
+    def material( self, i ) -> str:
+        return self._getEntry( 'materials', i, self.reader.readMaterial )
+    
+    def primitive( self, i ) -> rModelPrimitive:
+        return self._getEntry( 'primitives', i, self.reader.readPrimitive )
+    
+    def envelope( self, i ) -> rModelEnvelope:
+        return self._getEntry( 'envelopes', i, self.reader.readEnvelope )
+    
+    calcModelMtx = rModelData.calcModelMtx
+    usesTriStrips = rModelData.usesTriStrips
+    getIndices = rModelData.getIndices
+    getPrimitiveIndices = rModelData.getPrimitiveIndices
+    getPrimitiveTriangles = rModelData.getPrimitiveTriangles
@@ -4,10 +4,12 @@ Binary texture (.TEX) serialization module.
 
 from dataclasses import dataclass
 from typing import Optional
+import os
 import target
 import util
 from ncl import *
 from dds import *
+import texcompress
 
 class rTextureHeaderDesc(object):
     def __init__( self, value=0 ):
@@ -282,13 +284,49 @@ class rTextureSurfaceData:
     def __init__( self ):
         self.mips = []
         
+class rTextureMipList:
+    '''
+    Read-only list of the mips of a surface that fetches each mip from the source buffer when it is accessed.
+    Mips are returned as views into the buffer, so no mip data is copied.
+    '''
+    
+    def __init__( self, buffer, offsets, sizes ):
+        self.buffer = memoryview( buffer )
+        self.offsets = offsets
+        self.sizes = sizes
+        
+    def getMipByteSize( self, index ):
+        return self.sizes[ index ]
+        
+    def __len__( self ):
+        return len( self.offsets )
+    
+    def __getitem__( self, index ):
+        if isinstance( index, slice ):
+            return [ self[ i ] for i in range( *index.indices( len( self ) ) ) ]
+        
+        off = self.offsets[ index ]
+        size = self.sizes[ index ]
+        if off + size > len( self.buffer ):
+            raise IndexError( f'mip {index} at offset {off} with size {size} is out of bounds' )
+        return self.buffer[ off : off + size ]
+    
+    def __iter__( self ):
+        for i in range( len( self ) ):
+            yield self[ i ]
+        
+
 class rTextureData:
     def __init__( self ):
         self.header = rTextureHeader()
         self.faces = []
         self.surfaces = []
         
-    def read( self, stream ):
+    def readHeader( self, stream, size ):
+        '''
+        Reads the header, faces and mip offset table from the stream, and returns the offset and size of every mip 
+        of every surface given the total size of the file
+        '''
         self.header.read( stream )
         
         if self.header.desc.getDimensions() == 6:
@@ -300,58 +338,87 @@ class rTextureData:
         mipOffsets = []
         for i in range( self.header.fmt.getSurfaceCount() * self.header.dim.getMipCount() ):
             mipOffsets.append( stream.readUInt64() )
-        
+            
+        # determine mip sizes from the offset of the next mip
+        mipSizes = []
+        for i in range( len( mipOffsets ) ):
+            nextOff = mipOffsets[ i + 1 ] if i + 1 < len( mipOffsets ) else size
+            mipSizes.append( nextOff - mipOffsets[ i ] )
+        return mipOffsets, mipSizes
+        
+    def read( self, stream, lazy=False ):
+        '''
+        Reads the texture from the stream. In lazy mode only the header and the mip offset table are read,
+        and the mips are fetched from the stream buffer when they are accessed.
+        '''
+        mipOffsets, mipSizes = self.readHeader( stream, stream.getSize() )
+        
+        mipCount = self.header.dim.getMipCount()
         for i in range( self.header.fmt.getSurfaceCount() ):
             surface = rTextureSurfaceData()
-             
-            for j in range( self.header.dim.getMipCount() ):
-                off = mipOffsets[ i * self.header.dim.getMipCount() + j ]
-                
-                # determine mip size
-                nextOff = None
-                nextMipOffsetIdx = i * self.header.dim.getMipCount() + j + 1
-                if nextMipOffsetIdx < len( mipOffsets ):
-                    nextOff = mipOffsets[ nextMipOffsetIdx ]
-                else:
-                    nextOff = stream.getSize()
-                        
-                # read mip data
-                size = nextOff - off
-                stream.setOffset( off )
-                mip = stream.readBytes( size )
-                surface.mips.append( mip )
+            start = i * mipCount
+            end = start + mipCount
+            
+            if lazy:
+                surface.mips = rTextureMipList( stream.getBuffer(), mipOffsets[ start : end ], mipSizes[ start : end ] )
+            else:
+                for j in range( start, end ):
+                    # read mip data
+                    stream.setOffset( mipOffsets[ j ] )
+                    mip = stream.readBytes( mipSizes[ j ] )
+                    surface.mips.append( mip )
                 
             self.surfaces.append( surface )
-                
-    def write( self, stream ):
+            
+    def writeHeader( self, stream, mipSizes ):
+        '''Writes the header, faces and mip offset table for mips of the given sizes, stored in order after the table'''
         self.header.write( stream )
         
         for face in self.faces:
             face.write( stream )
         
-        offPos = stream.getOffset()
-        off = offPos + ( 8 * self.header.fmt.getSurfaceCount() * self.header.dim.getMipCount() )
+        off = stream.getOffset() + ( 8 * len( mipSizes ) )
+        for size in mipSizes:
+            stream.writeUInt64( off )
+            off += size
+                
+    def write( self, stream ):
+        self.writeHeader( stream, [ len( mip ) for surface in self.surfaces for mip in surface.mips ] )
         for surface in self.surfaces:
             for mip in surface.mips:
-                # write offset
-                stream.setOffset( offPos )
-                stream.writeUInt64( off )
-                offPos = stream.getOffset()
-                
-                # write data
-                stream.setOffset( off )
                 stream.writeBytes( mip )
-                off += len( mip )
                 
-    def loadBinaryFile( self, path ):
-        self.read( NclBitStream( util.loadIntoByteArray( path ) ) )
+    def loadBinaryFile( self, path, lazy=False ):
+        if lazy:
+            # mips are fetched from the mapped file when they are accessed, so the file must not be overwritten while they are in use
+            self.read( util.openReadOnlyStream( path ), lazy )
+        else:
+            self.read( NclBitStream( util.loadIntoByteArray( path ) ) )
+        
+    def loadBinaryFileHeader( self, f ):
+        '''Reads only the header, faces and mip offset table from an open file, and returns the offset and size of every mip'''
+        start = f.tell()
+        fileSize = os.fstat( f.fileno() ).st_size
+        header = rTextureHeader()
+        header.read( NclBitStream( memoryview( f.read( 16 ) ) ) )
+        
+        headerSize = 16 + ( 36 * 3 if header.desc.getDimensions() == 6 else 0 ) + \
+            ( 8 * header.fmt.getSurfaceCount() * header.dim.getMipCount() )
+        f.seek( start )
+        return self.readHeader( NclBitStream( memoryview( f.read( headerSize ) ) ), fileSize )
         
     def saveBinaryFile( self, path ):
+        # write the mips directly rather than copying them into the stream first
         stream = NclBitStream()
-        self.write( stream )
-        util.saveByteArrayToFile( path, stream.getBuffer() )
-        
-    def toDDS( self ):
+        self.writeHeader( stream, [ len( mip ) for surface in self.surfaces for mip in surface.mips ] )
+        with util.openFileForWriting( path ) as f:
+            f.write( stream.getBuffer() )
+            for surface in self.surfaces:
+                for mip in surface.mips:
+                    f.write( mip )
+        
+    def createDDSHeader( self ):
+        '''Creates a DDS file with the header matching this texture, but without any data'''
         hasMips = self.header.dim.mipCount > 1
         isCubeMap = self.header.fmt.surfaceCount > 1
         
@@ -367,10 +434,6 @@ class rTextureData:
         dds.header.dwHeight = self.header.dim.getHeight()
         dds.header.dwWidth = self.header.dim.getWidth()
         dds.header.dwMipMapCount = self.header.dim.getMipCount()   
-        dds.buffer = bytearray()
-        for surface in self.surfaces:
-            for mip in surface.mips:
-                dds.buffer += mip
 
         fmt = self.header.fmt.getSurfaceFmt()
         ddsFmt = rTextureSurfaceFmt.getDDSFormat( fmt )
@@ -401,6 +464,36 @@ class rTextureData:
 
         return dds
     
+    def toDDS( self ):
+        dds = self.createDDSHeader()
+        
+        # copy the mips straight into a buffer of the final size
+        dds.buffer = bytearray( sum( len( mip ) for surface in self.surfaces for mip in surface.mips ) )
+        off = 0
+        for surface in self.surfaces:
+            for mip in surface.mips:
+                size = len( mip )
+                dds.buffer[ off : off + size ] = mip
+                off += size
+        return dds
+    
+    def getFormatName( self ):
+        '''Gets the texconv style name of the format the surfaces are encoded in'''
+        ddsFmt = rTextureSurfaceFmt.getDDSFormat( self.header.fmt.getSurfaceFmt() )
+        return texcompress.getFormatName( ddsFmt.fourCC if ddsFmt.pixelFormat == DDPF_FOURCC else DDS_FOURCC_NONE, ddsFmt.dxgiFormat )
+    
+    def getMipSize( self, mip ):
+        return ( max( 1, self.header.dim.getWidth() >> mip ), max( 1, self.header.dim.getHeight() >> mip ) )
+    
+    def decodeMip( self, mip=0, surface=0 ):
+        '''Decodes a mip of a surface to an ( height, width, 4 ) RGBA uint8 array'''
+        width, height = self.getMipSize( mip )
+        return texcompress.decode( self.surfaces[ surface ].mips[ mip ], width, height, self.getFormatName() )
+    
+    def decodeSurfaces( self, mip=0 ):
+        '''Decodes a mip of every surface, eg. all faces of a cubemap, to a list of RGBA arrays'''
+        return [ self.decodeMip( mip, i ) for i in range( len( self.surfaces ) ) ]
+    
     def setDefaultCubeMapFaces( self ):
         self.faces.clear()
         
@@ -441,7 +534,8 @@ class rTextureData:
         self.faces.append( face )
     
     @staticmethod
-    def fromDDS( dds: DDSFile ):
+    def fromDDSHeader( dds: DDSFile ):
+        '''Creates a texture without any mips from the header of a DDS file, and returns it with the sizes of the mips of each surface'''
         tex = rTextureData()
         isCubeMap = dds.header.dwCaps2 & DDSCAPS2_CUBEMAP
         
@@ -449,55 +543,105 @@ class rTextureData:
         if isCubeMap:
             surfaceCount = 6
         
-        off = 0
-        for i in range( surfaceCount ):
-            surface = rTextureSurfaceData()
-            fmt = None
-            if dds.header.ddspf.dwFlags & DDPF_FOURCC:
-                blockSize = 8
-                fmt = rTextureSurfaceFmt.BM_OPA
-                if dds.header.ddspf.dwFourCC != DDS_FOURCC_DXT1:
-                    fmt = rTextureSurfaceFmt.BM_XLU
-                    blockSize = 16
+        mipSizes = []
+        fmt = None
+        if dds.header.ddspf.dwFlags & DDPF_FOURCC:
+            blockSize = 8
+            fmt = rTextureSurfaceFmt.BM_OPA
+            if dds.header.ddspf.dwFourCC != DDS_FOURCC_DXT1:
+                fmt = rTextureSurfaceFmt.BM_XLU
+                blockSize = 16
+            
+            width = dds.header.dwWidth 
+            height = dds.header.dwHeight
+            for i in range( dds.header.dwMipMapCount ):
+                mipSizes.append( ddsCalcLinearSizeBlockCompressed( width, height, blockSize ) )
+                width //= 2
+                height //= 2
+        else:
+            # TODO LIN assumed here
+            fmt = rTextureSurfaceFmt.LIN
+            width = dds.header.dwWidth 
+            height = dds.header.dwHeight
+            for i in range( dds.header.dwMipMapCount ):
+                mipSizes.append( ddsCalcLinearSizeBpp( width, height, dds.header.ddspf.dwRGBBitCount ) )
+                width = max( 1, width // 2 )
+                height = max( 1, height // 2 )
                 
-                width = dds.header.dwWidth 
-                height = dds.header.dwHeight
-                for i in range( dds.header.dwMipMapCount ):
-                    size = ddsCalcLinearSizeBlockCompressed( width, height, blockSize )
-                    mip = dds.buffer[off:off+size]
-                    assert(len(mip) == size)
-                    off += size
-                    width //= 2
-                    height //= 2
-                    surface.mips.append( mip )
-            else:
-                # TODO LIN assumed here
-                fmt = rTextureSurfaceFmt.LIN
-                width = dds.header.dwWidth 
-                height = dds.header.dwHeight
-                for i in range( dds.header.dwMipMapCount ):
-                    size = ddsCalcLinearSizeBpp( width, height, dds.header.ddspf.dwRGBBitCount )
-                    mip = dds.buffer[off:off+size]
-                    assert(len(mip) == size)
-                    off += size
-                    width = max( 1, width // 2 )
-                    height = max( 1, height // 2 )
-                    surface.mips.append( mip )
-
-            tex.surfaces.append( surface )
-
         tex.header.dim.setMipCount( dds.header.dwMipMapCount )
         tex.header.dim.setHeight( dds.header.dwHeight )
         tex.header.dim.setWidth( dds.header.dwWidth )
         tex.header.fmt.setSurfaceFmt( fmt )        
         tex.header.fmt.setField3( 1 )
         tex.header.fmt.setField4( 0 )
-        tex.header.fmt.setSurfaceCount( len( tex.surfaces ) )
+        tex.header.fmt.setSurfaceCount( surfaceCount )
         if isCubeMap:
             tex.header.desc.setDimensions( 6 )
             tex.setDefaultCubeMapFaces()
         
+        return tex, mipSizes
+    
+    @staticmethod
+    def fromDDS( dds: DDSFile ):
+        tex, mipSizes = rTextureData.fromDDSHeader( dds )
+        
+        # mips are views into the DDS buffer rather than copies
+        buffer = memoryview( dds.buffer )
+        off = 0
+        for i in range( tex.header.fmt.getSurfaceCount() ):
+            surface = rTextureSurfaceData()
+            for size in mipSizes:
+                mip = buffer[off:off+size]
+                assert(len(mip) == size)
+                off += size
+                surface.mips.append( mip )
+            tex.surfaces.append( surface )
+        
         return tex
+    
+def convertTEXFileToDDSFile( texPath, ddsPath ):
+    '''
+    Converts a TEX file to a DDS file by writing the DDS header and copying the mips from one file to the other in chunks,
+    so memory use does not depend on the size of the texture
+    '''
+    with open( texPath, "rb" ) as src:
+        tex = rTextureData()
+        mipOffsets, mipSizes = tex.loadBinaryFileHeader( src )
+        
+        stream = NclBitStream()
+        tex.createDDSHeader().writeHeader( stream )
+        with util.openFileForWriting( ddsPath ) as dst:
+            dst.write( stream.getBuffer() )
+            for off, size in zip( mipOffsets, mipSizes ):
+                util.copyFileRange( src, dst, off, size )
+                
+def convertDDSFileToTEXFile( ddsPath, texPath, surfaceFmt=None, faces=None ):
+    '''
+    Converts a DDS file to a TEX file by writing the TEX header and copying the mips from one file to the other in chunks,
+    so memory use does not depend on the size of the texture. The surface format and cubemap faces can be overridden.
+    '''
+    with open( ddsPath, "rb" ) as src:
+        stream = NclBitStream( memoryview( src.read( DDSFile.MAX_HEADER_SIZE ) ) )
+        dds = DDSFile()
+        dds.readHeader( stream )
+        dataOffset = stream.getOffset()
+        
+        tex, mipSizes = rTextureData.fromDDSHeader( dds )
+        if surfaceFmt != None:
+            tex.header.fmt.setSurfaceFmt( surfaceFmt )
+        if faces != None:
+            tex.faces = list( faces )
+        
+        allMipSizes = mipSizes * tex.header.fmt.getSurfaceCount()
+        dataSize = sum( allMipSizes )
+        if dataOffset + dataSize > os.fstat( src.fileno() ).st_size:
+            raise Exception( f"DDS file is too small to contain {dataSize} bytes of texture data: {ddsPath}" )
+        
+        stream = NclBitStream()
+        tex.writeHeader( stream, allMipSizes )
+        with util.openFileForWriting( texPath ) as dst:
+            dst.write( stream.getBuffer() )
+            util.copyFileRange( src, dst, dataOffset, dataSize )
         
 def _test():
     # tex = rTextureData()
@@ -2,8 +2,25 @@
 Intermediate shader object info database utility module for easier access to shader info for parsing vertex buffers.
 '''
 
-from typing import Dict
+from typing import Dict, NamedTuple, Tuple
+from types import MappingProxyType
 
+# component type -> size of a component in bytes
+SHADER_INPUT_TYPE_SIZES = {
+    1:  4,
+    2:  2,
+    3:  2,
+    4:  2,
+    5:  2,
+    6:  2,
+    7:  1,
+    8:  1,
+    9:  1,
+    10: 1,
+    11: 4,
+    13: 1,
+    14: 4,
+}
 
 class ShaderInputInfo:
     '''Describes a shader input variable'''
@@ -13,6 +30,45 @@ class ShaderInputInfo:
         self.name: str = name
         self.componentCount: int = componentCount
 
+class ShaderInputLayoutElement(NamedTuple):
+    '''Describes where a shader input is stored in a vertex'''
+    name: str
+    index: int
+    offset: int
+    type: int
+    componentCount: int
+    size: int
+
+class ShaderInputLayout:
+    '''
+    Immutable, compiled description of the vertex layout of a shader object. 
+    Elements are grouped by input name in the order the names first appear in the inputs,
+    which is the order in which vertex data is decoded.
+    '''
+    __slots__ = ( 'elements', 'groups', 'elementsByName', 'size', 'cache' )
+    
+    def __init__( self, inputs ):
+        elementsByName = {}
+        for inputInfo in inputs:
+            elements = elementsByName.setdefault( inputInfo.name, [] )
+            size = SHADER_INPUT_TYPE_SIZES.get( inputInfo.type, 0 ) * inputInfo.componentCount
+            elements.append( ShaderInputLayoutElement( inputInfo.name, len( elements ), inputInfo.offset, 
+                                                       inputInfo.type, inputInfo.componentCount, size ) )
+        
+        self.groups: Tuple[Tuple[str, Tuple[ShaderInputLayoutElement, ...]], ...] = \
+            tuple( ( name, tuple( elements ) ) for name, elements in elementsByName.items() )
+        self.elements: Tuple[ShaderInputLayoutElement, ...] = tuple( x for name, elements in self.groups for x in elements )
+        self.elementsByName = MappingProxyType( dict( self.groups ) )
+        
+        # minimum vertex stride needed to hold all inputs
+        self.size: int = max( [ x.offset + x.size for x in self.elements ], default=0 )
+        
+        # derived data, eg. numpy dtypes, keyed by its parameters
+        self.cache = {}
+        
+    def getElements( self, name ):
+        return self.elementsByName.get( name, () )
+
 class ShaderObjectInfo:
     '''Describes a shader object'''
     def __init__(self, index, name, hashValue, inputs=None):
@@ -21,6 +77,7 @@ class ShaderObjectInfo:
         self.hash: int = hashValue
         self.inputs: list[ShaderInputInfo] = []
         self.inputsByName: Dict[str, ShaderInputInfo] = {}
+        self._layout: ShaderInputLayout = None
         if len(inputs) > 0:
             for inputInfo in inputs:
                 self.addInput( inputInfo )
@@ -31,6 +88,13 @@ class ShaderObjectInfo:
             self.inputsByName[ inputInfo.name ] = [ inputInfo ]
         else:
             self.inputsByName[ inputInfo.name ].append( inputInfo )
+        self._layout = None
+        
+    def getLayout( self ) -> ShaderInputLayout:
+        '''Gets the compiled vertex layout of the inputs, which is created on first use'''
+        if self._layout is None:
+            self._layout = ShaderInputLayout( self.inputs )
+        return self._layout
         
     def getInput( self, name ):
         return self.inputsByName[ name ]
@@ -0,0 +1,77 @@
+'''
+Compares saving and loading material libraries as yml and as binary snapshots.
+Uses the given MRL, MRL yml or snapshot files, or a library generated from the material templates if none are given.
+'''
+
+import os
+import sys
+import io
+import time
+sys.path.append( os.path.dirname( sys.path[0] ) )
+
+import target
+from immaterial import *
+
+RUNS = 5
+
+def measure( func ):
+    best = None
+    for i in range( RUNS ):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best == None else min( best, elapsed )
+    return best
+
+def createTemplateLib( copies ):
+    lib = imMaterialLib()
+    for i in range( copies ):
+        for type in imMaterialInfo.TEMPLATE_MATERIALS:
+            lib.materials.append( imMaterialInfo.createFromTemplate( type, f'material_{i}_{len( lib.materials )}' ) )
+    lib.updateTextureList()
+    return lib
+
+def loadLib( path ):
+    lib = imMaterialLib()
+    if path.lower().endswith( '.mrl' ):
+        lib.loadBinaryFile( path )
+    else:
+        lib.loadFile( path )
+    return lib
+
+def main():
+    target.setTarget( 'mvc3-pc' )
+    libs = [loadLib( path ) for path in sys.argv[1:]] if len( sys.argv ) > 1 else [createTemplateLib( 40 )]
+
+    yamlTexts = []
+    def saveYaml():
+        yamlTexts.clear()
+        for lib in libs:
+            f = io.StringIO()
+            lib.saveYamlIO( f )
+            yamlTexts.append( f.getvalue() )
+
+    snapshots = []
+    def saveSnapshot():
+        snapshots.clear()
+        for lib in libs:
+            snapshots.append( lib.saveSnapshotBuffer() )
+
+    def loadYaml():
+        for yamlText in yamlTexts:
+            imMaterialLib().loadYamlString( yamlText )
+
+    def loadSnapshot():
+        for snapshot in snapshots:
+            imMaterialLib().loadSnapshotBuffer( snapshot )
+
+    materialCount = sum( len( lib.materials ) for lib in libs )
+    print( f'{len( libs )} material libraries, {materialCount} materials' )
+    for what, yamlFunc, snapshotFunc in [( 'save', saveYaml, saveSnapshot ), ( 'load', loadYaml, loadSnapshot )]:
+        yamlTime = measure( yamlFunc )
+        snapshotTime = measure( snapshotFunc )
+        print( '{}: yml {:8.1f} ms, snapshot {:8.1f} ms ({:.1f}x)'.format( what, yamlTime * 1000, snapshotTime * 1000, yamlTime / snapshotTime ) )
+    print( 'size: yml {} bytes, snapshot {} bytes'.format( sum( len( x ) for x in yamlTexts ), sum( len( x ) for x in snapshots ) ) )
+
+if __name__ == '__main__':
+    main()
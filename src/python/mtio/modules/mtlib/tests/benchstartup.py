@@ -0,0 +1,30 @@
+'''
+Measures the time it takes to import the library in a fresh interpreter, and to load the shader and type databases.
+'''
+
+import os
+import sys
+import subprocess
+import statistics
+
+RUNS = 10
+MTIO_DIR = os.path.realpath( os.path.join( os.path.dirname( __file__ ), '../../..' ) )
+
+def measure( code ):
+    times = []
+    for i in range( RUNS ):
+        output = subprocess.check_output( [sys.executable, '-c', code], cwd=MTIO_DIR )
+        times.append( float( output ) )
+    return statistics.median( times ), min( times )
+
+def main():
+    importCode = 'import time; start = time.perf_counter(); import modules.mtlib; print( time.perf_counter() - start )'
+    loadCode = 'import modules.mtlib, mvc3shaderdb, mvc3types, time; start = time.perf_counter(); ' \
+        'mvc3shaderdb.getShaderObjects(); mvc3types.getTypeNameByHash(); print( time.perf_counter() - start )'
+
+    for name, code in [( 'import modules.mtlib', importCode ), ( 'first database lookup', loadCode )]:
+        median, best = measure( code )
+        print( '{:<24} median {:7.1f} ms, best {:7.1f} ms ({} runs)'.format( name, median * 1000, best * 1000, RUNS ) )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+'''
+Compares the parse and dump times of the pure Python and the libyaml based YAML backends.
+Uses the given YAML files, or a generated model metadata file and MRL yml if none are given.
+'''
+
+import os
+import sys
+import io
+import time
+sys.path.append( os.path.dirname( sys.path[0] ) )
+
+import target
+import yamlutil
+from metadata import *
+from immaterial import *
+
+RUNS = 5
+
+def measure( func ):
+    best = None
+    for i in range( RUNS ):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best == None else min( best, elapsed )
+    return best
+
+def createMetadataText( count ):
+    joints = [dict( id=i, name=f'jnt_{i}' ) for i in range( count )]
+    primitives = [dict( id=i, name=f'prim_{i}', index=i ) for i in range( count )]
+    yamlObj = dict( version=1, name='bench',
+        joints=ModelMetadata._createComplexMapping( joints ),
+        groups=ModelMetadata._createComplexMapping( [] ),
+        primitives=ModelMetadata._createComplexMapping( primitives ) )
+    return yamlutil.dump( yamlObj, width=1024 )
+
+def createMrlText( copies ):
+    lib = imMaterialLib()
+    for i in range( copies ):
+        for type in imMaterialInfo.TEMPLATE_MATERIALS:
+            lib.materials.append( imMaterialInfo.createFromTemplate( type, f'material_{i}_{len( lib.materials )}' ) )
+    f = io.StringIO()
+    lib.saveYamlIO( f )
+    return f.getvalue()
+
+def main():
+    target.setTarget( 'mvc3-pc' )
+    if len( sys.argv ) > 1:
+        texts = []
+        for path in sys.argv[1:]:
+            with open( path, 'r' ) as f:
+                texts.append( ( os.path.basename( path ), f.read() ) )
+    else:
+        texts = [( 'metadata', createMetadataText( 2000 ) ), ( 'mrl yml', createMrlText( 10 ) )]
+
+    if not yamlutil.HAS_LIBYAML:
+        print( 'PyYAML was built without libyaml, both backends are pure Python' )
+
+    for name, text in texts:
+        obj = yamlutil.load( text, loader=yamlutil.PySafeLoader )
+        pyLoadTime = measure( lambda: yamlutil.load( text, loader=yamlutil.PySafeLoader ) )
+        cLoadTime = measure( lambda: yamlutil.load( text, loader=yamlutil.SafeLoader ) )
+        pyDumpTime = measure( lambda: yamlutil.dump( obj, dumper=yamlutil.PySafeDumper, width=1024 ) )
+        cDumpTime = measure( lambda: yamlutil.dump( obj, dumper=yamlutil.SafeDumper, width=1024 ) )
+        print( f'{name} ({len( text )} bytes)' )
+        print( '    load: python {:8.1f} ms, libyaml {:8.1f} ms ({:.1f}x)'.format( pyLoadTime * 1000, cLoadTime * 1000, pyLoadTime / cLoadTime ) )
+        print( '    dump: python {:8.1f} ms, libyaml {:8.1f} ms ({:.1f}x)'.format( pyDumpTime * 1000, cDumpTime * 1000, pyDumpTime / cDumpTime ) )
+
+if __name__ == '__main__':
+    main()
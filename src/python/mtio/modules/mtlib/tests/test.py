@@ -33,8 +33,7 @@ def areBuffersEqual( a, b ):
 
 def testMrlYaml( mrlBuffer, modPath ):
     # read model for material names
-    mod = rModelData()
-    mod.read( NclBitStream( util.loadIntoByteArray( modPath ) ) )
+    mod = rModelView( util.openReadOnlyStream( modPath ) )
     mvc3materialnamedb.registerMaterialNames( mod.materials )
     
     # read mtl into intermediate 
@@ -187,9 +186,7 @@ def dumpModStats( inputName, stats ):
     ymlPath = os.path.join( basePath, baseName + '.2749c8a8.mrl.yml' )
     
     # read mod
-    modBuffer = util.loadIntoByteArray( modPath )
-    mod = rModelData()
-    mod.read( NclBitStream( modBuffer ) )
+    mod = rModelView( util.openReadOnlyStream( modPath ) )
     
     addFreq( stats, 'header.vertexBuffer2Size', mod.header.vertexBuffer2Size )   
     addFreq( stats, 'header.exData present', mod.exData != None ) 
@@ -0,0 +1,636 @@
+'''
+In-process block compression of RGBA images into the DDS formats used by TEX files (DXT1, DXT5, BC7 and RGBA),
+and decompression of BC1, BC2, BC3 and BC7 data back to RGBA.
+All encoders and decoders work on arrays of 4x4 blocks at once and require NumPy.
+'''
+
+import libtarget
+from dds import *
+
+if libtarget.numpy:
+    import numpy as np
+
+# number of blocks encoded at once, to bound the memory used by the intermediate arrays
+BLOCK_CHUNK_SIZE = 16384
+
+SUPPORTED_FORMATS = ['DXT1', 'DXT5', 'BC7', 'RGBA']
+
+BC7_WEIGHTS4 = [0, 4, 9, 13, 17, 21, 26, 30, 34, 38, 43, 47, 51, 55, 60, 64]
+
+def srgbToLinear( values ):
+    '''Converts sRGB encoded values in the range [0, 1] to linear values'''
+    return np.where( values <= 0.04045, values / 12.92, ( ( values + 0.055 ) / 1.055 ) ** 2.4 )
+
+def linearToSrgb( values ):
+    '''Converts linear values in the range [0, 1] to sRGB encoded values'''
+    values = np.clip( values, 0.0, 1.0 )
+    return np.where( values <= 0.0031308, values * 12.92, 1.055 * ( values ** ( 1.0 / 2.4 ) ) - 0.055 )
+
+def generateMips( rgba, srgb=True ):
+    '''
+    Generates the full mip chain of an ( height, width, 4 ) uint8 image down to 1x1 using a box filter.
+    When srgb is set the color channels are filtered in linear space. Returns the list of mips, starting with the image itself.
+    '''
+    mips = [ np.asarray( rgba, dtype=np.uint8 ) ]
+    image = mips[0].astype( np.float32 ) / 255.0
+    if srgb:
+        image[..., 0:3] = srgbToLinear( image[..., 0:3] )
+
+    while image.shape[0] > 1 or image.shape[1] > 1:
+        height, width = image.shape[0:2]
+        if height > 1:
+            image = ( image[0:height & ~1:2] + image[1:height & ~1:2] ) * 0.5
+        if width > 1:
+            image = ( image[:, 0:width & ~1:2] + image[:, 1:width & ~1:2] ) * 0.5
+
+        mip = image.copy()
+        if srgb:
+            mip[..., 0:3] = linearToSrgb( mip[..., 0:3] )
+        mips.append( np.clip( np.rint( mip * 255.0 ), 0, 255 ).astype( np.uint8 ) )
+    return mips
+
+def _toBlocks( rgba ):
+    '''Splits an ( height, width, 4 ) image into ( blockCount, 16, 4 ) blocks in row-major order, padding partial blocks with edge pixels'''
+    height, width = rgba.shape[0:2]
+    paddedHeight = ( height + 3 ) // 4 * 4
+    paddedWidth = ( width + 3 ) // 4 * 4
+    if paddedHeight != height or paddedWidth != width:
+        rgba = np.pad( rgba, ( ( 0, paddedHeight - height ), ( 0, paddedWidth - width ), ( 0, 0 ) ), mode='edge' )
+    return rgba.reshape( paddedHeight // 4, 4, paddedWidth // 4, 4, 4 ).transpose( 0, 2, 1, 3, 4 ).reshape( -1, 16, 4 )
+
+def _iterBlockChunks( rgba ):
+    blocks = _toBlocks( rgba )
+    for start in range( 0, len( blocks ), BLOCK_CHUNK_SIZE ):
+        yield blocks[ start : start + BLOCK_CHUNK_SIZE ].astype( np.float32 )
+
+def _calcPrincipalAxisEndpoints( pixels ):
+    '''Returns the endpoints of the line through the ( blockCount, 16, channels ) pixels along their principal axis'''
+    mean = pixels.mean( axis=1, keepdims=True )
+    centered = pixels - mean
+    covariance = np.einsum( 'nki,nkj->nij', centered, centered )
+
+    # power iteration, starting from the bounding box diagonal
+    axis = pixels.max( axis=1 ) - pixels.min( axis=1 )
+    for i in range( 4 ):
+        axis = np.einsum( 'nij,nj->ni', covariance, axis )
+        length = np.sqrt( ( axis * axis ).sum( axis=1, keepdims=True ) )
+        axis = np.where( length > 0, axis / np.maximum( length, 1e-12 ), 0.0 )
+
+    projection = np.einsum( 'nki,ni->nk', centered, axis )
+    start = mean[:, 0] + projection.min( axis=1 )[:, np.newaxis] * axis
+    end = mean[:, 0] + projection.max( axis=1 )[:, np.newaxis] * axis
+    return np.clip( start, 0, 255 ), np.clip( end, 0, 255 )
+
+def _refineEndpoints( pixels, weights, start, end ):
+    '''
+    Solves the least squares endpoints for the given per pixel interpolation weights, where 0 selects the start and 1 the end.
+    Blocks for which the system is singular keep their endpoints.
+    '''
+    a = 1.0 - weights
+    b = weights
+    aa = ( a * a ).sum( axis=1 )
+    ab = ( a * b ).sum( axis=1 )
+    bb = ( b * b ).sum( axis=1 )
+    ax = np.einsum( 'nk,nki->ni', a, pixels )
+    bx = np.einsum( 'nk,nki->ni', b, pixels )
+    det = aa * bb - ab * ab
+    valid = np.abs( det ) > 1e-6
+    safeDet = np.where( valid, det, 1.0 )[:, np.newaxis]
+    refinedStart = ( ax * bb[:, np.newaxis] - bx * ab[:, np.newaxis] ) / safeDet
+    refinedEnd = ( bx * aa[:, np.newaxis] - ax * ab[:, np.newaxis] ) / safeDet
+    valid = valid[:, np.newaxis]
+    return np.clip( np.where( valid, refinedStart, start ), 0, 255 ), np.clip( np.where( valid, refinedEnd, end ), 0, 255 )
+
+def _selectIndices( pixels, palette ):
+    '''Returns the index of the nearest ( blockCount, paletteSize, channels ) palette entry for every pixel'''
+    diff = pixels[:, :, np.newaxis, :] - palette[:, np.newaxis, :, :]
+    return ( diff * diff ).sum( axis=3 ).argmin( axis=2 )
+
+def _packIndices( indices, bitsPerIndex ):
+    '''Packs ( blockCount, 16 ) indices into an uint64 per block, with the first pixel in the lowest bits'''
+    shifts = np.arange( 16, dtype=np.uint64 ) * np.uint64( bitsPerIndex )
+    return np.bitwise_or.reduce( indices.astype( np.uint64 ) << shifts, axis=1 )
+
+def _quantize565( colors ):
+    colors = np.rint( colors ).astype( np.int32 )
+    r = ( colors[:, 0] * 31 + 127 ) // 255
+    g = ( colors[:, 1] * 63 + 127 ) // 255
+    b = ( colors[:, 2] * 31 + 127 ) // 255
+    return ( ( r << 11 ) | ( g << 5 ) | b ).astype( np.uint16 )
+
+def _expand565( values ):
+    values = values.astype( np.int32 )
+    r = ( values >> 11 ) & 0x1F
+    g = ( values >> 5 ) & 0x3F
+    b = values & 0x1F
+    return np.stack( [ ( r << 3 ) | ( r >> 2 ), ( g << 2 ) | ( g >> 4 ), ( b << 3 ) | ( b >> 2 ) ], axis=1 ).astype( np.float32 )
+
+def _encodeColorEndpoints( pixels, start, end ):
+    '''Quantizes BC1 color endpoints and selects the indices, always using the opaque 4 color mode'''
+    color0 = _quantize565( end )
+    color1 = _quantize565( start )
+
+    # color0 must be greater than color1 to select the 4 color mode
+    swap = color0 < color1
+    color0, color1 = np.where( swap, color1, color0 ), np.where( swap, color0, color1 )
+
+    e0 = _expand565( color0 )
+    e1 = _expand565( color1 )
+    palette = np.stack( [ e0, e1, ( 2 * e0 + e1 ) / 3, ( e0 + 2 * e1 ) / 3 ], axis=1 )
+    indices = _selectIndices( pixels, palette )
+    indices[ color0 == color1 ] = 0
+    return color0, color1, indices
+
+BC1_INDEX_WEIGHTS = [ 0.0, 1.0, 1.0 / 3.0, 2.0 / 3.0 ]
+
+def _encodeColorBlocks( pixels ):
+    '''Encodes ( blockCount, 16, 3 ) float pixels into BC1 color blocks'''
+    start, end = _calcPrincipalAxisEndpoints( pixels )
+    color0, color1, indices = _encodeColorEndpoints( pixels, start, end )
+
+    # refine the endpoints once using the selected indices
+    weights = np.asarray( BC1_INDEX_WEIGHTS, dtype=np.float32 )[ indices ]
+    refinedEnd, refinedStart = _refineEndpoints( pixels, weights, _expand565( color0 ), _expand565( color1 ) )
+    refined = _encodeColorEndpoints( pixels, refinedStart, refinedEnd )
+
+    # keep whichever encoding has the lowest error
+    def calcError( color0, color1, indices ):
+        e0 = _expand565( color0 )
+        e1 = _expand565( color1 )
+        palette = np.stack( [ e0, e1, ( 2 * e0 + e1 ) / 3, ( e0 + 2 * e1 ) / 3 ], axis=1 )
+        decoded = np.take_along_axis( palette, indices[:, :, np.newaxis], axis=1 )
+        return ( ( decoded - pixels ) ** 2 ).sum( axis=( 1, 2 ) )
+
+    useRefined = calcError( *refined ) < calcError( color0, color1, indices )
+    color0 = np.where( useRefined, refined[0], color0 )
+    color1 = np.where( useRefined, refined[1], color1 )
+    indices = np.where( useRefined[:, np.newaxis], refined[2], indices )
+
+    blocks = np.zeros( len( pixels ), dtype=[ ( 'color0', '<u2' ), ( 'color1', '<u2' ), ( 'indices', '<u4' ) ] )
+    blocks['color0'] = color0
+    blocks['color1'] = color1
+    blocks['indices'] = _packIndices( indices, 2 )
+    return blocks
+
+def _encodeAlphaBlocks( alpha ):
+    '''Encodes ( blockCount, 16 ) float alpha values into BC3 alpha blocks using the 8 value mode'''
+    alpha0 = np.rint( alpha.max( axis=1 ) ).astype( np.int32 )
+    alpha1 = np.rint( alpha.min( axis=1 ) ).astype( np.int32 )
+    palette = [ alpha0, alpha1 ]
+    for i in range( 1, 7 ):
+        palette.append( ( ( 7 - i ) * alpha0 + i * alpha1 ) / 7.0 )
+    palette = np.stack( palette, axis=1 ).astype( np.float32 )
+    indices = np.abs( alpha[:, :, np.newaxis] - palette[:, np.newaxis, :] ).argmin( axis=2 )
+    indices[ alpha0 == alpha1 ] = 0
+
+    packed = _packIndices( indices, 3 )
+    blocks = np.zeros( len( alpha ), dtype=[ ( 'alpha0', 'u1' ), ( 'alpha1', 'u1' ), ( 'indices', 'u1', 6 ) ] )
+    blocks['alpha0'] = alpha0
+    blocks['alpha1'] = alpha1
+    blocks['indices'] = ( packed[:, np.newaxis] >> ( np.arange( 6, dtype=np.uint64 ) * np.uint64( 8 ) ) ) & np.uint64( 0xFF )
+    return blocks
+
+def encodeBC1( rgba ):
+    '''Encodes an ( height, width, 4 ) uint8 image as opaque BC1 (DXT1)'''
+    return b''.join( _encodeColorBlocks( pixels[:, :, 0:3] ).tobytes() for pixels in _iterBlockChunks( rgba ) )
+
+def encodeBC3( rgba ):
+    '''Encodes an ( height, width, 4 ) uint8 image as BC3 (DXT5)'''
+    chunks = []
+    for pixels in _iterBlockChunks( rgba ):
+        alphaBlocks = _encodeAlphaBlocks( pixels[:, :, 3] )
+        colorBlocks = _encodeColorBlocks( pixels[:, :, 0:3] )
+        blocks = np.empty( ( len( pixels ), 16 ), dtype=np.uint8 )
+        blocks[:, 0:8] = alphaBlocks.view( np.uint8 ).reshape( -1, 8 )
+        blocks[:, 8:16] = colorBlocks.view( np.uint8 ).reshape( -1, 8 )
+        chunks.append( blocks.tobytes() )
+    return b''.join( chunks )
+
+def _quantizeBC7Endpoint( endpoint ):
+    '''Quantizes ( blockCount, 4 ) endpoints to 7 bits per channel plus a shared p-bit, picking the p-bit with the lowest error'''
+    best = None
+    for pbit in ( 0, 1 ):
+        quantized = np.clip( np.rint( ( endpoint - pbit ) / 2.0 ), 0, 127 ).astype( np.int32 )
+        error = ( ( ( quantized << 1 ) | pbit ) - endpoint ) ** 2
+        error = error.sum( axis=1 )
+        if best == None:
+            best = [ quantized, np.zeros( len( endpoint ), dtype=np.int32 ), error ]
+        else:
+            better = error < best[2]
+            best[0] = np.where( better[:, np.newaxis], quantized, best[0] )
+            best[1] = np.where( better, 1, best[1] )
+            best[2] = np.where( better, error, best[2] )
+    return best[0], best[1]
+
+def _encodeBC7Endpoints( pixels, start, end ):
+    quantized0, pbit0 = _quantizeBC7Endpoint( start )
+    quantized1, pbit1 = _quantizeBC7Endpoint( end )
+    e0 = ( ( quantized0 << 1 ) | pbit0[:, np.newaxis] )
+    e1 = ( ( quantized1 << 1 ) | pbit1[:, np.newaxis] )
+    weights = np.asarray( BC7_WEIGHTS4, dtype=np.int32 )[np.newaxis, :, np.newaxis]
+    palette = ( ( 64 - weights ) * e0[:, np.newaxis, :] + weights * e1[:, np.newaxis, :] + 32 ) >> 6
+    palette = palette.astype( np.float32 )
+    indices = _selectIndices( pixels, palette )
+    decoded = np.take_along_axis( palette, indices[:, :, np.newaxis], axis=1 )
+    error = ( ( decoded - pixels ) ** 2 ).sum( axis=( 1, 2 ) )
+    return quantized0, pbit0, quantized1, pbit1, indices, error
+
+def _putBits( lo, hi, offset, count, values ):
+    '''Writes count bits of values at the given bit offset of the 128 bit blocks stored as lo and hi'''
+    values = values.astype( np.uint64 )
+    if offset >= 64:
+        hi |= values << np.uint64( offset - 64 )
+    else:
+        lo |= values << np.uint64( offset )
+        if offset + count > 64:
+            hi |= values >> np.uint64( 64 - offset )
+
+def _encodeBC7Blocks( pixels ):
+    '''Encodes ( blockCount, 16, 4 ) float pixels into BC7 mode 6 blocks'''
+    start, end = _calcPrincipalAxisEndpoints( pixels )
+    best = _encodeBC7Endpoints( pixels, start, end )
+
+    # refine the endpoints once using the selected indices
+    weights = np.asarray( BC7_WEIGHTS4, dtype=np.float32 )[ best[4] ] / 64.0
+    refinedStart, refinedEnd = _refineEndpoints( pixels, weights, start, end )
+    refined = _encodeBC7Endpoints( pixels, refinedStart, refinedEnd )
+    useRefined = refined[5] < best[5]
+    quantized0, pbit0, quantized1, pbit1, indices = [
+        np.where( useRefined.reshape( ( -1, ) + ( 1, ) * ( b.ndim - 1 ) ), r, b ) for b, r in zip( best[0:5], refined[0:5] ) ]
+
+    # the most significant bit of the first index is implicitly zero, so swap the endpoints where needed
+    swap = indices[:, 0] >= 8
+    quantized0, quantized1 = np.where( swap[:, np.newaxis], quantized1, quantized0 ), np.where( swap[:, np.newaxis], quantized0, quantized1 )
+    pbit0, pbit1 = np.where( swap, pbit1, pbit0 ), np.where( swap, pbit0, pbit1 )
+    indices = np.where( swap[:, np.newaxis], 15 - indices, indices )
+
+    lo = np.zeros( len( pixels ), dtype=np.uint64 )
+    hi = np.zeros( len( pixels ), dtype=np.uint64 )
+    _putBits( lo, hi, 0, 7, np.full( len( pixels ), 1 << 6 ) )
+    offset = 7
+    for channel in range( 4 ):
+        _putBits( lo, hi, offset, 7, quantized0[:, channel] )
+        _putBits( lo, hi, offset + 7, 7, quantized1[:, channel] )
+        offset += 14
+    _putBits( lo, hi, offset, 1, pbit0 )
+    _putBits( lo, hi, offset + 1, 1, pbit1 )
+    offset += 2
+    _putBits( lo, hi, offset, 3, indices[:, 0] )
+    offset += 3
+    for i in range( 1, 16 ):
+        _putBits( lo, hi, offset, 4, indices[:, i] )
+        offset += 4
+
+    return np.stack( [ lo, hi ], axis=1 ).astype( '<u8' )
+
+def encodeBC7( rgba ):
+    '''Encodes an ( height, width, 4 ) uint8 image as BC7, using mode 6 for every block'''
+    return b''.join( _encodeBC7Blocks( pixels ).tobytes() for pixels in _iterBlockChunks( rgba ) )
+
+def encodeRGBA( rgba ):
+    '''Encodes an ( height, width, 4 ) uint8 image as uncompressed R8G8B8A8'''
+    return np.ascontiguousarray( rgba, dtype=np.uint8 ).tobytes()
+
+def encodeDDS( rgba, fmt, srgb=True, mips=True ):
+    '''
+    Encodes an ( height, width, 4 ) uint8 image into a DDS file of the given texconv style format name (DXT1, DXT5, BC7 or RGBA).
+    When mips is set the full mip chain is generated, in linear space if srgb is set.
+    '''
+    if fmt not in SUPPORTED_FORMATS:
+        raise NotImplementedError( f'unsupported block compression format: {fmt}' )
+
+    rgba = np.asarray( rgba, dtype=np.uint8 )
+    images = generateMips( rgba, srgb ) if mips else [ rgba ]
+    encodeFn = { 'DXT1': encodeBC1, 'DXT5': encodeBC3, 'BC7': encodeBC7, 'RGBA': encodeRGBA }[ fmt ]
+
+    dds = DDSFile()
+    dds.header.dwHeight = rgba.shape[0]
+    dds.header.dwWidth = rgba.shape[1]
+    dds.header.dwMipMapCount = len( images )
+    dds.header.dwFlags |= DDSD_MIPMAPCOUNT
+    if len( images ) > 1:
+        dds.header.dwCaps |= DDSCAPS_COMPLEX | DDSCAPS_MIPMAP
+    dds.buffer = bytearray()
+    for image in images:
+        dds.buffer += encodeFn( image )
+
+    if fmt == 'RGBA':
+        dds.header.dwFlags |= DDSD_PITCH
+        dds.header.ddspf.dwFlags |= DDS_RGBA
+        dds.header.ddspf.dwRGBBitCount = 32
+        dds.header.ddspf.dwRBitMask = 0xff
+        dds.header.ddspf.dwGBitMask = 0xff00
+        dds.header.ddspf.dwBBitMask = 0xff0000
+        dds.header.ddspf.dwABitMask = 0xff000000
+        dds.header.dwPitchOrLinearSize = ddsCalcPitchBpp( dds.header.dwWidth, 32 )
+    else:
+        blockSize = 8 if fmt == 'DXT1' else 16
+        dds.header.dwFlags |= DDSD_LINEARSIZE
+        dds.header.dwPitchOrLinearSize = ddsCalcLinearSizeBlockCompressed( dds.header.dwWidth, dds.header.dwHeight, blockSize )
+        dds.header.ddspf.dwFlags |= DDPF_FOURCC
+        if fmt == 'DXT1':
+            dds.header.ddspf.dwFourCC = DDS_FOURCC_DXT1
+        elif fmt == 'DXT5':
+            dds.header.ddspf.dwFourCC = DDS_FOURCC_DXT5
+        else:
+            dds.header.ddspf.dwFourCC = DDS_FOURCC_DXT10
+            dds.dxt10Header.dxgiFormat = DXGI_FORMAT_BC7_UNORM
+            dds.dxt10Header.resourceDimension = D3D11_RESOURCE_DIMENSION_TEXTURE2D
+            dds.dxt10Header.arraySize = 1
+    return dds
+
+BC7_WEIGHTS2 = [0, 21, 43, 64]
+BC7_WEIGHTS3 = [0, 9, 18, 27, 37, 46, 55, 64]
+
+# subset count, partition bits, rotation bits, index selection bits, color bits, alpha bits, 
+# endpoint p-bits, shared p-bits, index bits, secondary index bits
+BC7_MODES = [
+    ( 3, 4, 0, 0, 4, 0, 1, 0, 3, 0 ),
+    ( 2, 6, 0, 0, 6, 0, 0, 1, 3, 0 ),
+    ( 3, 6, 0, 0, 5, 0, 0, 0, 2, 0 ),
+    ( 2, 6, 0, 0, 7, 0, 1, 0, 2, 0 ),
+    ( 1, 0, 2, 1, 5, 6, 0, 0, 2, 3 ),
+    ( 1, 0, 2, 0, 7, 8, 0, 0, 2, 2 ),
+    ( 1, 0, 0, 0, 7, 7, 1, 0, 4, 0 ),
+    ( 2, 6, 0, 0, 5, 5, 1, 0, 2, 0 ),
+]
+
+# 2 subset partitions, bit i is the subset of pixel i
+BC7_PARTITIONS2 = [
+    0xCCCC, 0x8888, 0xEEEE, 0xECC8, 0xC880, 0xFEEC, 0xFEC8, 0xEC80, 0xC800, 0xFFEC, 0xFE80, 0xE800, 0xFFE8, 0xFF00, 0xFFF0, 0xF000,
+    0xF710, 0x008E, 0x7100, 0x08CE, 0x008C, 0x7310, 0x3100, 0x8CCE, 0x088C, 0x3110, 0x6666, 0x366C, 0x17E8, 0x0FF0, 0x718E, 0x399C,
+    0xAAAA, 0xF0F0, 0x5A5A, 0x33CC, 0x3C3C, 0x55AA, 0x9696, 0xA55A, 0x73CE, 0x13C8, 0x324C, 0x3BDC, 0x6996, 0xC33C, 0x9966, 0x0660,
+    0x0272, 0x04E4, 0x4E40, 0x2720, 0xC936, 0x936C, 0x39C6, 0x639C, 0x9336, 0x9CC6, 0x817E, 0xE718, 0xCCF0, 0x0FCC, 0x7744, 0xEE22,
+]
+
+# 3 subset partitions, 2 bits per pixel with pixel i at bit 2i
+BC7_PARTITIONS3 = [
+    0xAA685050, 0x6A5A5040, 0x5A5A4200, 0x5450A0A8, 0xA5A50000, 0xA0A05050, 0x5555A0A0, 0x5A5A5050,
+    0xAA550000, 0xAA555500, 0xAAAA5500, 0x90909090, 0x94949494, 0xA4A4A4A4, 0xA9A59450, 0x2A0A4250,
+    0xA5945040, 0x0A425054, 0xA5A5A500, 0x55A0A0A0, 0xA8A85454, 0x6A6A4040, 0xA4A45000, 0x1A1A0500,
+    0x0050A4A4, 0xAAA59090, 0x14696914, 0x69691400, 0xA08585A0, 0xAA821414, 0x50A4A450, 0x6A5A0200,
+    0xA9A58000, 0x5090A0A8, 0xA8A09050, 0x24242424, 0x00AA5500, 0x24924924, 0x24499224, 0x50A50A50,
+    0x500AA550, 0xAAAA4444, 0x66660000, 0xA5A0A5A0, 0x50A050A0, 0x69286928, 0x44AAAA44, 0x66666600,
+    0xAA444444, 0x54A854A8, 0x95809580, 0x96969600, 0xA85454A8, 0x80959580, 0xAA141414, 0x96960000,
+    0xAAAA1414, 0xA05050A0, 0xA0A5A5A0, 0x96000000, 0x40804080, 0xA9A8A9A8, 0xAAAAAA44, 0x2A4A5254,
+]
+
+BC7_ANCHORS2 = [
+    15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15,
+    15,  2,  8,  2,  2,  8,  8, 15,  2,  8,  2,  2,  8,  8,  2,  2,
+    15, 15,  6,  8,  2,  8, 15, 15,  2,  8,  2,  2,  2, 15, 15,  6,
+     6,  2,  6,  8, 15, 15,  2,  2, 15, 15, 15, 15, 15,  2,  2, 15,
+]
+
+BC7_ANCHORS3A = [
+     3,  3, 15, 15,  8,  3, 15, 15,  8,  8,  6,  6,  6,  5,  3,  3,
+     3,  3,  8, 15,  3,  3,  6, 10,  5,  8,  8,  6,  8,  5, 15, 15,
+     8, 15,  3,  5,  6, 10,  8, 15, 15,  3, 15,  5, 15, 15, 15, 15,
+     3, 15,  5,  5,  5,  8,  5, 10,  5, 10,  8, 13, 15, 12,  3,  3,
+]
+
+BC7_ANCHORS3B = [
+    15,  8,  8,  3, 15, 15,  3,  8, 15, 15, 15, 15, 15, 15, 15,  8,
+    15,  8, 15,  3, 15,  8, 15,  8,  3, 15,  6, 10, 15, 15, 10,  8,
+    15,  3, 15, 10, 10,  8,  9, 10,  6, 15,  8, 15,  3,  6,  6,  8,
+    15,  3, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15,  3, 15, 15,  8,
+]
+
+def _fromBlocks( blocks, width, height ):
+    '''Reassembles ( blockCount, 16, 4 ) blocks in row-major order into an ( height, width, 4 ) image'''
+    blocksX = ( width + 3 ) // 4
+    blocksY = ( height + 3 ) // 4
+    image = blocks.reshape( blocksY, blocksX, 4, 4, 4 ).transpose( 0, 2, 1, 3, 4 ).reshape( blocksY * 4, blocksX * 4, 4 )
+    return np.ascontiguousarray( image[ 0:height, 0:width ] )
+
+def _unpackIndices( packed, bitsPerIndex ):
+    '''Unpacks an uint64 per block into ( blockCount, 16 ) indices, with the first pixel in the lowest bits'''
+    shifts = np.arange( 16, dtype=np.uint64 ) * np.uint64( bitsPerIndex )
+    return ( ( packed.astype( np.uint64 )[:, np.newaxis] >> shifts ) & np.uint64( ( 1 << bitsPerIndex ) - 1 ) ).astype( np.intp )
+
+def _decodeColorBlocks( blocks, allowTransparent ):
+    '''Decodes ( blockCount, 8 ) uint8 BC1 color blocks into ( blockCount, 16, 4 ) pixels'''
+    fields = blocks.view( [ ( 'color0', '<u2' ), ( 'color1', '<u2' ), ( 'indices', '<u4' ) ] ).reshape( -1 )
+    color0 = fields['color0']
+    color1 = fields['color1']
+    e0 = _expand565( color0 ).astype( np.int32 )
+    e1 = _expand565( color1 ).astype( np.int32 )
+    
+    # 3 color mode with transparent black is only used by BC1 when color0 <= color1
+    threeColor = ( color0 <= color1 )[:, np.newaxis] if allowTransparent else np.zeros( ( len( blocks ), 1 ), dtype=bool )
+    opaque = np.full( ( len( blocks ), 1 ), 255, dtype=np.int32 )
+    palette = np.stack( [
+        np.concatenate( [ e0, opaque ], axis=1 ),
+        np.concatenate( [ e1, opaque ], axis=1 ),
+        np.where( threeColor, np.concatenate( [ ( e0 + e1 ) // 2, opaque ], axis=1 ), np.concatenate( [ ( 2 * e0 + e1 ) // 3, opaque ], axis=1 ) ),
+        np.where( threeColor, 0, np.concatenate( [ ( e0 + 2 * e1 ) // 3, opaque ], axis=1 ) ),
+    ], axis=1 )
+    indices = _unpackIndices( fields['indices'], 2 )
+    return np.take_along_axis( palette, indices[:, :, np.newaxis], axis=1 ).astype( np.uint8 )
+
+def _decodeAlphaBlocks( blocks ):
+    '''Decodes ( blockCount, 8 ) uint8 BC3 alpha blocks into ( blockCount, 16 ) alpha values'''
+    alpha0 = blocks[:, 0].astype( np.int32 )
+    alpha1 = blocks[:, 1].astype( np.int32 )
+    eightValues = ( alpha0 > alpha1 )[:, np.newaxis]
+    palette = [ alpha0, alpha1 ]
+    for i in range( 1, 7 ):
+        palette.append( np.where( eightValues[:, 0], ( ( 7 - i ) * alpha0 + i * alpha1 ) // 7,
+                                  ( ( 5 - i ) * alpha0 + i * alpha1 ) // 5 if i < 5 else ( 0 if i == 5 else 255 ) ) )
+    palette = np.stack( palette, axis=1 )
+    packed = np.zeros( len( blocks ), dtype=np.uint64 )
+    for i in range( 6 ):
+        packed |= blocks[:, 2 + i].astype( np.uint64 ) << np.uint64( 8 * i )
+    return np.take_along_axis( palette, _unpackIndices( packed, 3 ), axis=1 ).astype( np.uint8 )
+
+def decodeBC1( data, width, height ):
+    '''Decodes BC1 (DXT1) data into an ( height, width, 4 ) uint8 image'''
+    blocks = np.frombuffer( data, dtype=np.uint8, count=_calcBlockCount( width, height ) * 8 ).reshape( -1, 8 )
+    return _fromBlocks( _decodeColorBlocks( blocks, True ), width, height )
+
+def decodeBC2( data, width, height ):
+    '''Decodes BC2 (DXT2/DXT3) data into an ( height, width, 4 ) uint8 image'''
+    blocks = np.frombuffer( data, dtype=np.uint8, count=_calcBlockCount( width, height ) * 16 ).reshape( -1, 16 )
+    pixels = _decodeColorBlocks( np.ascontiguousarray( blocks[:, 8:16] ), False )
+    alpha = np.stack( [ blocks[:, 0:8] & 0x0F, blocks[:, 0:8] >> 4 ], axis=2 ).reshape( -1, 16 )
+    pixels[:, :, 3] = alpha * 17
+    return _fromBlocks( pixels, width, height )
+
+def decodeBC3( data, width, height ):
+    '''Decodes BC3 (DXT4/DXT5) data into an ( height, width, 4 ) uint8 image'''
+    blocks = np.frombuffer( data, dtype=np.uint8, count=_calcBlockCount( width, height ) * 16 ).reshape( -1, 16 )
+    pixels = _decodeColorBlocks( np.ascontiguousarray( blocks[:, 8:16] ), False )
+    pixels[:, :, 3] = _decodeAlphaBlocks( blocks[:, 0:8] )
+    return _fromBlocks( pixels, width, height )
+
+def _readBits( bits, offset, count ):
+    '''Reads count bits starting at the scalar or per block offset from ( blockCount, 128 ) unpacked block bits'''
+    if count == 0:
+        return np.zeros( len( bits ), dtype=np.int32 )
+    positions = np.asarray( offset )[..., np.newaxis] + np.arange( count )
+    positions = np.broadcast_to( positions, ( len( bits ), count ) )
+    values = np.take_along_axis( bits, positions, axis=1 ).astype( np.int32 )
+    return ( values << np.arange( count, dtype=np.int32 ) ).sum( axis=1 )
+
+def _unquantizeBC7( values, bitCount ):
+    values = values << ( 8 - bitCount )
+    return values | ( values >> bitCount )
+
+def _decodeBC7Mode( bits, mode ):
+    '''Decodes ( blockCount, 128 ) unpacked bits of blocks that all use the given mode into ( blockCount, 16, 4 ) pixels'''
+    subsetCount, partitionBits, rotationBits, indexSelectionBits, colorBits, alphaBits, \
+        endpointPBits, sharedPBits, indexBits, secondaryIndexBits = BC7_MODES[ mode ]
+    blockCount = len( bits )
+    offset = mode + 1
+    partition = _readBits( bits, offset, partitionBits )
+    offset += partitionBits
+    rotation = _readBits( bits, offset, rotationBits )
+    offset += rotationBits
+    indexSelection = _readBits( bits, offset, indexSelectionBits )
+    offset += indexSelectionBits
+    
+    endpointCount = subsetCount * 2
+    endpoints = np.zeros( ( blockCount, endpointCount, 4 ), dtype=np.int32 )
+    for channel in range( 3 ):
+        for i in range( endpointCount ):
+            endpoints[:, i, channel] = _readBits( bits, offset, colorBits )
+            offset += colorBits
+    for i in range( endpointCount ):
+        endpoints[:, i, 3] = _readBits( bits, offset, alphaBits )
+        offset += alphaBits
+        
+    # expand the endpoints to 8 bits, with the p-bit as least significant bit
+    channelBits = np.array( [ colorBits ] * 3 + [ alphaBits ], dtype=np.int32 )
+    if endpointPBits or sharedPBits:
+        for i in range( endpointCount ):
+            if endpointPBits:
+                pbit = _readBits( bits, offset + i, 1 )
+            else:
+                pbit = _readBits( bits, offset + i // 2, 1 )
+            endpoints[:, i, :] = ( endpoints[:, i, :] << 1 ) | pbit[:, np.newaxis]
+        offset += endpointCount if endpointPBits else subsetCount
+        channelBits = channelBits + 1
+    for channel in range( 4 ):
+        if channelBits[ channel ] > 1:
+            endpoints[:, :, channel] = _unquantizeBC7( endpoints[:, :, channel], channelBits[ channel ] )
+    if alphaBits == 0:
+        endpoints[:, :, 3] = 255
+        
+    # determine the subset and anchor of every pixel
+    pixels = np.arange( 16 )
+    if subsetCount == 1:
+        subsets = np.zeros( ( blockCount, 16 ), dtype=np.intp )
+        isAnchor = np.broadcast_to( pixels == 0, ( blockCount, 16 ) )
+    elif subsetCount == 2:
+        subsets = ( ( np.asarray( BC7_PARTITIONS2 )[ partition ][:, np.newaxis] >> pixels ) & 1 ).astype( np.intp )
+        isAnchor = ( pixels == 0 ) | ( pixels == np.asarray( BC7_ANCHORS2 )[ partition ][:, np.newaxis] )
+    else:
+        subsets = ( ( np.asarray( BC7_PARTITIONS3, dtype=np.int64 )[ partition ][:, np.newaxis] >> ( pixels * 2 ) ) & 3 ).astype( np.intp )
+        isAnchor = ( pixels == 0 ) | ( pixels == np.asarray( BC7_ANCHORS3A )[ partition ][:, np.newaxis] ) | \
+                   ( pixels == np.asarray( BC7_ANCHORS3B )[ partition ][:, np.newaxis] )
+    
+    # anchor indices have an implicit zero most significant bit
+    def readIndices( offset, indexBits, isAnchor ):
+        counts = np.where( isAnchor, indexBits - 1, indexBits )
+        offsets = offset + np.cumsum( counts, axis=1 ) - counts
+        indices = np.zeros( ( blockCount, 16 ), dtype=np.intp )
+        for bit in range( indexBits ):
+            present = bit < counts
+            value = np.take_along_axis( bits, np.minimum( offsets + bit, 127 ), axis=1 )
+            indices |= np.where( present, value, 0 ).astype( np.intp ) << bit
+        return indices, offset + 16 * indexBits - np.count_nonzero( isAnchor[0] )
+        
+    indices, offset = readIndices( offset, indexBits, isAnchor )
+    weightTables = { 2: BC7_WEIGHTS2, 3: BC7_WEIGHTS3, 4: BC7_WEIGHTS4 }
+    colorWeights = np.asarray( weightTables[ indexBits ], dtype=np.int32 )[ indices ]
+    alphaWeights = colorWeights
+    if secondaryIndexBits > 0:
+        secondaryIndices, offset = readIndices( offset, secondaryIndexBits, np.broadcast_to( pixels == 0, ( blockCount, 16 ) ) )
+        secondaryWeights = np.asarray( weightTables[ secondaryIndexBits ], dtype=np.int32 )[ secondaryIndices ]
+        swap = ( indexSelection == 1 )[:, np.newaxis]
+        colorWeights, alphaWeights = np.where( swap, secondaryWeights, colorWeights ), np.where( swap, colorWeights, secondaryWeights )
+        
+    e0 = np.take_along_axis( endpoints, ( subsets * 2 )[:, :, np.newaxis], axis=1 )
+    e1 = np.take_along_axis( endpoints, ( subsets * 2 + 1 )[:, :, np.newaxis], axis=1 )
+    weights = np.concatenate( [ np.repeat( colorWeights[:, :, np.newaxis], 3, axis=2 ), alphaWeights[:, :, np.newaxis] ], axis=2 )
+    result = ( ( 64 - weights ) * e0 + weights * e1 + 32 ) >> 6
+    
+    # rotation swaps the alpha channel with one of the color channels
+    for channel in range( 3 ):
+        rotated = rotation == channel + 1
+        if rotated.any():
+            result[ rotated, :, channel ], result[ rotated, :, 3 ] = result[ rotated, :, 3 ], result[ rotated, :, channel ].copy()
+    return result.astype( np.uint8 )
+
+def decodeBC7( data, width, height ):
+    '''Decodes BC7 data into an ( height, width, 4 ) uint8 image'''
+    blocks = np.frombuffer( data, dtype=np.uint8, count=_calcBlockCount( width, height ) * 16 ).reshape( -1, 16 )
+    bits = np.unpackbits( blocks, axis=1, bitorder='little' )
+    
+    # the mode is the position of the first set bit, blocks without any are invalid and decode to zero
+    modes = np.where( bits[:, 0:8].any( axis=1 ), bits[:, 0:8].argmax( axis=1 ), -1 )
+    pixels = np.zeros( ( len( blocks ), 16, 4 ), dtype=np.uint8 )
+    for mode in range( 8 ):
+        selected = modes == mode
+        for start in range( 0, np.count_nonzero( selected ), BLOCK_CHUNK_SIZE ):
+            chunk = np.nonzero( selected )[0][ start : start + BLOCK_CHUNK_SIZE ]
+            pixels[ chunk ] = _decodeBC7Mode( bits[ chunk ], mode )
+    return _fromBlocks( pixels, width, height )
+
+def decodeRGBA( data, width, height ):
+    '''Decodes uncompressed R8G8B8A8 data into an ( height, width, 4 ) uint8 image'''
+    return np.frombuffer( data, dtype=np.uint8, count=width * height * 4 ).reshape( height, width, 4 ).copy()
+
+def _calcBlockCount( width, height ):
+    return ( ( width + 3 ) // 4 ) * ( ( height + 3 ) // 4 )
+
+def getFormatName( fourCC, dxgiFormat=None ):
+    '''Gets the texconv style format name for a DDS four character code and DXGI format'''
+    if fourCC == DDS_FOURCC_DXT1: return 'DXT1'
+    elif fourCC in [DDS_FOURCC_DXT2, DDS_FOURCC_DXT3]: return 'DXT3'
+    elif fourCC in [DDS_FOURCC_DXT4, DDS_FOURCC_DXT5]: return 'DXT5'
+    elif fourCC == DDS_FOURCC_DXT10:
+        if dxgiFormat in [DXGI_FORMAT_BC7_UNORM, DXGI_FORMAT_BC7_TYPELESS, DXGI_FORMAT_BC7_UNORM_SRGB]: return 'BC7'
+        elif dxgiFormat in [DXGI_FORMAT_BC1_UNORM, DXGI_FORMAT_BC1_TYPELESS, DXGI_FORMAT_BC1_UNORM_SRGB]: return 'DXT1'
+        elif dxgiFormat in [DXGI_FORMAT_BC2_UNORM, DXGI_FORMAT_BC2_TYPELESS, DXGI_FORMAT_BC2_UNORM_SRGB]: return 'DXT3'
+        elif dxgiFormat in [DXGI_FORMAT_BC3_UNORM, DXGI_FORMAT_BC3_TYPELESS, DXGI_FORMAT_BC3_UNORM_SRGB]: return 'DXT5'
+        elif dxgiFormat in [DXGI_FORMAT_R8G8B8A8_UNORM, DXGI_FORMAT_R8G8B8A8_TYPELESS, DXGI_FORMAT_R8G8B8A8_UNORM_SRGB]: return 'RGBA'
+    elif fourCC == DDS_FOURCC_NONE: return 'RGBA'
+    raise NotImplementedError( f'unsupported block compression format: {fourCC} {dxgiFormat}' )
+
+def decode( data, width, height, fmt ):
+    '''Decodes data of the given texconv style format name (DXT1, DXT3, DXT5, BC7 or RGBA) into an ( height, width, 4 ) uint8 image'''
+    decodeFn = { 'DXT1': decodeBC1, 'DXT3': decodeBC2, 'DXT5': decodeBC3, 'BC7': decodeBC7, 'RGBA': decodeRGBA }.get( fmt )
+    if decodeFn == None:
+        raise NotImplementedError( f'unsupported block compression format: {fmt}' )
+    return decodeFn( data, max( 1, width ), max( 1, height ) )
+
+def canDecodeDDS( dds ):
+    '''Checks if the pixel format of a DDS file is supported by the decoders'''
+    pf = dds.header.ddspf
+    if pf.dwFlags & DDPF_FOURCC:
+        try:
+            getFormatName( pf.dwFourCC, dds.dxt10Header.dxgiFormat )
+            return True
+        except NotImplementedError:
+            return False
+    return pf.dwRGBBitCount == 32 and pf.dwRBitMask == 0xff and pf.dwGBitMask == 0xff00 and pf.dwBBitMask == 0xff0000
+
+def decodeDDS( dds, mip=0, surface=0 ):
+    '''Decodes a mip of a surface in a DDS file into an ( height, width, 4 ) uint8 image'''
+    fmt = getFormatName( dds.header.ddspf.dwFourCC, dds.dxt10Header.dxgiFormat )
+    mipCount = max( 1, dds.header.dwMipMapCount )
+    offset = 0
+    for i in range( surface * mipCount + mip ):
+        width = max( 1, dds.header.dwWidth >> ( i % mipCount ) )
+        height = max( 1, dds.header.dwHeight >> ( i % mipCount ) )
+        offset += calcMipSize( width, height, fmt )
+    width = max( 1, dds.header.dwWidth >> mip )
+    height = max( 1, dds.header.dwHeight >> mip )
+    return decode( memoryview( dds.buffer )[ offset : offset + calcMipSize( width, height, fmt ) ], width, height, fmt )
+
+def calcMipSize( width, height, fmt ):
+    '''Calculates the size in bytes of a mip of the given dimensions and format'''
+    if fmt == 'RGBA':
+        return width * height * 4
+    return _calcBlockCount( width, height ) * ( 8 if fmt == 'DXT1' else 16 )
@@ -0,0 +1,142 @@
+'''
+Persistent content addressed cache for converted textures.
+'''
+
+import os
+import shutil
+import hashlib
+import target
+import util
+import libtarget
+
+class TextureCache:
+    '''
+    On-disk cache of texture conversion results, keyed by the content of the source (and reference) texture
+    together with every setting that affects the output. Entries are evicted in least recently used order
+    once the total size of the cache exceeds the size limit.
+    '''
+
+    VERSION = 2
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__( self, cacheDir: str, maxSize: int = 1024 * 1024 * 1024 ):
+        self.cacheDir = cacheDir
+        self.maxSize = maxSize
+        self._fileHashes = dict()
+        # total size of the entries, counted once by walking the cache and kept up to date by store()
+        self._totalSize = None
+
+    def _hashFile( self, path ):
+        stat = os.stat( path )
+        statKey = ( os.path.realpath( path ), stat.st_size, stat.st_mtime_ns )
+        digest = self._fileHashes.get( statKey )
+        if digest == None:
+            h = hashlib.sha256()
+            with open( path, 'rb' ) as f:
+                while True:
+                    chunk = f.read( TextureCache.CHUNK_SIZE )
+                    if not chunk:
+                        break
+                    h.update( chunk )
+            digest = h.hexdigest()
+            self._fileHashes[ statKey ] = digest
+        return digest
+
+    def _getExt( self, path ):
+        basePath, baseName, exts = util.splitPath( path )
+        return exts[len(exts) - 1].lower() if len( exts ) > 0 else ''
+
+    def _getEntryPath( self, key, ext ):
+        return os.path.join( self.cacheDir, key[0:2], key + '.' + ext )
+
+    @staticmethod
+    def getEncoderBackend() -> str:
+        '''Gets the name of the backend that encodes DDS textures, as the outputs of the backends differ'''
+        # textures are encoded in-process when NumPy is available, and with texconv otherwise
+        return 'texcompress' if libtarget.numpy else 'texconv'
+
+    def getKey( self, srcTexturePath: str, dstExt: str, refTexturePath: str = None, forcedFormat: int = None,
+                swapNormalMapRAChannels: bool = False, invertNormalMapG: bool = False ) -> str:
+        '''Gets the cache key for converting the given source texture with the given settings'''
+
+        # the base name is part of the key because the output format can be derived from it
+        refHash = self._hashFile( refTexturePath ) if refTexturePath != None and refTexturePath != '' else None
+        parts = [
+            TextureCache.VERSION,
+            self._hashFile( srcTexturePath ),
+            util.splitPath( srcTexturePath )[1],
+            refHash,
+            forcedFormat,
+            dstExt.lower(),
+            swapNormalMapRAChannels,
+            invertNormalMapG,
+            target.current.name,
+            TextureCache.getEncoderBackend(),
+        ]
+        return hashlib.sha256( repr( parts ).encode( 'utf-8' ) ).hexdigest()
+
+    def fetch( self, key: str, dstPath: str ) -> bool:
+        '''Copies the cached output for the key to the destination path. Returns False if there is no cached output.'''
+        entryPath = self._getEntryPath( key, self._getExt( dstPath ) )
+        if not os.path.exists( entryPath ):
+            return False
+
+        shutil.copyfile( entryPath, dstPath )
+
+        # mark as recently used
+        os.utime( entryPath, None )
+        return True
+
+    def store( self, key: str, dstPath: str ):
+        '''Adds the converted output at the destination path to the cache, and evicts old entries if needed'''
+        entryPath = self._getEntryPath( key, self._getExt( dstPath ) )
+        os.makedirs( os.path.dirname( entryPath ), exist_ok=True )
+
+        try:
+            oldSize = os.path.getsize( entryPath )
+        except OSError:
+            oldSize = 0
+
+        # copy to a temporary file first so concurrent exports never see a partially written entry
+        tempPath = f'{entryPath}.{os.getpid()}.tmp'
+        shutil.copyfile( dstPath, tempPath )
+        os.replace( tempPath, entryPath )
+
+        if self._totalSize == None:
+            self.evict()
+        else:
+            self._totalSize += os.path.getsize( entryPath ) - oldSize
+            if self._totalSize > self.maxSize:
+                self.evict()
+
+    def evict( self ):
+        '''Removes the least recently used entries until the cache fits within its size limit, and recounts its total size'''
+        entries = []
+        totalSize = 0
+        for root, dirs, files in os.walk( self.cacheDir ):
+            for name in files:
+                if name.endswith( '.tmp' ):
+                    continue
+
+                path = os.path.join( root, name )
+                try:
+                    stat = os.stat( path )
+                except OSError:
+                    continue
+                entries.append( ( stat.st_mtime, stat.st_size, path ) )
+                totalSize += stat.st_size
+
+        self._totalSize = totalSize
+        if totalSize <= self.maxSize:
+            return
+
+        entries.sort()
+        for mtime, size, path in entries:
+            try:
+                os.remove( path )
+            except OSError:
+                continue
+            totalSize -= size
+            if totalSize <= self.maxSize:
+                break
+        self._totalSize = totalSize
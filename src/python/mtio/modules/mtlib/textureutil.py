@@ -1,11 +1,21 @@
 import os
+import tempfile
 
 import util
 from rtexture import *
 import texconv
+import texcompress
+import libtarget
 import log
+from texturecache import TextureCache
 from PIL import Image
 
+if libtarget.numpy:
+    import numpy as np
+
+# largest texture dimension supported by feature level 9.1
+MAX_TEXTURE_SIZE = 2048
+
 def doesTextureUseAlpha( textureFilePath: str ) -> bool:
     fileName: str
     fileExt: str
@@ -17,7 +27,11 @@ def doesTextureUseAlpha( textureFilePath: str ) -> bool:
         # if it's a dds, load it and determine if it uses a known encoding
         # that supports alpha
         dds = DDSFile.fromFile( textureFilePath )
-        if dds.header.ddspf.dwFourCC in [DDS_FOURCC_DXT2, DDS_FOURCC_DXT3, DDS_FOURCC_DXT4, DDS_FOURCC_DXT5]:
+        if libtarget.numpy and dds.header.ddspf.dwFourCC in [DDS_FOURCC_DXT2, DDS_FOURCC_DXT3, DDS_FOURCC_DXT4, DDS_FOURCC_DXT5, DDS_FOURCC_DXT10] \
+            and texcompress.canDecodeDDS( dds ):
+            # decode it to check whether the alpha channel is actually used
+            return bool( ( texcompress.decodeDDS( dds )[..., 3] < 255 ).any() )
+        elif dds.header.ddspf.dwFourCC in [DDS_FOURCC_DXT2, DDS_FOURCC_DXT3, DDS_FOURCC_DXT4, DDS_FOURCC_DXT5]:
             return True
         else:
             # likely DXT1 or other
@@ -31,9 +45,43 @@ def doesTextureUseAlpha( textureFilePath: str ) -> bool:
             # alpha information that may exist in the file
             return True
 
+def _calcPow2Size( size: int ) -> int:
+    '''Returns the power of two nearest to the given size, within the supported texture size'''
+    pow2 = 1
+    while pow2 * 2 <= size:
+        pow2 *= 2
+    if pow2 * 2 - size < size - pow2:
+        pow2 *= 2
+    return min( pow2, MAX_TEXTURE_SIZE )
+
+def swizzleNormalMapImage( im: Image.Image, swapRAChannels: bool = False, invertG: bool = False ) -> Image.Image:
+    '''Applies the normal map channel swizzles to an image, returning it as RGBA'''
+    r, g, b, a = im.convert( 'RGBA' ).split()
+    if swapRAChannels:
+        r, a = a, r
+    if invertG:
+        g = g.point( lambda x: 255 - x )
+    return Image.merge( 'RGBA', ( r, g, b, a ) )
+
+def encodeTextureToDDS( srcTexturePath: str, dstDDSPath: str, fmtDDSName: str, srgb: bool = True,
+                        swapNormalMapRAChannels: bool = False, invertNormalMapG: bool = False ) -> None:
+    '''Converts an image file to a power of two DDS file with mips using the built-in block compression encoders'''
+    if util.splitPath( srcTexturePath )[2][-1].lower() == 'dds':
+        im = Image.fromarray( texcompress.decodeDDS( DDSFile.fromFile( srcTexturePath ) ), 'RGBA' )
+    else:
+        im = Image.open( srcTexturePath ).convert( 'RGBA' )
+    size = ( _calcPow2Size( im.width ), _calcPow2Size( im.height ) )
+    if size != im.size:
+        im = im.resize( size, Image.LANCZOS )
+    
+    if swapNormalMapRAChannels or invertNormalMapG:
+        im = swizzleNormalMapImage( im, swapNormalMapRAChannels, invertNormalMapG )
+    texcompress.encodeDDS( np.asarray( im, dtype=np.uint8 ), fmtDDSName, srgb=srgb ).saveFile( dstDDSPath )
+
 def convertTexture( srcTexturePath: str, dstTexturePath: str = None, 
                    refTexturePath: str = None, forcedFormat: int = None,
-                   swapNormalMapRAChannels: bool = False, invertNormalMapG: bool = False ) -> None:    
+                   swapNormalMapRAChannels: bool = False, invertNormalMapG: bool = False, 
+                   cache: TextureCache = None ) -> None:    
     srcBasePath, srcBaseName, srcExts = util.splitPath( srcTexturePath )
     srcExt = srcExts[len(srcExts) - 1]
     
@@ -61,18 +109,30 @@ def convertTexture( srcTexturePath: str, dstTexturePath: str = None,
     dstBasePath, dstBaseName, dstExts = util.splitPath( dstTexturePath )
     dstExt = dstExts[len(dstExts) - 1]
     
+    if cache != None:
+        # serve unchanged textures from the cache, and convert and add them otherwise
+        key = cache.getKey( srcTexturePath, dstExt, refTexturePath, forcedFormat, swapNormalMapRAChannels, invertNormalMapG )
+        if cache.fetch( key, dstTexturePath ):
+            log.info('using cached conversion of {} for {}'.format(srcTexturePath, dstTexturePath))
+            return
+        
+        convertTexture( srcTexturePath, dstTexturePath, refTexturePath, forcedFormat, swapNormalMapRAChannels, invertNormalMapG )
+        cache.store( key, dstTexturePath )
+        return
+    
     refTex = None
     if refTexturePath != None and refTexturePath != '':
         # open reference texture if provided
+        # only the header and faces are used, so the mips are not read. the file is closed right away
+        # so that it can be overwritten when the reference is also the output
         refTex = rTextureData()
-        refTex.loadBinaryFile( refTexturePath )
+        with open( refTexturePath, 'rb' ) as f:
+            refTex.loadBinaryFileHeader( f )
     
     if srcExt == 'tex':
         # convert tex to dds first (lossless)
         log.info('converting TEX {} to DDS {}'.format(srcTexturePath, dstTexturePath))
-        tex = rTextureData()
-        tex.loadBinaryFile( srcTexturePath )
-        tex.toDDS().saveFile( dstTexturePath )
+        convertTEXFileToDDSFile( srcTexturePath, dstTexturePath )
         
         if dstExt != 'dds':
             # if the target type is not dds, convert the dds with texconv
@@ -140,20 +200,27 @@ def convertTexture( srcTexturePath: str, dstTexturePath: str = None,
                 
                 log.info( 'converting input {} to DDS {}'.format(srcTexturePath, srcDDSPath))
                 log.debug( 'DDS format: {}'.format( fmtDDSName ) )
-                log.debug( 'texconv start')
-                texconv.texconv( srcTexturePath, outPath=srcDDSBasePath, fileType='DDS', featureLevel=9.1, pow2=True, fmt=fmtDDSName, overwrite=True, srgb=True )
-                log.debug( 'texconv end')
+                if libtarget.numpy and fmtDDSName in texcompress.SUPPORTED_FORMATS and ( srcExt.lower() != 'dds' or texcompress.canDecodeDDS( dds ) ):
+                    # normal maps store vectors rather than colors, so they are filtered as linear data
+                    encodeTextureToDDS( srcTexturePath, srcDDSPath, fmtDDSName, srgb=not isNormal,
+                                        swapNormalMapRAChannels=swapNormalMapRAChannels, invertNormalMapG=invertNormalMapG )
+                else:
+                    with tempfile.TemporaryDirectory() as tempDir:
+                        texconvInputPath = srcTexturePath
+                        if swapNormalMapRAChannels or invertNormalMapG:
+                            # texconv doesn't swizzle, so pass it a swizzled copy named such that it still outputs to srcDDSPath
+                            try:
+                                im = swizzleNormalMapImage( Image.open( srcTexturePath ), swapNormalMapRAChannels, invertNormalMapG )
+                                texconvInputPath = os.path.join( tempDir, os.path.splitext( os.path.basename( srcDDSPath ) )[0] + '.png' )
+                                im.save( texconvInputPath )
+                            except Exception as e:
+                                log.warn( 'unable to apply normal map swizzles to {}, converting it as is: {}'.format( srcTexturePath, e ) )
+                            
+                        log.debug( 'texconv start')
+                        texconv.texconv( texconvInputPath, outPath=srcDDSBasePath, fileType='DDS', featureLevel=9.1, pow2=True, fmt=fmtDDSName, overwrite=True, srgb=not isNormal )
+                        log.debug( 'texconv end')
             
             log.info('converting DDS {} to TEX {}'.format( srcDDSPath, dstTexturePath ))
             log.debug('TEX format: {}'.format(fmt))
-            dds = DDSFile.fromFile( srcDDSPath )
-            tex = rTextureData.fromDDS( dds )
-            tex.header.fmt.surfaceFmt = fmt
-            
             # copy faces from original cubemap if needed
-            if refTex != None: 
-                tex.faces.clear()
-                for face in refTex.faces:
-                    tex.faces.append( face )
-            
-            tex.saveBinaryFile( dstTexturePath )
\ No newline at end of file
+            convertDDSFileToTEXFile( srcDDSPath, dstTexturePath, fmt, refTex.faces if refTex != None else None )
\ No newline at end of file
@@ -7,6 +7,10 @@ import math
 import os
 import sys
 import re
+import mmap
+import contextlib
+
+import libtarget
 
 import mvc3shaderdb
 from rshader import rShaderObjectId
@@ -24,14 +28,89 @@ def loadIntoByteArray( path ):
         data = f.read( size )
     return data
 
-def saveByteArrayToFile( path, buffer ):
-    '''Saves the given byte array to the specified file'''
+def loadIntoMemoryView( path ):
+    '''
+    Maps the given file into memory as a read-only view, without copying its contents.
+    The file must not be written to while the view, or any slice of it, is referenced.
+    '''
+    
+    with open( path, "rb" ) as f:
+        if os.fstat( f.fileno() ).st_size == 0:
+            return memoryview( bytes() )
+        mapping = mmap.mmap( f.fileno(), 0, access=mmap.ACCESS_READ )
+    
+    # the view keeps the mapping alive for as long as it, or any slice of it, is referenced
+    return memoryview( mapping )
+
+def openReadOnlyStream( path ):
+    '''
+    Opens the given file as a read-only stream, backed by a memory mapping where supported.
+    Data read from the stream are views into the mapping, so only use this for objects that are meant to view the file
+    (eg. rModelView) and prefer mapReadOnlyStream for scanning files.
+    '''
+    
+    if libtarget.noesis:
+        return NclBitStream( loadIntoByteArray( path ) )
+    else:
+        return NclBitStream( loadIntoMemoryView( path ) )
+    
+@contextlib.contextmanager
+def mapReadOnlyStream( path ):
+    '''
+    Maps the given file as a read-only stream for the duration of the with block, and closes the mapping afterwards.
+    Views read from the stream must not be used outside of the block.
+    '''
+    
+    if libtarget.noesis:
+        yield NclBitStream( loadIntoByteArray( path ) )
+        return
+    
+    with open( path, "rb" ) as f:
+        if os.fstat( f.fileno() ).st_size == 0:
+            yield NclBitStream( memoryview( bytes() ) )
+            return
+        
+        mapping = mmap.mmap( f.fileno(), 0, access=mmap.ACCESS_READ )
+        view = memoryview( mapping )
+        try:
+            yield NclBitStream( view )
+        finally:
+            view.release()
+            try:
+                mapping.close()
+            except BufferError:
+                # views read from the stream are still referenced, the mapping is closed once they are released
+                pass
+
+def openFileForWriting( path ):
+    '''Opens the specified file for writing, creating its directory if needed'''
     
     dirName = os.path.dirname( path )
     if dirName != '':
         os.makedirs( os.path.dirname( path ), exist_ok=True )
-    with open( path, "wb" ) as f:
+    return open( path, "wb" )
+
+def saveByteArrayToFile( path, buffer ):
+    '''Saves the given byte array to the specified file'''
+    
+    with openFileForWriting( path ) as f:
         f.write( buffer )
+        
+# size of the buffer used to copy data between files
+COPY_CHUNK_SIZE = 1024 * 1024
+
+def copyFileRange( src, dst, offset, size, chunkSize=COPY_CHUNK_SIZE ):
+    '''Copies size bytes at the given offset of the source file to the current position of the destination file, one chunk at a time'''
+    
+    buffer = bytearray( min( size, chunkSize ) )
+    view = memoryview( buffer )
+    src.seek( offset )
+    while size > 0:
+        count = src.readinto( view[ 0 : min( size, len( buffer ) ) ] )
+        if count == 0:
+            raise EOFError( f'unexpected end of file while copying {size} bytes' )
+        dst.write( view[ 0 : count ] )
+        size -= count
 
 def replaceSuffix( name, suffix, replacement ):
     '''Replaces the specified suffix with a replacement suffix'''
@@ -48,7 +127,7 @@ def readCStringBuffer( stream, length ):
             break
         len += 1
     
-    return buf[0:len].decode( "ASCII" )
+    return bytes( buf[0:len] ).decode( "ASCII" )
 
 def writeCStringBuffer( stream, value, length ):
     '''Writes an ASCII C-string buffer to the stream'''
@@ -104,10 +183,7 @@ def hex32( val ):
 def readFloatBuffer( stream, length ):
     '''Reads a float buffer from a stream with the specified length'''
     
-    buf = []
-    for i in range( length ):
-        buf.append( stream.readFloat() )
-    return buf
+    return stream.readFloats( length )
 
 def splitPath( path ):
     '''Splits the given path into the directory path, the base file name and an array of extensions'''
@@ -128,23 +204,6 @@ def bitPack( value, mask, bitOffset, index):
     '''Packs the specified bits into the value'''
     return ( value & ~( mask << bitOffset ) ) | ( index & mask ) << bitOffset
 
-def iterModelIndexBuffer( model, primitive, indexReadStream ):
-    '''
-    fix index buffer for drawing by subtracting the vertex start index from the indices
-    '''
-    indexStart = ( primitive.indexBufferOffset + primitive.indexStartIndex ) * 2
-    indexEnd = indexStart + ( primitive.indexCount * 2 )
-    indexReadStream.seek( indexStart )
-    badIdx = -1
-    for i in range(primitive.indexCount):
-        idx = indexReadStream.readUShort()
-        fixedIdx = idx - primitive.vertexStartIndex
-        assert( idx >= 0 )
-        if (fixedIdx < 0):
-            badIdx = i
-        yield fixedIdx
-    if badIdx != -1: print("Bad indices at " + str(badIdx) + " indexStart: " + str(indexStart) + " vertexStartIndex: " + str(primitive.vertexStartIndex))
-    
 def getLibDir():
     '''Gets the path to the library directory'''
     
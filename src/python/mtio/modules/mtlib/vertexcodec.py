@@ -12,6 +12,9 @@ from ncl import *
  
 import libtarget
 
+if libtarget.numpy:
+    import numpy as np
+
 if libtarget.noesis:
     # Noesis implementation
     import noesis
@@ -208,6 +211,88 @@ def encodeVertexComponent( compType, val ):
     elif compType == 14: return encodeR8G8B8A8( val )
     else: raise Exception( "Unhandled vertex component type: " + str( compType ) )
     
+def _encodeFS8Array( arr ):
+    arr = np.asarray( arr, dtype=np.float64 )
+    arr = np.where( np.isnan( arr ), 0, arr )
+    if target.current.name in ['aa-pc']:
+        enc = np.trunc( arr * 127 )
+    else:
+        # mvc3-pc
+        enc = np.trunc( ( arr * 127 ) + 127 )
+    return ( enc.astype( np.int64 ) & 0xFF ).astype( np.uint8 )
+
+def _encodeFS16Array( arr ):
+    arr = np.asarray( arr, dtype=np.float64 )
+    enc = np.where( arr < 0, np.trunc( np.abs( arr ) * 0x8000 ), np.trunc( np.abs( arr ) * 0x7FFF ) )
+    return ( enc.astype( np.int64 ) & 0xFFFF ).astype( np.uint16 )
+
+def _encodeFU8Array( arr ):
+    enc = np.trunc( np.asarray( arr, dtype=np.float64 ) * 0xFF )
+    return ( enc.astype( np.int64 ) & 0xFF ).astype( np.uint8 )
+
+def _encodeIntArray( arr, mask, dtype ):
+    enc = np.trunc( np.asarray( arr, dtype=np.float64 ) ).astype( np.int64 )
+    return ( enc & mask ).astype( dtype )
+
+def _encodeX8Y8Z8W8Array( arr ):
+    arr = np.asarray( arr, dtype=np.float64 )
+    if arr.shape[1] < 4:
+        arr = np.concatenate( ( arr[:, 0:3], np.ones( ( arr.shape[0], 1 ) ) ), axis=1 )
+    lanes = _encodeFS8Array( arr[:, 0:4] ).astype( np.uint32 )
+    return lanes[:, 0] | ( lanes[:, 1] << 8 ) | ( lanes[:, 2] << 16 ) | ( lanes[:, 3] << 24 )
+
+def _encodeR8G8B8A8Array( arr ):
+    lanes = np.asarray( arr, dtype=np.int64 )[:, 0] & 0xFF
+    return ( lanes | ( lanes << 8 ) | ( lanes << 16 ) | ( lanes << 24 ) ).astype( np.uint32 )
+
+def encodeVertexComponentArray( compType, arr ):
+    '''
+    Encodes an array of values with shape ( vertexCount, ) into an array of raw components.
+    Vector types (11, 14) take an array of shape ( vertexCount, componentCount ) instead.
+    Matches encodeVertexComponent for every value.
+    '''
+    if   compType == 1:  return np.asarray( arr, dtype=np.float64 ).astype( np.float32 )
+    elif compType == 2:  return np.asarray( arr, dtype=np.float64 ).astype( np.float16 ).view( np.uint16 )
+    elif compType == 3:  return _encodeIntArray( arr, 0xFFFF, np.uint16 )
+    elif compType == 4:  return _encodeIntArray( arr, 0xFFFF, np.uint16 ).view( np.int16 )
+    elif compType == 5:  return _encodeFS16Array( arr )
+    # elif compType == 6: 
+    elif compType == 7:  return _encodeIntArray( arr, 0xFF, np.uint8 )
+    elif compType == 8:  return _encodeIntArray( arr, 0xFF, np.uint8 )
+    elif compType == 9:  return _encodeFS8Array( arr )
+    elif compType == 10: return _encodeFU8Array( arr )
+    elif compType == 11: return _encodeX8Y8Z8W8Array( arr )
+    # elif compType == 12: 
+    elif compType == 13: return _encodeIntArray( arr, 0xFF, np.uint8 )
+    elif compType == 14: return _encodeR8G8B8A8Array( arr )
+    else: raise Exception( "Unhandled vertex component type: " + str( compType ) )
+    
+def encodeVertexBufferArrays( layout, columns, vertexCount, stride, endian = Endian.LITTLE ):
+    '''
+    Encodes columns of vertex data into a vertex buffer in one pass.
+    The layout is a sequence of ( column name, column index, component type ) in the order they are stored in a vertex,
+    where a column name of None stores a zero. The columns map each name to an array of shape ( vertexCount, ... ).
+    '''
+    endianFmt = Endian.STRUCT_FORMAT[ endian ]
+    buffer = np.zeros( ( vertexCount, stride ), dtype=np.uint8 )
+    offset = 0
+    for name, index, compType in layout:
+        if name is None:
+            values = np.zeros( vertexCount )
+        else:
+            values = columns[ name ]
+            if index is not None:
+                values = values[:, index]
+            
+        encoded = encodeVertexComponentArray( compType, values )
+        encoded = np.ascontiguousarray( encoded, dtype=encoded.dtype.newbyteorder( endianFmt ) )
+        size = encoded.dtype.itemsize
+        buffer[:, offset:offset + size] = encoded.view( np.uint8 ).reshape( vertexCount, size )
+        offset += size
+        
+    assert( offset == stride )
+    return buffer.tobytes()
+    
 def decodeVertexInputLayout( inputInfo, reader, writer, p ):
     '''
     Returns new component count
@@ -222,17 +307,15 @@ def decodeVertexInputLayout( inputInfo, reader, writer, p ):
     newComponentCount = int(size / 4)
     return newComponentCount
 
-def decodeVertexBuffer( shaderInfo, vertexBuffer, vertexCount, stride ):
-    '''
-    Returns (buffer, newStride, newInputs)
-    '''
+def _decodeVertexBufferScalar( shaderInfo, vertexBuffer, vertexCount, stride ):
     reader = NclBitStream( vertexBuffer )
     writer = NclBitStream()
     newInputs = []
     newStride = 0
     
     if vertexCount > 0:
-        for key, value in shaderInfo.inputsByName.items():
+        layout = shaderInfo.getLayout()
+        for key, value in layout.groups:
             newOffset = writer.tell()
             newComponentCount = 0
             for inputInfo in value:
@@ -241,13 +324,139 @@ def decodeVertexBuffer( shaderInfo, vertexBuffer, vertexCount, stride ):
             
         newStride = writer.tell()
         
+        elements = layout.elements
         for i in range(1, vertexCount):
             p = i * stride
-            for key, value in shaderInfo.inputsByName.items():
-                for inputInfo in value:
-                    decodeVertexInputLayout( inputInfo, reader, writer, p )
+            for inputInfo in elements:
+                decodeVertexInputLayout( inputInfo, reader, writer, p )
     
     return (writer.getBuffer(), newStride, newInputs)
+
+# component type -> (numpy storage type, decoded values per component)
+VERTEX_COMPONENT_ARRAY_TYPES = {
+    1:  ( 'f4', 1 ),
+    2:  ( 'f2', 1 ),
+    3:  ( 'u2', 1 ),
+    4:  ( 'i2', 1 ),
+    5:  ( 'u2', 1 ),
+    6:  ( 'u2', 1 ),
+    7:  ( 'u1', 1 ),
+    8:  ( 'u1', 1 ),
+    9:  ( 'u1', 1 ),
+    10: ( 'u1', 1 ),
+    11: ( 'u4', 4 ),
+    13: ( 'u1', 1 ),
+    14: ( 'u4', 4 ),
+}
+
+def getVertexComponentArrayType( compType ):
+    if compType not in VERTEX_COMPONENT_ARRAY_TYPES:
+        raise Exception( "Unhandled vertex component type: " + str( compType ) )
+    return VERTEX_COMPONENT_ARRAY_TYPES[ compType ]
+
+def createVertexBufferDtype( shaderInfo, stride, endian = Endian.LITTLE ):
+    '''
+    Creates a numpy structured dtype mapping each shader input onto its location in a vertex.
+    Fields are named '<input name>_<input index>' in the order of the compiled layout of the shader.
+    The dtype is cached on the layout.
+    '''
+    layout = shaderInfo.getLayout()
+    key = ( 'dtype', stride, endian )
+    dtype = layout.cache.get( key )
+    if dtype is None:
+        endianFmt = Endian.STRUCT_FORMAT[ endian ]
+        names = []
+        formats = []
+        offsets = []
+        for element in layout.elements:
+            fmt, _ = getVertexComponentArrayType( element.type )
+            names.append( '{}_{}'.format( element.name, element.index ) )
+            formats.append( ( endianFmt + fmt, ( element.componentCount, ) ) )
+            offsets.append( element.offset )
+        dtype = np.dtype( { 'names': names, 'formats': formats, 'offsets': offsets, 'itemsize': stride } )
+        layout.cache[ key ] = dtype
+    return dtype
+
+def _decodeFS8Array( arr ):
+    if target.current.name in ['aa-pc']:
+        return arr.view( np.int8 ).astype( np.float64 ) / 127
+    else:
+        # mvc3-pc
+        return ( arr.astype( np.float64 ) - 127 ) / 127
+
+def _splitUInt8x4Array( arr ):
+    # ( count, n ) uint32 -> ( count, n * 4 ) uint8 lanes, lowest byte first
+    lanes = ( arr[..., np.newaxis] >> np.array( [0, 8, 16, 24], dtype=np.uint32 ) ) & 0xFF
+    return lanes.astype( np.uint8 ).reshape( arr.shape[0], -1 )
+
+def decodeVertexComponentArray( compType, arr ):
+    '''
+    Decodes an array of shape ( vertexCount, componentCount ) of raw components into a float64 array
+    of shape ( vertexCount, decodedComponentCount ). Matches decodeVertexComponent for every value.
+    '''
+    if   compType == 1:  return arr.astype( np.float64 )
+    elif compType == 2:  return arr.astype( np.float64 )
+    elif compType == 3:  return arr.astype( np.float64 )
+    elif compType == 4:  return arr.astype( np.float64 )
+    elif compType == 5:  return arr.astype( np.float64 ) / 32767
+    elif compType == 6:  return arr.astype( np.float64 ) / 65535
+    elif compType == 7:  return arr.astype( np.float64 )
+    elif compType == 8:  return arr.astype( np.float64 )
+    elif compType == 9:  return _decodeFS8Array( arr )
+    elif compType == 10: return arr.astype( np.float64 ) / 255
+    elif compType == 11: return _decodeFS8Array( _splitUInt8x4Array( arr ) )
+    # elif compType == 12: 
+    elif compType == 13: return arr.astype( np.float64 )
+    elif compType == 14: return _splitUInt8x4Array( arr ).astype( np.float64 )
+    else: raise Exception( "Unhandled vertex component type: " + str( compType ) )
+
+def decodeVertexBufferArrays( shaderInfo, vertexBuffer, vertexCount, stride, endian = Endian.LITTLE ):
+    '''
+    Decodes all vertices in one pass.
+    Returns a dict of input name -> float32 array of shape ( vertexCount, componentCount ),
+    in the order of the compiled layout of the shader.
+    '''
+    dtype = createVertexBufferDtype( shaderInfo, stride, endian )
+    if len( vertexBuffer ) < vertexCount * stride:
+        # the last vertex may be cut short by the end of the buffer
+        padded = bytearray( vertexCount * stride )
+        padded[0:len( vertexBuffer )] = vertexBuffer
+        vertexBuffer = padded
+    vertices = np.frombuffer( vertexBuffer, dtype=dtype, count=vertexCount )
+    
+    arrays = {}
+    for key, value in shaderInfo.getLayout().groups:
+        decoded = []
+        for element in value:
+            decoded.append( decodeVertexComponentArray( element.type, vertices[ '{}_{}'.format( key, element.index ) ] ) )
+        arrays[ key ] = np.concatenate( decoded, axis=1 ).astype( np.float32 )
+    return arrays
+
+def _decodeVertexBufferNumpy( shaderInfo, vertexBuffer, vertexCount, stride ):
+    newInputs = []
+    newStride = 0
+    if vertexCount <= 0:
+        return (bytes(), newStride, newInputs)
+    
+    arrays = decodeVertexBufferArrays( shaderInfo, vertexBuffer, vertexCount, stride )
+    if len( arrays ) == 0:
+        return (bytes(), newStride, newInputs)
+    
+    for key, arr in arrays.items():
+        newInputs.append( ( key, newStride, arr.shape[1] ) )
+        newStride += arr.shape[1] * 4
+        
+    buffer = np.concatenate( list( arrays.values() ), axis=1 ).astype( '<f4', copy=False )
+    return (buffer.tobytes(), newStride, newInputs)
+
+def decodeVertexBuffer( shaderInfo, vertexBuffer, vertexCount, stride ):
+    '''
+    Returns (buffer, newStride, newInputs)
+    '''
+    if libtarget.numpy:
+        return _decodeVertexBufferNumpy( shaderInfo, vertexBuffer, vertexCount, stride )
+    else:
+        return _decodeVertexBufferScalar( shaderInfo, vertexBuffer, vertexCount, stride )
     
 def test():
     encFS16Val = 14691
@@ -0,0 +1,48 @@
+'''
+Shared YAML I/O used for the model metadata, MRL yml files and the editor config.
+Uses the libyaml based loader and dumper when PyYAML was built with it, and falls back to the pure Python ones otherwise.
+'''
+
+import yaml
+
+HAS_LIBYAML = hasattr( yaml, 'CSafeLoader' ) and hasattr( yaml, 'CSafeDumper' )
+
+class FlowList(list):
+    '''List that is written in flow style, ie. [a, b, c] on a single line'''
+    pass
+
+def _createDumper( baseDumper ):
+    class Dumper(baseDumper):
+        pass
+    Dumper.add_representer( FlowList, lambda dumper, data: dumper.represent_sequence( 'tag:yaml.org,2002:seq', data, flow_style=True ) )
+    return Dumper
+
+PySafeLoader = yaml.SafeLoader
+PySafeDumper = _createDumper( yaml.SafeDumper )
+if HAS_LIBYAML:
+    SafeLoader = yaml.CSafeLoader
+    SafeDumper = _createDumper( yaml.CSafeDumper )
+else:
+    SafeLoader = PySafeLoader
+    SafeDumper = PySafeDumper
+
+def setFlowStyle( x ):
+    '''Marks the given sequence to be written in flow style'''
+    return FlowList( x )
+
+def load( stream, loader=None ):
+    '''Loads a YAML document from a string or a file'''
+    return yaml.load( stream, Loader=loader if loader is not None else SafeLoader )
+
+def loadFile( path ):
+    with open( path, 'r' ) as f:
+        return load( f )
+
+def dump( obj, stream=None, dumper=None, **kwargs ):
+    '''Dumps an object to a YAML document, keeping the key order of dicts. Returns the document if no stream is given.'''
+    kwargs.setdefault( 'sort_keys', False )
+    return yaml.dump( obj, stream, Dumper=dumper if dumper is not None else SafeDumper, **kwargs )
+
+def dumpFile( path, obj, **kwargs ):
+    with open( path, 'w' ) as f:
+        dump( obj, f, **kwargs )
@@ -226,6 +226,7 @@ class MtMaxModelExportRollout(MtRollout):
         self.chkExportNormals.checked = plugin.config.exportNormals
         self.chkExportGroupPerMesh.checked = plugin.config.exportGroupPerMesh
         self.chkExportGenerateEnvelopes.checked = plugin.config.exportGenerateEnvelopes
+        self.chkExportOptimizeVertexCache.checked = plugin.config.exportOptimizeVertexCache
         self.cbxExportMaterialPreset.items = plugin.toMaxArray( imMaterialInfo.TEMPLATE_MATERIALS )
         self.cbxExportMaterialPreset.selection = rt.findItem(self.cbxExportMaterialPreset.items, plugin.config.exportMaterialPreset)
         MtMaxModelExportRollout.updateVisibility()
@@ -388,6 +389,10 @@ class MtMaxModelExportRollout(MtRollout):
     def chkExportGenerateEnvelopesChanged( state ):
         plugin.config.exportGenerateEnvelopes = state
         
+    @staticmethod
+    def chkExportOptimizeVertexCacheChanged( state ):
+        plugin.config.exportOptimizeVertexCache = state
+        
     @staticmethod
     def cbxExportMaterialPresetSelected( state ):
         plugin.config.exportMaterialPreset = state
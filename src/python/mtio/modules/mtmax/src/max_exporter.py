@@ -18,15 +18,9 @@ def updateSubProgress( what, value, count = 0 ):
     rollout.pbExportSub.value = value if count == 0 else (value/count) * 100
     rollout.lblExportProgressSubCategory.text = what
 
-def progressCallback( what, i, count ):
-    if max_plugin.plugin.updateUI():
-        max_plugin.plugin.logger.info( what + f' {i}/{count}' )
-        updateSubProgress( what, i, count )
-
 class MaxModelExporter(ModelExporterBase):
     def __init__(self) -> None:
         super().__init__(max_plugin.plugin)
-        self.progressCallback = progressCallback
 
     def getEditorGroupCustomAttributeData( self, node: EditorNodeProxy  ) -> EditorCustomAttributeSetProxy:
         maxNode = node.unwrap()
@@ -248,8 +242,9 @@ class MaxModelExporter(ModelExporterBase):
         
         primWorkingSets: Dict[int, imPrimitiveWorkingSet] = dict()
 
+        progress = self.progress.stage( 'Processing faces', faceCount )
         for i in range( 0, faceCount ):
-            if self.plugin.updateUI(): self.updateSubProgress( 'Processing faces', i, faceCount )
+            progress.update( i )
             
             face = rt.getFace( maxMesh, i + 1 )
             tvFace = rt.getTVFace( maxMesh, i + 1 ) if hasUVs else None
@@ -342,6 +337,7 @@ don't have an reference/original model specified as it will override the skeleto
                         weight.weights.append( 1 )
                         weight.indices.append( rootIndex )
                         tempMesh.weights.append( weight )
+        progress.done()
 
         self.generatePrimitives( editorNode, attribs, primWorkingSets )
             
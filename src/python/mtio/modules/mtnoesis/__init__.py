@@ -50,33 +50,20 @@ def convertInputTypeToRPGEODATA( t ):
     raise Exception("Unknown input type: " + str(t))
        
 def tryBindShaderInput( shaderInfo, name, func, vertexBuffer, stride, useCount = False ):
-    if shaderInfo.hasInput(name):
-        inputInfos = shaderInfo.getInput( name )
-        for inputInfo in inputInfos:
-            print( "input name: " + inputInfo.name )
-            print( "input type: " + str( inputInfo.type ) )
-            if not useCount: func( vertexBuffer, convertInputTypeToRPGEODATA( inputInfo.type ), stride, inputInfo.offset )
-            else:            func( vertexBuffer, convertInputTypeToRPGEODATA( inputInfo.type ), stride, inputInfo.offset, inputInfo.componentCount )
+    for inputInfo in shaderInfo.getLayout().getElements( name ):
+        print( "input name: " + inputInfo.name )
+        print( "input type: " + str( inputInfo.type ) )
+        if not useCount: func( vertexBuffer, convertInputTypeToRPGEODATA( inputInfo.type ), stride, inputInfo.offset )
+        else:            func( vertexBuffer, convertInputTypeToRPGEODATA( inputInfo.type ), stride, inputInfo.offset, inputInfo.componentCount )
 
 def rebaseIndexBuffer( model, primitive, indexReadStream ):
     '''
     fix index buffer for drawing by subtracting the vertex start index from the indices
     '''
-    indexStart = ( primitive.indexBufferOffset + primitive.indexStartIndex ) * 2
-    indexEnd = indexStart + ( primitive.indexCount * 2 )
-    indexReadStream.seek( indexStart )
-    indexWriteStream = NoeBitStream()
-    badIdx = -1
-    for i in range(primitive.indexCount):
-        idx = indexReadStream.readUShort()
-        fixedIdx = idx - primitive.vertexStartIndex
-        assert( idx >= 0 )
-        if (fixedIdx < 0):
-            badIdx = i
-        indexWriteStream.writeUShort( fixedIdx )
-    if badIdx != -1: print("Bad indices at " + str(badIdx) + " indexStart: " + str(indexStart) + " vertexStartIndex: " + str(primitive.vertexStartIndex))
-    indexBufferBytes = indexWriteStream.getBuffer()
-    return indexBufferBytes
+    indices = model.getPrimitiveIndices( primitive, rebase=True )
+    if len( indices ) > 0 and min( indices ) < 0: 
+        print("Bad indices, indexStart: " + str(primitive.indexBufferOffset + primitive.indexStartIndex) + " vertexStartIndex: " + str(primitive.vertexStartIndex))
+    return indexArrayToBuffer( indices )
 
 def fixTextureMapPath( basePath, path ):
     return basePath + '/' + os.path.basename(path) + ".241f5deb.dds"
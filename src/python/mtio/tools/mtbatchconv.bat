@@ -0,0 +1,2 @@
+py -3 "%~dp0\mtbatchconv.py" "%~1"
+pause
\ No newline at end of file
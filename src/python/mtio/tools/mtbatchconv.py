@@ -0,0 +1,119 @@
+import os
+import sys
+import time
+import argparse
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+def getScriptDir():
+    return os.path.dirname(os.path.realpath(__file__))
+
+sys.path.append( os.path.realpath( os.path.dirname( __file__ ) + "/../" ) )
+sys.path.append( getScriptDir() )
+from modules.mtlib import *
+from modules.mtlib import textureutil
+import mtmrlconv
+
+def classifyFile( path ):
+    '''Returns the kind of file (mod, mrl, tex or yml) based on its extensions, including hashed names such as .241f5deb.tex'''
+    basePath, baseName, exts = util.splitPath( path )
+    if len( exts ) == 0:
+        return None
+
+    lastExt = exts[len(exts) - 1].lower()
+    if lastExt in ['mod', 'mrl', 'tex']:
+        return lastExt
+    elif lastExt in ['yml', 'yaml', imMaterialLib.SNAPSHOT_EXT] and 'mrl' in [x.lower() for x in exts]:
+        return 'yml'
+    return None
+
+def iterFiles( path ):
+    for root, dirs, files in os.walk( path ):
+        for name in files:
+            yield os.path.join( root, name )
+
+def collectJobs( path, pack, format='yml' ):
+    '''
+    Collects the files to convert. When unpacking, TEX files are converted to DDS and MRL files to YML (or snapshots),
+    using the model next to them for material names. When packing, MRL YML and snapshot files are converted back to MRL.
+    Each output is only written by one job, if several inputs convert to the same MRL the one in the given format is used.
+    '''
+    jobs = []
+    jobIndexByOutputPath = dict()
+    stats = dict( mod=0, mrl=0, tex=0, yml=0 )
+    for filePath in iterFiles( path ):
+        kind = classifyFile( filePath )
+        if kind == None:
+            continue
+
+        stats[kind] += 1
+        if ( pack and kind == 'yml' ) or ( not pack and kind == 'mrl' ):
+            outputPath = os.path.normcase( os.path.abspath( mtmrlconv.getOutputPath( filePath, format ) ) )
+            index = jobIndexByOutputPath.get( outputPath )
+            if index == None:
+                jobIndexByOutputPath[ outputPath ] = len( jobs )
+                jobs.append( ( kind, filePath ) )
+            elif util.splitPath( filePath )[2][-1].lower() == format:
+                jobs[ index ] = ( kind, filePath )
+        elif not pack and kind == 'tex':
+            jobs.append( ( kind, filePath ) )
+    return jobs, stats
+
+def initWorker( targetName, namesPath ):
+    target.setTarget( targetName )
+    mvc3materialnamedb.setUserIndexPath( namesPath )
+
+def convertFile( kind, path, format ):
+    '''Converts a single file. Any error is caught and returned so that one bad file does not stop the batch.'''
+    try:
+        size = os.path.getsize( path )
+        if kind == 'tex':
+            textureutil.convertTexture( path )
+        else:
+            mtmrlconv.processFile( path, None, format )
+        return path, size, None
+    except Exception:
+        return path, 0, traceback.format_exc()
+
+def main():
+    parser = argparse.ArgumentParser( description='converts all TEX, MRL and MRL YML files in an extracted archive directory' )
+    parser.add_argument( "input", type=str, help='the extracted archive directory' )
+    parser.add_argument( "--pack", action='store_true', help='converts MRL YML files back to MRL instead of unpacking TEX and MRL files' )
+    parser.add_argument( "-j", "--workers", type=int, default=os.cpu_count(), help='the number of worker processes' )
+    parser.add_argument( "--target", default="mvc3-pc" )
+    parser.add_argument( "--format", choices=mtmrlconv.FORMATS, default='yml', help='the format MRL files are unpacked to, yml or a binary snapshot that is faster to convert' )
+    parser.add_argument( "--names", default=mvc3materialnamedb.getDefaultUserIndexPath(), help='the file material names learned from models are saved to' )
+    args = parser.parse_args()
+    target.setTarget( args.target )
+    mvc3materialnamedb.setUserIndexPath( args.names )
+
+    jobs, stats = collectJobs( args.input, args.pack, args.format )
+    print( 'found {} mrl, {} tex and {} yml files, converting {} (mod files are only used for material names, found {})'.format(
+        stats['mrl'], stats['tex'], stats['yml'], len( jobs ), stats['mod'] ) )
+
+    startTime = time.perf_counter()
+    totalSize = 0
+    failed = []
+    with ProcessPoolExecutor( max_workers=max( 1, args.workers ), initializer=initWorker, initargs=( args.target, args.names ) ) as executor:
+        futures = [executor.submit( convertFile, kind, path, args.format ) for kind, path in jobs]
+        for i, future in enumerate( as_completed( futures ) ):
+            path, size, error = future.result()
+            if error != None:
+                print( 'failed: {}\n{}'.format( path, error ) )
+                failed.append( path )
+            else:
+                totalSize += size
+            print( '{}/{} {}'.format( i + 1, len( jobs ), path ) )
+
+    elapsed = max( time.perf_counter() - startTime, 1e-9 )
+    converted = len( jobs ) - len( failed )
+    print( 'converted {} files, {} failed in {:.2f}s ({:.1f} files/s, {:.2f} MB/s)'.format(
+        converted, len( failed ), elapsed, converted / elapsed, totalSize / ( 1024 * 1024 ) / elapsed ) )
+    for path in failed:
+        print( 'failed: {}'.format( path ) )
+
+    if len( failed ) > 0:
+        sys.exit( 1 )
+
+if __name__ == '__main__':
+    main()
@@ -11,30 +11,44 @@ from modules.mtlib import *
 def noneOrEmpty( s ):
     return s == None or len( s ) == 0
 
-def processFile( path, outPath ):
-    # detect paths
+FORMATS = ['yml', imMaterialLib.SNAPSHOT_EXT]
+
+def getPaths( path, format='yml' ):
+    '''Returns the model, MRL and MRL yml (or snapshot) paths that belong to the given input path'''
     basePath, baseName, exts = util.splitPath( path )
     if len( exts ) == 1:
         modPath = os.path.join( basePath, baseName + '.mod' )
         mrlPath = os.path.join( basePath, baseName + '.mrl' )
-        ymlPath = os.path.join( basePath, baseName + '.mrl.yml' )
     else:
         modPath = os.path.join( basePath, baseName + '.58a15856.mod' )
         mrlPath = os.path.join( basePath, baseName + '.2749c8a8.mrl' )
-        ymlPath = os.path.join( basePath, baseName + '.2749c8a8.mrl.yml' )
+    ymlPath = mrlPath + '.' + format
     
     lastExt = exts[len(exts) - 1]
     if lastExt == 'mrl':
         mrlPath = path
     elif lastExt == 'mod':
         modPath = path
-    elif lastExt in ['yml', 'yaml']:
+    elif lastExt in ['yml', 'yaml', imMaterialLib.SNAPSHOT_EXT]:
         ymlPath = path
-    
+    return modPath, mrlPath, ymlPath
+
+def getOutputPath( path, format='yml' ):
+    '''Returns the path processFile writes to when no output path is given'''
+    modPath, mrlPath, ymlPath = getPaths( path, format )
+    lastExt = util.splitPath( path )[2][-1]
+    return mrlPath if lastExt in ['yml', 'yaml', imMaterialLib.SNAPSHOT_EXT] else ymlPath
+
+def processFile( path, outPath, format='yml', deduplicate=False ):
+    '''
+    Converts an MRL file (or the MRL next to a model) to the given intermediate format, which is either yml or
+    the binary snapshot, or an MRL yml or snapshot file back to MRL.
+    '''
+    modPath, mrlPath, ymlPath = getPaths( path, format )
+    lastExt = util.splitPath( path )[2][-1]
     if lastExt in ['mrl', 'mod']:
         if os.path.exists( modPath ):
-            model = rModelData()
-            model.read( NclBitStream( util.loadIntoByteArray( modPath ) ) )
+            model = rModelView( util.openReadOnlyStream( modPath ) )
             mvc3materialnamedb.registerMaterialNames( model.materials )
             
         if not os.path.exists( mrlPath ):
@@ -47,27 +61,37 @@ def processFile( path, outPath ):
         if noneOrEmpty( outPath ):
             outPath = ymlPath
         
-        matLib.saveYamlFile( outPath )
-    elif lastExt in ['yml', 'yaml']:
+        if format == imMaterialLib.SNAPSHOT_EXT:
+            matLib.saveSnapshotFile( outPath )
+        else:
+            matLib.saveYamlFile( outPath )
+    elif lastExt in ['yml', 'yaml', imMaterialLib.SNAPSHOT_EXT]:
         matLib = imMaterialLib()
-        matLib.loadYamlFile( ymlPath )
+        matLib.loadFile( ymlPath )
         
         if noneOrEmpty( outPath ):
             outPath = mrlPath
         
         with open( outPath, "wb" ) as f:
             stream = NclBitStream()
-            matLib.saveBinaryStream(stream)
+            stats = matLib.saveBinaryStream( stream, deduplicate )
             f.write(stream.getBuffer())
+        
+        if deduplicate:
+            print( "{}: {}".format( outPath, stats ) )
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument( "input" )
     parser.add_argument( "output", nargs='?' )
     parser.add_argument( "--target", default="mvc3-pc" )
+    parser.add_argument( "--format", choices=FORMATS, default='yml', help='the format MRL files are converted to, yml or a binary snapshot that is faster to convert' )
+    parser.add_argument( "--dedupe", action='store_true', help='share identical command lists, constant buffers and animation data between materials when writing MRL files' )
+    parser.add_argument( "--names", default=mvc3materialnamedb.getDefaultUserIndexPath(), help='the file material names learned from models are saved to' )
     args = parser.parse_args()
     target.setTarget( args.target )
-    processFile( args.input, args.output )
+    mvc3materialnamedb.setUserIndexPath( args.names )
+    processFile( args.input, args.output, args.format, args.dedupe )
 
 if __name__ == '__main__':
     main()
\ No newline at end of file